@@ -0,0 +1,451 @@
+# app/api/v1/authen/access_engine.py
+"""
+In-process RBAC: answers what the `public.check_access` RPC answered, from one compiled snapshot per company.
+
+The RPC's SQL is not in this repository; these are the semantics rebuilt from the table shapes and kept here:
+
+- a profile's permissions = role_permissions of its user_roles, plus those of the group_roles of its
+  user_groups; only roles / groups / permissions of the company (or global, company_code NULL) count,
+  and only active user_profiles of that company
+- a route is protected by every active protected_routes row (is_active not false) matching it; the
+  profile needs ANY of the permissions mapped to the route, not all of them
+- route matching is per path segment: literal beats `{param}` / `:param`, which beats a trailing `*`;
+  the query string is ignored; method `*` / `ALL` / `ANY` / empty matches every method
+- a route with no matching protected_routes row is denied (deny by default)
+
+Because these rules are reconstructed, the RPC stays the source of truth until shadow runs prove them:
+
+- ACCESS_ENGINE_ENFORCE=false (default): check_route() answers from the RPC and compares every answer
+  with the engine's
+- ACCESS_ENGINE_ENFORCE=true: the engine answers; ACCESS_RPC_SHADOW_RATE of the checks are still
+  compared with the RPC
+- mismatches are logged and counted (GET /health/caches -> access); flip the flag only after they stay 0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.authen.auth import current_principal
+from app.api.v1.authen.principal_cache import ResolvedPrincipal
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+from app.database.session import get_db
+
+logger = get_service_logger("service.access_engine")
+
+ANY_METHOD = "*"
+
+
+def _normalize_path(route: str) -> List[str]:
+    path = (route or "").split("?", 1)[0].strip()
+    return [seg for seg in path.split("/") if seg]
+
+
+def _normalize_method(method: str) -> str:
+    m = (method or "").strip().upper()
+    return ANY_METHOD if m in ("", "*", "ALL", "ANY") else m
+
+
+def _is_param(seg: str) -> bool:
+    return (seg.startswith("{") and seg.endswith("}")) or seg.startswith(":")
+
+
+# =========================================================
+# ROUTE TRIE (protected_routes -> required permission bits)
+# =========================================================
+class RouteTrie:
+    """
+    Segment trie over protected_routes.route_path.
+
+    - literal segments win over `{param}` / `:param`, which win over a trailing `*`
+    - each terminal keeps {method: mask}; a route needs ANY of the bits in its mask
+    """
+
+    __slots__ = ("children", "param", "wildcard", "methods")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, RouteTrie] = {}
+        self.param: Optional[RouteTrie] = None
+        self.wildcard: Optional[RouteTrie] = None
+        self.methods: Dict[str, int] = {}
+
+    def add(self, route: str, method: str, mask: int) -> None:
+        node = self
+        for seg in _normalize_path(route):
+            if seg == "*":
+                node.wildcard = node.wildcard or RouteTrie()
+                node = node.wildcard
+                break
+            if _is_param(seg):
+                node.param = node.param or RouteTrie()
+                node = node.param
+            else:
+                node = node.children.setdefault(seg, RouteTrie())
+        m = _normalize_method(method)
+        node.methods[m] = node.methods.get(m, 0) | mask
+
+    def _required(self, method: str) -> Optional[int]:
+        if method not in self.methods and ANY_METHOD not in self.methods:
+            return None
+        return self.methods.get(method, 0) | self.methods.get(ANY_METHOD, 0)
+
+    def _match(self, segs: List[str], i: int, method: str) -> Optional[int]:
+        if i == len(segs):
+            found = self._required(method)
+            if found is not None:
+                return found
+        else:
+            child = self.children.get(segs[i])
+            if child is not None:
+                found = child._match(segs, i + 1, method)
+                if found is not None:
+                    return found
+            if self.param is not None:
+                found = self.param._match(segs, i + 1, method)
+                if found is not None:
+                    return found
+        if self.wildcard is not None:
+            return self.wildcard._required(method)
+        return None
+
+    def match(self, route: str, method: str) -> Optional[int]:
+        """Required permission mask for (route, method), or None when the route is not protected."""
+        return self._match(_normalize_path(route), 0, _normalize_method(method))
+
+
+# =========================================================
+# COMPILED SNAPSHOT (one per company_code)
+# =========================================================
+@dataclass(frozen=True)
+class CompiledAccess:
+    company_code: str
+    version: int
+    loaded_at: float
+    bits: Dict[str, int] = field(default_factory=dict)           # permission_code -> bit
+    profile_masks: Dict[str, int] = field(default_factory=dict)  # profile_id -> granted bits
+    routes: RouteTrie = field(default_factory=RouteTrie)
+
+    def profile_mask(self, profile_id: object) -> int:
+        return self.profile_masks.get(str(profile_id), 0)
+
+    def can_access(self, profile_id: object, route: str, method: str) -> bool:
+        # deny by default: a route without an active protected_routes entry grants nothing
+        required = self.routes.match(route, method)
+        return bool(required) and bool(self.profile_mask(profile_id) & required)
+
+    def has_permission(self, profile_id: object, permission_code: str) -> bool:
+        bit = self.bits.get(permission_code)
+        return bit is not None and bool(self.profile_mask(profile_id) & bit)
+
+    def permissions_of(self, profile_id: object) -> List[str]:
+        mask = self.profile_mask(profile_id)
+        return sorted(code for code, bit in self.bits.items() if mask & bit)
+
+
+_Q_PERMISSIONS = text("""
+    select p.id, p.permission_code
+    from public.permissions p
+    where p.company_code = :cc or p.company_code is null
+""")
+
+_Q_ROUTES = text("""
+    select pr.route_path, pr.http_method, pr.permission_id
+    from public.protected_routes pr
+    where pr.is_active is not false
+""")
+
+_Q_ROLE_PERMISSIONS = text("""
+    select rp.role_id, rp.permission_id
+    from public.role_permissions rp
+    join public.roles r on r.id = rp.role_id
+    where r.company_code = :cc or r.company_code is null
+""")
+
+_Q_GROUP_ROLES = text("""
+    select gr.group_id, gr.role_id
+    from public.group_roles gr
+    join public.groups g on g.id = gr.group_id
+    where g.company_code = :cc or g.company_code is null
+""")
+
+_Q_PROFILE_ROLES = text("""
+    select ur.profile_id, ur.role_id
+    from public.user_roles ur
+    join public.user_profiles up on up.id = ur.profile_id
+    where up.company_code = :cc and up.is_active is not false
+""")
+
+_Q_PROFILE_GROUPS = text("""
+    select ug.profile_id, ug.group_id
+    from public.user_groups ug
+    join public.user_profiles up on up.id = ug.profile_id
+    where up.company_code = :cc and up.is_active is not false
+""")
+
+
+async def _rows(db: AsyncSession, q, params: Optional[dict] = None) -> List[Tuple]:
+    return [tuple(r) for r in (await db.execute(q, params or {})).all()]
+
+
+def compile_access(
+    company_code: str,
+    version: int,
+    *,
+    permissions: Iterable[Tuple],
+    routes: Iterable[Tuple],
+    role_permissions: Iterable[Tuple],
+    group_roles: Iterable[Tuple],
+    profile_roles: Iterable[Tuple],
+    profile_groups: Iterable[Tuple],
+) -> CompiledAccess:
+    bit_by_perm_id: Dict[str, int] = {}
+    bits: Dict[str, int] = {}
+    for i, (perm_id, code) in enumerate(permissions):
+        bit = 1 << i
+        bit_by_perm_id[str(perm_id)] = bit
+        bits[code] = bits.get(code, 0) | bit
+
+    trie = RouteTrie()
+    for route_path, http_method, perm_id in routes:
+        bit = bit_by_perm_id.get(str(perm_id))
+        if bit:  # permission belongs to another company -> not enforceable here
+            trie.add(route_path, http_method, bit)
+
+    role_mask: Dict[str, int] = {}
+    for role_id, perm_id in role_permissions:
+        bit = bit_by_perm_id.get(str(perm_id), 0)
+        role_mask[str(role_id)] = role_mask.get(str(role_id), 0) | bit
+
+    group_mask: Dict[str, int] = {}
+    for group_id, role_id in group_roles:
+        group_mask[str(group_id)] = group_mask.get(str(group_id), 0) | role_mask.get(str(role_id), 0)
+
+    profile_masks: Dict[str, int] = {}
+    for profile_id, role_id in profile_roles:
+        profile_masks[str(profile_id)] = profile_masks.get(str(profile_id), 0) | role_mask.get(str(role_id), 0)
+    for profile_id, group_id in profile_groups:
+        profile_masks[str(profile_id)] = profile_masks.get(str(profile_id), 0) | group_mask.get(str(group_id), 0)
+
+    return CompiledAccess(
+        company_code=company_code,
+        version=version,
+        loaded_at=time.monotonic(),
+        bits=bits,
+        profile_masks=profile_masks,
+        routes=trie,
+    )
+
+
+# =========================================================
+# ENGINE (lazy per company, refreshed on RBAC writes)
+# =========================================================
+class AccessEngine:
+    """
+    In-process replacement for the `check_access` RPC (semantics: module docstring).
+
+    - compiles user_roles / user_groups / group_roles / role_permissions / permissions
+      (+ protected_routes) into per-profile bitmasks and a route trie, per company_code
+    - one version for all companies: RBAC and protected_routes writes (users module services,
+      users_service helpers) call invalidate() after they commit
+    - TTL bounds staleness for writes made by other workers or directly in the database
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self._ttl_seconds = ttl_seconds
+        self._snapshots: Dict[str, CompiledAccess] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._version = 0
+        self.compared = 0  # answers checked against the RPC
+        self.mismatches = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = float(get_settings().ACCESS_CACHE_TTL_SECONDS)
+        return self._ttl_seconds
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _is_fresh(self, snap: Optional[CompiledAccess]) -> bool:
+        if snap is None or snap.version != self._version:
+            return False
+        ttl = self.ttl_seconds
+        return ttl <= 0 or (time.monotonic() - snap.loaded_at) < ttl
+
+    async def get(self, db: AsyncSession, company_code: str) -> CompiledAccess:
+        snap = self._snapshots.get(company_code)
+        if self._is_fresh(snap):
+            return snap
+
+        lock = self._locks.setdefault(company_code, asyncio.Lock())
+        async with lock:
+            snap = self._snapshots.get(company_code)
+            if self._is_fresh(snap):
+                return snap
+
+            version = self._version
+            params = {"cc": company_code}
+            t0 = time.perf_counter()
+            snap = compile_access(
+                company_code,
+                version,
+                permissions=await _rows(db, _Q_PERMISSIONS, params),
+                routes=await _rows(db, _Q_ROUTES),
+                role_permissions=await _rows(db, _Q_ROLE_PERMISSIONS, params),
+                group_roles=await _rows(db, _Q_GROUP_ROLES, params),
+                profile_roles=await _rows(db, _Q_PROFILE_ROLES, params),
+                profile_groups=await _rows(db, _Q_PROFILE_GROUPS, params),
+            )
+            # a write landed while loading -> serve this result once, do not keep it
+            if version == self._version:
+                self._snapshots[company_code] = snap
+            logger.info(
+                "access compiled company=%s permissions=%s profiles=%s version=%s elapsed_ms=%.1f",
+                company_code, len(snap.bits), len(snap.profile_masks), version, (time.perf_counter() - t0) * 1000,
+            )
+            return snap
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._snapshots.clear()
+
+    def record(self, engine: bool, rpc: bool, **ctx: object) -> bool:
+        """Count one engine / RPC comparison; a mismatch is logged with its context."""
+        self.compared += 1
+        if engine == rpc:
+            return True
+        self.mismatches += 1
+        logger.warning("access engine / RPC mismatch engine=%s rpc=%s %s", engine, rpc, ctx)
+        return False
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "enforce": bool(get_settings().ACCESS_ENGINE_ENFORCE),
+            "companies": len(self._snapshots),
+            "version": self._version,
+            "compared": self.compared,
+            "mismatches": self.mismatches,
+        }
+
+
+access_engine = AccessEngine()
+
+
+# =========================================================
+# RPC (source of truth until ACCESS_ENGINE_ENFORCE)
+# =========================================================
+_Q_RPC = text("""
+    select public.check_access(
+        p_profile_id => :p_profile_id,
+        p_route => :p_route,
+        p_method => :p_method,
+        p_company_code => :p_company_code
+    )
+""")
+
+
+async def check_rpc(db: AsyncSession, profile_id: object, route: str, method: str, company_code: str) -> bool:
+    """Answer of the `check_access` RPC itself (one round-trip)."""
+    params = {
+        "p_profile_id": str(profile_id),
+        "p_route": route,
+        "p_method": method,
+        "p_company_code": company_code,
+    }
+    return bool((await db.execute(_Q_RPC, params)).scalar())
+
+
+async def check_route(
+    db: AsyncSession,
+    profile_id: object,
+    route: str,
+    method: str,
+    company_code: str,
+    *,
+    enforce: Optional[bool] = None,
+    shadow_rate: Optional[float] = None,
+) -> bool:
+    """
+    Can the profile call (route, method)? What /check_access and require_access() answer.
+
+    - not enforced: the RPC answers; the engine's answer is compared with it (an engine failure
+      is logged and never changes the answer)
+    - enforced: the engine answers; a `shadow_rate` sample is compared with the RPC (an RPC
+      failure is logged and never changes the answer)
+    """
+    s = get_settings()
+    enforce = bool(s.ACCESS_ENGINE_ENFORCE) if enforce is None else enforce
+    ctx = {"company": company_code, "profile_id": str(profile_id), "route": route, "method": method}
+
+    if not enforce:
+        expected = await check_rpc(db, profile_id, route, method, company_code)
+        try:
+            compiled = await access_engine.get(db, company_code)
+            access_engine.record(compiled.can_access(profile_id, route, method), expected, **ctx)
+        except Exception as e:
+            logger.warning("access engine shadow check failed: %s", e)
+        return expected
+
+    compiled = await access_engine.get(db, company_code)
+    allowed = compiled.can_access(profile_id, route, method)
+    rate = float(s.ACCESS_RPC_SHADOW_RATE) if shadow_rate is None else shadow_rate
+    if rate > 0 and random.random() < rate:
+        try:
+            access_engine.record(allowed, await check_rpc(db, profile_id, route, method, company_code), **ctx)
+        except Exception as e:
+            logger.warning("check_access RPC shadow check failed: %s", e)
+    return allowed
+
+
+# =========================================================
+# FASTAPI DEPENDENCY
+# =========================================================
+def require_access(permission_code: Optional[str] = None):
+    """
+    Enforce RBAC on a route.
+
+        @router.get(..., dependencies=[Depends(require_access())])  # protected_routes by route template
+        @router.get(..., dependencies=[Depends(require_access("patients.read"))])
+
+    By route template the answer comes from check_route() (the RPC until ACCESS_ENGINE_ENFORCE).
+    A permission code has no RPC equivalent and is always answered by the engine.
+    JWT only; DEV / HEADER modes (no resolved principal) are not enforced.
+    """
+
+    async def _dependency(
+        request: Request,
+        principal: Optional[ResolvedPrincipal] = Depends(current_principal),
+        db: AsyncSession = Depends(get_db),
+    ) -> None:
+        if principal is None:
+            return
+        if not principal.profile_id or not principal.company_code:
+            raise HTTPException(status_code=403, detail="Forbidden")
+
+        if permission_code:
+            compiled = await access_engine.get(db, principal.company_code)
+            allowed = compiled.has_permission(principal.profile_id, permission_code)
+        else:
+            route = request.scope.get("route")
+            path = getattr(route, "path", request.url.path)
+            allowed = await check_route(db, principal.profile_id, path, request.method, principal.company_code)
+        if not allowed:
+            raise HTTPException(status_code=403, detail="Forbidden")
+
+    return _dependency
+
+
+def require_admin():
+    """Operational endpoints (schema refresh): the route must be granted through protected_routes."""
+    return require_access()
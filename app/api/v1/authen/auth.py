@@ -12,6 +12,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.session import get_db
 from app.core.config import get_settings, Settings  # DI
+from app.api.v1.authen.principal_cache import ResolvedPrincipal, principal_cache
+from app.api.v1.authen.token_cache import verified_token_cache
 
 
 # =========================================================
@@ -53,6 +55,12 @@ def verify_token(
 
     aud = getattr(settings, "SUPABASE_JWT_AUD", "authenticated")
 
+    # same token seen before (and not past its exp) -> skip the HS256 verify
+    digest = verified_token_cache.digest(token, settings.SUPABASE_JWT_SECRET, aud)
+    cached = verified_token_cache.get(digest)
+    if cached is not None:
+        return cached
+
     try:
         from jose import jwt  # pip install python-jose
 
@@ -63,10 +71,12 @@ def verify_token(
             audience=aud,
             options={"verify_aud": True},
         )
-        return claims
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=f"Token verification failed: {e}")
 
+    verified_token_cache.put(digest, claims)
+    return dict(claims)
+
 
 def _jwt_user_id(decoded_token: Dict[str, Any], settings: Settings) -> Optional[UUID]:
     if settings.AUTH_MODE.upper() != "JWT":
@@ -88,6 +98,7 @@ def _jwt_user_id(decoded_token: Dict[str, Any], settings: Settings) -> Optional[
 async def _load_user_profile(db: AsyncSession, user_id: UUID) -> Dict[str, Any] | None:
     q = text("""
         select
+          up.id as profile_id,
           up.company_code,
           up.patient_id,
           up.staff_id,
@@ -102,29 +113,46 @@ async def _load_user_profile(db: AsyncSession, user_id: UUID) -> Dict[str, Any]
     return dict(row) if row else None
 
 
-async def _get_profile_or_401(
-    db: AsyncSession,
-    decoded_token: Dict[str, Any],
-    settings: Settings,
-) -> Dict[str, Any]:
+async def current_principal(
+    db: AsyncSession = Depends(get_db),
+    decoded_token: dict = Depends(verify_token),
+    settings: Settings = Depends(get_settings),
+) -> Optional[ResolvedPrincipal]:
+    """
+    JWT: caller's user_profiles row, resolved once per request (FastAPI dependency cache)
+         and across requests via principal_cache (TTL LRU keyed by `sub`).
+    DEV / HEADER: None (context comes from query/header).
+    """
     uid = _jwt_user_id(decoded_token, settings)
     if not uid:
-        raise HTTPException(status_code=401, detail="Unauthorized")
+        return None
 
-    profile = await _load_user_profile(db, uid)
-    if not profile:
-        raise HTTPException(status_code=401, detail="User profile not found")
-    if profile.get("is_active") is False:
+    sub = str(uid)
+    principal = principal_cache.get(sub)
+    if principal is None:
+        generation = principal_cache.generation
+        profile = await _load_user_profile(db, uid)
+        if not profile:
+            raise HTTPException(status_code=401, detail="User profile not found")
+        principal = ResolvedPrincipal.from_profile(uid, profile)
+        principal_cache.put(sub, principal, generation=generation)
+
+    if not principal.is_active:
         raise HTTPException(status_code=403, detail="User is inactive")
-    return profile
+    return principal
+
+
+def _require_principal(principal: Optional[ResolvedPrincipal]) -> ResolvedPrincipal:
+    if principal is None:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    return principal
 
 
 # =========================================================
 # COMPANY CONTEXT
 # =========================================================
 async def current_company_code(
-    db: AsyncSession = Depends(get_db),
-    decoded_token: dict = Depends(verify_token),
+    principal: Optional[ResolvedPrincipal] = Depends(current_principal),
     settings: Settings = Depends(get_settings),
     # 👇 รับจาก query param ก่อน
     company_code: str | None = Query(default=None, alias="company_code"),
@@ -141,8 +169,7 @@ async def current_company_code(
         return value.strip() if value else None
 
     # JWT
-    profile = await _get_profile_or_401(db, decoded_token, settings)
-    return profile.get("company_code")
+    return _require_principal(principal).company_code
 
 
 
@@ -150,8 +177,7 @@ async def current_company_code(
 # PATIENT CONTEXT
 # =========================================================
 async def current_patient_id(
-    db: AsyncSession = Depends(get_db),
-    decoded_token: dict = Depends(verify_token),
+    principal: Optional[ResolvedPrincipal] = Depends(current_principal),
     settings: Settings = Depends(get_settings),
     # 👇 รับจาก query param ก่อน
     patient_id: str | None = Query(default=None, alias="patient_id"),
@@ -172,7 +198,5 @@ async def current_patient_id(
         return value.strip() if value else None
 
     # JWT
-    profile = await _get_profile_or_401(db, decoded_token, settings)
-    pid = profile.get("patient_id")
-    return str(pid) if pid else None
+    return _require_principal(principal).patient_id
 
@@ -1,12 +1,13 @@
 # auth_service.py
-from supabase import create_client, Client
-import os
-from gotrue.types import AuthResponse
-from gotrue.errors import AuthApiError
-
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")  # ใช้ ANON หรือ SERVICE_ROLE ตาม use case
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+# shared client, created on first call (SUPABASE_KEY: ANON หรือ SERVICE_ROLE ตาม use case)
+from app.services.supabase_client import supabase
+
+if TYPE_CHECKING:
+    from gotrue.types import AuthResponse
 
 def signup_user(email: str, password: str) -> AuthResponse:
     return supabase.auth.sign_up({"email": email, "password": password})
@@ -1,12 +1,13 @@
-from app.services.supabase_client import supabase
-from app.core.config import get_settings
-settings = get_settings()  # ✅ โหลดค่าจาก .env ผ่าน config
-
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
-from fastapi import APIRouter, Request, HTTPException, Response
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Request, HTTPException, Response
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
 from uuid import UUID
 
+from app.api.v1.authen.access_engine import check_route
+from app.database.session import get_db
+
 # logging
 from app.core.logging_config import get_service_logger
 logger = get_service_logger("service.user_access")
@@ -27,38 +28,57 @@ class CheckAccessRequest(BaseModel):
 class CheckAccessResponse(BaseModel):
     has_access: bool
 
+class AccessCheckItem(BaseModel):
+    route: str
+    method: str
+
+class CheckAccessBatchRequest(BaseModel):
+    profile_id: UUID
+    company_code: str
+    checks: List[AccessCheckItem] = Field(..., min_length=1, max_length=500)
+
+
 @router.post("/check", response_class=UnicodeJSONResponse, summary="ตรวจสอบสิทธิ์ผู้ใช้", response_description="ผลลัพธ์การตรวจสอบสิทธิ์ผู้ใช้งาน")
-async def check_access(data: CheckAccessRequest):
+async def check_access(data: CheckAccessRequest, db: AsyncSession = Depends(get_db)):
     try:
-        logger.info("📥 Received check_access request: profile_id=%s, route=%s, method=%s, company_code=%s",
-                    data.profile_id, data.route, data.method, data.company_code)
+        # RPC until ACCESS_ENGINE_ENFORCE, compiled in-process (access_engine) after; the other side is compared
+        has_access = await check_route(db, data.profile_id, data.route, data.method, data.company_code)
+        logger.debug("check_access profile_id=%s route=%s method=%s company_code=%s -> %s",
+                     data.profile_id, data.route, data.method, data.company_code, has_access)
+
+        return ResponseHandler.success(
+            message="Access checked successfully",
+            data={"has_access": has_access}
+        )
 
-        response = supabase.rpc("check_access", {
-            "p_profile_id": str(data.profile_id),
-            "p_route": data.route,
-            "p_method": data.method,
-            "p_company_code": data.company_code
-        }).execute()
+    except Exception as e:
+        logger.exception("🔥 Exception occurred in check_access: %s", str(e))
+        return ResponseHandler.error(
+            code="SYS_001",
+            message="Exception occurred while checking access",
+            details={"error": str(e)},
+            status_code=500
+        )
 
-        logger.info("✅ Supabase RPC response: data=%s", response.data)
 
-        # ✅ ตรวจว่าผลลัพธ์เป็น boolean หรือไม่
-        if isinstance(response.data, bool):
-            return ResponseHandler.success(
-                message="Access checked successfully",
-                data={"has_access": response.data}
-            )
-        else:
-            logger.error("❗ Unexpected RPC result format: %s", response.data)
-            return ResponseHandler.error(
-                code="RPC_002",
-                message="Unexpected RPC result format",
-                details={"raw_result": response.data},
-                status_code=500
-            )
+@router.post("/check_batch", response_class=UnicodeJSONResponse, summary="ตรวจสอบสิทธิ์ผู้ใช้ (หลายเส้นทาง)", response_description="ผลลัพธ์การตรวจสอบสิทธิ์ตามลำดับที่ส่งมา")
+async def check_access_batch(data: CheckAccessBatchRequest, db: AsyncSession = Depends(get_db)):
+    try:
+        results = [
+            {
+                "route": item.route,
+                "method": item.method,
+                "has_access": await check_route(db, data.profile_id, item.route, item.method, data.company_code),
+            }
+            for item in data.checks
+        ]
+        return ResponseHandler.success(
+            message="Access checked successfully",
+            data={"results": results}
+        )
 
     except Exception as e:
-        logger.exception("🔥 Exception occurred in check_access: %s", str(e))
+        logger.exception("🔥 Exception occurred in check_access_batch: %s", str(e))
         return ResponseHandler.error(
             code="SYS_001",
             message="Exception occurred while checking access",
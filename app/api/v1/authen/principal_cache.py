@@ -0,0 +1,128 @@
+# app/api/v1/authen/principal_cache.py
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import get_settings
+
+
+@dataclass(frozen=True)
+class ResolvedPrincipal:
+    """Authenticated caller + its user_profiles row (JWT mode)."""
+
+    user_id: UUID
+    profile_id: Optional[str]
+    company_code: Optional[str]
+    patient_id: Optional[str]
+    staff_id: Optional[str]
+    actor_type: Optional[str]
+    email: Optional[str]
+    is_active: bool
+
+    @classmethod
+    def from_profile(cls, user_id: UUID, profile: Dict[str, Any]) -> "ResolvedPrincipal":
+        pid = profile.get("patient_id")
+        sid = profile.get("staff_id")
+        return cls(
+            user_id=user_id,
+            profile_id=str(profile["profile_id"]) if profile.get("profile_id") else None,
+            company_code=profile.get("company_code"),
+            patient_id=str(pid) if pid else None,
+            staff_id=str(sid) if sid else None,
+            actor_type=profile.get("actor_type"),
+            email=profile.get("email"),
+            is_active=profile.get("is_active") is not False,
+        )
+
+
+class PrincipalCache:
+    """
+    TTL + LRU cache of resolved principals keyed by JWT `sub`.
+
+    - filled by auth.current_principal (one user_profiles query on miss)
+    - invalidated by UserProfilesService writes (create/update/delete)
+    - TTL bounds staleness for profile writes made by other workers
+    - thread-safe: sync (threadpool) routes write, async deps read
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._items: "OrderedDict[str, Tuple[float, ResolvedPrincipal]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = float(get_settings().PRINCIPAL_CACHE_TTL_SECONDS)
+        return self._ttl_seconds
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is None:
+            self._max_entries = int(get_settings().PRINCIPAL_CACHE_MAX_ENTRIES)
+        return self._max_entries
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, sub: str) -> Optional[ResolvedPrincipal]:
+        if self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._items.get(sub)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, principal = entry
+            if time.monotonic() >= expires_at:
+                del self._items[sub]
+                self.misses += 1
+                return None
+            self._items.move_to_end(sub)
+            self.hits += 1
+            return principal
+
+    def put(self, sub: str, principal: ResolvedPrincipal, *, generation: Optional[int] = None) -> None:
+        """Store a principal; skipped when an invalidation happened after `generation` was read."""
+        ttl = self.ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._items[sub] = (time.monotonic() + ttl, principal)
+            self._items.move_to_end(sub)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def invalidate(self, sub: Optional[Any] = None) -> None:
+        """Drop one user (by `sub` / user_id) or, when unknown, everything."""
+        with self._lock:
+            self._generation += 1
+            if sub is None:
+                self._items.clear()
+            else:
+                self._items.pop(str(sub), None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,95 @@
+# app/api/v1/authen/token_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import get_settings
+
+
+class VerifiedTokenCache:
+    """
+    Bounded cache: token digest -> verified claims, valid until the token's `exp`.
+
+    - key material = keyed BLAKE2b(token, secret + audience); raw tokens are never stored
+    - lookup by digest prefix, then hmac.compare_digest on the full digest
+    - entries expire at `exp` (tokens without `exp` are not cached)
+    - LRU eviction at VERIFIED_TOKEN_CACHE_MAX_ENTRIES
+    - hits / misses / expired / evictions for cache effectiveness
+    """
+
+    _PREFIX = 16  # hex chars used as dict key
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries = max_entries
+        self._items: "OrderedDict[str, Tuple[str, float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is None:
+            self._max_entries = int(get_settings().VERIFIED_TOKEN_CACHE_MAX_ENTRIES)
+        return self._max_entries
+
+    @staticmethod
+    def digest(token: str, secret: str, audience: str) -> str:
+        key = hashlib.sha256(f"{secret}\x00{audience}".encode("utf-8")).digest()
+        return hashlib.blake2b(token.encode("utf-8"), key=key, digest_size=32).hexdigest()
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        if self.max_entries <= 0:
+            return None
+        key = digest[: self._PREFIX]
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None or not hmac.compare_digest(entry[0], digest):
+                self.misses += 1
+                return None
+            _, exp, claims = entry
+            if time.time() >= exp:
+                del self._items[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return dict(claims)
+
+    def put(self, digest: str, claims: Dict[str, Any]) -> None:
+        exp = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+        key = digest[: self._PREFIX]
+        with self._lock:
+            self._items[key] = (digest, float(exp), claims)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+verified_token_cache = VerifiedTokenCache()
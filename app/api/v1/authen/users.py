@@ -1,6 +1,4 @@
 from app.services.supabase_client import supabase
-from app.core.config import get_settings
-settings = get_settings()  # ✅ โหลดค่าจาก .env ผ่าน config
 
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
 import json
@@ -169,6 +169,22 @@ class ListPayload(ORMBaseModel, Generic[T]):
     aggregations: Optional[Dict[str, Any]] = None  # e.g. {"active": 10, "inactive": 2}
 
     items: list[T] = Field(default_factory=list)
+
+
+# ----------------------------------------------------------
+# Typeahead (/suggest) — deliberately NOT wrapped in the success envelope
+# ----------------------------------------------------------
+class SuggestItem(BaseModel):
+    id: str
+    label: str
+
+
+class SuggestPayload(BaseModel):
+    """Picker response: {"q": "...", "items": [{"id", "label"}]} — top-K only, no paging / count."""
+
+    q: str
+    items: list[SuggestItem] = Field(default_factory=list)
+
     
 # ----------------------------------------------------------
 # (Optional) Page-based pagination (if you still need it)
@@ -36,6 +36,27 @@ class AIConsultActionsRepository:
         )
         return (await self.db.execute(q)).scalar_one_or_none()
 
+    @staticmethod
+    def build_content_json(
+        *,
+        topic_code: str,
+        action: str,
+        items: list[str],
+        disclaimer: str,
+        triage: dict[str, Any],
+        ui_cards: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        return {
+            "quick_action": action,
+            "topic_code": topic_code,
+            "items": items,
+            "disclaimer": disclaimer,
+            "triage": triage,
+            "ui_cards": ui_cards,
+            "retrieval": None,
+            "source": "ai_topics.default_cards",
+        }
+
     async def add_assistant_message(
         self,
         *,
@@ -56,16 +77,14 @@ class AIConsultActionsRepository:
             session_id=sid,
             role="assistant",
             content=assistant_text,
-            content_json={
-                "quick_action": action,
-                "topic_code": topic_code,
-                "items": items,
-                "disclaimer": disclaimer,
-                "triage": triage,
-                "ui_cards": ui_cards,
-                "retrieval": None,
-                "source": "ai_topics.default_cards",
-            },
+            content_json=self.build_content_json(
+                topic_code=topic_code,
+                action=action,
+                items=items,
+                disclaimer=disclaimer,
+                triage=triage,
+                ui_cards=ui_cards,
+            ),
         )
         self.db.add(msg)
         return msg
@@ -7,6 +7,8 @@ from uuid import UUID
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.utils.search_text import escape_like
+
 
 class AITopicCategoriesRepository:
     def __init__(self, db: AsyncSession):
@@ -43,15 +45,16 @@ class AITopicCategoriesRepository:
             where.append(
                 """
                 (
-                    category_code ILIKE :q
-                    OR category_name_th ILIKE :q
-                    OR category_name_en ILIKE :q
-                    OR COALESCE(description_th, '') ILIKE :q
-                    OR COALESCE(description_en, '') ILIKE :q
+                    COALESCE(category_code, '') ILIKE :q ESCAPE '\\'
+                    OR category_name_th ILIKE :q ESCAPE '\\'
+                    OR category_name_en ILIKE :q ESCAPE '\\'
+                    OR COALESCE(description_th, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(description_en, '') ILIKE :q ESCAPE '\\'
                 )
                 """
             )
-            params["q"] = f"%{q}%"
+            # literal substring, as CategoryCatalog.search matches it
+            params["q"] = f"%{escape_like(q.strip())}%"
 
         where_sql = " AND ".join(where)
 
@@ -87,7 +90,7 @@ class AITopicCategoriesRepository:
                 updated_by
             FROM public.ai_topic_categories
             WHERE {where_sql}
-            ORDER BY sort_order ASC, category_name_th ASC
+            ORDER BY sort_order ASC, category_name_th ASC, id ASC
             LIMIT :limit OFFSET :offset
             """
         )
@@ -99,6 +102,45 @@ class AITopicCategoriesRepository:
         rows = [dict(row._mapping) for row in result.fetchall()]
         return rows, total
 
+    async def list_catalog_rows(self, *, company_code: Optional[str]) -> list[dict[str, Any]]:
+        """Every non-deleted category the company sees (own + global), list_categories columns; see AITopicCatalog."""
+        if company_code:
+            scope_sql = "(company_code = :company_code OR company_code IS NULL)"
+            params: dict[str, Any] = {"company_code": company_code}
+        else:
+            scope_sql = "company_code IS NULL"
+            params = {}
+
+        sql = text(
+            f"""
+            SELECT
+                id,
+                company_code,
+                category_code,
+                category_name_th,
+                category_name_en,
+                description_th,
+                description_en,
+                parent_category_id,
+                icon_name,
+                color_code,
+                sort_order,
+                is_active,
+                is_system,
+                is_deleted,
+                metadata,
+                created_at,
+                updated_at,
+                created_by,
+                updated_by
+            FROM public.ai_topic_categories
+            WHERE is_deleted = false
+              AND {scope_sql}
+            """
+        )
+        result = await self.db.execute(sql, params)
+        return [dict(row._mapping) for row in result.fetchall()]
+
     async def get_by_id(
         self,
         *,
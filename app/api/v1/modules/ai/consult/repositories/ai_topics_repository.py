@@ -6,6 +6,8 @@ from uuid import UUID
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.utils.search_text import escape_like
+
 
 class AITopicsRepository:
     def __init__(self, db: AsyncSession):
@@ -57,20 +59,21 @@ class AITopicsRepository:
             where.append(
                 """
                 (
-                    COALESCE(t.topic_code, '') ILIKE :q
-                    OR COALESCE(t.label_th, '') ILIKE :q
-                    OR COALESCE(t.label_en, '') ILIKE :q
-                    OR COALESCE(t.topic_name_th, '') ILIKE :q
-                    OR COALESCE(t.topic_name_en, '') ILIKE :q
-                    OR COALESCE(t.description_th, '') ILIKE :q
-                    OR COALESCE(t.description_en, '') ILIKE :q
-                    OR COALESCE(c.category_code, '') ILIKE :q
-                    OR COALESCE(c.category_name_th, '') ILIKE :q
-                    OR COALESCE(c.category_name_en, '') ILIKE :q
+                    COALESCE(t.topic_code, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(t.label_th, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(t.label_en, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(t.topic_name_th, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(t.topic_name_en, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(t.description_th, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(t.description_en, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(c.category_code, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(c.category_name_th, '') ILIKE :q ESCAPE '\\'
+                    OR COALESCE(c.category_name_en, '') ILIKE :q ESCAPE '\\'
                 )
                 """
             )
-            params["q"] = f"%{q.strip()}%"
+            # literal substring: % and _ in q are not wildcards (same as TopicCatalog.search)
+            params["q"] = f"%{escape_like(q.strip())}%"
 
         where_sql = " AND ".join(where)
 
@@ -148,6 +151,61 @@ class AITopicsRepository:
         rows = [dict(row._mapping) for row in result.fetchall()]
         return rows, total
 
+    async def list_catalog_rows(self, *, company_code: Optional[str]) -> list[dict[str, Any]]:
+        """Every non-deleted topic the company sees (own + global), with its category; see AITopicCatalog."""
+        if company_code:
+            scope_sql = "(t.company_code = :company_code OR t.company_code IS NULL)"
+            params: dict[str, Any] = {"company_code": company_code}
+        else:
+            scope_sql = "t.company_code IS NULL"
+            params = {}
+
+        sql = text(
+            f"""
+            SELECT
+                t.id,
+                t.company_code,
+                t.topic_code,
+                t.label_th,
+                t.label_en,
+                t.topic_name_th,
+                t.topic_name_en,
+                t.description_th,
+                t.description_en,
+                t.default_cards,
+                t.is_active,
+                t.sort_order,
+                t.created_at,
+                t.updated_at,
+                t.ai_topic_category_id,
+                t.intent_code,
+                t.topic_type,
+                t.topic_level,
+                t.output_format,
+                t.action_type,
+                t.requires_auth,
+                t.requires_patient_context,
+                t.requires_booking_context,
+                t.requires_payment_context,
+                t.requires_service_context,
+                t.is_system,
+                t.is_default,
+                t.version_no,
+                c.category_code,
+                c.category_name_th,
+                c.category_name_en,
+                c.parent_category_id
+            FROM public.ai_topics t
+            LEFT JOIN public.ai_topic_categories c
+                ON c.id = t.ai_topic_category_id
+            WHERE t.is_deleted = false
+              AND {scope_sql}
+            ORDER BY t.topic_code ASC
+            """
+        )
+        result = await self.db.execute(sql, params)
+        return [dict(row._mapping) for row in result.fetchall()]
+
 
     async def get_topic_cards(
         self,
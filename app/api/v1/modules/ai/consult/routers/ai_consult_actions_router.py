@@ -3,6 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Path
+from fastapi.responses import StreamingResponse
 
 from app.utils.ResponseHandler import UnicodeJSONResponse
 from app.utils.api_response import ApiResponse
@@ -16,6 +17,7 @@ from app.api.v1.modules.ai.consult.services.ai_consult_actions_service import (
 from app.api.v1.modules.chat.models._envelopes.chat_envelopes import (
     ChatSendMessageEnvelope,
 )
+from app.services.reply_stream import SSE_HEADERS, stream_reply
 
 router = APIRouter()
 
@@ -40,6 +42,35 @@ def _forbidden_patient_id():
     )
 
 
+def _quick_action_error(result, session_id: UUID):
+    if result == "SESSION_NOT_FOUND":
+        return ApiResponse.err(
+            data_key="NOT_FOUND",
+            default_code="DATA_001",
+            default_message="Session not found.",
+            details={"session_id": str(session_id)},
+            status_code=404,
+        )
+
+    if result == "TOPIC_NOT_SET":
+        return ApiResponse.err(
+            data_key="INVALID",
+            default_code="DATA_002",
+            default_message="Topic not set on session.",
+            details={"session_id": str(session_id)},
+            status_code=400,
+        )
+
+    if result == "TOPIC_NOT_FOUND":
+        return ApiResponse.err(
+            data_key="NOT_FOUND",
+            default_code="DATA_001",
+            default_message="Topic not found.",
+            status_code=404,
+        )
+    return None
+
+
 @router.post(
     "/{session_id}/quick",
     response_class=UnicodeJSONResponse,
@@ -68,34 +99,76 @@ async def quick_action(
         lang=body.lang,
     )
 
-    if result == "SESSION_NOT_FOUND":
-        return ApiResponse.err(
-            data_key="NOT_FOUND",
-            default_code="DATA_001",
-            default_message="Session not found.",
-            details={"session_id": str(session_id)},
-            status_code=404,
-        )
-
-    if result == "TOPIC_NOT_SET":
-        return ApiResponse.err(
-            data_key="INVALID",
-            default_code="DATA_002",
-            default_message="Topic not set on session.",
-            details={"session_id": str(session_id)},
-            status_code=400,
-        )
-
-    if result == "TOPIC_NOT_FOUND":
-        return ApiResponse.err(
-            data_key="NOT_FOUND",
-            default_code="DATA_001",
-            default_message="Topic not found.",
-            status_code=404,
-        )
+    error = _quick_action_error(result, session_id)
+    if error is not None:
+        return error
 
     return ApiResponse.ok(
         success_key="CREATE_SUCCESS",
         default_message="Quick action completed successfully.",
         data=result,
-    )
\ No newline at end of file
+    )
+
+
+@router.post(
+    "/{session_id}/quick/stream",
+    response_class=StreamingResponse,
+    operation_id="quick_action_ai_consult_session_stream",
+    responses={200: {"content": {"text/event-stream": {}}, "description": "start -> delta* -> done (or error)"}},
+)
+async def quick_action_stream(
+    body: AIQuickActionRequest,
+    session_id: UUID = Path(...),
+    service: AIConsultActionsService = Depends(get_ai_consult_actions_service),
+    company_code: str | None = Depends(current_company_code),
+    patient_id: str | None = Depends(current_patient_id),
+):
+    """Same as /quick, but the assistant text is streamed as server-sent events."""
+    if not company_code:
+        return _unauthorized_company_code()
+
+    if not patient_id:
+        return _forbidden_patient_id()
+
+    result = await service.prepare_streamed_quick_action(
+        company_code=company_code,
+        patient_id=patient_id,
+        session_id=session_id,
+        action=body.action,
+        lang=body.lang,
+    )
+
+    error = _quick_action_error(result, session_id)
+    if error is not None:
+        return error
+
+    assistant_id = result["assistant_message_id"]
+
+    async def persist(text: str, status: str) -> None:
+        aborted = {} if status == "done" else {"stream_status": status}
+        await AIConsultActionsService.persist_streamed_quick_action(
+            company_code=company_code,
+            patient_id=patient_id,
+            session_id=session_id,
+            message_id=assistant_id,
+            content=text,
+            content_json={**result["content_json"], **aborted},
+        )
+
+    return StreamingResponse(
+        stream_reply(
+            prompt=body.action,
+            draft=result["assistant_text"],
+            lang=result["lang"],
+            start={"session_id": session_id, "assistant_message_id": assistant_id},
+            final={
+                "triage": result["triage"],
+                "ui_cards": result["ui_cards"],
+                "retrieval": None,
+                "assistant_message_id": assistant_id,
+            },
+            persist=persist,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from app.api.v1.modules.ai.consult.repositories.ai_consult_actions_repository import (
     AIConsultActionsRepository,
@@ -10,7 +10,9 @@ from app.api.v1.modules.ai.consult.services.ai_consult_service import (
     AITopicsService,
     get_ai_topic_cards,
     _action_title,
+    _to_uuid,
 )
+from app.api.v1.modules.chat.services.chat_service import ChatService
 
 
 class AIConsultActionsService:
@@ -116,7 +118,7 @@ class AIConsultActionsService:
 
         return triage, ui_cards
 
-    async def run_quick_action(
+    async def _compose_quick_action(
         self,
         *,
         company_code: str,
@@ -125,6 +127,7 @@ class AIConsultActionsService:
         action: str,
         lang: str | None = None,
     ) -> dict[str, Any] | str:
+        """Ownership + topic cards -> reply parts (no writes); error code string on failure."""
         sess = await self.repo.get_owned_session(
             company_code=company_code,
             patient_id=patient_id,
@@ -162,21 +165,51 @@ class AIConsultActionsService:
             items=items,
             lang=lang_norm,
         )
+        return {
+            "session": sess,
+            "topic_code": topic_code,
+            "lang": lang_norm,
+            "items": items,
+            "disclaimer": disclaimer,
+            "assistant_text": assistant_text,
+            "triage": triage,
+            "ui_cards": ui_cards,
+        }
 
+    async def run_quick_action(
+        self,
+        *,
+        company_code: str,
+        patient_id: str,
+        session_id: UUID | str,
+        action: str,
+        lang: str | None = None,
+    ) -> dict[str, Any] | str:
+        composed = await self._compose_quick_action(
+            company_code=company_code,
+            patient_id=patient_id,
+            session_id=session_id,
+            action=action,
+            lang=lang,
+        )
+        if isinstance(composed, str):
+            return composed
+
+        triage = composed["triage"]
         try:
             if triage:
-                await self.repo.set_session_triage(session=sess, triage=triage)
+                await self.repo.set_session_triage(session=composed["session"], triage=triage)
 
             await self.repo.add_assistant_message(
                 company_code=company_code,
                 session_id=session_id,
-                topic_code=topic_code,
+                topic_code=composed["topic_code"],
                 action=action,
-                items=items,
-                disclaimer=disclaimer,
-                assistant_text=assistant_text,
+                items=composed["items"],
+                disclaimer=composed["disclaimer"],
+                assistant_text=composed["assistant_text"],
                 triage=triage,
-                ui_cards=ui_cards,
+                ui_cards=composed["ui_cards"],
             )
 
             await self.repo.commit()
@@ -186,8 +219,69 @@ class AIConsultActionsService:
             raise
 
         return {
-            "assistant_text": assistant_text,
+            "assistant_text": composed["assistant_text"],
             "triage": triage,
-            "ui_cards": ui_cards,
+            "ui_cards": composed["ui_cards"],
+            "retrieval": None,
+        }
+
+    async def prepare_streamed_quick_action(
+        self,
+        *,
+        company_code: str,
+        patient_id: str,
+        session_id: UUID | str,
+        action: str,
+        lang: str | None = None,
+    ) -> dict[str, Any] | str:
+        """
+        Streaming variant, step 1 (reads only): the draft reply, its content_json and a pre-allocated
+        assistant message id; the request transaction is closed before streaming starts.
+        """
+        composed = await self._compose_quick_action(
+            company_code=company_code,
+            patient_id=patient_id,
+            session_id=session_id,
+            action=action,
+            lang=lang,
+        )
+        if isinstance(composed, str):
+            return composed
+        await self.repo.rollback()  # end the read transaction; nothing to write yet
+
+        return {
+            "assistant_message_id": uuid4(),
+            "lang": composed["lang"],
+            "assistant_text": composed["assistant_text"],
+            "triage": composed["triage"],
+            "ui_cards": composed["ui_cards"],
             "retrieval": None,
-        }
\ No newline at end of file
+            "content_json": AIConsultActionsRepository.build_content_json(
+                topic_code=composed["topic_code"],
+                action=action,
+                items=composed["items"],
+                disclaimer=composed["disclaimer"],
+                triage=composed["triage"],
+                ui_cards=composed["ui_cards"],
+            ),
+        }
+
+    @staticmethod
+    async def persist_streamed_quick_action(
+        *,
+        company_code: str,
+        patient_id: str,
+        session_id: UUID | str,
+        message_id: UUID,
+        content: str,
+        content_json: dict[str, Any],
+    ) -> None:
+        """Streaming variant, step 2 (background): same single-statement write as a chat reply."""
+        await ChatService.persist_assistant_message(
+            company_code=company_code,
+            patient_id=_to_uuid(patient_id),
+            session_id=_to_uuid(session_id),
+            message_id=message_id,
+            content=content,
+            content_json=content_json,
+        )
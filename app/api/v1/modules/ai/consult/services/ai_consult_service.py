@@ -11,6 +11,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 
 from app.db.models.ai_topics import AITopic
 from app.api.v1.modules.chat.models.chat_models import ChatSession, ChatMessage
+from app.services.schema_capabilities import schema_capabilities
 from app.api.v1.modules.ai.consult.models.dtos import (
     AITopicItem,
     AITopicsList,
@@ -20,6 +21,10 @@ from app.api.v1.modules.ai.consult.models.dtos import (
 from app.api.v1.modules.ai.consult.repositories.ai_topics_repository import (
     AITopicsRepository,
 )
+from app.api.v1.modules.ai.consult.services.ai_topic_catalog import (
+    TopicCatalog,
+    ai_topic_catalog,
+)
 
 DEFAULT_DISCLAIMER_TH = (
     "ข้อมูลทั่วไปเพื่อการให้ความรู้ ไม่ใช่คำแนะนำทางการแพทย์ "
@@ -138,6 +143,18 @@ class AITopicsService:
                     cards.cause = [str(x) for x in items]
         return cards
 
+    async def _catalog(self, company_code: Optional[str], lang_norm: str) -> Optional[TopicCatalog]:
+        """Compiled catalog for (company, lang); None when AI_TOPIC_CATALOG_TTL_SECONDS=0."""
+        if not ai_topic_catalog.enabled:
+            return None
+        return await ai_topic_catalog.get(
+            company_code,
+            lang_norm,
+            lambda: self.repo.list_catalog_rows(company_code=company_code),
+            map_item=self._map_item,
+            parse_cards=self._parse_default_cards,
+        )
+
     async def list_topics(
         self,
         *,
@@ -154,6 +171,21 @@ class AITopicsService:
         sort_dir: str,
     ) -> tuple[AITopicsList, int]:
         lang_norm = self._norm_lang(lang)
+        catalog = await self._catalog(company_code, lang_norm)
+        if catalog is not None:
+            items, total = catalog.search(
+                category_id=category_id,
+                category_code=category_code,
+                q=q,
+                is_active=is_active,
+                include_uncategorized=include_uncategorized,
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+            )
+            return AITopicsList(items=items), total
+
         rows, total = await self.repo.list_topics(
             company_code=company_code,
             category_id=category_id,
@@ -178,18 +210,25 @@ class AITopicsService:
         lang: str | None,
     ) -> Optional[AITopicCardsPayload]:
         lang_norm = self._norm_lang(lang)
-        row = await self.repo.get_topic_cards(
-            company_code=company_code,
-            topic_code=topic_code,
-        )
-        if not row:
-            return None
+        catalog = await self._catalog(company_code, lang_norm)
+        if catalog is not None:
+            found = catalog.cards(topic_code)
+            if not found:
+                return None
+            code, cards = found
+        else:
+            row = await self.repo.get_topic_cards(
+                company_code=company_code,
+                topic_code=topic_code,
+            )
+            if not row:
+                return None
+            code, cards = row["topic_code"], self._parse_default_cards(row.get("default_cards"))
 
-        cards = self._parse_default_cards(row.get("default_cards"))
         disclaimer = DEFAULT_DISCLAIMER_EN if lang_norm == "EN" else DEFAULT_DISCLAIMER_TH
 
         return AITopicCardsPayload(
-            topic_code=row["topic_code"],
+            topic_code=code,
             cards=cards,
             disclaimer=disclaimer,
         )
@@ -370,23 +409,20 @@ async def get_ai_topic_cards(
     repo = AITopicsRepository(db)
     service = AITopicsService(repo)
 
-    row = await repo.get_topic_cards(
+    payload = await service.get_topic_cards(
         company_code=company_code,
         topic_code=topic_code,
+        lang=lang,
     )
-    if not row:
+    if not payload:
         return None
 
-    lang_norm = service._norm_lang(lang)
-    cards = service._parse_default_cards(row.get("default_cards"))
-    disclaimer = DEFAULT_DISCLAIMER_EN if lang_norm == "EN" else DEFAULT_DISCLAIMER_TH
-
     class _TopicLite:
         def __init__(self, topic_code: str):
             self.topic_code = topic_code
 
-    topic = _TopicLite(topic_code=row["topic_code"])
-    return topic, cards, disclaimer
+    topic = _TopicLite(topic_code=payload.topic_code)
+    return topic, payload.cards, payload.disclaimer
 
 
 async def run_quick_action(
@@ -552,30 +588,36 @@ async def create_escalation_handoff(
 
     escalation_id: str | None = None
 
-    try:
-        rpc_sql = text(
-            "select public.rpc_request_escalation(:sid, :triage_level, :reason, :metadata) as escalation_id"
-        ).bindparams(bindparam("metadata", type_=JSONB))
-
-        res = await db.execute(
-            rpc_sql,
-            {
-                "sid": sid,
-                "triage_level": final_triage,
-                "reason": final_reason,
-                "metadata": meta,
-            },
-        )
-        escalation_id = _safe_str(res.scalar_one_or_none())
+    # RPC only where the database has it (probed once, see schema_capabilities);
+    # elsewhere insert directly instead of a failing call + rollback per escalation
+    await schema_capabilities.ensure(db)
+    if schema_capabilities.has_function("public.rpc_request_escalation"):
+        try:
+            rpc_sql = text(
+                "select public.rpc_request_escalation(:sid, :triage_level, :reason, :metadata) as escalation_id"
+            ).bindparams(bindparam("metadata", type_=JSONB))
+
+            res = await db.execute(
+                rpc_sql,
+                {
+                    "sid": sid,
+                    "triage_level": final_triage,
+                    "reason": final_reason,
+                    "metadata": meta,
+                },
+            )
+            escalation_id = _safe_str(res.scalar_one_or_none())
 
-        if not escalation_id:
-            raise RuntimeError("rpc_request_escalation returned null")
+            if not escalation_id:
+                raise RuntimeError("rpc_request_escalation returned null")
 
-        await db.commit()
+            await db.commit()
 
-    except Exception:
-        await db.rollback()
+        except Exception:
+            await db.rollback()
+            escalation_id = None
 
+    if not escalation_id:
         insert_sql = text(
             """
             insert into public.chat_escalations
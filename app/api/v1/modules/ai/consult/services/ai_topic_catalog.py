@@ -0,0 +1,367 @@
+# app/api/v1/modules/ai/consult/services/ai_topic_catalog.py
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+from app.api.v1.modules.ai.consult.models.dtos import AITopicCards, AITopicItem
+
+logger = get_service_logger("service.ai_topic_catalog")
+
+# topics without company_code (global catalog) are the only ones a NULL company sees
+GLOBAL_SCOPE = "*"
+LANGS = ("TH", "EN")
+
+# same columns AITopicsRepository.list_topics matches with ILIKE (escaped: a literal, case-insensitive substring)
+SEARCH_FIELDS = (
+    "topic_code",
+    "label_th",
+    "label_en",
+    "topic_name_th",
+    "topic_name_en",
+    "description_th",
+    "description_en",
+    "category_code",
+    "category_name_th",
+    "category_name_en",
+)
+SORT_FIELDS = ("sort_order", "topic_code", "label_th", "label_en", "created_at", "updated_at", "category_code")
+# same columns AITopicCategoriesRepository.list_categories matches
+CATEGORY_SEARCH_FIELDS = ("category_code", "category_name_th", "category_name_en", "description_th", "description_en")
+
+Loader = Callable[[], Awaitable[List[Dict[str, Any]]]]
+MapItem = Callable[[Dict[str, Any], str], AITopicItem]
+MapCategory = Callable[[Dict[str, Any]], Any]
+ParseCards = Callable[[object], AITopicCards]
+
+
+@dataclass(frozen=True)
+class CompiledTopic:
+    item: AITopicItem  # labels already picked for the catalog's language; shared, read-only
+    haystack: str  # lower-cased search fields, \x1f separated (a match never spans two fields)
+    category_id: Optional[str]
+    category_code: Optional[str]
+    is_active: bool
+    sort_values: Dict[str, Any]
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    # NULLS LAST ascending / NULLS FIRST descending, as PostgreSQL orders them
+    return (value is None, value)
+
+
+class TopicCatalog:
+    """
+    One company's non-deleted topics (own + global) for one language, joined with their category.
+
+    search() answers the same filters / sort / paging as AITopicsRepository.list_topics; text sorts
+    use code point order instead of the database collation. cards() answers get_topic_cards: active
+    topics only, the company's own topic before a global one with the same code.
+    """
+
+    __slots__ = ("lang", "version", "loaded_at", "topics", "_cards")
+
+    def __init__(
+        self,
+        lang: str,
+        topics: List[CompiledTopic],
+        cards: Dict[str, Tuple[str, AITopicCards]],
+        *,
+        version: int,
+    ):
+        self.lang = lang
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.topics = topics  # topic_code order: the tie-break of every sort
+        self._cards = cards
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def search(
+        self,
+        *,
+        category_id: Optional[UUID],
+        category_code: Optional[str],
+        q: Optional[str],
+        is_active: Optional[bool],
+        include_uncategorized: bool,
+        limit: int,
+        offset: int,
+        sort_by: str,
+        sort_dir: str,
+    ) -> Tuple[List[AITopicItem], int]:
+        cid = str(category_id) if category_id else None
+        needle = q.strip().lower() if q else ""
+        categorized_only = not include_uncategorized and not category_id and not category_code
+
+        found = [
+            t
+            for t in self.topics
+            if (is_active is None or t.is_active == is_active)
+            and (not cid or t.category_id == cid)
+            and (not category_code or t.category_code == category_code)
+            and (not categorized_only or t.category_id is not None)
+            and (not needle or needle in t.haystack)
+        ]
+        field = sort_by if sort_by in SORT_FIELDS else "sort_order"
+        # stable: equal keys keep topic_code order in both directions
+        found.sort(key=lambda t: _sort_key(t.sort_values[field]), reverse=str(sort_dir).lower() == "desc")
+        return [t.item for t in found[offset : offset + limit]], len(found)
+
+    def cards(self, topic_code: str) -> Optional[Tuple[str, AITopicCards]]:
+        """(topic_code, parsed default_cards); the cards object is shared, read-only."""
+        return self._cards.get(topic_code)
+
+
+@dataclass(frozen=True)
+class CompiledCategory:
+    item: Any  # AIConsultTopicCategoryItem (TH and EN names): shared, read-only
+    haystack: str
+    parent_category_id: Optional[str]
+    is_active: bool
+
+
+class CategoryCatalog:
+    """
+    One company's non-deleted categories (own + global). Not per language: items carry both names.
+
+    search() answers the same filters / paging as AITopicCategoriesRepository.list_categories, in its
+    order (sort_order, category_name_th, id).
+    """
+
+    __slots__ = ("version", "loaded_at", "categories")
+
+    def __init__(self, categories: List[CompiledCategory], *, version: int):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def search(
+        self,
+        *,
+        is_active: Optional[bool],
+        q: Optional[str],
+        parent_category_id: Optional[UUID],
+        limit: int,
+        offset: int,
+    ) -> Tuple[List[Any], int]:
+        pid = str(parent_category_id) if parent_category_id else None
+        needle = q.strip().lower() if q else ""
+        found = [
+            c
+            for c in self.categories
+            if (is_active is None or c.is_active == is_active)
+            and (not pid or c.parent_category_id == pid)
+            and (not needle or needle in c.haystack)
+        ]
+        return [c.item for c in found[offset : offset + limit]], len(found)
+
+
+def compile_categories(rows: List[Dict[str, Any]], *, version: int, map_item: MapCategory) -> CategoryCatalog:
+    rows = sorted(
+        rows, key=lambda r: (_sort_key(r.get("sort_order")), _sort_key(r.get("category_name_th")), str(r["id"]))
+    )
+    return CategoryCatalog(
+        [
+            CompiledCategory(
+                item=map_item(r),
+                haystack="\x1f".join(str(r.get(f) or "").lower() for f in CATEGORY_SEARCH_FIELDS),
+                parent_category_id=str(r["parent_category_id"]) if r.get("parent_category_id") else None,
+                is_active=bool(r.get("is_active", True)),
+            )
+            for r in rows
+        ],
+        version=version,
+    )
+
+
+def compile_catalogs(
+    rows: List[Dict[str, Any]],
+    *,
+    company_code: Optional[str],
+    version: int,
+    map_item: MapItem,
+    parse_cards: ParseCards,
+) -> Dict[str, TopicCatalog]:
+    """One TopicCatalog per language from one load; default_cards are parsed once and shared."""
+    rows = sorted(rows, key=lambda r: r.get("topic_code") or "")
+
+    cards: Dict[str, Tuple[str, AITopicCards]] = {}
+    ranked = sorted(
+        (r for r in rows if r.get("is_active")),
+        key=lambda r: (r.get("company_code") != company_code, r.get("sort_order") or 0),
+    )
+    for r in ranked:
+        code = r["topic_code"]
+        if code not in cards:
+            cards[code] = (code, parse_cards(r.get("default_cards")))
+
+    shared = [
+        (
+            "\x1f".join(str(r.get(f) or "").lower() for f in SEARCH_FIELDS),
+            str(r["ai_topic_category_id"]) if r.get("ai_topic_category_id") else None,
+            r.get("category_code"),
+            bool(r.get("is_active", True)),
+            {f: r.get(f) for f in SORT_FIELDS},
+        )
+        for r in rows
+    ]
+    return {
+        lang: TopicCatalog(
+            lang,
+            [
+                CompiledTopic(
+                    item=map_item(r, lang),
+                    haystack=haystack,
+                    category_id=category_id,
+                    category_code=category_code,
+                    is_active=is_active,
+                    sort_values=sort_values,
+                )
+                for r, (haystack, category_id, category_code, is_active, sort_values) in zip(rows, shared)
+            ],
+            cards,
+            version=version,
+        )
+        for lang in LANGS
+    }
+
+
+class AITopicCatalog:
+    """
+    Compiled topic catalogs per (company_code, lang) for /ai-consult/topics search and cards, and
+    the company's category catalog for the category list.
+
+    - built lazily on first lookup: one query for all of the company's topics, compiled for every
+      language at once (labels picked, default_cards parsed, search text lower-cased)
+    - category / topic-service writes call invalidate(): the next lookup rebuilds
+    - TTL bounds staleness for writes made by other workers or directly in the database;
+      AI_TOPIC_CATALOG_TTL_SECONDS=0 turns the catalog off (one query per request, as before)
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self._ttl_seconds = ttl_seconds
+        self._catalogs: Dict[Tuple[str, str], TopicCatalog] = {}
+        self._categories: Dict[str, CategoryCatalog] = {}
+        self._versions: Dict[str, int] = {}
+        self._generation = 0  # bumped by invalidate(None): every scope
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = float(get_settings().AI_TOPIC_CATALOG_TTL_SECONDS)
+        return self._ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def version(self, scope: str) -> int:
+        return self._generation + self._versions.get(scope, 0)
+
+    def _is_fresh(self, scope: str, catalog: Optional[TopicCatalog | CategoryCatalog]) -> bool:
+        return (
+            catalog is not None
+            and catalog.version == self.version(scope)
+            and (time.monotonic() - catalog.loaded_at) < self.ttl_seconds
+        )
+
+    async def get(
+        self,
+        company_code: Optional[str],
+        lang: str,
+        loader: Loader,
+        *,
+        map_item: MapItem,
+        parse_cards: ParseCards,
+    ) -> TopicCatalog:
+        scope = company_code or GLOBAL_SCOPE
+        catalog = self._catalogs.get((scope, lang))
+        if self._is_fresh(scope, catalog):
+            self.hits += 1
+            return catalog
+
+        self.misses += 1
+        lock = self._locks.setdefault(scope, asyncio.Lock())
+        async with lock:
+            catalog = self._catalogs.get((scope, lang))
+            if self._is_fresh(scope, catalog):
+                return catalog
+
+            version = self.version(scope)
+            t0 = time.perf_counter()
+            rows = await loader()
+            built = compile_catalogs(
+                rows, company_code=company_code, version=version, map_item=map_item, parse_cards=parse_cards
+            )
+            # a write landed while loading -> serve this result once, do not keep it
+            if version == self.version(scope):
+                for lng, c in built.items():
+                    self._catalogs[(scope, lng)] = c
+            logger.info(
+                "ai topic catalog built scope=%s topics=%d elapsed_ms=%.1f",
+                scope, len(rows), (time.perf_counter() - t0) * 1000,
+            )
+            return built[lang]
+
+    async def get_categories(self, company_code: Optional[str], loader: Loader, *, map_item: MapCategory) -> CategoryCatalog:
+        scope = company_code or GLOBAL_SCOPE
+        catalog = self._categories.get(scope)
+        if self._is_fresh(scope, catalog):
+            self.hits += 1
+            return catalog
+
+        self.misses += 1
+        async with self._locks.setdefault(scope, asyncio.Lock()):
+            catalog = self._categories.get(scope)
+            if self._is_fresh(scope, catalog):
+                return catalog
+
+            version = self.version(scope)
+            rows = await loader()
+            built = compile_categories(rows, version=version, map_item=map_item)
+            if version == self.version(scope):
+                self._categories[scope] = built
+            logger.info("ai topic category catalog built scope=%s categories=%d", scope, len(rows))
+            return built
+
+    def invalidate(self, company_code: Optional[str] = None) -> None:
+        """Rebuild the company's catalogs on the next lookup; None: every company (global topics / categories)."""
+        if company_code:
+            self._versions[company_code] = self._versions.get(company_code, 0) + 1
+            for lang in LANGS:
+                self._catalogs.pop((company_code, lang), None)
+            self._categories.pop(company_code, None)
+        else:
+            self._generation += 1
+            self._catalogs.clear()
+            self._categories.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "catalogs": {
+                f"{scope}:{lang}": {"topics": len(c), "version": c.version}
+                for (scope, lang), c in self._catalogs.items()
+            },
+            "categories": {scope: {"categories": len(c), "version": c.version} for scope, c in self._categories.items()},
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+ai_topic_catalog = AITopicCatalog()
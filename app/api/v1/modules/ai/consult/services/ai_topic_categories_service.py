@@ -18,6 +18,7 @@ from app.api.v1.modules.ai.consult.models.ai_consult_topic_categories_dtos impor
 from app.api.v1.modules.ai.consult.repositories.ai_topic_categories_repository import (
     AITopicCategoriesRepository,
 )
+from app.api.v1.modules.ai.consult.services.ai_topic_catalog import ai_topic_catalog
 
 
 class AITopicCategoriesService:
@@ -61,6 +62,21 @@ class AITopicCategoriesService:
         limit: int,
         offset: int,
     ) -> tuple[AIConsultTopicCategoryListPayload, int]:
+        if ai_topic_catalog.enabled:
+            catalog = await ai_topic_catalog.get_categories(
+                company_code,
+                lambda: self.repo.list_catalog_rows(company_code=company_code),
+                map_item=self._map_item,
+            )
+            items, total = catalog.search(
+                is_active=is_active,
+                q=q,
+                parent_category_id=parent_category_id,
+                limit=limit,
+                offset=offset,
+            )
+            return AIConsultTopicCategoryListPayload(items=items), total
+
         rows, total = await self.repo.list_categories(
             company_code=company_code,
             is_active=is_active,
@@ -113,6 +129,9 @@ class AITopicCategoriesService:
             payload=payload,
             created_by=created_by,
         )
+        # category names / codes are compiled into every topic item; a shared (global) category
+        # reaches every company's catalog
+        ai_topic_catalog.invalidate()
         return AIConsultTopicCategoryCreatePayload(**row)
 
     async def update_category(
@@ -141,6 +160,7 @@ class AITopicCategoriesService:
         )
         if not row:
             return None
+        ai_topic_catalog.invalidate()
 
         return await self.get_detail(
             category_id=category_id,
@@ -179,6 +199,7 @@ class AITopicCategoriesService:
         )
         if not ok:
             return None
+        ai_topic_catalog.invalidate()
 
         return AIConsultTopicCategoryDeletePayload(id=category_id, deleted=True)
 
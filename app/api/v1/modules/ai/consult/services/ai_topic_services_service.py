@@ -13,6 +13,7 @@ from app.api.v1.modules.ai.consult.models.ai_consult_topic_services_dtos import
 from app.api.v1.modules.ai.consult.repositories.ai_topic_services_repository import (
     AITopicServicesRepository,
 )
+from app.api.v1.modules.ai.consult.services.ai_topic_catalog import ai_topic_catalog
 
 
 class AITopicServicesService:
@@ -119,6 +120,7 @@ class AITopicServicesService:
             payload=payload,
             created_by=created_by,
         )
+        ai_topic_catalog.invalidate(company_code)
         return AIConsultTopicServiceCreatePayload(**row)
 
     async def update_binding(
@@ -137,6 +139,7 @@ class AITopicServicesService:
         )
         if not row:
             return None
+        ai_topic_catalog.invalidate(company_code)
         return AIConsultTopicServiceDetailPayload(**self._map_item(row).model_dump())
 
     async def delete_binding(
@@ -153,4 +156,5 @@ class AITopicServicesService:
         )
         if not ok:
             return None
+        ai_topic_catalog.invalidate(company_code)
         return AIConsultTopicServiceDeletePayload(id=binding_id, deleted=True)
\ No newline at end of file
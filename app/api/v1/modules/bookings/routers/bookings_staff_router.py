@@ -1,7 +1,5 @@
 # app/api/v1/bookings/bookings_staff.py
 
-from app.core.config import get_settings
-settings = get_settings()
 
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
 from fastapi import APIRouter, HTTPException
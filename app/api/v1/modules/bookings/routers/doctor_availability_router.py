@@ -1,8 +1,6 @@
 from fastapi import APIRouter, Request, HTTPException, Response, Query, Depends
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
 from app.services.supabase_client import supabase
-from app.core.config import get_settings
-settings = get_settings()  # ✅ โหลดค่าจาก .env ผ่าน config
 from urllib.parse import unquote
 from pydantic import BaseModel
 from uuid import UUID
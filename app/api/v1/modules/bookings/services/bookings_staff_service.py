@@ -2,8 +2,6 @@
 
 from uuid import UUID
 from app.services.supabase_client import supabase
-from app.core.config import get_settings
-settings = get_settings()  # ✅ โหลดค่าจาก .env ผ่าน config
 
 # ==============================
 #booking staff
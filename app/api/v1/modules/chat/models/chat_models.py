@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Column, Text, Boolean, Integer, ForeignKey, DateTime, text
+from sqlalchemy import Column, Text, Boolean, Integer, ForeignKey, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 
@@ -42,7 +42,17 @@ class ChatSession(Base):
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        # history paging: keyset on (created_at, id) within one session, newest first
+        Index(
+            "ix_chat_messages_session_history",
+            "company_code",
+            "session_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        {"schema": "public"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
 
@@ -38,6 +38,8 @@ class ChatSendMessagePayload(BaseModel):
     triage: dict[str, Any] = {}
     ui_cards: list[dict[str, Any]] = []
     retrieval: Optional[dict[str, Any]] = None
+    user_message_id: Optional[UUID] = None
+    assistant_message_id: Optional[UUID] = None
 
 
 class ChatCreateSessionPayload(BaseModel):
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, select, update, text, desc, func
+from sqlalchemy import Select, bindparam, select, update, text, desc, func, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.modules.chat.models.chat_models import ChatSession, ChatMessage
+from app.services.schema_capabilities import schema_capabilities
 
 
 @dataclass
@@ -194,12 +196,11 @@ class ChatRepository:
         - If view exists -> query it ORDER BY last_activity_at
         - Else -> query chat_sessions ORDER BY chat_sessions.last_activity_at
         NOTE: Do not attempt multiple failing queries inside one request.
+        View existence comes from schema_capabilities (probed at startup), not a per-call to_regclass.
         """
 
-        chk = await db.execute(text("SELECT to_regclass('public.vw_chat_sessions_summary')"))
-        view_name = chk.scalar_one_or_none()
-
-        if view_name:
+        await schema_capabilities.ensure(db)
+        if schema_capabilities.has_view("public.vw_chat_sessions_summary"):
             base_where = """
                 FROM public.vw_chat_sessions_summary
                 WHERE company_code = :cc
@@ -282,9 +283,9 @@ class ChatRepository:
         ]
         stmt: Select = select(ChatMessage).where(*conditions)
 
-        if hasattr(ChatMessage, "is_deleted"):
-            conditions.append(ChatMessage.is_deleted.is_(False))  # type: ignore[attr-defined]
-            stmt = stmt.where(ChatMessage.is_deleted.is_(False))  # type: ignore[attr-defined]
+        # is_deleted is mapped on ChatMessage: every select already requires the column
+        conditions.append(ChatMessage.is_deleted.is_(False))  # type: ignore[attr-defined]
+        stmt = stmt.where(ChatMessage.is_deleted.is_(False))  # type: ignore[attr-defined]
 
         if before is not None:
             conditions.append(ChatMessage.created_at < before)
@@ -298,6 +299,41 @@ class ChatRepository:
         res = await db.execute(stmt)
         return res.scalars().all(), int(total)
 
+    # columns a history page may return; id / created_at are always selected (they form the cursor)
+    HISTORY_FIELDS: tuple[str, ...] = ("id", "session_id", "role", "content", "content_json", "created_at")
+
+    @staticmethod
+    async def list_messages_page(
+        db: AsyncSession,
+        *,
+        company_code: str,
+        session_id: UUID,
+        limit: int = 50,
+        after: Optional[tuple[datetime, UUID]] = None,
+        fields: Sequence[str] = HISTORY_FIELDS,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        One keyset page of a session's messages, newest first: (rows, has_more).
+
+        `after` is the (created_at, id) of the last row of the previous page. No COUNT and no OFFSET,
+        so every page is an index range scan on ix_chat_messages_session_history; only `fields`
+        are selected (leave out content_json for a compact transcript).
+        """
+        wanted = {"id", "created_at", *fields}
+        cols = [getattr(ChatMessage, f).label(f) for f in ChatRepository.HISTORY_FIELDS if f in wanted]
+        stmt: Select = select(*cols).where(
+            ChatMessage.company_code == company_code,
+            ChatMessage.session_id == session_id,
+            ChatMessage.is_deleted.is_(False),
+        )
+
+        if after is not None:
+            stmt = stmt.where(tuple_(ChatMessage.created_at, ChatMessage.id) < tuple_(*after))
+
+        stmt = stmt.order_by(desc(ChatMessage.created_at), desc(ChatMessage.id)).limit(limit + 1)
+        rows = [dict(r) for r in (await db.execute(stmt)).mappings().all()]
+        return rows[:limit], len(rows) > limit
+
     @staticmethod
     async def insert_message(
         db: AsyncSession,
@@ -334,6 +370,73 @@ class ChatRepository:
         await db.refresh(m)
         return m
 
+    @staticmethod
+    async def append_messages(
+        db: AsyncSession,
+        *,
+        company_code: str,
+        patient_id: UUID,
+        session_id: UUID,
+        messages: Sequence[tuple[str, str, dict[str, Any]]],
+        triage_level: Optional[str] = None,
+        triage_reason: Optional[str] = None,
+        ids: Optional[Sequence[Optional[UUID]]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Send path in one round-trip: ownership check + session bump + multi-row insert.
+
+        - UPDATE chat_sessions (last_activity_at, triage when triage_level is given) only matches
+          the patient's own session; the INSERT selects from its RETURNING, so a foreign/missing
+          session inserts nothing and [] is returned
+        - messages: (role, content, content_json) in order; created_at is offset by 1µs per row so
+          user -> assistant order survives ORDER BY created_at within one transaction
+        - ids: optional pre-allocated message ids (streamed replies announce the id before the write)
+        """
+        rows_sql = ",\n".join(
+            f"({i}, CAST(:id_{i} AS uuid), CAST(:role_{i} AS text), CAST(:content_{i} AS text), :json_{i})"
+            for i in range(len(messages))
+        )
+        stmt = text(
+            """
+            WITH s AS (
+                UPDATE public.chat_sessions
+                   SET last_activity_at = now(),
+                       triage_level = COALESCE(CAST(:triage_level AS text), triage_level),
+                       triage_reason = CASE WHEN CAST(:triage_level AS text) IS NULL
+                                            THEN triage_reason ELSE CAST(:triage_reason AS text) END
+                 WHERE id = :sid
+                   AND company_code = :cc
+                   AND patient_id = :pid
+                RETURNING id
+            )
+            INSERT INTO public.chat_messages (id, company_code, session_id, role, content, content_json, created_at)
+            SELECT COALESCE(v.id, gen_random_uuid()), :cc, s.id, v.role, v.content, v.content_json,
+                   now() + v.ord * interval '1 microsecond'
+            FROM s
+            CROSS JOIN (VALUES
+            """ + rows_sql + """
+            ) AS v(ord, id, role, content, content_json)
+            ORDER BY v.ord
+            RETURNING id, role, created_at
+            """
+        ).bindparams(*(bindparam(f"json_{i}", type_=JSONB) for i in range(len(messages))))
+
+        params: dict[str, Any] = {
+            "sid": session_id,
+            "cc": company_code,
+            "pid": patient_id,
+            "triage_level": triage_level,
+            "triage_reason": triage_reason,
+        }
+        for i, (role, content, content_json) in enumerate(messages):
+            params[f"id_{i}"] = ids[i] if ids else None
+            params[f"role_{i}"] = role
+            params[f"content_{i}"] = content
+            params[f"json_{i}"] = content_json or {}
+
+        res = await db.execute(stmt, params)
+        return sorted((dict(r) for r in res.mappings().all()), key=lambda r: r["created_at"])
+
     @staticmethod
     async def soft_delete_message(
         db: AsyncSession,
@@ -357,9 +460,6 @@ class ChatRepository:
         if not m:
             return False
 
-        if not hasattr(m, "is_deleted"):
-            return False
-
         m.is_deleted = True  # type: ignore[attr-defined]
         await db.flush()
         return True
@@ -375,6 +475,10 @@ class ChatRepository:
         patient_id: UUID,
         assistant_message_id: UUID,
     ) -> list[dict[str, Any]]:
+        await schema_capabilities.ensure(db)
+        if not schema_capabilities.has_view("public.vw_chat_message_citations"):
+            return []
+
         stmt_check = (
             select(ChatMessage.id)
             .join(ChatSession, ChatSession.id == ChatMessage.session_id)
@@ -390,11 +494,6 @@ class ChatRepository:
         if not ok:
             return []
 
-        chk = await db.execute(text("SELECT to_regclass('public.vw_chat_message_citations')"))
-        view_name = chk.scalar_one_or_none()
-        if not view_name:
-            return []
-
         stmt = text(
             """
             SELECT *
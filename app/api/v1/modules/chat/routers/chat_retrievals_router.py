@@ -62,11 +62,19 @@ async def create_chat_retrieval_items(
     retrievals_service: ChatRetrievalsService = Depends(get_chat_retrievals_service),
     company_code: str = Depends(current_company_code),
 ):
-    out = await retrievals_service.add_items(
-                company_code=company_code,
+    out = await retrievals_service.add_retrieval_items(
+        company_code=company_code,
         retrieval_id=retrieval_id,
         items=items,
     )
+    if out is None:
+        return ApiResponse.err(
+            data_key="NOT_FOUND",
+            default_code="DATA_404",
+            default_message="Retrieval not found.",
+            details={"retrieval_id": str(retrieval_id)},
+            status_code=404,
+        )
     return ApiResponse.ok(
         success_key="CREATE_SUCCESS",
         default_message="Retrieval items added.",
@@ -9,7 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.session import get_db
 from app.utils.ResponseHandler import UnicodeJSONResponse
 from app.utils.api_response import ApiResponse
-from app.api.v1.utils.list_payload_builder import build_list_payload
+from app.api.v1.utils.list_payload_builder import (
+    build_cursor_payload,
+    build_list_payload,
+    decode_cursor,
+    encode_cursor,
+)
 from app.api.v1.authen.auth import current_company_code, current_patient_id
 from app.api.v1.modules.chat.utils.auth_guards import guard_patient_chat
 
@@ -17,7 +22,9 @@ from app.api.v1.modules.chat.models._envelopes.chat_envelopes import (
     ChatSessionHeaderEnvelope,
     ChatMessagesEnvelope,
 )
+from app.api.v1.modules.chat.repositories.chat_repository import ChatRepository
 from app.api.v1.modules.chat.services.chat_service import (
+    ChatService,
     get_chat_session_header,
     list_chat_messages,
 )
@@ -111,4 +118,89 @@ async def read_messages(
     )
 
 
+# GET /api/v1/chat/sessions/{session_id}/history
+@router.get(
+    "/{session_id}/history",
+    response_class=UnicodeJSONResponse,
+    response_model=ChatMessagesEnvelope,
+    response_model_exclude_none=True,
+    operation_id="read_message_history",
+)
+async def read_message_history(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    company_code: str = Depends(current_company_code),
+    patient_id: str | None = Depends(current_patient_id),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description="paging.next_cursor of the previous page"),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated subset of " + ",".join(ChatRepository.HISTORY_FIELDS)
+        + " (id, created_at always included); e.g. id,role,content,created_at to skip content_json",
+    ),
+):
+    """
+    Message history newest page first, without a total: follow paging.next_cursor to load older
+    messages. Items within a page are chronological.
+    """
+    guard = guard_patient_chat(company_code, patient_id)
+    if guard:
+        return guard
 
+    selected = None
+    if fields:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = sorted(set(selected) - set(ChatRepository.HISTORY_FIELDS))
+        if unknown:
+            return ApiResponse.err(
+                data_key="INVALID",
+                default_code="DATA_003",
+                default_message="Invalid request.",
+                details={"fields": unknown, "allowed": list(ChatRepository.HISTORY_FIELDS)},
+                status_code=422,
+            )
+
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            return ApiResponse.err(
+                data_key="INVALID",
+                default_code="DATA_003",
+                default_message="Invalid request.",
+                details={"cursor": cursor, "detail": "Invalid cursor"},
+                status_code=422,
+            )
+
+    page = await ChatService.list_message_history(
+        db,
+        company_code=company_code,
+        patient_id=UUID(patient_id),
+        session_id=session_id,
+        limit=limit,
+        after=after,
+        fields=selected,
+    )
+    if page is None:
+        return ApiResponse.err(
+            data_key="NOT_FOUND",
+            default_code="DATA_001",
+            default_message="Session not found.",
+            details={"session_id": str(session_id)},
+            status_code=404,
+        )
+
+    payload = build_cursor_payload(
+        items=page["items"],
+        limit=limit,
+        cursor=cursor,
+        next_cursor=encode_cursor(*page["next"]) if page["next"] else None,
+        fields=selected,
+    )
+
+    return ApiResponse.ok(
+        success_key="GET_SUCCESS",
+        default_message="Messages loaded successfully.",
+        data=payload,
+    )
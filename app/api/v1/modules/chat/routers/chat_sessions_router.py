@@ -3,6 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Path
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.session import get_db
@@ -19,6 +20,7 @@ from app.api.v1.modules.chat.models._envelopes.chat_envelopes import (
 from app.api.v1.modules.chat.models.schemas import ChatCreateSessionRequest, ChatSendMessageRequest
 from app.api.v1.modules.chat.dependencies import get_chat_service
 from app.api.v1.modules.chat.services.chat_service import ChatService, close_chat_session, send_chat_message
+from app.services.reply_stream import SSE_HEADERS, stream_reply
 
 
 router = APIRouter()
@@ -105,6 +107,75 @@ async def post_message(
     )
 
 
+# POST /api/v1/chat/sessions/{session_id}/messages/stream
+@router.post(
+    "/{session_id}/messages/stream",
+    response_class=StreamingResponse,
+    operation_id="post_message_stream",
+    responses={200: {"content": {"text/event-stream": {}}, "description": "start -> delta* -> done (or error)"}},
+)
+async def post_message_stream(
+    body: ChatSendMessageRequest,
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    company_code: str = Depends(current_company_code),
+    patient_id: str | None = Depends(current_patient_id),
+):
+    """Same as POST /messages, but the assistant text is streamed as server-sent events."""
+    guard = guard_patient_chat(company_code, patient_id)
+    if guard:
+        return guard
+
+    pid = UUID(patient_id)
+    started = await ChatService.start_streamed_message(
+        db,
+        company_code=company_code,
+        patient_id=pid,
+        session_id=session_id,
+        text=body.text,
+    )
+    if started == "SESSION_NOT_FOUND":
+        return ApiResponse.err(
+            data_key="NOT_FOUND",
+            default_code="DATA_001",
+            default_message="Session not found.",
+            details={"session_id": str(session_id)},
+            status_code=404,
+        )
+
+    reply = started["reply"]
+    assistant_id = started["assistant_message_id"]
+    meta = {"triage": reply["triage"], "ui_cards": reply["ui_cards"], "retrieval": reply["retrieval"]}
+
+    async def persist(text: str, status: str) -> None:
+        # a disconnected / failed stream is still recorded, marked with how it ended
+        aborted = {} if status == "done" else {"stream_status": status}
+        await ChatService.persist_assistant_message(
+            company_code=company_code,
+            patient_id=pid,
+            session_id=session_id,
+            message_id=assistant_id,
+            content=text,
+            content_json={**meta, **aborted},
+        )
+
+    return StreamingResponse(
+        stream_reply(
+            prompt=body.text,
+            draft=reply["assistant_text"],
+            start={
+                "session_id": session_id,
+                "user_message_id": started["user_message_id"],
+                "assistant_message_id": assistant_id,
+            },
+            final={**meta, "assistant_message_id": assistant_id},
+            persist=persist,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 # POST /api/v1/chat/sessions/{session_id}/close
 @router.post(
     "/{session_id}/close",
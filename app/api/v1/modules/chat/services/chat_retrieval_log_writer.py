@@ -0,0 +1,126 @@
+# app/api/v1/modules/chat/services/chat_retrieval_log_writer.py
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.modules.chat.models.schemas import (
+    ChatRetrievalCreateRequest,
+    ChatRetrievalItemCreateRequest,
+)
+from app.api.v1.modules.chat.services.chat_retrievals_service import ChatRetrievalsService
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+from app.database.database import AsyncSessionLocal
+
+logger = get_service_logger("service.chat_retrieval_log")
+
+_Record = Tuple[str, ChatRetrievalCreateRequest, List[ChatRetrievalItemCreateRequest]]
+
+
+class ChatRetrievalLogWriter:
+    """
+    Retrieval logging off the request path.
+
+    submit() only enqueues (never awaits the database); one worker task drains the queue and
+    writes up to `batch_size` retrievals per transaction on its own session, each as a single
+    header + items statement under a savepoint (one bad record does not lose the batch).
+    When the queue is full new records are dropped and counted: logging must not slow answers.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        s = get_settings()
+        self.max_queue = max_queue or s.CHAT_RETRIEVAL_LOG_QUEUE
+        self.batch_size = max(1, batch_size or s.CHAT_RETRIEVAL_LOG_BATCH)
+        self._session_factory = session_factory
+        self._queue: Optional[asyncio.Queue[_Record]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._written = 0
+        self._failed = 0
+        self._dropped = 0
+
+    def submit(
+        self,
+        company_code: str,
+        req: ChatRetrievalCreateRequest,
+        items: Sequence[ChatRetrievalItemCreateRequest],
+    ) -> bool:
+        """Queue one retrieval (+ items) for writing; False if it was dropped."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="chat-retrieval-log-writer")
+        try:
+            self._queue.put_nowait((company_code, req, list(items)))
+            return True
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 100 == 0:
+                logger.warning("retrieval log queue full (%d); dropped=%d", self.max_queue, self._dropped)
+            return False
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._write(batch)
+            except Exception:
+                self._failed += len(batch)
+                logger.exception("retrieval log batch of %d failed", len(batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: List[_Record]) -> None:
+        async with self._session_factory() as db:
+            service = ChatRetrievalsService(db)
+            for company_code, req, items in batch:
+                try:
+                    async with db.begin_nested():
+                        await service.log_retrieval(company_code, req, items)
+                    self._written += 1
+                except Exception as e:
+                    self._failed += 1
+                    logger.warning("retrieval log failed session=%s: %s", req.session_id, e)
+            await db.commit()
+
+    async def aclose(self, timeout: float = 10.0) -> None:
+        """Shutdown: write what is queued (up to timeout), then stop the worker."""
+        if self._task is None:
+            return
+        if self._queue is not None and not self._task.done():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("retrieval log writer: %d records not written at shutdown", self._queue.qsize())
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+        self._queue = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "written": self._written,
+            "failed": self._failed,
+            "dropped": self._dropped,
+        }
+
+
+retrieval_log_writer = ChatRetrievalLogWriter()
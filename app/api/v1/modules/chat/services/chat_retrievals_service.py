@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import json
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import Float, Integer, Text, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.modules.chat.models.schemas import (
@@ -16,6 +18,98 @@ from app.api.v1.modules.chat.models.dtos import (
     ChatRetrievalDetailOut,
     ChatCitationOut,
 )
+from app.services.schema_capabilities import schema_capabilities
+
+
+_RETRIEVAL_COLUMNS = "id, company_code, session_id, assistant_message_id, query_text, query_hash, top_k, filters, metadata, created_at"
+_ITEM_COLUMNS = "id, retrieval_id, chunk_id, document_id, rank, score, metadata, created_at"
+
+# items travel as one array per column: the statement text is the same for any number of items
+# (cacheable, no per-item bind parameters); metadata goes as JSON text and is cast per row
+_ITEM_ARRAYS = (
+    bindparam("chunk_ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+    bindparam("document_ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+    bindparam("ranks", type_=ARRAY(Integer)),
+    bindparam("scores", type_=ARRAY(Float)),
+    bindparam("metadatas", type_=ARRAY(Text)),
+)
+_UNNEST_ITEMS = (
+    "unnest(:chunk_ids, :document_ids, :ranks, :scores, :metadatas) "
+    "AS u(chunk_id, document_id, rank, score, metadata)"
+)
+_HEADER_PARAMS = (
+    bindparam("filters", type_=JSONB),
+    bindparam("metadata", type_=JSONB),
+)
+
+_INSERT_RETRIEVAL = text(
+    f"""
+    INSERT INTO public.chat_retrievals
+      (company_code, session_id, assistant_message_id, query_text, query_hash, top_k, filters, metadata)
+    VALUES
+      (:company_code, :session_id, :assistant_message_id, :query_text, :query_hash, :top_k, :filters, :metadata)
+    RETURNING {_RETRIEVAL_COLUMNS}
+    """
+).bindparams(*_HEADER_PARAMS)
+
+# only into a retrieval of this company: nothing is inserted (no rows returned) otherwise
+_INSERT_ITEMS = text(
+    f"""
+    INSERT INTO public.chat_retrieval_items
+      (retrieval_id, chunk_id, document_id, rank, score, metadata)
+    SELECT r.id, u.chunk_id, u.document_id, u.rank, u.score, CAST(u.metadata AS jsonb)
+    FROM public.chat_retrievals r
+    CROSS JOIN {_UNNEST_ITEMS}
+    WHERE r.id = :retrieval_id
+      AND r.company_code = :company_code
+    RETURNING {_ITEM_COLUMNS}
+    """
+).bindparams(*_ITEM_ARRAYS)
+
+_RETRIEVAL_OWNED = text("SELECT 1 FROM public.chat_retrievals WHERE id = :retrieval_id AND company_code = :company_code")
+
+# header + items in one round-trip (background retrieval logging)
+_LOG_RETRIEVAL = text(
+    f"""
+    WITH r AS (
+      INSERT INTO public.chat_retrievals
+        (company_code, session_id, assistant_message_id, query_text, query_hash, top_k, filters, metadata)
+      VALUES
+        (:company_code, :session_id, :assistant_message_id, :query_text, :query_hash, :top_k, :filters, :metadata)
+      RETURNING id
+    ), i AS (
+      INSERT INTO public.chat_retrieval_items
+        (retrieval_id, chunk_id, document_id, rank, score, metadata)
+      SELECT r.id, u.chunk_id, u.document_id, u.rank, u.score, CAST(u.metadata AS jsonb)
+      FROM r
+      CROSS JOIN {_UNNEST_ITEMS}
+    )
+    SELECT id FROM r
+    """
+).bindparams(*_HEADER_PARAMS, *_ITEM_ARRAYS)
+
+
+def _header_params(company_code: str, req: ChatRetrievalCreateRequest) -> Dict[str, Any]:
+    return {
+        "company_code": company_code,
+        "session_id": req.session_id,
+        "assistant_message_id": req.assistant_message_id,
+        "query_text": req.query_text,
+        "query_hash": req.query_hash,
+        "top_k": req.top_k,
+        "filters": req.filters,
+        "metadata": req.metadata,
+    }
+
+
+def _item_params(items: Sequence[ChatRetrievalItemCreateRequest]) -> Dict[str, Any]:
+    return {
+        "chunk_ids": [i.chunk_id for i in items],
+        "document_ids": [i.document_id for i in items],
+        "ranks": [i.rank for i in items],
+        "scores": [i.score for i in items],
+        "metadatas": [json.dumps(i.metadata, ensure_ascii=False, default=str) for i in items],
+    }
 
 
 class ChatRetrievalsService:
@@ -34,69 +128,49 @@ class ChatRetrievalsService:
         company_code: str,
         req: ChatRetrievalCreateRequest,
     ) -> ChatRetrievalOut:
-        stmt = text(
-            """
-            INSERT INTO public.chat_retrievals
-              (company_code, session_id, assistant_message_id, query_text, query_hash, top_k, filters, metadata)
-            VALUES
-              (:company_code, :session_id, :assistant_message_id, :query_text, :query_hash, :top_k, :filters::jsonb, :metadata::jsonb)
-            RETURNING
-              id, company_code, session_id, assistant_message_id, query_text, query_hash, top_k, filters, metadata, created_at
-            """
-        )
-
-        res = await self.db.execute(
-            stmt,
-            {
-                "company_code": company_code,
-                "session_id": str(req.session_id),
-                "assistant_message_id": str(req.assistant_message_id)
-                if req.assistant_message_id
-                else None,
-                "query_text": req.query_text,
-                "query_hash": req.query_hash,
-                "top_k": req.top_k,
-                "filters": req.filters,
-                "metadata": req.metadata,
-            },
-        )
-        row = res.mappings().first()
+        try:
+            row = (await self.db.execute(_INSERT_RETRIEVAL, _header_params(company_code, req))).mappings().one()
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
         return ChatRetrievalOut(**row)
 
     async def add_retrieval_items(
         self,
+        company_code: str,
         retrieval_id: UUID,
-        items: List[ChatRetrievalItemCreateRequest],
-    ) -> List[ChatRetrievalItemOut]:
+        items: Sequence[ChatRetrievalItemCreateRequest],
+    ) -> Optional[List[ChatRetrievalItemOut]]:
+        """Insert all items in one fixed statement; None if the retrieval is not this company's."""
         if not items:
-            return []
-
-        values_sql = []
-        params = {"retrieval_id": str(retrieval_id)}
-        for i, item in enumerate(items):
-            values_sql.append(
-                f"(:retrieval_id, :chunk_id_{i}, :document_id_{i}, :rank_{i}, :score_{i}, :metadata_{i}::jsonb)"
-            )
-            params[f"chunk_id_{i}"] = str(item.chunk_id)
-            params[f"document_id_{i}"] = str(item.document_id) if item.document_id else None
-            params[f"rank_{i}"] = item.rank
-            params[f"score_{i}"] = item.score
-            params[f"metadata_{i}"] = item.metadata
+            # nothing to insert, but a foreign / unknown retrieval_id is still not found
+            owned = await self.db.execute(_RETRIEVAL_OWNED, {"retrieval_id": retrieval_id, "company_code": company_code})
+            return [] if owned.scalar() else None
+        params = {"company_code": company_code, "retrieval_id": retrieval_id, **_item_params(items)}
+        try:
+            rows = (await self.db.execute(_INSERT_ITEMS, params)).mappings().all()
+            if not rows:
+                await self.db.rollback()
+                return None
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return sorted((ChatRetrievalItemOut(**r) for r in rows), key=lambda x: x.rank)
 
-        stmt = text(
-            """
-            INSERT INTO public.chat_retrieval_items
-              (retrieval_id, chunk_id, document_id, rank, score, metadata)
-            VALUES
-            """ + ",\n".join(values_sql) + """
-            RETURNING
-              id, retrieval_id, chunk_id, document_id, rank, score, metadata, created_at
-            """
-        )
-
-        res = await self.db.execute(stmt, params)
-        rows = res.mappings().all()
-        return [ChatRetrievalItemOut(**r) for r in rows]
+    async def log_retrieval(
+        self,
+        company_code: str,
+        req: ChatRetrievalCreateRequest,
+        items: Sequence[ChatRetrievalItemCreateRequest],
+    ) -> UUID:
+        """
+        Retrieval header + items in one statement, no commit (the caller batches several per
+        transaction, see ChatRetrievalLogWriter). Returns the new retrieval id.
+        """
+        params = {**_header_params(company_code, req), **_item_params(items)}
+        return (await self.db.execute(_LOG_RETRIEVAL, params)).scalar_one()
 
     async def get_retrieval_detail(
         self,
@@ -171,6 +245,10 @@ class ChatRetrievalsService:
         company_code: str,
         assistant_message_id: UUID,
     ) -> List[ChatCitationOut]:
+        await schema_capabilities.ensure(self.db)
+        if not schema_capabilities.has_view("public.vw_chat_message_citations"):
+            return []
+
         stmt = text(
             """
             SELECT
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
-from uuid import UUID
+from typing import Any, Optional, Sequence
+from uuid import UUID, uuid4
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.modules.chat.repositories.chat_repository import ChatRepository
+from app.database.database import AsyncSessionLocal
 
 
 class ChatService:
@@ -223,14 +224,22 @@ class ChatService:
             raise
 
     @staticmethod
-    async def send_message(
+    async def list_message_history(
         db: AsyncSession,
         *,
         company_code: str,
         patient_id: UUID,
         session_id: UUID,
-        text: str,
-    ) -> dict[str, Any] | str:
+        limit: int = 50,
+        after: Optional[tuple[datetime, UUID]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Cursor-paged history (walks backwards from the newest message); None if the session is not owned.
+
+        Each page is returned oldest -> newest; `next` is the (created_at, id) of its oldest row,
+        to be passed back as `after` for the page before it (None on the first message).
+        """
         try:
             owned = await ChatRepository.get_owned_session(
                 db,
@@ -239,58 +248,163 @@ class ChatService:
                 session_id=session_id,
             )
             if not owned:
-                return "SESSION_NOT_FOUND"
+                return None
 
-            # 1) insert user message
-            await ChatRepository.insert_message(
+            rows, has_more = await ChatRepository.list_messages_page(
                 db,
                 company_code=company_code,
                 session_id=session_id,
-                role="user",
-                content=text,
-                content_json={},
+                limit=limit,
+                after=after,
+                fields=fields or ChatRepository.HISTORY_FIELDS,
             )
+        except Exception:
+            await db.rollback()
+            raise
 
-            # 2) TODO: replace stub with real RAG/LLM
-            triage: dict[str, Any] = {}
-            ui_cards: list[dict[str, Any]] = []
-            lowered = text.lower()
-            if any(k in lowered for k in ["แน่นหน้าอก", "หายใจไม่ออก", "ชัก", "หมดสติ"]):
-                triage = {"level": "urgent", "reason": "มีอาการที่ควรพบแพทย์โดยเร็ว"}
-                ui_cards.append(
-                    {
-                        "type": "cta",
-                        "label": "Doctor Consultation Recommended",
-                        "action": {"type": "open_escalation"},
-                    }
-                )
+        nxt = (rows[-1]["created_at"], rows[-1]["id"]) if has_more else None
+        rows.reverse()
+        for r in rows:
+            if "content_json" in r:
+                r["content_json"] = r["content_json"] or {}
+        return {"items": rows, "next": nxt}
 
-            assistant_text = "รับทราบครับ/ค่ะ เล่าอาการเพิ่มเติมได้เลย (ระยะเวลา, ความรุนแรง, อาการร่วม) เพื่อช่วยประเมินเบื้องต้น"
+    @staticmethod
+    def compose_reply(text: str) -> dict[str, Any]:
+        """Assistant reply for a user message (stub; replace with real RAG/LLM)."""
+        triage: dict[str, Any] = {}
+        ui_cards: list[dict[str, Any]] = []
+        lowered = text.lower()
+        if any(k in lowered for k in ["แน่นหน้าอก", "หายใจไม่ออก", "ชัก", "หมดสติ"]):
+            triage = {"level": "urgent", "reason": "มีอาการที่ควรพบแพทย์โดยเร็ว"}
+            ui_cards.append(
+                {
+                    "type": "cta",
+                    "label": "Doctor Consultation Recommended",
+                    "action": {"type": "open_escalation"},
+                }
+            )
 
-            await ChatRepository.insert_message(
+        assistant_text = "รับทราบครับ/ค่ะ เล่าอาการเพิ่มเติมได้เลย (ระยะเวลา, ความรุนแรง, อาการร่วม) เพื่อช่วยประเมินเบื้องต้น"
+        return {
+            "assistant_text": assistant_text,
+            "triage": triage,
+            "ui_cards": ui_cards,
+            "retrieval": None,
+        }
+
+    @staticmethod
+    async def send_message(
+        db: AsyncSession,
+        *,
+        company_code: str,
+        patient_id: UUID,
+        session_id: UUID,
+        text: str,
+    ) -> dict[str, Any] | str:
+        """
+        Compose the reply first, then persist the exchange in a single statement
+        (ownership + last_activity_at/triage + user & assistant rows, see ChatRepository.append_messages).
+        """
+        try:
+            reply = ChatService.compose_reply(text)
+            triage = reply["triage"]
+
+            rows = await ChatRepository.append_messages(
                 db,
                 company_code=company_code,
+                patient_id=patient_id,
                 session_id=session_id,
-                role="assistant",
-                content=assistant_text,
-                content_json={"triage": triage, "ui_cards": ui_cards, "retrieval": None},
+                messages=[
+                    ("user", text, {}),
+                    (
+                        "assistant",
+                        reply["assistant_text"],
+                        {"triage": triage, "ui_cards": reply["ui_cards"], "retrieval": reply["retrieval"]},
+                    ),
+                ],
+                triage_level=triage.get("level"),
+                triage_reason=triage.get("reason"),
             )
-
-            if triage.get("level"):
-                owned.triage_level = triage.get("level")
-                owned.triage_reason = triage.get("reason")
+            if not rows:
+                await db.rollback()
+                return "SESSION_NOT_FOUND"
 
             await db.commit()
             return {
-                "assistant_text": assistant_text,
-                "triage": triage,
-                "ui_cards": ui_cards,
-                "retrieval": None,
+                **reply,
+                "user_message_id": rows[0]["id"],
+                "assistant_message_id": rows[-1]["id"],
             }
         except Exception:
             await db.rollback()
             raise
 
+    @staticmethod
+    async def start_streamed_message(
+        db: AsyncSession,
+        *,
+        company_code: str,
+        patient_id: UUID,
+        session_id: UUID,
+        text: str,
+    ) -> dict[str, Any] | str:
+        """
+        Streaming send, step 1: persist the user message (ownership-checked, one statement) and
+        allocate the assistant message id; the reply itself is streamed, then persisted by
+        persist_assistant_message() in the background.
+        """
+        try:
+            rows = await ChatRepository.append_messages(
+                db,
+                company_code=company_code,
+                patient_id=patient_id,
+                session_id=session_id,
+                messages=[("user", text, {})],
+            )
+            if not rows:
+                await db.rollback()
+                return "SESSION_NOT_FOUND"
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        return {
+            "reply": ChatService.compose_reply(text),
+            "user_message_id": rows[0]["id"],
+            "assistant_message_id": uuid4(),
+        }
+
+    @staticmethod
+    async def persist_assistant_message(
+        *,
+        company_code: str,
+        patient_id: UUID,
+        session_id: UUID,
+        message_id: UUID,
+        content: str,
+        content_json: dict[str, Any],
+    ) -> None:
+        """Background write of a streamed reply (own session: the request's is closed by now)."""
+        triage = content_json.get("triage") or {}
+        async with AsyncSessionLocal() as db:
+            try:
+                await ChatRepository.append_messages(
+                    db,
+                    company_code=company_code,
+                    patient_id=patient_id,
+                    session_id=session_id,
+                    messages=[("assistant", content, content_json)],
+                    triage_level=triage.get("level"),
+                    triage_reason=triage.get("reason"),
+                    ids=[message_id],
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
     @staticmethod
     async def soft_delete_message(
         db: AsyncSession,
@@ -0,0 +1,109 @@
+# app/api/v1/modules/kb/ingest_documents.py
+
+"""
+Chunk + embed KB documents into kb_chunks.
+
+python -m app.api.v1.modules.kb.ingest_documents [--company CODE] [--document ID ...] [--limit N]
+                                                 [--include-failed] [--restart] [--dry-run]
+
+Without --document, walks the active documents in status draft / ingesting (plus failed with
+--include-failed) that have metadata.source_path. Each document resumes from its last committed
+batch (see KBIngestionService); --restart discards its chunks first. Prints per-document
+throughput. Safe to interrupt and re-run.
+
+Chunks written here reach a running API's vector index on its next partition refresh
+(KB_VECTOR_INDEX_TTL_SECONDS); ingestion started through the API updates it immediately.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Dict, List
+from uuid import UUID
+
+from app.core.clients.openai_client import get_openai_client
+from app.core.clients.storage_client import get_storage
+from app.database.database import AsyncSessionLocal
+from app.services.embeddings import get_embedding_service
+
+from app.api.v1.modules.kb.repositories.kb_ingestion_repository import KBIngestionRepository
+from app.api.v1.modules.kb.services.kb_ingestion_service import KBIngestionService
+
+
+async def ingest(
+    *,
+    company: str | None,
+    documents: List[UUID],
+    limit: int | None,
+    include_failed: bool,
+    restart: bool,
+    dry_run: bool,
+) -> Dict[str, int]:
+    if not documents:
+        async with AsyncSessionLocal() as db:
+            rows = await KBIngestionRepository(db).list_pending(
+                company_code=company, include_failed=include_failed, limit=limit
+            )
+        for r in rows:
+            ingest_state = (r.get("metadata") or {}).get("ingest") or {}
+            print(
+                f"  {r['id']} [{r['company_code']}] {r['status']} "
+                f"{ingest_state.get('chunks_done', 0)}/{ingest_state.get('chunks_total', '?')} {r['title']}",
+                flush=True,
+            )
+        documents = [r["id"] for r in rows]
+
+    stats = {"documents": len(documents), "ready": 0, "failed": 0, "chunks": 0}
+    if dry_run:
+        return stats
+
+    svc = KBIngestionService()
+    for document_id in documents:
+        report = await svc.ingest(document_id, restart=restart)
+        stats["ready" if report.status == "ready" else "failed"] += 1
+        stats["chunks"] += report.written
+        print(
+            f"  {document_id} {report.status}: pages={report.pages} chunks={report.resumed_from + report.written}"
+            f"/{report.chunks} (resumed_from={report.resumed_from}) {report.seconds:.1f}s "
+            f"{report.chunks_per_second:.1f} chunks/s {report.chars_per_second:.0f} chars/s "
+            f"[embed wait {report.embed_seconds:.1f}s, write {report.write_seconds:.1f}s]"
+            + (f" error={report.error}" if report.error else ""),
+            flush=True,
+        )
+    return stats
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    try:
+        stats = await ingest(
+            company=args.company,
+            documents=args.document or [],
+            limit=args.limit,
+            include_failed=args.include_failed,
+            restart=args.restart,
+            dry_run=args.dry_run,
+        )
+        print(("would ingest" if args.dry_run else "done") + f": {stats}")
+    finally:
+        if get_embedding_service.cache_info().currsize:
+            await get_embedding_service().aclose()
+        if get_openai_client.cache_info().currsize:
+            await get_openai_client().aclose()
+        if get_storage.cache_info().currsize:
+            await get_storage().aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.api.v1.modules.kb.ingest_documents")
+    parser.add_argument("--company", default=None, help="only this company's documents")
+    parser.add_argument("--document", type=UUID, action="append", help="ingest this document (repeatable)")
+    parser.add_argument("--limit", type=int, default=None, help="stop after this many documents")
+    parser.add_argument("--include-failed", action="store_true", help="also retry documents in status failed")
+    parser.add_argument("--restart", action="store_true", help="discard already written chunks instead of resuming")
+    parser.add_argument("--dry-run", action="store_true", help="only list the documents that would be ingested")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
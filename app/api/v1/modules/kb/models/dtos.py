@@ -44,3 +44,5 @@ class KBSearchResultDTO(BaseModel):
     score: Optional[float] = None
     content: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    # per ranked list: {"vector": {"rank", "score"}, "lexical": {...}} (score above is the fused one in hybrid)
+    ranking: Optional[Dict[str, Any]] = None
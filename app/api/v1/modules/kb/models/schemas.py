@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from pydantic import BaseModel, Field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
+from uuid import UUID
 
 
 class KBDocumentCreateRequest(BaseModel):
@@ -25,4 +26,11 @@ class KBDocumentUpdateRequest(BaseModel):
 class KBSearchRequest(BaseModel):
     query: str = Field(..., min_length=1)
     top_k: int = Field(default=8, ge=1, le=50)
-    filters: Dict[str, Any] = Field(default_factory=dict)  # doc_type/tags/lang etc.
+    # doc_type / lang (language_code) / document_id(s): value or list; tags: any of;
+    # any other key: equality on the chunk metadata (value or list)
+    filters: Dict[str, Any] = Field(default_factory=dict)
+    # None = KB_SEARCH_MODE; hybrid = vector + BM25 merged by reciprocal rank fusion
+    mode: Optional[Literal["hybrid", "vector", "lexical"]] = None
+    # set by chat: the results are logged as a chat retrieval of this session (chat_retrievals)
+    session_id: Optional[UUID] = None
+    assistant_message_id: Optional[UUID] = None
@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -77,11 +78,11 @@ class KBDocumentsRepository:
             INSERT INTO public.kb_documents
               (company_code, doc_type, title, language_code, tags, metadata, status, is_active)
             VALUES
-              (:company_code, :doc_type, :title, :language_code, :tags, :metadata::jsonb, 'draft', true)
+              (:company_code, :doc_type, :title, :language_code, :tags, :metadata, 'draft', true)
             RETURNING
               id, company_code, doc_type, title, language_code, tags, status, is_active, metadata, created_at, updated_at
             """
-        )
+        ).bindparams(bindparam("metadata", type_=JSONB))
         params = {
             "company_code": company_code,
             "doc_type": payload["doc_type"],
@@ -100,10 +101,7 @@ class KBDocumentsRepository:
         params: Dict[str, Any] = {"company_code": company_code, "id": document_id}
         for k in ["doc_type","title","language_code","tags","status","is_active","metadata"]:
             if k in payload and payload[k] is not None:
-                if k == "metadata":
-                    set_parts.append("metadata = :metadata::jsonb")
-                else:
-                    set_parts.append(f"{k} = :{k}")
+                set_parts.append(f"{k} = :{k}")
                 params[k] = payload[k]
         if not set_parts:
             return await self.get_document(company_code=company_code, document_id=document_id)
@@ -118,6 +116,8 @@ class KBDocumentsRepository:
               id, company_code, doc_type, title, language_code, tags, status, is_active, metadata, created_at, updated_at
             """
         )
+        if "metadata" in params:
+            sql = sql.bindparams(bindparam("metadata", type_=JSONB))
         res = await self.db.execute(sql, params)
         row = res.mappings().first()
         return dict(row) if row else None
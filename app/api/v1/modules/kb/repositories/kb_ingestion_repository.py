@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Integer, Text, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, REAL, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.text_chunking import Chunk
+
+_DOC_COLUMNS = "id, company_code, doc_type, title, language_code, tags, status, is_active, metadata"
+
+_GET_DOCUMENT = text(f"SELECT {_DOC_COLUMNS} FROM public.kb_documents WHERE id = :id")
+
+_EMBEDDING_TYPE = text(
+    """
+    SELECT format_type(a.atttypid, a.atttypmod)
+    FROM pg_attribute a
+    WHERE a.attrelid = 'public.kb_chunks'::regclass AND a.attname = 'embedding' AND NOT a.attisdropped
+    """
+)
+
+_DONE_CHUNKS = text("SELECT COALESCE(MAX(chunk_index) + 1, 0) FROM public.kb_chunks WHERE document_id = :id")
+
+_DELETE_CHUNKS = text("DELETE FROM public.kb_chunks WHERE document_id = :id")
+
+# merged into metadata: the rest of the document metadata (source_path, ...) is left alone
+_SET_STATE = text(
+    """
+    UPDATE public.kb_documents
+    SET status = :status,
+        metadata = COALESCE(metadata, '{}'::jsonb) || jsonb_build_object('ingest', :ingest),
+        updated_at = NOW()
+    WHERE id = :id
+    """
+).bindparams(bindparam("ingest", type_=JSONB))
+
+# chunk metadata travels as JSON text per row (unnest would not take a jsonb[] of mixed shapes);
+# embeddings as one flat real[] sliced per row by ordinality (unnest flattens 2-D arrays), like the
+# embedding cache write, then cast to the column type (real[] -> vector / double precision[])
+_INSERT_CHUNKS = """
+    INSERT INTO public.kb_chunks (company_code, document_id, chunk_index, content, metadata, embedding)
+    SELECT :company_code, :document_id, u.chunk_index, u.content, CAST(u.metadata AS jsonb),
+           CAST((:embeddings)[(u.i - 1) * :dim + 1 : u.i * :dim] AS {type})
+    FROM unnest(:chunk_indexes, :contents, :metadatas) WITH ORDINALITY AS u(chunk_index, content, metadata, i)
+    RETURNING id, chunk_index
+"""
+
+# embedding column type as reported by format_type(): vector(1536), real[], double precision[], ...
+_SAFE_TYPE = re.compile(r"^[a-z][a-z0-9_ ]*(\(\d+\))?(\[\])?$")
+
+
+def _flatten(embeddings: Sequence[Sequence[float]]) -> Tuple[List[float], int]:
+    """(row-major floats, dim); NumPy rows go through tolist() (no per-element float())."""
+    dim = len(embeddings[0]) if embeddings else 0
+    flat: List[float] = []
+    for e in embeddings:
+        if len(e) != dim:
+            raise ValueError(f"embedding has {len(e)} dims, expected {dim}")
+        flat.extend(e.tolist() if hasattr(e, "tolist") else map(float, e))
+    return flat, dim
+
+
+class KBIngestionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._insert_sql: Dict[str, Any] = {}
+
+    async def get_document(self, *, document_id: UUID) -> Optional[Dict[str, Any]]:
+        row = (await self.db.execute(_GET_DOCUMENT, {"id": document_id})).mappings().first()
+        return dict(row) if row else None
+
+    async def list_pending(
+        self,
+        *,
+        company_code: Optional[str] = None,
+        include_failed: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Active documents with a source file that are not ingested yet (or were interrupted)."""
+        statuses = ["draft", "ingesting"] + (["failed"] if include_failed else [])
+        sql = f"""
+            SELECT {_DOC_COLUMNS}
+            FROM public.kb_documents
+            WHERE status = ANY(:statuses)
+              AND is_active IS NOT FALSE
+              AND metadata ? 'source_path'
+        """
+        params: Dict[str, Any] = {"statuses": statuses}
+        if company_code:
+            sql += " AND company_code = :company_code"
+            params["company_code"] = company_code
+        sql += " ORDER BY created_at, id"
+        if limit:
+            sql += " LIMIT :limit"
+            params["limit"] = limit
+        stmt = text(sql).bindparams(bindparam("statuses", type_=ARRAY(Text)))
+        return [dict(r) for r in (await self.db.execute(stmt, params)).mappings().all()]
+
+    async def embedding_column_type(self) -> str:
+        column_type = (await self.db.execute(_EMBEDDING_TYPE)).scalar()
+        if not column_type or not _SAFE_TYPE.match(column_type):
+            raise RuntimeError(f"unsupported kb_chunks.embedding type: {column_type!r}")
+        return column_type
+
+    async def count_done_chunks(self, *, document_id: UUID) -> int:
+        """Chunks are written in chunk_index order, one committed batch at a time: the resume point."""
+        return int((await self.db.execute(_DONE_CHUNKS, {"id": document_id})).scalar() or 0)
+
+    async def delete_chunks(self, *, document_id: UUID) -> None:
+        await self.db.execute(_DELETE_CHUNKS, {"id": document_id})
+
+    async def set_state(self, *, document_id: UUID, status: str, ingest: Dict[str, Any]) -> None:
+        await self.db.execute(_SET_STATE, {"id": document_id, "status": status, "ingest": ingest})
+
+    async def insert_chunks(
+        self,
+        *,
+        company_code: str,
+        document_id: UUID,
+        column_type: str,
+        chunks: Sequence[Chunk],
+        metadatas: Sequence[Dict[str, Any]],
+        embeddings: Sequence[Sequence[float]],
+    ) -> Dict[int, UUID]:
+        """One INSERT ... SELECT FROM unnest(...) for the whole batch; returns chunk_index -> id."""
+        stmt = self._insert_sql.get(column_type)
+        if stmt is None:
+            stmt = self._insert_sql[column_type] = text(_INSERT_CHUNKS.format(type=column_type)).bindparams(
+                bindparam("document_id", type_=PG_UUID(as_uuid=True)),
+                bindparam("chunk_indexes", type_=ARRAY(Integer)),
+                bindparam("contents", type_=ARRAY(Text)),
+                bindparam("metadatas", type_=ARRAY(Text)),
+                bindparam("embeddings", type_=ARRAY(REAL)),
+                bindparam("dim", type_=Integer),
+            )
+        flat, dim = _flatten(embeddings)
+        res = await self.db.execute(
+            stmt,
+            {
+                "company_code": company_code,
+                "document_id": document_id,
+                "chunk_indexes": [c.index for c in chunks],
+                "contents": [c.content for c in chunks],
+                "metadatas": [json.dumps(m, ensure_ascii=False) for m in metadatas],
+                "embeddings": flat,
+                "dim": dim,
+            },
+        )
+        return {r.chunk_index: r.id for r in res.all()}
@@ -1,28 +1,102 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
 from uuid import UUID
 
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import Settings
-from app.core.clients.openai_client import OpenAIClient
+from app.services.vector_index import VectorDoc, VectorRow
+from app.utils.lazy_import import LazyModule
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyModule("numpy")
+
+# rows per keyset page while loading a company's vectors (bounded result sets, no OFFSET); also
+# bounds the transient Python floats asyncpg decodes per page (~2000 x 1536 x 32 B)
+VECTOR_LOAD_BATCH = 2000
+
+_ACTIVE_DOCS = text(
+    """
+    SELECT id, doc_type, language_code, tags
+    FROM public.kb_documents
+    WHERE company_code = :company_code
+      AND is_active IS NOT FALSE
+    """
+)
+
+# embedding (pgvector / float[]) comes back as real[] -> list[float] decoded by asyncpg, no text parsing,
+# and is converted to float32 as each page is read; content feeds the BM25 index (only its terms are kept)
+_VECTORS_SELECT = """
+    SELECT c.id, c.document_id, CAST(c.embedding AS real[]) AS embedding, c.metadata, c.content
+    FROM public.kb_chunks c
+    JOIN public.kb_documents d ON d.id = c.document_id AND d.company_code = c.company_code
+    WHERE c.company_code = :company_code
+      AND c.embedding IS NOT NULL
+      AND d.is_active IS NOT FALSE
+"""
+_VECTORS_FIRST = text(_VECTORS_SELECT + " ORDER BY c.id LIMIT :limit")
+_VECTORS_AFTER = text(_VECTORS_SELECT + " AND c.id > :after ORDER BY c.id LIMIT :limit")
+
+_CHUNKS_BY_ID = text(
+    """
+    SELECT
+      c.id AS chunk_id, c.document_id, d.title AS document_title, c.chunk_index, c.content, c.metadata
+    FROM public.kb_chunks c
+    JOIN public.kb_documents d ON d.id = c.document_id
+    WHERE c.company_code = :company_code
+      AND c.id = ANY(:ids)
+    """
+).bindparams(bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True))))
 
 
 class KBSearchRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def search_by_text(
-        self,
-        *,
-        company_code: str,
-        query: str,
-        top_k: int,
-        filters: Dict[str, Any],
-        settings: Settings,
-    ) -> List[Dict[str, Any]]:
-        # Keep existing client behavior; returns list[dict]
-        client = OpenAIClient(settings=settings, db=self.db)
-        results = await client.kb_search(company_code=company_code, query=query, top_k=top_k, filters=filters)
-        return results
+    async def load_vectors(self, *, company_code: str) -> Tuple[List[VectorRow], List[VectorDoc]]:
+        """Every embedded chunk of the company's active documents (vector + BM25 index hydration)."""
+        docs = [
+            VectorDoc(id=r.id, doc_type=r.doc_type, language_code=r.language_code, tags=frozenset(r.tags or ()))
+            for r in (await self.db.execute(_ACTIVE_DOCS, {"company_code": company_code})).all()
+        ]
+
+        rows: List[VectorRow] = []
+        after = None
+        while True:
+            params: Dict[str, Any] = {"company_code": company_code, "limit": VECTOR_LOAD_BATCH}
+            if after is None:
+                page = (await self.db.execute(_VECTORS_FIRST, params)).all()
+            else:
+                page = (await self.db.execute(_VECTORS_AFTER, {**params, "after": after})).all()
+            # float32 per row (4 B / value) before the next page: the page's list[float] (~32 B / value)
+            # is garbage once the loop moves on, never held for the whole company
+            rows.extend(
+                VectorRow(
+                    chunk_id=r.id,
+                    document_id=r.document_id,
+                    embedding=np.asarray(r.embedding, dtype=np.float32),
+                    metadata=r.metadata or {},
+                    text=r.content or "",
+                )
+                for r in page
+            )
+            if len(page) < VECTOR_LOAD_BATCH:
+                return rows, docs
+            after = page[-1].id
+
+    async def list_vector_companies(self) -> List[str]:
+        res = await self.db.execute(
+            text("SELECT DISTINCT company_code FROM public.kb_chunks WHERE embedding IS NOT NULL")
+        )
+        return [r[0] for r in res.all()]
+
+    async def fetch_chunks(self, *, company_code: str, chunk_ids: Sequence[UUID]) -> List[Dict[str, Any]]:
+        """Content / title of the hits, by primary key (the index only holds vectors)."""
+        if not chunk_ids:
+            return []
+        res = await self.db.execute(_CHUNKS_BY_ID, {"company_code": company_code, "ids": list(chunk_ids)})
+        return [dict(r) for r in res.mappings().all()]
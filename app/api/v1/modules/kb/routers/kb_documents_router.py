@@ -141,6 +141,45 @@ async def update_kb_document(
     )
 
 
+@router.post("/{document_id}/ingest", response_class=UnicodeJSONResponse, response_model=KBDocumentEnvelope, operation_id="ingest_kb_document")
+async def ingest_kb_document(
+    request: Request,
+    document_id: UUID,
+    restart: bool = Query(False, description="discard already written chunks instead of resuming"),
+    svc: KBDocumentsService = Depends(get_kb_documents_service),
+):
+    """Chunk + embed metadata.source_path into kb_chunks in the background; poll the document for status."""
+    doc, outcome = await svc.start_ingestion(document_id=document_id, restart=restart)
+    if not doc:
+        return ResponseHandler.error_from_request(
+            request,
+            code="KB_DOCUMENT_NOT_FOUND",
+            message="Document not found",
+            status_code=404,
+        )
+    if outcome == "no_source":
+        return ResponseHandler.error_from_request(
+            request,
+            code="KB_DOCUMENT_NO_SOURCE",
+            message="metadata.source_path is not set",
+            status_code=422,
+        )
+    if outcome == "running":
+        return ResponseHandler.error_from_request(
+            request,
+            code="KB_DOCUMENT_INGESTING",
+            message="Document is already being ingested",
+            status_code=409,
+        )
+    item = KBDocumentDTO.model_validate(doc).model_dump(exclude_none=True)
+    return ResponseHandler.success_from_request(
+        request,
+        message="Ingestion started",
+        data={"item": item},
+        status_code=202,
+    )
+
+
 @router.delete("/{document_id}", response_class=UnicodeJSONResponse, response_model=KBDocumentEnvelope, operation_id="delete_kb_document")
 async def delete_kb_document(
     request: Request,
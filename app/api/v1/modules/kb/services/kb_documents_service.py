@@ -3,7 +3,10 @@ from __future__ import annotations
 from typing import Any, Dict, Optional, Tuple, List
 from uuid import UUID
 
+from app.services.vector_index import VectorDoc, kb_vector_index
+
 from app.api.v1.modules.kb.repositories.kb_documents_repository import KBDocumentsRepository
+from app.api.v1.modules.kb.services import kb_ingestion_service
 from app.api.v1.modules.kb.models.schemas import KBDocumentCreateRequest, KBDocumentUpdateRequest
 
 
@@ -36,10 +39,59 @@ class KBDocumentsService:
         return await self.repo.get_document(company_code=self.company_code, document_id=document_id)
 
     async def create_document(self, *, req: KBDocumentCreateRequest) -> Dict[str, Any]:
-        return await self.repo.create_document(company_code=self.company_code, payload=req.model_dump())
+        try:
+            doc = await self.repo.create_document(company_code=self.company_code, payload=req.model_dump())
+            await self.repo.db.commit()
+        except Exception:
+            await self.repo.db.rollback()
+            raise
+        return doc
 
     async def update_document(self, *, document_id: UUID, req: KBDocumentUpdateRequest) -> Optional[Dict[str, Any]]:
-        return await self.repo.update_document(company_code=self.company_code, document_id=document_id, payload=req.model_dump(exclude_none=True))
+        payload = req.model_dump(exclude_none=True)
+        try:
+            doc = await self.repo.update_document(company_code=self.company_code, document_id=document_id, payload=payload)
+            await self.repo.db.commit()
+        except Exception:
+            await self.repo.db.rollback()
+            raise
+        if doc is not None:
+            self._sync_vector_index(doc, payload)
+        return doc
 
     async def delete_document(self, *, document_id: UUID) -> None:
-        await self.repo.delete_document(company_code=self.company_code, document_id=document_id)
+        try:
+            await self.repo.delete_document(company_code=self.company_code, document_id=document_id)
+            await self.repo.db.commit()
+        except Exception:
+            await self.repo.db.rollback()
+            raise
+        kb_vector_index.remove_document(self.company_code, document_id)
+
+    async def start_ingestion(self, *, document_id: UUID, restart: bool = False) -> Tuple[Optional[Dict[str, Any]], str]:
+        """(document, outcome): outcome is "started", "running" (already, in this worker) or "no_source"."""
+        doc = await self.repo.get_document(company_code=self.company_code, document_id=document_id)
+        if doc is None:
+            return None, "not_found"
+        if not (doc.get("metadata") or {}).get("source_path"):
+            return doc, "no_source"
+        started = kb_ingestion_service.start_ingestion(document_id, restart=restart)
+        return doc, "started" if started else "running"
+
+    def _sync_vector_index(self, doc: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Search filters read doc_type / language / tags from the index: apply committed changes to it."""
+        if doc.get("is_active") is False:
+            kb_vector_index.remove_document(self.company_code, doc["id"])
+        elif payload.get("is_active") is True and not kb_vector_index.has_document(self.company_code, doc["id"]):
+            # (re)activated: its chunks are not loaded, rebuild the partition on next search
+            kb_vector_index.invalidate(self.company_code)
+        elif payload.keys() & {"doc_type", "language_code", "tags"}:
+            kb_vector_index.set_document(
+                self.company_code,
+                VectorDoc(
+                    id=doc["id"],
+                    doc_type=doc.get("doc_type"),
+                    language_code=doc.get("language_code"),
+                    tags=frozenset(doc.get("tags") or ()),
+                ),
+            )
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.clients.storage_client import get_storage
+from app.core.config import Settings, get_settings
+from app.core.logging_config import get_service_logger
+from app.database.database import AsyncSessionLocal
+from app.services.embeddings import get_embedding_service
+from app.services.text_chunking import Chunk, chunk_pages, read_pages
+from app.services.vector_index import VectorDoc, VectorRow, kb_vector_index
+
+from app.api.v1.modules.kb.repositories.kb_ingestion_repository import KBIngestionRepository
+
+if TYPE_CHECKING:
+    import numpy as np  # annotations only
+
+logger = get_service_logger("service.kb_ingestion")
+
+
+@dataclass
+class IngestReport:
+    document_id: UUID
+    company_code: Optional[str] = None
+    status: str = "failed"  # ready | failed | missing
+    pages: int = 0
+    chunks: int = 0
+    resumed_from: int = 0  # chunks already written by an earlier, interrupted run
+    written: int = 0
+    chars: int = 0
+    seconds: float = 0.0
+    embed_seconds: float = 0.0  # waiting on embeddings (the writer's view: overlapped with writes)
+    write_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.written / self.seconds if self.seconds else 0.0
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "document_id": str(self.document_id),
+            "seconds": round(self.seconds, 3),
+            "embed_seconds": round(self.embed_seconds, 3),
+            "write_seconds": round(self.write_seconds, 3),
+            "chunks_per_second": round(self.chunks_per_second, 1),
+            "chars_per_second": round(self.chars_per_second, 1),
+        }
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _chunk_metadata(doc: Dict[str, Any], chunk: Chunk) -> Dict[str, Any]:
+    return {
+        "page_start": chunk.page_start,
+        "page_end": chunk.page_end,
+        "char_start": chunk.char_start,
+        "char_end": chunk.char_end,
+        "language_code": doc.get("language_code"),
+    }
+
+
+class KBIngestionService:
+    """
+    kb_documents -> embedded kb_chunks, resumable.
+
+    - source: metadata.source_path in KB_SOURCE_BUCKET (PDF via pypdf, otherwise UTF-8 text, pages split on \\f)
+    - chunks: page-aware with overlap (app/services/text_chunking.py); deterministic, so chunk_index
+      identifies the same chunk on every run
+    - batches of KB_INGEST_BATCH chunks are embedded up to KB_INGEST_CONCURRENCY batches ahead of
+      the writer; each batch is one unnest INSERT + the metadata.ingest checkpoint in one transaction
+    - resume: when metadata.ingest.fingerprint (source sha256 + chunk settings + embedding model)
+      still matches, the chunks already committed are skipped; otherwise they are replaced
+    - status: draft -> ingesting -> ready | failed
+
+    Runs on its own sessions (background task / CLI), not on a request session.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: Optional[Settings] = None,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.settings = settings or get_settings()
+        self._session_factory = session_factory
+
+    def _fingerprint(self, source_sha256: str) -> str:
+        backend = get_embedding_service().backend
+        s = self.settings
+        return f"{source_sha256}:{s.KB_CHUNK_CHARS}:{s.KB_CHUNK_OVERLAP_CHARS}:{backend.model}:{backend.dim}"
+
+    async def _load_source(self, source_path: str) -> Tuple[str, List[str]]:
+        """Download to a temp file, return (sha256, pages)."""
+        fd, name = tempfile.mkstemp(prefix="wp-kb-", suffix=PurePosixPath(source_path).suffix)
+        os.close(fd)
+        local = Path(name)
+        try:
+            await get_storage().download(self.settings.KB_SOURCE_BUCKET, source_path, local)
+            sha256 = await asyncio.to_thread(_sha256_file, local)
+            pages = await asyncio.to_thread(read_pages, local)
+            return sha256, pages
+        finally:
+            await asyncio.to_thread(local.unlink, True)
+
+    async def ingest(self, document_id: UUID, *, restart: bool = False) -> IngestReport:
+        report = IngestReport(document_id=document_id)
+        t0 = time.perf_counter()
+        async with self._session_factory() as db:
+            repo = KBIngestionRepository(db)
+            doc = await repo.get_document(document_id=document_id)
+            if doc is None:
+                report.status, report.error = "missing", "document not found"
+                return report
+            report.company_code = doc["company_code"]
+            state: Dict[str, Any] = {}
+            try:
+                await self._run(repo, doc, report, state, restart=restart)
+            except Exception as e:
+                await db.rollback()
+                report.error = f"{type(e).__name__}: {e}"
+                logger.exception("ingest failed document=%s after %d chunks", document_id, report.written)
+                # the checkpoint stays: a later run resumes unless the source / settings changed
+                previous = (doc.get("metadata") or {}).get("ingest") or {}
+                try:
+                    await repo.set_state(
+                        document_id=document_id,
+                        status="failed",
+                        ingest={**previous, **state, "error": report.error},
+                    )
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    logger.warning("could not record failure document=%s", document_id)
+            finally:
+                report.seconds = time.perf_counter() - t0
+
+        logger.info(
+            "ingest %s document=%s chunks=%d/%d resumed_from=%d %.1fs (%.1f chunks/s, %.0f chars/s)",
+            report.status, document_id, report.resumed_from + report.written, report.chunks,
+            report.resumed_from, report.seconds, report.chunks_per_second, report.chars_per_second,
+        )
+        return report
+
+    async def _run(
+        self,
+        repo: KBIngestionRepository,
+        doc: Dict[str, Any],
+        report: IngestReport,
+        state: Dict[str, Any],
+        *,
+        restart: bool,
+    ) -> None:
+        """Fills `state` (the metadata.ingest checkpoint) as it goes; a cancelled run stays 'ingesting'."""
+        started = time.perf_counter()
+        s = self.settings
+        db = repo.db
+        document_id, company_code = doc["id"], doc["company_code"]
+        metadata = doc.get("metadata") or {}
+        source_path = metadata.get("source_path")
+        if not source_path:
+            raise ValueError("metadata.source_path is not set")
+
+        sha256, pages = await self._load_source(source_path)
+        chunks = await asyncio.to_thread(
+            chunk_pages, pages, max_chars=s.KB_CHUNK_CHARS, overlap_chars=s.KB_CHUNK_OVERLAP_CHARS
+        )
+        report.pages, report.chunks = len(pages), len(chunks)
+
+        fingerprint = self._fingerprint(sha256)
+        previous = metadata.get("ingest") or {}
+        column_type = await repo.embedding_column_type()
+        if not restart and previous.get("fingerprint") == fingerprint:
+            done = await repo.count_done_chunks(document_id=document_id)
+        else:
+            await repo.delete_chunks(document_id=document_id)
+            done = 0
+        report.resumed_from = done
+
+        state.update(
+            fingerprint=fingerprint,
+            source_sha256=sha256,
+            pages=len(pages),
+            chunks_total=len(chunks),
+            chunks_done=done,
+            started_at=_now(),
+        )
+        await repo.set_state(document_id=document_id, status="ingesting", ingest=state)
+        await db.commit()
+        if not done:
+            kb_vector_index.remove_document(company_code, document_id)
+
+        vdoc = VectorDoc(
+            id=document_id,
+            doc_type=doc.get("doc_type"),
+            language_code=doc.get("language_code"),
+            tags=frozenset(doc.get("tags") or ()),
+        )
+        embeddings = get_embedding_service()
+        size = max(1, s.KB_INGEST_BATCH)
+        batches = [chunks[i : i + size] for i in range(done, len(chunks), size)]
+
+        async def _embed(batch: Sequence[Chunk]) -> List[np.ndarray]:
+            return await embeddings.embed_many([c.content for c in batch], remember=False)
+
+        async def _write(batch: Sequence[Chunk], task: "asyncio.Task[List[np.ndarray]]") -> None:
+            t = time.perf_counter()
+            vectors = await task
+            report.embed_seconds += time.perf_counter() - t
+
+            t = time.perf_counter()
+            metas = [_chunk_metadata(doc, c) for c in batch]
+            ids = await repo.insert_chunks(
+                company_code=company_code,
+                document_id=document_id,
+                column_type=column_type,
+                chunks=batch,
+                metadatas=metas,
+                embeddings=vectors,
+            )
+            checkpoint = {**state, "chunks_done": batch[-1].index + 1}
+            await repo.set_state(document_id=document_id, status="ingesting", ingest=checkpoint)
+            await db.commit()
+            state.update(checkpoint)
+            report.write_seconds += time.perf_counter() - t
+            report.written += len(batch)
+            report.chars += sum(len(c.content) for c in batch)
+
+            kb_vector_index.upsert(
+                company_code,
+                [
+                    VectorRow(chunk_id=ids[c.index], document_id=document_id, embedding=v, metadata=m, text=c.content)
+                    for c, v, m in zip(batch, vectors, metas)
+                ],
+                [vdoc],
+            )
+
+        # embeddings run up to KB_INGEST_CONCURRENCY batches ahead; writes stay in chunk_index order,
+        # so everything below chunks_done is always committed
+        ahead: Deque[Tuple[Sequence[Chunk], asyncio.Task]] = deque()
+        try:
+            for batch in batches:
+                ahead.append((batch, asyncio.create_task(_embed(batch))))
+                if len(ahead) >= max(1, s.KB_INGEST_CONCURRENCY):
+                    await _write(*ahead.popleft())
+            while ahead:
+                await _write(*ahead.popleft())
+        finally:
+            for _, task in ahead:
+                task.cancel()
+
+        elapsed = time.perf_counter() - started
+        state.update(
+            finished_at=_now(),
+            seconds=round(elapsed, 3),
+            chunks_per_second=round(report.written / elapsed, 1) if elapsed else 0.0,
+        )
+        state.pop("error", None)
+        await repo.set_state(document_id=document_id, status="ready", ingest=state)
+        await db.commit()
+        report.status = "ready"
+
+
+# ---- background runs (POST /kb/documents/{id}/ingest) ----
+_running: Dict[UUID, "asyncio.Task[IngestReport]"] = {}
+
+
+def is_ingesting(document_id: UUID) -> bool:
+    return document_id in _running
+
+
+def start_ingestion(document_id: UUID, *, restart: bool = False) -> bool:
+    """Ingest in the background of this worker; False if the document is already being ingested here."""
+    if document_id in _running:
+        return False
+    task = asyncio.create_task(KBIngestionService().ingest(document_id, restart=restart))
+    _running[document_id] = task
+    task.add_done_callback(lambda _t: _running.pop(document_id, None))
+    return True
+
+
+async def cancel_ingestions() -> None:
+    """Shutdown: stop running ingestions; they stay 'ingesting' and resume from their checkpoint."""
+    tasks: Set[asyncio.Task] = set(_running.values())
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.wait(tasks, timeout=5)
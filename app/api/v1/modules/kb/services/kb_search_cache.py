@@ -0,0 +1,85 @@
+# app/api/v1/modules/kb/services/kb_search_cache.py
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.core.config import get_settings
+from app.services.embeddings import content_hash
+from app.services.vector_index import FusedHit
+
+# (company_code, query hash, mode, filters, top_k)
+SearchKey = Tuple[str, str, str, str, int]
+
+
+class KBSearchCache:
+    """
+    TTL + LRU cache of ranked KB search hits (chunk ids + scores, not content).
+
+    - key: company, content_hash of the query (NFC + collapsed whitespace), mode, filters, top_k
+    - each entry remembers the vector index version it was ranked on (kb_vector_index.version):
+      any write or rebuild of the company's partition bumps it, so an entry never outlives the
+      index state it came from; mismatching entries count as misses and are replaced
+    - a hit skips the query embedding and both index scans; chunk content is still read by
+      primary key per request, so edited / deleted chunks are never served from here
+    - event loop only (no lock): get / put run between awaits
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._items: "OrderedDict[SearchKey, Tuple[int, float, List[FusedHit]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = float(get_settings().KB_SEARCH_CACHE_TTL_SECONDS)
+        return self._ttl_seconds
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is None:
+            self._max_entries = int(get_settings().KB_SEARCH_CACHE_MAX_ENTRIES)
+        return self._max_entries
+
+    @staticmethod
+    def key(company_code: str, query: str, mode: str, filters: Mapping[str, Any], top_k: int) -> SearchKey:
+        canonical = json.dumps(filters or {}, sort_keys=True, ensure_ascii=False, default=str)
+        return (company_code, content_hash(query), mode, canonical, int(top_k))
+
+    def get(self, key: SearchKey, version: int) -> Optional[List[FusedHit]]:
+        if self.ttl_seconds <= 0:
+            return None
+        entry = self._items.get(key)
+        if entry is None or entry[0] != version or time.monotonic() >= entry[1]:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, key: SearchKey, version: int, hits: List[FusedHit]) -> None:
+        ttl = self.ttl_seconds
+        if ttl <= 0:
+            return
+        self._items[key] = (version, time.monotonic() + ttl, hits)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+kb_search_cache = KBSearchCache()
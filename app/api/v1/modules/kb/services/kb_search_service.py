@@ -1,24 +1,138 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import asyncio
+from typing import Any, Dict, List, Sequence
 
 from app.core.config import Settings
+from app.database.database import AsyncSessionLocal
+from app.services.embeddings import content_hash, get_embedding_service
+from app.services.vector_index import FusedHit, Loader, kb_vector_index, reciprocal_rank_fusion
 
+from app.api.v1.modules.chat.models.schemas import ChatRetrievalCreateRequest, ChatRetrievalItemCreateRequest
+from app.api.v1.modules.chat.services.chat_retrieval_log_writer import retrieval_log_writer
 from app.api.v1.modules.kb.repositories.kb_search_repository import KBSearchRepository
+from app.api.v1.modules.kb.services.kb_search_cache import kb_search_cache
 from app.api.v1.modules.kb.models.schemas import KBSearchRequest
 
 
+def kb_vector_loader(company_code: str) -> Loader:
+    """Vector loader on its own session (startup hydration, background refresh)."""
+
+    async def _load():
+        async with AsyncSessionLocal() as db:
+            return await KBSearchRepository(db).load_vectors(company_code=company_code)
+
+    return _load
+
+
+async def hydrate_kb_vector_index() -> None:
+    """Startup: build every company's partition (runs in the background, see main.lifespan)."""
+    async with AsyncSessionLocal() as db:
+        companies = await KBSearchRepository(db).list_vector_companies()
+    await kb_vector_index.warm(companies, kb_vector_loader)
+
+
+def _score(hit: FusedHit, mode: str) -> float:
+    """hybrid: the fused (RRF) score; a single list: its own score (cosine / BM25)."""
+    return hit.score if mode == "hybrid" else next(iter(hit.scores.values()))
+
+
 class KBSearchService:
     def __init__(self, *, repo: KBSearchRepository, company_code: str, settings: Settings):
         self.repo = repo
         self.company_code = company_code
         self.settings = settings
 
+    def _loader(self) -> Loader:
+        return lambda: self.repo.load_vectors(company_code=self.company_code)
+
+    async def _vector(self, req: KBSearchRequest, depth: int):
+        vector = await get_embedding_service().embed(req.query)
+        return await kb_vector_index.search(
+            self.company_code,
+            self._loader(),
+            vector,
+            depth,
+            req.filters,
+            refresh_loader=kb_vector_loader(self.company_code),
+        )
+
+    async def _lexical(self, req: KBSearchRequest, depth: int):
+        return await kb_vector_index.lexical_search(
+            self.company_code,
+            self._loader(),
+            req.query,
+            depth,
+            req.filters,
+            refresh_loader=kb_vector_loader(self.company_code),
+        )
+
+    async def rank(self, *, req: KBSearchRequest, mode: str) -> List[FusedHit]:
+        """
+        Ranked chunk ids. hybrid: vector and BM25 lists (KB_HYBRID_CANDIDATES deep each) merged by
+        reciprocal rank fusion; the lexical search runs while the query is being embedded.
+        """
+        if mode == "vector":
+            rankings = {"vector": await self._vector(req, req.top_k)}
+        elif mode == "lexical":
+            rankings = {"lexical": await self._lexical(req, req.top_k)}
+        else:
+            depth = max(req.top_k, int(self.settings.KB_HYBRID_CANDIDATES))
+            vector_hits, lexical_hits = await asyncio.gather(self._vector(req, depth), self._lexical(req, depth))
+            rankings = {"vector": vector_hits, "lexical": lexical_hits}
+        return reciprocal_rank_fusion(rankings, k=int(self.settings.KB_RRF_K), top_k=req.top_k)
+
     async def search(self, *, req: KBSearchRequest) -> List[Dict[str, Any]]:
-        return await self.repo.search_by_text(
-            company_code=self.company_code,
-            query=req.query,
-            top_k=req.top_k,
-            filters=req.filters,
-            settings=self.settings,
+        mode = req.mode or self.settings.KB_SEARCH_MODE
+        key = kb_search_cache.key(self.company_code, req.query, mode, req.filters, req.top_k)
+        version = kb_vector_index.version(self.company_code)
+        hits = kb_search_cache.get(key, version)
+        if hits is None:
+            hits = await self.rank(req=req, mode=mode)
+            # not if the index changed (write / first build) meanwhile: the ranking may predate it
+            if kb_vector_index.version(self.company_code) == version:
+                kb_search_cache.put(key, version, hits)
+        rows = {
+            r["chunk_id"]: r
+            for r in await self.repo.fetch_chunks(company_code=self.company_code, chunk_ids=[h.chunk_id for h in hits])
+        }
+        # a chunk deleted since the index saw it is simply skipped
+        hits = [h for h in hits if h.chunk_id in rows]
+        if req.session_id is not None:
+            self._log(req, mode, hits)
+        return [
+            {
+                **rows[h.chunk_id],
+                "score": _score(h, mode),
+                "ranking": {name: {"rank": h.ranks[name], "score": h.scores[name]} for name in h.ranks},
+            }
+            for h in hits
+        ]
+
+    def _log(self, req: KBSearchRequest, mode: str, hits: Sequence[FusedHit]) -> None:
+        """Queue the retrieval for chat_retrievals / chat_retrieval_items (off the request path)."""
+        retrieval_log_writer.submit(
+            self.company_code,
+            ChatRetrievalCreateRequest(
+                session_id=req.session_id,
+                assistant_message_id=req.assistant_message_id,
+                query_text=req.query,
+                query_hash=content_hash(req.query),
+                top_k=req.top_k,
+                filters=req.filters,
+                metadata={"source": "kb_search", "mode": mode, "rrf_k": int(self.settings.KB_RRF_K)},
+            ),
+            [
+                ChatRetrievalItemCreateRequest(
+                    chunk_id=h.chunk_id,
+                    document_id=h.document_id,
+                    rank=rank,
+                    score=_score(h, mode),
+                    metadata={
+                        **{f"{name}_rank": r for name, r in h.ranks.items()},
+                        **{f"{name}_score": sc for name, sc in h.scores.items()},
+                    },
+                )
+                for rank, h in enumerate(hits, start=1)
+            ],
         )
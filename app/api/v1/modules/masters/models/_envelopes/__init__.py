@@ -70,6 +70,7 @@ from .service_types_envelopes import ServiceTypeDeleteEnvelope
 from .currencies_envelopes import CurrenciesSearchEnvelope
 from .languages_envelopes import LanguagesSearchEnvelope
 from .geographies_envelopes import GeographiesSearchEnvelope
+from .geo_tree_envelopes import GeoTreeEnvelope
 
 __all__ = [
     "CompanySearchEnvelope",
@@ -144,4 +145,5 @@ __all__ = [
     "CurrenciesSearchEnvelope",
     "LanguagesSearchEnvelope",
     "GeographiesSearchEnvelope",
+    "GeoTreeEnvelope",
 ]
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from typing import TypeAlias
+from app.api.v1.models._envelopes.base_envelopes import SuccessEnvelope
+
+# data = {"version": "...", "countries": [...]}  (full)
+# data = {"version": "...", "base_version": "...", "delta": {...}}  (delta)
+GeoTreeEnvelope: TypeAlias = SuccessEnvelope[dict]
@@ -29,13 +29,44 @@ def _build_ilike_filters(model: Any, q: str, fields: Sequence[str]):
     return filters
 
 
+async def _load_rows(session: AsyncSession, stmt, model: Any) -> list[dict]:
+    stmt = stmt.order_by(*model.__table__.primary_key.columns)
+    rows = (await session.execute(stmt)).mappings().all()
+    return [dict(r) for r in rows]
+
+
 class BaseSettingsSearchRepository:
     """DB-only: list/search with paging. No commit/rollback."""
 
+    # fields matched by the in-memory (reference cache) search; None -> search_fields
+    snapshot_search_fields: Sequence[str] | None = None
+    # columns returned by search(); None -> every table column
+    list_columns: Sequence[str] | None = None
+
     def __init__(self, session: AsyncSession, model: Any, search_fields: Sequence[str]):
         self.session = session
         self.model = model
         self.search_fields = list(search_fields)
+
+    @property
+    def pk_field(self) -> str:
+        return self.model.__table__.primary_key.columns.keys()[0]
+
+    def projection(self):
+        """select(...) used by load_all(); joined repositories override with their labels."""
+        return select(*self.model.__table__.c)
+
+    @property
+    def response_fields(self) -> list[str]:
+        """Keys of the rows search() returns; the cached search trims snapshot rows to these."""
+        if self.list_columns:
+            return list(self.list_columns)
+        return list(self.projection().selected_columns.keys())
+
+    async def load_all(self) -> list[dict]:
+        """Whole table (all is_active values) as plain dicts, for the reference cache."""
+        return await _load_rows(self.session, self.projection(), self.model)
+
     async def search(
         self,
         q: str | None,
@@ -47,7 +78,7 @@ class BaseSettingsSearchRepository:
     ):
         # ✅ Standard: select columns + mappings() for list/search
         table = self.model.__table__
-        cols = list(table.c)  # all columns -> dict-like rows
+        cols = [table.c[c] for c in self.list_columns] if self.list_columns else list(table.c)  # -> dict-like rows
 
         stmt = select(*cols)
 
@@ -105,34 +136,65 @@ class BaseSettingsSearchRepository:
     #     return rows, int(total)
 
 
+async def _get_with_options(session: AsyncSession, model: Any, pk_field: str, pk: Any, options: Sequence[Any]):
+    stmt = select(model).where(getattr(model, pk_field) == pk)
+    if options:
+        stmt = stmt.options(*options).execution_options(populate_existing=True)
+    return (await session.execute(stmt)).scalars().first()
+
+
 class BaseSettingsReadRepository:
     """DB-only: read by primary key. No commit/rollback."""
 
-    def __init__(self, session: AsyncSession, model: Any, pk_field: str = "id"):
+    def __init__(
+        self,
+        session: AsyncSession,
+        model: Any,
+        pk_field: str = "id",
+        load_options: Sequence[Any] = (),
+    ):
         self.session = session
         self.model = model
         self.pk_field = pk_field
+        # relationships are not eager by default: pass loaders for the ones the response reads
+        self.load_options = tuple(load_options)
 
     async def get(self, pk: Any):
-        col = getattr(self.model, self.pk_field)
-        stmt = select(self.model).where(col == pk)
-        return (await self.session.execute(stmt)).scalars().first()
+        return await _get_with_options(self.session, self.model, self.pk_field, pk, self.load_options)
+
+    async def load_all(self) -> list[dict]:
+        """Same rows as BaseSettingsSearchRepository.load_all() for single-table entities."""
+        return await _load_rows(self.session, select(*self.model.__table__.c), self.model)
 
 
 class BaseSettingsCrudRepository:
     """DB-only CRUD. No commit/rollback."""
 
-    def __init__(self, session: AsyncSession, model: Any, pk_field: str = "id"):
+    def __init__(
+        self,
+        session: AsyncSession,
+        model: Any,
+        pk_field: str = "id",
+        load_options: Sequence[Any] = (),
+    ):
         self.session = session
         self.model = model
         self.pk_field = pk_field
+        self.load_options = tuple(load_options)
+
+    async def _with_refs(self, obj: Any) -> Any:
+        # refresh() does not load relationships -> re-select with the loaders the response needs
+        if not self.load_options:
+            return obj
+        pk = getattr(obj, self.pk_field)
+        return await _get_with_options(self.session, self.model, self.pk_field, pk, self.load_options)
 
     async def create(self, data: dict) -> Any:
         obj = self.model(**data)
         self.session.add(obj)
         await self.session.flush()
         await self.session.refresh(obj)
-        return obj
+        return await self._with_refs(obj)
 
     async def update(self, pk: Any, data: dict) -> Any:
         obj = await self.session.get(self.model, pk)
@@ -142,7 +204,7 @@ class BaseSettingsCrudRepository:
             setattr(obj, k, v)
         await self.session.flush()
         await self.session.refresh(obj)
-        return obj
+        return await self._with_refs(obj)
 
     async def delete(self, pk: Any) -> bool:
         obj = await self.session.get(self.model, pk)
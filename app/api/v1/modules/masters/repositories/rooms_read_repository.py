@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.db.models import Room
 from app.api.v1.modules.masters.repositories.base_settings_repository import BaseSettingsReadRepository
@@ -8,4 +9,9 @@ from app.api.v1.modules.masters.repositories.base_settings_repository import Bas
 
 class RoomReadRepository(BaseSettingsReadRepository):
     def __init__(self, session: AsyncSession):
-        super().__init__(session=session, model=Room, pk_field='id')
+        super().__init__(
+            session=session,
+            model=Room,
+            pk_field='id',
+            load_options=(joinedload(Room.location), joinedload(Room.building), joinedload(Room.room_type)),
+        )
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_
 from uuid import UUID
 from app.db.models.core_settings import Service, ServiceType
+from app.services.suggest_index import SuggestRow
 from app.api.v1.modules.masters.repositories.base_settings_repository import BaseSettingsSearchRepository
 
 
@@ -86,3 +87,26 @@ class ServiceSearchRepository(BaseSettingsSearchRepository):
         stmt = stmt.limit(limit).offset(offset)
         rows = (await self.session.execute(stmt)).mappings().all()
         return rows, total
+
+    async def suggest_rows(self, limit: int) -> list[SuggestRow]:
+        """Active services for the in-memory suggest index (service type name is matched, not shown)."""
+        stmt = (
+            select(Service.id, Service.service_name, ServiceType.service_type_name)
+            .select_from(Service)
+            .join(ServiceType, Service.service_type_id == ServiceType.id)
+            .where(Service.is_active.is_(True))
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [(r.id, r.service_name, (r.service_type_name or "",)) for r in rows]
+
+    async def suggest_exceeds(self, max_rows: int) -> bool:
+        """More than max_rows suggestable services? (skips max_rows ids, transfers at most one)"""
+        stmt = (
+            select(Service.id)
+            .join(ServiceType, Service.service_type_id == ServiceType.id)
+            .where(Service.is_active.is_(True))
+            .offset(max_rows)
+            .limit(1)
+        )
+        return (await self.session.execute(stmt)).first() is not None
@@ -20,6 +20,7 @@ from .geographies_search_router import router as geographies_search_router
 from .geographies_grid_router import router as geographies_grid_router
 from .languages_search_router import router as languages_search_router
 from .languages_grid_router import router as languages_grid_router
+from .geo_tree_router import router as geo_tree_router
 
 from .provinces_search_router import router as provinces_search_router
 from .provinces_grid_router import router as provinces_grid_router
@@ -97,6 +98,7 @@ router.include_router(geographies_search_router, prefix="/geographies")
 router.include_router(geographies_grid_router, prefix="/geographies")
 router.include_router(languages_search_router, prefix="/languages")
 router.include_router(languages_grid_router, prefix="/languages")
+router.include_router(geo_tree_router, prefix="/geo_tree")
 
 router.include_router(provinces_search_router, prefix="/provinces")
 router.include_router(provinces_grid_router, prefix="/provinces")
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.session import get_db
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
+from app.utils.router_helpers import etag_matches, not_modified
 
 from app.api.v1.utils.list_payload_builder import build_list_payload
 
@@ -59,6 +60,11 @@ async def search_cities(
     sort_dir: str = Query("desc", pattern="^(asc|desc)$", description="Sort direction: asc|desc"),
     svc: CitySearchService = Depends(get_search_service),
 ):
+    # ✅ reference data served from in-process cache; ETag = content digest
+    etag = await svc.etag()
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     rows, total = await svc.search(
         q=q,
         province_id=province_id,
@@ -83,8 +89,10 @@ async def search_cities(
         },
     )
 
-    return ResponseHandler.success_from_request(
+    resp = ResponseHandler.success_from_request(
         request,
         message=ResponseCode.SUCCESS["LISTED"][1],
         data=payload.model_dump(exclude_none=True),
-    )
\ No newline at end of file
+    )
+    resp.headers["ETag"] = etag
+    return resp
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.session import get_db
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
+from app.utils.router_helpers import etag_matches, not_modified
 
 from app.api.v1.utils.list_payload_builder import build_list_payload
 
@@ -58,6 +59,11 @@ async def grid_countries(
     sort_dir: str = Query("desc", pattern="^(asc|desc)$", description="Sort direction: asc|desc"),
     svc: CountrySearchService = Depends(get_search_service),
 ):
+    # ✅ reference data served from in-process cache; ETag = content digest
+    etag = await svc.etag()
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     rows, total = await svc.search(q=q, is_active=is_active, limit=limit, offset=offset, sort_by=sort_by, sort_dir=sort_dir)
     items = [CountryResponse.model_validate(_normalize_row(r), from_attributes=True).model_dump(exclude_none=True) for r in rows]
     payload = build_list_payload(
@@ -68,8 +74,10 @@ async def grid_countries(
         filters={"q": q, "is_active": is_active, "sort_by": sort_by, "sort_dir": sort_dir},
     )
 
-    return ResponseHandler.success_from_request(
+    resp = ResponseHandler.success_from_request(
         request,
         message=ResponseCode.SUCCESS["LISTED"][1],
         data=payload.model_dump(exclude_none=True),
     )
+    resp.headers["ETag"] = etag
+    return resp
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.session import get_db
+from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
+from app.utils.router_helpers import etag_matches, not_modified
+
+from app.api.v1.modules.masters.repositories.countries_search_repository import CountrySearchRepository
+from app.api.v1.modules.masters.repositories.provinces_search_repository import ProvinceSearchRepository
+from app.api.v1.modules.masters.repositories.cities_search_repository import CitySearchRepository
+from app.api.v1.modules.masters.repositories.districts_search_repository import DistrictSearchRepository
+from app.api.v1.modules.masters.services.countries_search_service import CountrySearchService
+from app.api.v1.modules.masters.services.provinces_search_service import ProvinceSearchService
+from app.api.v1.modules.masters.services.cities_search_service import CitySearchService
+from app.api.v1.modules.masters.services.districts_search_service import DistrictSearchService
+from app.api.v1.modules.masters.services.geo_tree_service import GeoTreeService
+from app.api.v1.modules.masters.models._envelopes import GeoTreeEnvelope
+
+router = APIRouter()
+# router = APIRouter(prefix="/geo_tree", tags=["Core_Settings"])
+
+
+def get_geo_tree_service(session: AsyncSession = Depends(get_db)) -> GeoTreeService:
+    return GeoTreeService(
+        countries=CountrySearchService(CountrySearchRepository(session)),
+        provinces=ProvinceSearchService(ProvinceSearchRepository(session)),
+        cities=CitySearchService(CitySearchRepository(session)),
+        districts=DistrictSearchService(DistrictSearchRepository(session)),
+    )
+
+
+@router.get(
+    "",
+    response_class=UnicodeJSONResponse,
+    response_model=GeoTreeEnvelope,
+    response_model_exclude_none=True,
+    operation_id="read_geo_tree",
+)
+async def read_geo_tree(
+    request: Request,
+    since: str | None = Query(None, description="Client's current tree version -> delta response"),
+    svc: GeoTreeService = Depends(get_geo_tree_service),
+):
+    """
+    Address form tree: country -> provinces -> cities -> districts (active only).
+
+    - no `since`: full tree, pre-serialized (gzip when accepted), ETag = version
+    - `since=<version>`: {"version", "base_version", "delta": {level: {upsert, remove}}}
+      falls back to the full tree if the base version is no longer known
+    """
+    if since:
+        snap, delta = await svc.delta_since(since)
+        if delta is not None:
+            return ResponseHandler.success_from_request(
+                request,
+                message=ResponseCode.SUCCESS["FOUND"][1],
+                data={"version": snap.version, "base_version": since, "delta": delta},
+            )
+    else:
+        snap = await svc.snapshot()
+
+    etag = f'"{snap.version}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    body = snap.body_json
+    if "gzip" in (request.headers.get("accept-encoding") or "").lower():
+        body = snap.body_gzip
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(content=body, media_type=UnicodeJSONResponse.media_type, headers=headers)
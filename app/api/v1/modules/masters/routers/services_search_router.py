@@ -13,6 +13,7 @@ from app.api.v1.modules.masters.repositories.services_search_repository import S
 from app.api.v1.modules.masters.services.services_search_service import ServiceSearchService
 from app.api.v1.modules.masters.models._envelopes import ServiceSearchEnvelope
 from app.api.v1.modules.masters.models.dtos import ServiceResponse
+from app.api.v1.models._envelopes.base_envelopes import SuggestPayload
 
 router = APIRouter()
 # router = APIRouter(prefix="/services", tags=["Core_Settings"])
@@ -89,4 +90,20 @@ async def search_services(
         request,
         message=ResponseCode.SUCCESS["LISTED"][1],
         data=payload.model_dump(exclude_none=True),
-    )
\ No newline at end of file
+    )
+
+
+@router.get(
+    "/suggest",
+    response_class=UnicodeJSONResponse,
+    response_model=SuggestPayload,
+    operation_id="suggest_services",
+)
+async def suggest_services(
+    q: str = Query(..., min_length=1, description="prefix: service name / service type"),
+    limit: int = Query(10, ge=1, le=50),
+    svc: ServiceSearchService = Depends(get_search_service),
+):
+    # picker hot path: no envelope, no count
+    items = await svc.suggest(q=q, limit=limit)
+    return UnicodeJSONResponse(content={"q": q, "items": items})
@@ -4,17 +4,67 @@ from typing import Any, Iterable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.utils.list_filters import filter_items_in_memory, page_items, sort_items_in_memory
 from app.api.v1.modules.masters.repositories.base_settings_repository import (
     BaseSettingsSearchRepository,
     BaseSettingsReadRepository,
     BaseSettingsCrudRepository,
 )
+from app.api.v1.modules.masters.services.reference_data_cache import (
+    ReferenceSnapshot,
+    reference_data_cache,
+)
 
 
 class BaseSettingsSearchService:
+    # reference tables: set to the table name to serve search/paging from the in-process cache
+    cache_table: str | None = None
+
     def __init__(self, repo: BaseSettingsSearchRepository):
         self.repo = repo
 
+    async def snapshot(self) -> ReferenceSnapshot:
+        return await reference_data_cache.get(
+            self.cache_table,
+            self.repo.load_all,
+            pk_field=self.repo.pk_field,
+        )
+
+    async def etag(self) -> str | None:
+        if not self.cache_table:
+            return None
+        return (await self.snapshot()).etag
+
+    async def search_snapshot(
+        self,
+        *,
+        q: str | None,
+        is_active: bool | None,
+        limit: int,
+        offset: int,
+        sort_by: str | None = None,
+        sort_dir: str = "asc",
+        equals: dict[str, Any] | None = None,
+    ):
+        """In-memory equivalent of repo.search(): filter -> sort -> page, returns (rows, total).
+
+        Rows carry the same keys as repo.search() rows (repo.response_fields), not the whole snapshot row.
+        """
+        snap = await self.snapshot()
+        items = filter_items_in_memory(
+            list(snap.items),
+            q=q,
+            is_active=is_active,
+            search_fields=list(self.repo.snapshot_search_fields or self.repo.search_fields),
+        )
+        for f, v in (equals or {}).items():
+            if v is not None:
+                items = [x for x in items if x.get(f) == v]
+
+        items = sort_items_in_memory(items, sort_by=sort_by, sort_dir=sort_dir)
+        fields = self.repo.response_fields
+        return [{f: x.get(f) for f in fields} for x in page_items(items, limit, offset)], len(items)
+
     async def search(
         self,
         q: str | None,
@@ -24,6 +74,16 @@ class BaseSettingsSearchService:
         sort_by: str | None = None,
         sort_dir: str = "asc",
     ):
+        if self.cache_table and not base_filters:
+            return await self.search_snapshot(
+                q=q,
+                is_active=None,
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+            )
+
         return await self.repo.search(
             q=q or "",
             limit=limit,
@@ -35,24 +95,42 @@ class BaseSettingsSearchService:
 
 
 class BaseSettingsReadService:
+    # single-table reference entities: read by pk from the in-process cache
+    cache_table: str | None = None
+
     def __init__(self, repo: BaseSettingsReadRepository):
         self.repo = repo
 
     async def get(self, pk: Any):
+        if self.cache_table:
+            snap = await reference_data_cache.get(
+                self.cache_table,
+                self.repo.load_all,
+                pk_field=self.repo.pk_field,
+            )
+            return snap.get(pk)
         return await self.repo.get(pk)
 
 
 class BaseSettingsCrudService:
     """Transaction boundary: commit/rollback lives here."""
 
+    # reference tables: bump the cache version after every committed write
+    cache_table: str | None = None
+
     def __init__(self, session: AsyncSession, repo: BaseSettingsCrudRepository):
         self.session = session
         self.repo = repo
 
+    def _invalidate_cache(self) -> None:
+        if self.cache_table:
+            reference_data_cache.invalidate(self.cache_table)
+
     async def create(self, data: dict):
         try:
             obj = await self.repo.create(data)
             await self.session.commit()
+            self._invalidate_cache()
             return obj
         except Exception:
             await self.session.rollback()
@@ -65,6 +143,7 @@ class BaseSettingsCrudService:
                 await self.session.rollback()
                 return None
             await self.session.commit()
+            self._invalidate_cache()
             return obj
         except Exception:
             await self.session.rollback()
@@ -77,6 +156,7 @@ class BaseSettingsCrudService:
                 await self.session.rollback()
                 return False
             await self.session.commit()
+            self._invalidate_cache()
             return True
         except Exception:
             await self.session.rollback()
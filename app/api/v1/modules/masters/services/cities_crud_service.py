@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.cities_crud_repository import CityC
 
 
 class CityCrudService(BaseSettingsCrudService):
+    cache_table = "cities"
+
     def __init__(self, session: AsyncSession, repo: CityCrudRepository):
         super().__init__(session=session, repo=repo)
@@ -7,6 +7,8 @@ from app.api.v1.modules.masters.repositories.cities_search_repository import Cit
 
 
 class CitySearchService(BaseSettingsSearchService):
+    cache_table = "cities"
+
     def __init__(self, repo: CitySearchRepository):
         super().__init__(repo=repo)
 
@@ -20,12 +22,12 @@ class CitySearchService(BaseSettingsSearchService):
         sort_by: str | None = None,
         sort_dir: str = "asc",
     ):
-        return await self.repo.search(
+        return await self.search_snapshot(
             q=q,
-            province_id=province_id,
             is_active=is_active,
             limit=limit,
             offset=offset,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            equals={"province_id": province_id},
         )
\ No newline at end of file
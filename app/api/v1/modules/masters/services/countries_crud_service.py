@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.countries_crud_repository import Co
 
 
 class CountryCrudService(BaseSettingsCrudService):
+    cache_table = "countries"
+
     def __init__(self, session: AsyncSession, repo: CountryCrudRepository):
         super().__init__(session=session, repo=repo)
@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.countries_read_repository import Co
 
 
 class CountryReadService(BaseSettingsReadService):
+    cache_table = "countries"
+
     def __init__(self, repo: CountryReadRepository):
         super().__init__(repo=repo)
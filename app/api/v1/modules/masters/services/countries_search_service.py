@@ -5,6 +5,8 @@ from app.api.v1.modules.masters.repositories.countries_search_repository import
 
 
 class CountrySearchService(BaseSettingsSearchService):
+    cache_table = "countries"
+
     def __init__(self, repo: CountrySearchRepository):
         super().__init__(repo=repo)
 
@@ -17,7 +19,7 @@ class CountrySearchService(BaseSettingsSearchService):
         sort_by: str | None = None,
         sort_dir: str = "asc",
     ):
-        return await self.repo.search(
+        return await self.search_snapshot(
             q=q,
             is_active=is_active,
             limit=limit,
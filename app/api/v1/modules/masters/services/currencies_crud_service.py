@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.currencies_crud_repository import C
 
 
 class CurrencyCrudService(BaseSettingsCrudService):
+    cache_table = "currencies"
+
     def __init__(self, session: AsyncSession, repo: CurrencyCrudRepository):
         super().__init__(session=session, repo=repo)
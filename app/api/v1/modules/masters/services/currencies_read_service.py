@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.currencies_read_repository import C
 
 
 class CurrencyReadService(BaseSettingsReadService):
+    cache_table = "currencies"
+
     def __init__(self, repo: CurrencyReadRepository):
         super().__init__(repo=repo)
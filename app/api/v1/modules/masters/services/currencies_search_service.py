@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.currencies_search_repository import
 
 
 class CurrencySearchService(BaseSettingsSearchService):
+    cache_table = "currencies"
+
     def __init__(self, repo: CurrencySearchRepository):
         super().__init__(repo=repo)
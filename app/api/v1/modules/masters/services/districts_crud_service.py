@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.districts_crud_repository import Di
 
 
 class DistrictCrudService(BaseSettingsCrudService):
+    cache_table = "districts"
+
     def __init__(self, session: AsyncSession, repo: DistrictCrudRepository):
         super().__init__(session=session, repo=repo)
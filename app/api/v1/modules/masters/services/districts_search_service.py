@@ -5,6 +5,8 @@ from app.api.v1.modules.masters.repositories.districts_search_repository import
 
 
 class DistrictSearchService(BaseSettingsSearchService):
+    cache_table = "districts"
+
     def __init__(self, repo: DistrictSearchRepository):
         super().__init__(repo=repo)
 
@@ -20,14 +22,12 @@ class DistrictSearchService(BaseSettingsSearchService):
         sort_by: str | None = None,
         sort_dir: str = "asc",
     ):
-        return await self.repo.search(
+        return await self.search_snapshot(
             q=q,
-            zip_code_exact=zip_code_exact,
-            city_id=city_id,
-            province_id=province_id,
             is_active=is_active,
             limit=limit,
             offset=offset,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            equals={"zip_code": zip_code_exact, "city_id": city_id, "province_id": province_id},
         )
\ No newline at end of file
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.logging_config import get_service_logger
+from app.utils.ResponseHandler import ResponseCode
+from app.api.v1.modules.masters.services.countries_search_service import CountrySearchService
+from app.api.v1.modules.masters.services.provinces_search_service import ProvinceSearchService
+from app.api.v1.modules.masters.services.cities_search_service import CitySearchService
+from app.api.v1.modules.masters.services.districts_search_service import DistrictSearchService
+
+logger = get_service_logger("service.geo_tree")
+
+# previous versions kept for delta responses (address forms refresh rarely)
+MAX_HISTORY = 8
+
+LEVELS = ("countries", "provinces", "cities", "districts")
+
+# flat row shape per level (used by delta): parent key + display fields
+_FLAT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "countries": ("id", "name_lo", "name_en"),
+    "provinces": ("id", "country_code", "name_lo", "name_en"),
+    "cities": ("id", "province_id", "name_lo", "name_en"),
+    "districts": ("id", "city_id", "name_lo", "name_en", "zip_code"),
+}
+
+FlatTree = Dict[str, Dict[str, dict]]
+
+
+@dataclass(frozen=True)
+class GeoTreeSnapshot:
+    version: str
+    source_key: Tuple[str, ...]
+    flat: FlatTree
+    body_json: bytes
+    body_gzip: bytes
+
+
+def _active(items) -> List[dict]:
+    return [x for x in items if x.get("is_active") is not False]
+
+
+def _flat_row(level: str, row: dict) -> dict:
+    # search projections label name_lo as "name"
+    src = dict(row)
+    src.setdefault("name_lo", row.get("name"))
+    if level == "countries":
+        src["id"] = row.get("country_code")
+    return {f: src.get(f) for f in _FLAT_FIELDS[level]}
+
+
+def _build_flat(countries, provinces, cities, districts) -> FlatTree:
+    flat: FlatTree = {}
+    for level, rows in zip(LEVELS, (countries, provinces, cities, districts)):
+        flat[level] = {str(r["id"]): r for r in (_flat_row(level, x) for x in _active(rows))}
+    return flat
+
+
+def _sort_key(x: dict):
+    return (x.get("name_lo") or "", str(x.get("id")))
+
+
+def _build_tree(flat: FlatTree) -> List[dict]:
+    """Nest flat rows: country -> provinces -> cities -> districts (orphans are dropped)."""
+
+    groups: Dict[str, Dict[str, List[dict]]] = {}
+    for level, parent_field in (("provinces", "country_code"), ("cities", "province_id"), ("districts", "city_id")):
+        by_parent: Dict[str, List[dict]] = {}
+        for x in flat[level].values():
+            by_parent.setdefault(str(x[parent_field]), []).append(x)
+        for rows in by_parent.values():
+            rows.sort(key=_sort_key)
+        groups[level] = by_parent
+
+    def children(level: str, parent_id: Any) -> List[dict]:
+        return groups[level].get(str(parent_id), [])
+
+    out = []
+    for c in sorted(flat["countries"].values(), key=_sort_key):
+        provinces = []
+        for p in children("provinces", c["id"]):
+            cities = []
+            for ci in children("cities", p["id"]):
+                districts = [
+                    {"id": d["id"], "name_lo": d["name_lo"], "name_en": d["name_en"], "zip_code": d["zip_code"]}
+                    for d in children("districts", ci["id"])
+                ]
+                cities.append({"id": ci["id"], "name_lo": ci["name_lo"], "name_en": ci["name_en"], "districts": districts})
+            provinces.append({"id": p["id"], "name_lo": p["name_lo"], "name_en": p["name_en"], "cities": cities})
+        out.append({"country_code": c["id"], "name_lo": c["name_lo"], "name_en": c["name_en"], "provinces": provinces})
+    return out
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def build_snapshot(source_key: Tuple[str, ...], flat: FlatTree) -> GeoTreeSnapshot:
+    tree = _build_tree(flat)
+    version = hashlib.sha1(_dumps(tree)).hexdigest()[:16]
+
+    # body = SuccessEnvelope without per-request meta, so it can be compressed once
+    body = {
+        "status": "success",
+        "status_code": 200,
+        "message": ResponseCode.SUCCESS["FOUND"][1],
+        "data": {"version": version, "countries": tree},
+    }
+    body_json = _dumps(body)
+    return GeoTreeSnapshot(
+        version=version,
+        source_key=source_key,
+        flat=flat,
+        body_json=body_json,
+        body_gzip=gzip.compress(body_json, compresslevel=9, mtime=0),
+    )
+
+
+def diff_flat(old: FlatTree, new: FlatTree) -> Dict[str, Dict[str, list]]:
+    delta: Dict[str, Dict[str, list]] = {}
+    for level in LEVELS:
+        o, n = old.get(level, {}), new.get(level, {})
+        upsert = [row for k, row in n.items() if o.get(k) != row]
+        remove = [row["id"] for k, row in o.items() if k not in n]
+        if upsert or remove:
+            delta[level] = {"upsert": upsert, "remove": remove}
+    return delta
+
+
+class _GeoTreeState:
+    """Process-wide current snapshot + short history of previous versions."""
+
+    def __init__(self):
+        self.current: Optional[GeoTreeSnapshot] = None
+        self.history: "OrderedDict[str, FlatTree]" = OrderedDict()
+        self.lock = asyncio.Lock()
+
+    def remember(self, snap: GeoTreeSnapshot) -> None:
+        self.history[snap.version] = snap.flat
+        self.history.move_to_end(snap.version)
+        while len(self.history) > MAX_HISTORY:
+            self.history.popitem(last=False)
+
+
+_state = _GeoTreeState()
+
+
+class GeoTreeService:
+    """
+    country -> province -> city -> district tree, built from the reference cache.
+
+    The tree is rebuilt only when one of the four reference snapshots changes
+    (masters writes bump their versions), and kept pre-serialized + gzip'ed.
+    """
+
+    def __init__(
+        self,
+        countries: CountrySearchService,
+        provinces: ProvinceSearchService,
+        cities: CitySearchService,
+        districts: DistrictSearchService,
+    ):
+        self.sources = (countries, provinces, cities, districts)
+
+    async def snapshot(self) -> GeoTreeSnapshot:
+        snaps = [await s.snapshot() for s in self.sources]
+        source_key = tuple(s.etag for s in snaps)
+
+        current = _state.current
+        if current is not None and current.source_key == source_key:
+            return current
+
+        async with _state.lock:
+            current = _state.current
+            if current is not None and current.source_key == source_key:
+                return current
+
+            flat = _build_flat(*(s.items for s in snaps))
+            snap = build_snapshot(source_key, flat)
+            _state.current = snap
+            _state.remember(snap)
+            logger.info(
+                "geo tree rebuilt version=%s bytes=%s gzip=%s",
+                snap.version, len(snap.body_json), len(snap.body_gzip),
+            )
+            return snap
+
+    async def delta_since(self, base_version: str) -> Tuple[GeoTreeSnapshot, Optional[dict]]:
+        """
+        Returns (current snapshot, delta or None).
+        delta is None when base_version is unknown (caller should send the full tree).
+        """
+        snap = await self.snapshot()
+        base = _state.history.get(base_version)
+        if base is None:
+            return snap, None
+        return snap, diff_flat(base, snap.flat)
@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.geographies_crud_repository import
 
 
 class GeographyCrudService(BaseSettingsCrudService):
+    cache_table = "geographies"
+
     def __init__(self, session: AsyncSession, repo: GeographyCrudRepository):
         super().__init__(session=session, repo=repo)
@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.geographies_read_repository import
 
 
 class GeographyReadService(BaseSettingsReadService):
+    cache_table = "geographies"
+
     def __init__(self, repo: GeographyReadRepository):
         super().__init__(repo=repo)
@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.geographies_search_repository impor
 
 
 class GeographySearchService(BaseSettingsSearchService):
+    cache_table = "geographies"
+
     def __init__(self, repo: GeographySearchRepository):
         super().__init__(repo=repo)
@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.languages_crud_repository import La
 
 
 class LanguageCrudService(BaseSettingsCrudService):
+    cache_table = "languages"
+
     def __init__(self, session: AsyncSession, repo: LanguageCrudRepository):
         super().__init__(session=session, repo=repo)
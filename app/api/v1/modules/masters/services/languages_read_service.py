@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.languages_read_repository import La
 
 
 class LanguageReadService(BaseSettingsReadService):
+    cache_table = "languages"
+
     def __init__(self, repo: LanguageReadRepository):
         super().__init__(repo=repo)
@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.languages_search_repository import
 
 
 class LanguageSearchService(BaseSettingsSearchService):
+    cache_table = "languages"
+
     def __init__(self, repo: LanguageSearchRepository):
         super().__init__(repo=repo)
@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.provinces_crud_repository import Pr
 
 
 class ProvinceCrudService(BaseSettingsCrudService):
+    cache_table = "provinces"
+
     def __init__(self, session: AsyncSession, repo: ProvinceCrudRepository):
         super().__init__(session=session, repo=repo)
@@ -5,6 +5,8 @@ from app.api.v1.modules.masters.repositories.provinces_search_repository import
 
 
 class ProvinceSearchService(BaseSettingsSearchService):
+    cache_table = "provinces"
+
     def __init__(self, repo: ProvinceSearchRepository):
         super().__init__(repo=repo)
 
@@ -18,12 +20,12 @@ class ProvinceSearchService(BaseSettingsSearchService):
         sort_by: str | None = None,
         sort_dir: str = "asc",
     ):
-        return await self.repo.search(
+        return await self.search_snapshot(
             q=q,
-            country_code=country_code,
             is_active=is_active,
             limit=limit,
             offset=offset,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            equals={"country_code": country_code},
         )
\ No newline at end of file
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+
+logger = get_service_logger("service.reference_cache")
+
+# Reference tables are global (no company_code column) -> one shared scope.
+GLOBAL_SCOPE = "*"
+
+# Search projections of child tables embed parent names (provinces -> country_name_lo, ...),
+# so a write on a parent must also drop the children snapshots.
+DEPENDENT_TABLES: Dict[str, Tuple[str, ...]] = {
+    "countries": ("provinces",),
+    "provinces": ("cities", "districts"),
+    "cities": ("districts",),
+}
+
+Loader = Callable[[], Awaitable[List[dict]]]
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    table: str
+    version: int
+    items: Tuple[dict, ...]
+    etag: str
+    loaded_at: float
+    by_pk: Dict[str, dict] = field(default_factory=dict)
+
+    def get(self, pk: Any) -> Optional[dict]:
+        return self.by_pk.get(str(pk))
+
+
+def _digest(items: Tuple[dict, ...]) -> str:
+    raw = json.dumps(items, default=str, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class ReferenceDataCache:
+    """
+    In-process snapshots of masters reference tables.
+
+    - keyed by (company scope, table); global tables use GLOBAL_SCOPE
+    - version per table, bumped by the *_crud_service after commit
+    - ETag = content digest only (the version is per process): same data, same ETag on every worker
+    - TTL bounds staleness for writes made by other workers/processes
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self._ttl_seconds = ttl_seconds
+        self._snapshots: Dict[Tuple[str, str], ReferenceSnapshot] = {}
+        self._versions: Dict[str, int] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = float(get_settings().REFERENCE_CACHE_TTL_SECONDS)
+        return self._ttl_seconds
+
+    def version(self, table: str) -> int:
+        return self._versions.get(table, 0)
+
+    def _is_fresh(self, snap: Optional[ReferenceSnapshot]) -> bool:
+        if snap is None or snap.version != self.version(snap.table):
+            return False
+        ttl = self.ttl_seconds
+        return ttl <= 0 or (time.monotonic() - snap.loaded_at) < ttl
+
+    async def get(
+        self,
+        table: str,
+        loader: Loader,
+        *,
+        company_code: Optional[str] = None,
+        pk_field: Optional[str] = None,
+    ) -> ReferenceSnapshot:
+        key = (company_code or GLOBAL_SCOPE, table)
+        snap = self._snapshots.get(key)
+        if self._is_fresh(snap):
+            return snap
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            snap = self._snapshots.get(key)
+            if self._is_fresh(snap):
+                return snap
+
+            version = self.version(table)
+            items = tuple(await loader())
+            by_pk = {str(x[pk_field]): x for x in items if pk_field and x.get(pk_field) is not None}
+            snap = ReferenceSnapshot(
+                table=table,
+                version=version,
+                items=items,
+                etag=f'W/"{table}.{_digest(items)}"',
+                loaded_at=time.monotonic(),
+                by_pk=by_pk,
+            )
+
+            # a write landed while loading -> serve this result once, do not keep it
+            if version == self.version(table):
+                self._snapshots[key] = snap
+            logger.info("reference cache loaded table=%s rows=%s version=%s", table, len(items), version)
+            return snap
+
+    def invalidate(self, table: str) -> None:
+        """Bump version of table (and dependent projections) and drop their snapshots."""
+        pending = [table]
+        seen = set()
+        while pending:
+            t = pending.pop()
+            if t in seen:
+                continue
+            seen.add(t)
+            self._versions[t] = self.version(t) + 1
+            for key in [k for k in self._snapshots if k[1] == t]:
+                self._snapshots.pop(key, None)
+            pending.extend(DEPENDENT_TABLES.get(t, ()))
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+
+reference_data_cache = ReferenceDataCache()
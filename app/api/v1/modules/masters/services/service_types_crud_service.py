@@ -7,5 +7,7 @@ from app.api.v1.modules.masters.repositories.service_types_crud_repository impor
 
 
 class ServiceTypeCrudService(BaseSettingsCrudService):
+    cache_table = "service_types"
+
     def __init__(self, session: AsyncSession, repo: ServiceTypeCrudRepository):
         super().__init__(session=session, repo=repo)
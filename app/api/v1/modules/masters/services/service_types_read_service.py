@@ -5,5 +5,7 @@ from app.api.v1.modules.masters.repositories.service_types_read_repository impor
 
 
 class ServiceTypeReadService(BaseSettingsReadService):
+    cache_table = "service_types"
+
     def __init__(self, repo: ServiceTypeReadRepository):
         super().__init__(repo=repo)
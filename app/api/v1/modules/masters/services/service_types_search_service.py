@@ -5,6 +5,8 @@ from app.api.v1.modules.masters.repositories.service_types_search_repository imp
 
 
 class ServiceTypeSearchService(BaseSettingsSearchService):
+    cache_table = "service_types"
+
     def __init__(self, repo: ServiceTypeSearchRepository):
         super().__init__(repo=repo)
 
@@ -17,7 +19,7 @@ class ServiceTypeSearchService(BaseSettingsSearchService):
         sort_by: str | None = None,
         sort_dir: str = "asc",
     ):
-        return await self.repo.search(
+        return await self.search_snapshot(
             q=q,
             is_active=is_active,
             limit=limit,
@@ -4,8 +4,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.modules.masters.services.base_settings_service import BaseSettingsCrudService
 from app.api.v1.modules.masters.repositories.services_crud_repository import ServiceCrudRepository
+from app.api.v1.modules.masters.services.services_search_service import SUGGEST_ENTITY
+from app.services.suggest_index import suggest_index
 
 
 class ServiceCrudService(BaseSettingsCrudService):
     def __init__(self, session: AsyncSession, repo: ServiceCrudRepository):
         super().__init__(session=session, repo=repo)
+
+    def _invalidate_cache(self) -> None:
+        super()._invalidate_cache()
+        suggest_index.invalidate(SUGGEST_ENTITY)
@@ -3,6 +3,9 @@ from __future__ import annotations
 from uuid import UUID
 from app.api.v1.modules.masters.services.base_settings_service import BaseSettingsSearchService
 from app.api.v1.modules.masters.repositories.services_search_repository import ServiceSearchRepository
+from app.services.suggest_index import suggest_index
+
+SUGGEST_ENTITY = "services"
 
 
 class ServiceSearchService(BaseSettingsSearchService):
@@ -28,4 +31,13 @@ class ServiceSearchService(BaseSettingsSearchService):
             offset=offset,
             sort_by=sort_by,
             sort_dir=sort_dir,
-        )
\ No newline at end of file
+        )
+
+    async def suggest(self, *, q: str, limit: int = 10) -> list[dict]:
+        """Top-K (id, label) from the in-memory prefix index."""
+        index = await suggest_index.get(SUGGEST_ENTITY, self.repo.suggest_rows, probe=self.repo.suggest_exceeds)
+        if not index.partial:
+            return index.lookup(q, limit)
+
+        rows, _ = await self.repo.search(q=q, limit=limit)
+        return [{"id": str(r["id"]), "label": r["name"]} for r in rows]
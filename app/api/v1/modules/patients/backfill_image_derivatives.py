@@ -0,0 +1,112 @@
+# app/api/v1/modules/patients/backfill_image_derivatives.py
+
+"""
+Render thumbnail / preview derivatives for patient images uploaded before they existed.
+
+python -m app.api.v1.modules.patients.backfill_image_derivatives [--batch 100] [--concurrency 4] [--limit N] [--dry-run]
+
+Walks patient_images with thumbnail_url IS NULL in id order (keyset, so skipped rows are not
+revisited), downloads each original from the storage backend, renders in the derivative process
+pool and writes the URLs back once per batch. Rows pointing outside the photos bucket (external
+URLs) or at files that cannot be decoded are skipped and stay NULL. Safe to re-run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import select, update
+
+from app.api.v1.modules.patients.services.patient_photos_storage_service import store_derivatives_for_url
+from app.core.clients.storage_client import get_storage
+from app.core.logging_config import get_service_logger
+from app.database.database import AsyncSessionLocal
+from app.db.models.patient_settings import PatientImage
+from app.services import image_derivatives
+
+logger = get_service_logger("service.image_derivatives")
+
+
+async def _render_one(file_path: str, slots: asyncio.Semaphore) -> Optional[Dict[str, str]]:
+    async with slots:
+        try:
+            return await store_derivatives_for_url(file_path) or None
+        except Exception as e:
+            logger.warning("backfill failed file=%s: %s", file_path, e)
+            return None
+
+
+async def backfill(*, batch: int, concurrency: int, limit: Optional[int], dry_run: bool) -> Dict[str, int]:
+    if not image_derivatives.available() and not dry_run:
+        raise SystemExit("Pillow is not installed (pip install pillow)")
+
+    slots = asyncio.Semaphore(max(1, concurrency))
+    stats = {"seen": 0, "rendered": 0, "skipped": 0}
+    last_id = None
+    t0 = time.perf_counter()
+
+    async with AsyncSessionLocal() as db:
+        while not limit or stats["seen"] < limit:
+            stmt = select(PatientImage.id, PatientImage.file_path).where(PatientImage.thumbnail_url.is_(None))
+            if last_id is not None:
+                stmt = stmt.where(PatientImage.id > last_id)
+            size = min(batch, limit - stats["seen"]) if limit else batch
+            rows = (await db.execute(stmt.order_by(PatientImage.id).limit(size))).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            stats["seen"] += len(rows)
+            if dry_run:
+                continue
+
+            results = await asyncio.gather(*(_render_one(r.file_path, slots) for r in rows))
+            for r, urls in zip(rows, results):
+                if not urls:
+                    stats["skipped"] += 1
+                    continue
+                # guarded: the row may have been re-pointed meanwhile; keep updated_at as it was
+                await db.execute(
+                    update(PatientImage)
+                    .where(
+                        PatientImage.id == r.id,
+                        PatientImage.file_path == r.file_path,
+                        PatientImage.thumbnail_url.is_(None),
+                    )
+                    .values(**urls, updated_at=PatientImage.updated_at)
+                )
+                stats["rendered"] += 1
+            await db.commit()
+
+            elapsed = time.perf_counter() - t0
+            print(
+                f"  seen={stats['seen']} rendered={stats['rendered']} skipped={stats['skipped']} "
+                f"({stats['seen'] / elapsed:.1f} images/s)",
+                flush=True,
+            )
+    return stats
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    try:
+        stats = await backfill(batch=args.batch, concurrency=args.concurrency, limit=args.limit, dry_run=args.dry_run)
+        print(("would process" if args.dry_run else "done") + f": {stats}")
+    finally:
+        image_derivatives.shutdown()
+        if get_storage.cache_info().currsize:
+            await get_storage().aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.api.v1.modules.patients.backfill_image_derivatives")
+    parser.add_argument("--batch", type=int, default=100, help="rows per keyset page / commit")
+    parser.add_argument("--concurrency", type=int, default=4, help="images downloaded + rendered at once")
+    parser.add_argument("--limit", type=int, default=None, help="stop after this many rows")
+    parser.add_argument("--dry-run", action="store_true", help="only count the rows without derivatives")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
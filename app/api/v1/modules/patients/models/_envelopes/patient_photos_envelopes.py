@@ -54,6 +54,11 @@ class PatientPhotoUploadData(BaseModel):
 
     patient_id: UUID
     file_url: str
+    photo_id: Optional[str] = None
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    preview_url: Optional[str] = None
 
 
 class PatientPhotoUploadEnvelope(SuccessEnvelope):
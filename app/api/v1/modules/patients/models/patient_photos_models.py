@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict
 
@@ -13,4 +14,6 @@ class PatientPhotoRead(BaseModel):
     id: UUID
     patient_id: UUID
     file_path: str
+    thumbnail_url: Optional[str] = None
+    preview_url: Optional[str] = None
     uploaded_at: datetime
@@ -229,6 +229,8 @@ class PatientImageUpdate(BaseModel):
 class PatientImageRead(PatientImageBase, ORMBaseModel):
     id: UUID
     patient_id: UUID
+    thumbnail_url: Optional[str] = Field(None, description="256px JPEG rendition (null until generated)")
+    preview_url: Optional[str] = Field(None, description="1024px JPEG rendition (null until generated)")
     created_at: datetime
     updated_at: datetime
 
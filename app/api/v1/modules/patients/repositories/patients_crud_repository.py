@@ -6,7 +6,6 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.db.models.patient_settings import Patient
 from app.api.v1.modules.patients.models.schemas import PatientCreate, PatientUpdate
@@ -27,12 +26,8 @@ class PatientsCrudRepository:
 
     @staticmethod
     def _with_refs(stmt):
-        # ✅ Only load relationships that PatientRead expects.
-        return stmt.options(
-            selectinload(Patient.allergy),
-            selectinload(Patient.drug_allergy),
-            selectinload(Patient.alert),
-        )
+        # ✅ PatientRead is column-only -> no relationship loaders (add them here if it grows refs).
+        return stmt
 
     @staticmethod
     def _raise_integrity_error(e: IntegrityError) -> None:
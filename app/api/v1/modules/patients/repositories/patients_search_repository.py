@@ -1,11 +1,63 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from sqlalchemy import or_, select, func
+from sqlalchemy import case, or_, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.patient_settings import Patient, Source
+from app.db.models.patient_settings import (
+    Patient,
+    Source,
+    PATIENT_SEARCH_DIGITS,
+    PATIENT_SEARCH_TEXT,
+)
+from app.services.suggest_index import SuggestRow
+from app.utils.search_text import (
+    digits_only,
+    escape_like,
+    looks_like_phone_or_id,
+    normalize_text,
+    normalize_th_phone,
+    search_tokens,
+    strip_name_title,
+)
+
+SORT_RELEVANCE = "relevance"
+
+_PROJECTION = (
+    Patient.id,
+    Patient.patient_code,
+    Patient.full_name_lo,
+    Patient.full_name_en,
+    Patient.telephone,
+    Patient.status,
+    Patient.is_active,
+)
+
+
+def _item(r: Any) -> Dict[str, Any]:
+    return {
+        "id": r.id,
+        "patient_code": r.patient_code,
+        "full_name_lo": r.full_name_lo,
+        "full_name_en": r.full_name_en,
+        "telephone": r.telephone,
+        "status": r.status,
+        "is_active": r.is_active,
+    }
+
+
+def patient_suggest_row(r: Mapping[str, Any]) -> SuggestRow:
+    """(id, label, extra keys) for the /patients/suggest index; label shows name + code only."""
+    label = f"{r.get('full_name_lo') or ''} ({r.get('patient_code') or ''})"
+    extra = (
+        r.get("patient_code") or "",
+        r.get("first_name_en") or "",
+        r.get("last_name_en") or "",
+        r.get("telephone") or "",
+        r.get("id_card_no") or "",
+    )
+    return r["id"], label, extra
 
 
 class PatientsSearchRepository:
@@ -13,42 +65,23 @@ class PatientsSearchRepository:
 
     ✅ MUST NOT return ORM objects
     ✅ MUST NOT touch relationships (avoid lazy-load)
+
+    Keyword search (pg_trgm, see PATIENT_SEARCH_TEXT / PATIENT_SEARCH_DIGITS indexes):
+    - exact patient_code / id_card_no -> unique-index lookup, returned alone
+    - digits (phone / id card, "+66" folded to "0") -> trigram LIKE on the digits expression
+    - names (Thai / English, titles stripped) -> every token LIKE on the text expression
+    - ranked by trigram similarity (+ word-prefix bonus) when sort_by="relevance"
     """
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def search_projection(
-        self,
-        *,
-        q_text: str = "",
-        status: str = "",
-        source_type: str = "",
-        is_active: Optional[bool] = True,
-        limit: int = 50,
-        offset: int = 0,
-        sort_by: str = "created_at",
-        sort_order: str = "desc",
-    ) -> Tuple[List[Dict[str, Any]], int]:
+    @staticmethod
+    def _base_filters(*, status: str, source_type: str, is_active: Optional[bool]) -> list:
         filters = []
-
         if is_active is not None:
             filters.append(Patient.is_active.is_(is_active))
 
-        if q_text:
-            kw = f"%{q_text}%"
-            filters.append(
-                or_(
-                    Patient.first_name_lo.ilike(kw),
-                    Patient.last_name_lo.ilike(kw),
-                    func.coalesce(Patient.first_name_en, "").ilike(kw),
-                    func.coalesce(Patient.last_name_en, "").ilike(kw),
-                    Patient.patient_code.ilike(kw),
-                    func.coalesce(Patient.telephone, "").ilike(kw),
-                    Patient.id_card_no.ilike(kw),
-                )
-            )
-
         if status:
             filters.append(Patient.status == status)
 
@@ -60,44 +93,111 @@ class PatientsSearchRepository:
                     Patient.market_source_id.in_(src_ids_subq),
                 )
             )
+        return filters
+
+    async def _exact_match(self, q_text: str, filters: list) -> List[Dict[str, Any]]:
+        raw = q_text.strip().replace(" ", "")
+        candidates = {raw, raw.upper()}
+        if looks_like_phone_or_id(raw):
+            candidates.add(digits_only(raw))
+        candidates = sorted(candidates - {""})
+        stmt = (
+            select(*_PROJECTION)
+            .where(
+                *filters,
+                or_(Patient.patient_code.in_(candidates), Patient.id_card_no.in_(candidates)),
+            )
+            .limit(2)
+        )
+        return [_item(r) for r in (await self.db.execute(stmt)).all()]
+
+    @staticmethod
+    def _keyword(q: str) -> Tuple[list, Any]:
+        """(where clauses, rank expression) for a normalized keyword."""
+        if looks_like_phone_or_id(q):
+            d = normalize_th_phone(q) if q.startswith("+") else digits_only(q)
+            return [PATIENT_SEARCH_DIGITS.like(f"%{d}%")], func.similarity(PATIENT_SEARCH_DIGITS, d)
+
+        name = strip_name_title(q)
+        tokens = search_tokens(name) or [name]
+        conds = [PATIENT_SEARCH_TEXT.like(f"%{escape_like(t)}%", escape="\\") for t in tokens]
+        word_prefix = PATIENT_SEARCH_TEXT.like(f"% {escape_like(tokens[0])}%", escape="\\")
+        rank = func.similarity(PATIENT_SEARCH_TEXT, name) + case((word_prefix, 0.5), else_=0.0)
+        return conds, rank
 
-        # total
-        total_stmt = select(func.count()).select_from(Patient).where(*filters)
-        total = int((await self.db.execute(total_stmt)).scalar() or 0)
+    async def search_projection(
+        self,
+        *,
+        q_text: str = "",
+        status: str = "",
+        source_type: str = "",
+        is_active: Optional[bool] = True,
+        limit: int = 50,
+        offset: int = 0,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        filters = self._base_filters(status=status, source_type=source_type, is_active=is_active)
+
+        q = normalize_text(q_text)
+        rank = None
+        if q:
+            if " " not in q or looks_like_phone_or_id(q):
+                # every page of an exact hit is served from it, so paging agrees with the total
+                exact = await self._exact_match(q_text, filters)
+                if exact:
+                    return exact[offset : offset + limit], len(exact)
+
+            conds, rank = self._keyword(q)
+            filters.extend(conds)
+
+        # ordering: relevance (keyword only) or allowlisted column, newest first as tie-breaker
+        if sort_by == SORT_RELEVANCE or sort_by not in Patient.__table__.c:
+            order = [rank.desc()] if rank is not None else []
+            order += [Patient.created_at.desc(), Patient.id]
+        else:
+            sort_col = Patient.__table__.c[sort_by]
+            order = [sort_col.asc() if sort_order == "asc" else sort_col.desc(), Patient.id]
+
+        # one round-trip: page + total (window count over the filtered set)
+        stmt = (
+            select(*_PROJECTION, func.count().over().label("_total"))
+            .where(*filters)
+            .order_by(*order)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await self.db.execute(stmt)).all()
 
-        # allowlist sort
-        sort_col = getattr(Patient, sort_by, Patient.created_at)
-        sort_expr = sort_col.asc() if sort_order == "asc" else sort_col.desc()
+        if rows:
+            total = int(rows[0]._total)
+        elif offset > 0:
+            # page past the end: the window count has no row to ride on
+            total_stmt = select(func.count()).select_from(Patient).where(*filters)
+            total = int((await self.db.execute(total_stmt)).scalar() or 0)
+        else:
+            total = 0
 
+        return [_item(r) for r in rows], total
+
+    async def suggest_rows(self, limit: int) -> List[SuggestRow]:
+        """Active patients for the in-memory suggest index (one projection query)."""
         stmt = (
             select(
                 Patient.id,
                 Patient.patient_code,
                 Patient.full_name_lo,
-                Patient.full_name_en,
+                Patient.first_name_en,
+                Patient.last_name_en,
                 Patient.telephone,
-                Patient.status,
-                Patient.is_active,
+                Patient.id_card_no,
             )
-            .where(*filters)
-            .order_by(sort_expr)
+            .where(Patient.is_active.is_(True))
             .limit(limit)
-            .offset(offset)
         )
+        return [patient_suggest_row(r) for r in (await self.db.execute(stmt)).mappings().all()]
 
-        rows = (await self.db.execute(stmt)).all()
-
-        items = [
-            {
-                "id": r.id,
-                "patient_code": r.patient_code,
-                "full_name_lo": r.full_name_lo,
-                "full_name_en": r.full_name_en,
-                "telephone": r.telephone,
-                "status": r.status,
-                "is_active": r.is_active,
-            }
-            for r in rows
-        ]
-
-        return items, total
+    async def suggest_exceeds(self, max_rows: int) -> bool:
+        """More than max_rows active patients? (skips max_rows ids, transfers at most one)"""
+        stmt = select(Patient.id).where(Patient.is_active.is_(True)).offset(max_rows).limit(1)
+        return (await self.db.execute(stmt)).first() is not None
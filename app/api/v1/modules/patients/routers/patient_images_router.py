@@ -3,8 +3,9 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Path, Request
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Path, Request, UploadFile
 
+from app.core.clients.storage_client import ChecksumMismatch, UploadTooLarge
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
 from app.api.v1.modules.patients.dependencies import get_patient_images_service
 from app.api.v1.modules.patients.services.patient_images_service_v2 import PatientImagesService
@@ -119,6 +120,44 @@ async def create_image(
     )
 
 
+@router.post(
+    "/{patient_id:uuid}/images/upload",
+    response_class=UnicodeJSONResponse,
+    response_model=PatientImageCreateEnvelope,
+    response_model_exclude_none=True,
+    operation_id="upload_image",
+)
+async def upload_image(
+    request: Request,
+    patient_id: UUID,
+    file: UploadFile = File(...),
+    image_type: str | None = Form(default=None),
+    description: str | None = Form(default=None),
+    checksum_sha256: str | None = Form(default=None, description="hex sha256 of the file; verified after upload"),
+    svc: PatientImagesService = Depends(get_patient_images_service),
+):
+    """Stream the file to storage, render thumbnail / preview next to it, insert the PatientImage row."""
+    try:
+        created = await svc.upload(
+            patient_id=patient_id,
+            upload=file,
+            image_type=image_type,
+            description=description,
+            expected_sha256=checksum_sha256,
+        )
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ChecksumMismatch as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return ResponseHandler.success_from_request(
+        request,
+        message=ResponseCode.SUCCESS["CREATED"][1],
+        data={"item": created.model_dump()},
+        status_code=201,
+    )
+
+
 @router.patch(
     "/images/{image_id:uuid}",
     response_class=UnicodeJSONResponse,
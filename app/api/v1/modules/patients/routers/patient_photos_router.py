@@ -8,6 +8,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.clients.storage_client import ChecksumMismatch, UploadTooLarge
 from app.database.session import get_db
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
 
@@ -149,25 +150,33 @@ async def upload_photo(
     request: Request,
     patient_id: UUID = Form(...),
     file: UploadFile = File(...),
+    checksum_sha256: Optional[str] = Form(default=None, description="hex sha256 of the file; verified after upload"),
     svc: PatientPhotosService = Depends(get_photos_service),
 ):
     """Upload/replace patient photo:
-    1) upload bytes to Supabase Storage
-    2) insert row to PatientImage table
+    1) stream the file to storage in chunks (sha256-verified)
+    2) render thumbnail / preview next to it (process pool, best-effort)
+    3) insert row to PatientImage table
     """
     try:
-        file_bytes = await file.read()
-        item = await svc.upload(
-            patient_id=patient_id,
-            file_bytes=file_bytes,
-            original_filename=file.filename or "photo.jpg",
-            content_type=file.content_type or "application/octet-stream",
-        )
+        item = await svc.upload(patient_id=patient_id, upload=file, expected_sha256=checksum_sha256)
         return ResponseHandler.success_from_request(
             request,
             message=ResponseCode.SUCCESS["CREATED"][1],
-            data={"patient_id": patient_id, "file_url": item["file_path"], "photo_id": str(item["id"])},
+            data={
+                "patient_id": patient_id,
+                "file_url": item["file_path"],
+                "photo_id": str(item["id"]),
+                "size": item["size"],
+                "sha256": item["sha256"],
+                "thumbnail_url": item.get("thumbnail_url"),
+                "preview_url": item.get("preview_url"),
+            },
         )
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ChecksumMismatch as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -16,6 +16,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
+from app.api.v1.models._envelopes.base_envelopes import SuggestPayload
 from app.api.v1.modules.patients.dependencies import get_patients_search_service
 
 from app.api.v1.modules.patients.models._envelopes.patients_v2_envelopes import (
@@ -26,7 +27,7 @@ from app.api.v1.modules.patients.services.patients_search_service import Patient
 router = APIRouter()
 
 
-DEFAULT_SORT_BY = "created_at"
+DEFAULT_SORT_BY = "relevance"
 DEFAULT_SORT_ORDER = "desc"
 
 @router.get(
@@ -44,7 +45,7 @@ async def search_patients(
     status: str = Query(default="", description="filter status"),
     source_type: str = Query(default="", description="filter source type"),
     is_active: Optional[bool] = Query(default=True, description="default true"),
-    sort_by: str = Query(default=DEFAULT_SORT_BY, description="sort field"),
+    sort_by: str = Query(default=DEFAULT_SORT_BY, description="sort field (relevance = best keyword match first)"),
     sort_order: str = Query(default=DEFAULT_SORT_ORDER, pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
@@ -83,3 +84,20 @@ async def search_patients(
     except Exception as e:
         # Let global exception handler format SYS_001
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/suggest",
+    response_class=UnicodeJSONResponse,
+    response_model=SuggestPayload,
+    summary="Suggest Patients (typeahead)",
+    operation_id="suggest_patients",
+)
+async def suggest_patients(
+    svc: PatientsSearchService = Depends(get_patients_search_service),
+    q: str = Query(..., min_length=1, description="prefix: ชื่อ/นามสกุล/ชื่ออังกฤษ/รหัส/โทร/id_card"),
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    # picker hot path: no envelope, no count; returned as-is (no response_model re-validation)
+    items = await svc.suggest(q=q, limit=limit)
+    return UnicodeJSONResponse(content={"q": q, "items": items})
@@ -4,6 +4,8 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+from fastapi import UploadFile
+
 from app.api.v1.models._envelopes.base_envelopes import ListPayload, Paging, Sort
 from app.api.v1.modules.patients.models.patients_model import (
     PatientImageCreate,
@@ -15,6 +17,10 @@ from app.api.v1.modules.patients.repositories.patient_images_repository import (
     DEFAULT_SORT_BY,
     DEFAULT_SORT_ORDER,
 )
+from app.api.v1.modules.patients.services.patient_photos_storage_service import (
+    upload_patient_photo_to_storage,
+    remove_patient_photo_from_storage,
+)
 
 
 class PatientImagesService:
@@ -70,12 +76,45 @@ class PatientImagesService:
         created = await self.repo.create(obj)
         return PatientImageRead.model_validate(created)
 
+    async def upload(
+        self,
+        *,
+        patient_id: UUID,
+        upload: UploadFile,
+        image_type: Optional[str] = None,
+        description: Optional[str] = None,
+        expected_sha256: Optional[str] = None,
+    ) -> PatientImageRead:
+        """Stream the file to storage (+ thumbnail/preview), then insert the row; storage is cleaned up if the insert fails."""
+        from app.db.models.patient_settings import PatientImage
+
+        stored, derivatives = await upload_patient_photo_to_storage(
+            upload, patient_id=patient_id, expected_sha256=expected_sha256
+        )
+        obj = PatientImage(
+            patient_id=patient_id,
+            file_path=stored.url,
+            image_type=image_type or stored.content_type,
+            description=description,
+            **derivatives,
+        )
+        try:
+            created = await self.repo.create(obj)
+        except Exception:
+            await remove_patient_photo_from_storage(stored.url)
+            raise
+        return PatientImageRead.model_validate(created)
+
     async def update(self, image_id: UUID, body: PatientImageUpdate) -> Optional[PatientImageRead]:
         obj = await self.repo.get_by_id(image_id)
         if not obj:
             return None
 
         data = body.model_dump(exclude_unset=True, exclude_none=True)
+        if data.get("file_path") not in (None, obj.file_path):
+            # derivatives belong to the previous file; the backfill renders the new one
+            obj.thumbnail_url = None
+            obj.preview_url = None
         for k, v in data.items():
             setattr(obj, k, v)
 
@@ -86,5 +125,12 @@ class PatientImagesService:
         obj = await self.repo.get_by_id(image_id)
         if not obj:
             return False
+
+        # stored originals + derivatives are removed best-effort (external URLs are left alone)
+        try:
+            await remove_patient_photo_from_storage(obj.file_path)
+        except Exception:
+            pass
+
         await self.repo.delete(obj)
         return True
@@ -4,6 +4,8 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+from fastapi import UploadFile
+
 from app.api.v1.models._envelopes.base_envelopes import ListPayload, Paging, Sort
 from app.api.v1.modules.patients.models.patient_photos_models import PatientPhotoRead
 from app.api.v1.modules.patients.repositories.patient_photos_repository import (
@@ -29,6 +31,8 @@ class PatientPhotosService:
             id=obj.id,
             patient_id=obj.patient_id,
             file_path=obj.file_path,
+            thumbnail_url=obj.thumbnail_url,
+            preview_url=obj.preview_url,
             uploaded_at=getattr(obj, "created_at"),
         )
 
@@ -76,26 +80,35 @@ class PatientPhotosService:
         obj = await self.repo.get_latest_by_patient(patient_id)
         return self._to_read(obj) if obj else None
 
-    async def upload(self, *, patient_id: UUID, file_bytes: bytes, original_filename: str, content_type: str) -> Dict[str, Any]:
-        # 1) upload to storage (supabase bucket)
-        file_url = upload_patient_photo_to_storage(
-            patient_id=patient_id,
-            file_bytes=file_bytes,
-            original_filename=original_filename,
-            content_type=content_type,
+    async def upload(self, *, patient_id: UUID, upload: UploadFile, expected_sha256: Optional[str] = None) -> Dict[str, Any]:
+        # 1) stream to storage (bucket) -> public URL + verified size/sha256 + thumbnail/preview
+        stored, derivatives = await upload_patient_photo_to_storage(
+            upload, patient_id=patient_id, expected_sha256=expected_sha256
         )
 
-        # 2) store record in DB (PatientImage)
+        # 2) store record in DB (PatientImage); orphaned object is removed if the insert fails
         from app.db.models.patient_settings import PatientImage
 
         obj = PatientImage(
             patient_id=patient_id,
-            file_path=file_url,
-            image_type=content_type,
+            file_path=stored.url,
+            image_type=stored.content_type,
             description="photo",
+            **derivatives,
         )
-        created = await self.repo.create(obj)
-        return {"id": created.id, "patient_id": patient_id, "file_path": created.file_path}
+        try:
+            created = await self.repo.create(obj)
+        except Exception:
+            await remove_patient_photo_from_storage(stored.url)
+            raise
+        return {
+            "id": created.id,
+            "patient_id": patient_id,
+            "file_path": created.file_path,
+            "size": stored.size,
+            "sha256": stored.sha256,
+            **derivatives,
+        }
 
     async def delete(self, photo_id: UUID) -> bool:
         obj = await self.repo.get_by_id(photo_id)
@@ -104,7 +117,7 @@ class PatientPhotosService:
 
         # delete file from storage first (best-effort)
         try:
-            remove_patient_photo_from_storage(obj.file_path)
+            await remove_patient_photo_from_storage(obj.file_path)
         except Exception:
             # ✅ don't block DB delete (storage may already be removed)
             pass
@@ -2,56 +2,100 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
+import asyncio
+import os
+import tempfile
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import AsyncIterator, BinaryIO, Dict, Optional, Tuple
+from uuid import UUID, uuid4
 
-from app.services.supabase_client import supabase
+from fastapi import UploadFile
+
+from app.core.clients.storage_client import StoredObject, get_storage
+from app.core.config import get_settings
+from app.services import image_derivatives
 
 
 BUCKET = "patient-photos"
-PUBLIC_PREFIX = "/storage/v1/object/public/"
 
 
-def _extract_storage_filename(public_url: str) -> str | None:
+async def _iter_upload(upload: UploadFile, chunk_size: int, tee: Optional[BinaryIO] = None) -> AsyncIterator[bytes]:
+    # UploadFile is spooled by Starlette; read it back in fixed chunks instead of one .read()
+    # tee: local copy of the bytes for the derivative workers (no second pass over the upload)
+    await upload.seek(0)
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+        if tee is not None:
+            await asyncio.to_thread(tee.write, chunk)
+        yield chunk
+
+
+def _object_path(patient_id: Optional[UUID], original_filename: str) -> str:
+    ext = (Path(original_filename).suffix or ".jpg").lower()
+    name = f"{uuid4()}{ext}"
+    return f"{patient_id}/{name}" if patient_id else name
+
+
+def _temp_file(suffix: str = "") -> Tuple[BinaryIO, Path]:
+    fd, name = tempfile.mkstemp(prefix="wp-img-", suffix=suffix)
+    return os.fdopen(fd, "wb"), Path(name)
+
+
+async def upload_patient_photo_to_storage(
+    upload: UploadFile,
+    *,
+    patient_id: Optional[UUID] = None,
+    expected_sha256: Optional[str] = None,
+) -> Tuple[StoredObject, Dict[str, str]]:
     """
-    public_url example:
-      https://xxxx.supabase.co/storage/v1/object/public/patient-photos/<filename>
+    Stream an UploadFile to the photos bucket (bounded concurrency, sha256-verified), then render
+    the thumbnail / preview next to it. Returns (original, {"thumbnail_url", "preview_url"});
+    the derivative dict is empty when they could not be produced (see image_derivatives).
     """
-    if not public_url:
-        return None
-    parsed = urlparse(public_url)
-    if not parsed.path.startswith(PUBLIC_PREFIX):
-        return None
-    # remove bucket path
-    # /storage/v1/object/public/patient-photos/<filename>
-    marker = f"/storage/v1/object/public/{BUCKET}/"
-    if marker in parsed.path:
-        return parsed.path.split(marker, 1)[1]
-    return None
-
-
-async def upload_patient_photo_to_storage(file_bytes: bytes, original_filename: str, content_type: str | None) -> str:
-    file_id = str(uuid4())
-    ext = Path(original_filename).suffix or ".jpg"
-    file_name = f"{file_id}{ext}"
-
-    res = supabase.storage.from_(BUCKET).upload(
-        path=file_name,
-        file=file_bytes,
-        file_options={"content-type": content_type or "image/jpeg"},
-    )
-
-    res_dict = res if isinstance(res, dict) else getattr(res, "__dict__", {})
-    if res_dict.get("status_code", 200) >= 400:
-        msg = res_dict.get("message", "Unknown error")
-        raise RuntimeError(f"Storage upload failed: {msg}")
-
-    return supabase.storage.from_(BUCKET).get_public_url(file_name)
+    settings = get_settings()
+    path = _object_path(patient_id, upload.filename or "photo.jpg")
+    tee, local = await asyncio.to_thread(_temp_file, Path(path).suffix)
+    try:
+        try:
+            stored = await get_storage().put_stream(
+                BUCKET,
+                path,
+                _iter_upload(upload, settings.STORAGE_UPLOAD_CHUNK_BYTES, tee),
+                content_type=upload.content_type or "image/jpeg",
+                expected_sha256=expected_sha256,
+                max_bytes=settings.STORAGE_MAX_UPLOAD_BYTES,
+            )
+        finally:
+            await asyncio.to_thread(tee.close)
+        derivatives = await image_derivatives.store_derivatives(get_storage(), BUCKET, stored.path, local)
+        return stored, derivatives
+    finally:
+        await asyncio.to_thread(local.unlink, True)
+
+
+async def store_derivatives_for_url(public_url: str) -> Dict[str, str]:
+    """(Re)build the derivatives of an already stored original (backfill); {} if not in this bucket."""
+    storage = get_storage()
+    path = storage.path_from_url(BUCKET, public_url)
+    if not path:
+        return {}
+    tee, local = await asyncio.to_thread(_temp_file, Path(path).suffix)
+    await asyncio.to_thread(tee.close)
+    try:
+        await storage.download(BUCKET, path, local)
+        # stale / partial derivatives from an earlier run would block the (non-upserting) put
+        await storage.remove(BUCKET, image_derivatives.derivative_paths(path))
+        return await image_derivatives.store_derivatives(storage, BUCKET, path, local)
+    finally:
+        await asyncio.to_thread(local.unlink, True)
 
 
 async def remove_patient_photo_from_storage(public_url: str) -> None:
-    file_name = _extract_storage_filename(public_url)
-    if not file_name:
+    """Remove the original and its derivatives."""
+    storage = get_storage()
+    path = storage.path_from_url(BUCKET, public_url)
+    if not path:
         return
-    supabase.storage.from_(BUCKET).remove([file_name])
+    await storage.remove(BUCKET, [path, *image_derivatives.derivative_paths(path)])
@@ -6,6 +6,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.modules.patients.models.patients_model import PatientCreate, PatientUpdate
 from app.api.v1.modules.patients.repositories.patients_crud_repository import PatientsCrudRepository
+from app.api.v1.modules.patients.repositories.patients_search_repository import patient_suggest_row
+from app.api.v1.modules.patients.services.patients_search_service import SUGGEST_ENTITY
+from app.services.suggest_index import suggest_index
+
+
+def _refresh_suggest(row: dict) -> None:
+    if row.get("is_active") is False:
+        suggest_index.remove(SUGGEST_ENTITY, row["id"])
+    else:
+        suggest_index.upsert(SUGGEST_ENTITY, *patient_suggest_row(row))
 
 
 class PatientsCrudService:
@@ -19,6 +29,7 @@ class PatientsCrudService:
         try:
             created = await self.repo.create(payload)
             await self.db.commit()
+            _refresh_suggest(created)
             return created
         except Exception:
             await self.db.rollback()
@@ -31,6 +42,7 @@ class PatientsCrudService:
         try:
             updated = await self.repo.patch(patient_id, payload)
             await self.db.commit()
+            _refresh_suggest(updated)
             return updated
         except Exception:
             await self.db.rollback()
@@ -40,6 +52,7 @@ class PatientsCrudService:
         try:
             deleted_id = await self.repo.delete(patient_id)
             await self.db.commit()
+            suggest_index.remove(SUGGEST_ENTITY, deleted_id)
             return deleted_id
         except Exception:
             await self.db.rollback()
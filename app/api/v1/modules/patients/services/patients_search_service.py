@@ -3,8 +3,15 @@ from __future__ import annotations
 from typing import Optional
 
 from app.api.v1.models._envelopes.base_envelopes import ListPayload, Paging, Sort
+from app.services.suggest_index import suggest_index
 from app.api.v1.modules.patients.models.dtos import PatientSearchItemDTO
-from app.api.v1.modules.patients.repositories.patients_search_repository import PatientsSearchRepository
+from app.api.v1.modules.patients.repositories.patients_search_repository import (
+    SORT_RELEVANCE,
+    PatientsSearchRepository,
+)
+
+
+SUGGEST_ENTITY = "patients"
 
 
 class PatientsSearchService:
@@ -20,11 +27,15 @@ class PatientsSearchService:
         status: str = "",
         source_type: str = "",
         is_active: Optional[bool] = True,
-        sort_by: str = "created_at",
+        sort_by: str = SORT_RELEVANCE,
         sort_order: str = "desc",
         limit: int = 50,
         offset: int = 0,
     ) -> tuple[ListPayload[PatientSearchItemDTO], int, dict]:
+        # relevance needs a keyword; without one the list is newest first
+        if sort_by == SORT_RELEVANCE and not q.strip():
+            sort_by, sort_order = "created_at", "desc"
+
         items, total = await self.repo.search_projection(
             q_text=q,
             status=status,
@@ -58,3 +69,12 @@ class PatientsSearchService:
         )
 
         return payload, total, payload.filters
+
+    async def suggest(self, *, q: str, limit: int = 10) -> list[dict]:
+        """Top-K (id, label) from the in-memory prefix index; trigram search when the table is too large to hold."""
+        index = await suggest_index.get(SUGGEST_ENTITY, self.repo.suggest_rows, probe=self.repo.suggest_exceeds)
+        if not index.partial:
+            return index.lookup(q, limit)
+
+        items, _ = await self.repo.search_projection(q_text=q, limit=limit, sort_by=SORT_RELEVANCE)
+        return [{"id": str(x["id"]), "label": f"{x['full_name_lo']} ({x['patient_code']})"} for x in items]
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Staff
+from app.db.models import Location, Staff, StaffLocation
+from app.services.suggest_index import SuggestRow
 
 
 class StaffSearchRepository:
@@ -95,3 +96,54 @@ class StaffSearchRepository:
         rows = (await self.db.execute(stmt)).mappings().all()
         items = [dict(r) for r in rows]
         return items, total
+
+    async def suggest_rows(self, limit: int, company_code: Optional[str] = None) -> List[SuggestRow]:
+        """Active staff for the in-memory suggest index; company scope = main location or any staff_locations."""
+        stmt = self._suggest_scope(
+            select(Staff.id, Staff.staff_name, Staff.role, Staff.phone, Staff.email, Staff.license_number),
+            company_code,
+        )
+        rows = (await self.db.execute(stmt.order_by(Staff.staff_name).limit(limit))).mappings().all()
+        return [
+            (r["id"], r["staff_name"], (r["phone"] or "", (r["email"] or "").split("@", 1)[0], r["license_number"] or "", r["role"] or ""))
+            for r in rows
+        ]
+
+    async def suggest_search(self, q: str, limit: int, company_code: Optional[str] = None) -> list[dict]:
+        """/suggest from the DB (index too large): same scope as suggest_rows, name / phone / email / license match."""
+        stmt = self._suggest_scope(select(Staff.id, Staff.staff_name), company_code)
+        if q:
+            kw = f"%{q}%"
+            stmt = stmt.where(
+                or_(
+                    Staff.staff_name.ilike(kw),
+                    Staff.phone.ilike(kw),
+                    Staff.email.ilike(kw),
+                    func.coalesce(Staff.license_number, "").ilike(kw),
+                )
+            )
+        rows = (await self.db.execute(stmt.order_by(Staff.staff_name).limit(limit))).mappings().all()
+        return [dict(r) for r in rows]
+
+    async def suggest_exceeds(self, max_rows: int, company_code: Optional[str] = None) -> bool:
+        """More than max_rows suggestable staff in the scope? (skips max_rows ids, transfers at most one)"""
+        stmt = self._suggest_scope(select(Staff.id), company_code).offset(max_rows).limit(1)
+        return (await self.db.execute(stmt)).first() is not None
+
+    @staticmethod
+    def _suggest_scope(stmt, company_code: Optional[str]):
+        stmt = stmt.where(Staff.is_active.is_(True))
+        if company_code:
+            company_locations = select(Location.id).where(Location.company_code == company_code)
+            stmt = stmt.where(
+                or_(
+                    Staff.main_location_id.in_(company_locations),
+                    Staff.id.in_(
+                        select(StaffLocation.staff_id).where(
+                            StaffLocation.location_id.in_(company_locations),
+                            StaffLocation.is_active.is_(True),
+                        )
+                    ),
+                )
+            )
+        return stmt
@@ -5,6 +5,8 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query, Request
 
 from app.utils.ResponseHandler import ResponseHandler, ResponseCode, UnicodeJSONResponse
+from app.api.v1.authen.auth import current_company_code
+from app.api.v1.models._envelopes.base_envelopes import SuggestPayload
 from app.api.v1.utils.list_payload_builder import build_list_payload
 from app.api.v1.modules.staff.dependencies import get_staff_search_service
 from app.api.v1.modules.staff.services.staff_search_service import StaffSearchService
@@ -49,3 +51,20 @@ async def search_staff(
         message=ResponseCode.SUCCESS["LISTED"][1],
         data=payload.model_dump(exclude_none=True),
     )
+
+
+@router.get(
+    "/suggest",
+    response_class=UnicodeJSONResponse,
+    response_model=SuggestPayload,
+    operation_id="suggest_staff",
+)
+async def suggest_staff(
+    q: str = Query(..., min_length=1, description="prefix: staff_name/phone/email/license_number/role"),
+    limit: int = Query(default=10, ge=1, le=50),
+    company_code: str | None = Depends(current_company_code),
+    svc: StaffSearchService = Depends(get_staff_search_service),
+):
+    # picker hot path: no envelope, no count
+    items = await svc.suggest(q=q, limit=limit, company_code=company_code)
+    return UnicodeJSONResponse(content={"q": q, "items": items})
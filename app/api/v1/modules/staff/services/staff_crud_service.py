@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.modules.staff.models.dtos import StaffDetailDTO
 from app.api.v1.modules.staff.repositories.staff_crud_repository import StaffCrudRepository
+from app.api.v1.modules.staff.services.staff_search_service import SUGGEST_ENTITY
+from app.services.suggest_index import suggest_index
 
 
 class StaffCrudService:
@@ -19,6 +21,7 @@ class StaffCrudService:
         try:
             obj = await self.repo.create(payload_model)
             await self.db.commit()
+            suggest_index.invalidate(SUGGEST_ENTITY)
             return StaffDetailDTO.model_validate(obj)
         except Exception:
             await self.db.rollback()
@@ -35,6 +38,7 @@ class StaffCrudService:
                 return None
 
             await self.db.commit()
+            suggest_index.invalidate(SUGGEST_ENTITY)
             return StaffDetailDTO.model_validate(obj)
         except Exception:
             await self.db.rollback()
@@ -44,6 +48,7 @@ class StaffCrudService:
         try:
             deleted_id = await self.repo.delete(staff_id)
             await self.db.commit()
+            suggest_index.invalidate(SUGGEST_ENTITY)
             return deleted_id
         except Exception:
             await self.db.rollback()
@@ -8,6 +8,8 @@ from app.utils.payload_cleaner import clean_create, clean_update
 from app.api.v1.modules.staff.models.dtos import StaffLocationDTO
 from app.api.v1.modules.staff.models.schemas import StaffLocationsCreateModel, StaffLocationsUpdateModel
 from app.api.v1.modules.staff.repositories.staff_locations_crud_repository import StaffLocationsCrudRepository
+from app.api.v1.modules.staff.services.staff_search_service import SUGGEST_ENTITY
+from app.services.suggest_index import suggest_index
 
 
 class StaffLocationsCrudService:
@@ -19,6 +21,7 @@ class StaffLocationsCrudService:
         try:
             obj = await self.repo.create(clean_create(payload))
             await self.db.commit()
+            suggest_index.invalidate(SUGGEST_ENTITY)
             return StaffLocationDTO.model_validate(obj)
         except Exception:
             await self.db.rollback()
@@ -35,6 +38,7 @@ class StaffLocationsCrudService:
                 return None
 
             await self.db.commit()
+            suggest_index.invalidate(SUGGEST_ENTITY)
             return StaffLocationDTO.model_validate(obj)
         except Exception:
             await self.db.rollback()
@@ -47,6 +51,7 @@ class StaffLocationsCrudService:
                 return False
 
             await self.db.commit()
+            suggest_index.invalidate(SUGGEST_ENTITY)
             return True
         except Exception:
             await self.db.rollback()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional
 
 from app.api.v1.modules.staff.models.dtos import StaffSearchItemDTO
 from app.api.v1.modules.staff.repositories.staff_search_repository import StaffSearchRepository
+from app.services.suggest_index import suggest_index
+
+SUGGEST_ENTITY = "staff"
 
 
 class StaffSearchService:
@@ -23,3 +27,14 @@ class StaffSearchService:
         items, total = await self.repo.search(q=q, role=role, is_active=is_active, limit=limit, offset=offset)
         dto_items = [StaffSearchItemDTO.model_validate(x) for x in items]
         return dto_items, total
+
+    async def suggest(self, *, q: str, limit: int = 10, company_code: Optional[str] = None) -> list[dict]:
+        """Top-K (id, label) from the per-company prefix index."""
+        loader = partial(self.repo.suggest_rows, company_code=company_code)
+        probe = partial(self.repo.suggest_exceeds, company_code=company_code)
+        index = await suggest_index.get(SUGGEST_ENTITY, loader, scope=company_code, probe=probe)
+        if not index.partial:
+            return index.lookup(q, limit)
+
+        items = await self.repo.suggest_search(q, limit, company_code=company_code)
+        return [{"id": str(x["id"]), "label": x["staff_name"]} for x in items]
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.session import get_db
 from app.api.v1.modules.users.services import (
     UserProfilesSearchService, UserProfilesReadService, UserProfilesService,
     GroupsSearchService, GroupsReadService, GroupsService,
@@ -11,77 +15,76 @@ from app.api.v1.modules.users.services import (
     GroupRolesSearchService, GroupRolesReadService, GroupRolesService,
 )
 
-# NOTE: Supabase repository is created inside each service by default.
-# If later you want to inject DB/session, modify services to accept repo.
+# NOTE: each service builds its repository on the request's AsyncSession (get_db).
 
-def get_user_profiles_search_service() -> UserProfilesSearchService:
-    return UserProfilesSearchService()
+def get_user_profiles_search_service(db: AsyncSession = Depends(get_db)) -> UserProfilesSearchService:
+    return UserProfilesSearchService(db)
 
-def get_user_profiles_read_service() -> UserProfilesReadService:
-    return UserProfilesReadService()
+def get_user_profiles_read_service(db: AsyncSession = Depends(get_db)) -> UserProfilesReadService:
+    return UserProfilesReadService(db)
 
-def get_user_profiles_service() -> UserProfilesService:
-    return UserProfilesService()
+def get_user_profiles_service(db: AsyncSession = Depends(get_db)) -> UserProfilesService:
+    return UserProfilesService(db)
 
-def get_groups_search_service() -> GroupsSearchService:
-    return GroupsSearchService()
+def get_groups_search_service(db: AsyncSession = Depends(get_db)) -> GroupsSearchService:
+    return GroupsSearchService(db)
 
-def get_groups_read_service() -> GroupsReadService:
-    return GroupsReadService()
+def get_groups_read_service(db: AsyncSession = Depends(get_db)) -> GroupsReadService:
+    return GroupsReadService(db)
 
-def get_groups_service() -> GroupsService:
-    return GroupsService()
+def get_groups_service(db: AsyncSession = Depends(get_db)) -> GroupsService:
+    return GroupsService(db)
 
-def get_roles_search_service() -> RolesSearchService:
-    return RolesSearchService()
+def get_roles_search_service(db: AsyncSession = Depends(get_db)) -> RolesSearchService:
+    return RolesSearchService(db)
 
-def get_roles_read_service() -> RolesReadService:
-    return RolesReadService()
+def get_roles_read_service(db: AsyncSession = Depends(get_db)) -> RolesReadService:
+    return RolesReadService(db)
 
-def get_roles_service() -> RolesService:
-    return RolesService()
+def get_roles_service(db: AsyncSession = Depends(get_db)) -> RolesService:
+    return RolesService(db)
 
-def get_permissions_search_service() -> PermissionsSearchService:
-    return PermissionsSearchService()
+def get_permissions_search_service(db: AsyncSession = Depends(get_db)) -> PermissionsSearchService:
+    return PermissionsSearchService(db)
 
-def get_permissions_read_service() -> PermissionsReadService:
-    return PermissionsReadService()
+def get_permissions_read_service(db: AsyncSession = Depends(get_db)) -> PermissionsReadService:
+    return PermissionsReadService(db)
 
-def get_permissions_service() -> PermissionsService:
-    return PermissionsService()
+def get_permissions_service(db: AsyncSession = Depends(get_db)) -> PermissionsService:
+    return PermissionsService(db)
 
-def get_user_groups_search_service() -> UserGroupsSearchService:
-    return UserGroupsSearchService()
+def get_user_groups_search_service(db: AsyncSession = Depends(get_db)) -> UserGroupsSearchService:
+    return UserGroupsSearchService(db)
 
-def get_user_groups_read_service() -> UserGroupsReadService:
-    return UserGroupsReadService()
+def get_user_groups_read_service(db: AsyncSession = Depends(get_db)) -> UserGroupsReadService:
+    return UserGroupsReadService(db)
 
-def get_user_groups_service() -> UserGroupsService:
-    return UserGroupsService()
+def get_user_groups_service(db: AsyncSession = Depends(get_db)) -> UserGroupsService:
+    return UserGroupsService(db)
 
-def get_user_roles_search_service() -> UserRolesSearchService:
-    return UserRolesSearchService()
+def get_user_roles_search_service(db: AsyncSession = Depends(get_db)) -> UserRolesSearchService:
+    return UserRolesSearchService(db)
 
-def get_user_roles_read_service() -> UserRolesReadService:
-    return UserRolesReadService()
+def get_user_roles_read_service(db: AsyncSession = Depends(get_db)) -> UserRolesReadService:
+    return UserRolesReadService(db)
 
-def get_user_roles_service() -> UserRolesService:
-    return UserRolesService()
+def get_user_roles_service(db: AsyncSession = Depends(get_db)) -> UserRolesService:
+    return UserRolesService(db)
 
-def get_role_permissions_search_service() -> RolePermissionsSearchService:
-    return RolePermissionsSearchService()
+def get_role_permissions_search_service(db: AsyncSession = Depends(get_db)) -> RolePermissionsSearchService:
+    return RolePermissionsSearchService(db)
 
-def get_role_permissions_read_service() -> RolePermissionsReadService:
-    return RolePermissionsReadService()
+def get_role_permissions_read_service(db: AsyncSession = Depends(get_db)) -> RolePermissionsReadService:
+    return RolePermissionsReadService(db)
 
-def get_role_permissions_service() -> RolePermissionsService:
-    return RolePermissionsService()
+def get_role_permissions_service(db: AsyncSession = Depends(get_db)) -> RolePermissionsService:
+    return RolePermissionsService(db)
 
-def get_group_roles_search_service() -> GroupRolesSearchService:
-    return GroupRolesSearchService()
+def get_group_roles_search_service(db: AsyncSession = Depends(get_db)) -> GroupRolesSearchService:
+    return GroupRolesSearchService(db)
 
-def get_group_roles_read_service() -> GroupRolesReadService:
-    return GroupRolesReadService()
+def get_group_roles_read_service(db: AsyncSession = Depends(get_db)) -> GroupRolesReadService:
+    return GroupRolesReadService(db)
 
-def get_group_roles_service() -> GroupRolesService:
-    return GroupRolesService()
+def get_group_roles_service(db: AsyncSession = Depends(get_db)) -> GroupRolesService:
+    return GroupRolesService(db)
@@ -1,6 +1,10 @@
 from __future__ import annotations
-from app.api.v1.modules.users.repositories.supabase_base import SupabaseTableRepository
 
-class GroupsRepository(SupabaseTableRepository):
-    def __init__(self):
-        super().__init__("groups")
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Group
+from app.api.v1.modules.users.repositories.users_base_repository import UsersTableRepository
+
+class GroupsRepository(UsersTableRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model=Group, search_fields=['group_name'])
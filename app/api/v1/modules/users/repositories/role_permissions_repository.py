@@ -1,6 +1,10 @@
 from __future__ import annotations
-from app.api.v1.modules.users.repositories.supabase_base import SupabaseTableRepository
 
-class RolePermissionsRepository(SupabaseTableRepository):
-    def __init__(self):
-        super().__init__("role_permissions")
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import RolePermission
+from app.api.v1.modules.users.repositories.users_base_repository import UsersTableRepository
+
+class RolePermissionsRepository(UsersTableRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model=RolePermission, search_fields=[])
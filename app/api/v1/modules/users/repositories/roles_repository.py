@@ -1,6 +1,10 @@
 from __future__ import annotations
-from app.api.v1.modules.users.repositories.supabase_base import SupabaseTableRepository
 
-class RolesRepository(SupabaseTableRepository):
-    def __init__(self):
-        super().__init__("roles")
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Role
+from app.api.v1.modules.users.repositories.users_base_repository import UsersTableRepository
+
+class RolesRepository(UsersTableRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model=Role, search_fields=['role_name'])
@@ -1,15 +1,27 @@
 from __future__ import annotations
-from app.api.v1.modules.users.repositories.supabase_base import SupabaseTableRepository
-
-class UserProfilesRepository(SupabaseTableRepository):
-    def __init__(self):
-        super().__init__("user_profiles")
-
-    def search_by_name(self, q: str = ""):
-        # projection for list/search
-        return self.search(
-            q=q,
-            q_field="full_name",
-            columns="id, full_name, email, user_id, company_code, location_id, department_id, preferred_language, preferred_currency, is_active, created_at, updated_at",
-            order_by="full_name",
-        )
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import UserProfile
+from app.api.v1.modules.users.repositories.users_base_repository import UsersTableRepository
+
+class UserProfilesRepository(UsersTableRepository):
+    # list/read projection: never return password_hash
+    list_columns = (
+        "id",
+        "user_id",
+        "full_name",
+        "email",
+        "company_code",
+        "location_id",
+        "department_id",
+        "preferred_language",
+        "preferred_currency",
+        "avatar_url",
+        "is_active",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model=UserProfile, search_fields=['full_name'])
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.modules.masters.repositories.base_settings_repository import BaseSettingsSearchRepository
+
+
+class UsersTableRepository(BaseSettingsSearchRepository):
+    """
+    DB-only access to one users/RBAC table. No commit/rollback.
+
+    - search(): masters BaseSettingsSearchRepository contract (q ILIKE, base_filters, sort, limit/offset, total)
+    - reads and writes return the `list_columns` projection as plain dicts (single statement, RETURNING)
+    """
+
+    def __init__(self, session: AsyncSession, model: Any, search_fields: Sequence[str] = ()):
+        super().__init__(session=session, model=model, search_fields=search_fields)
+
+    def _columns(self):
+        table = self.model.__table__
+        return [table.c[c] for c in self.list_columns] if self.list_columns else list(table.c)
+
+    def _pk(self):
+        return self.model.__table__.c[self.pk_field]
+
+    @staticmethod
+    def _first(result) -> dict | None:
+        row = result.mappings().first()
+        return dict(row) if row else None
+
+    async def get_by_id(self, id_value: Any) -> dict | None:
+        stmt = select(*self._columns()).where(self._pk() == id_value)
+        return self._first(await self.session.execute(stmt))
+
+    async def insert(self, data: dict) -> dict | None:
+        stmt = insert(self.model.__table__).values(**data).returning(*self._columns())
+        return self._first(await self.session.execute(stmt))
+
+    async def update_by_id(self, id_value: Any, updated: dict) -> dict | None:
+        if not updated:
+            return await self.get_by_id(id_value)
+        stmt = update(self.model.__table__).where(self._pk() == id_value).values(**updated).returning(*self._columns())
+        return self._first(await self.session.execute(stmt))
+
+    async def delete_by_id(self, id_value: Any) -> dict | None:
+        stmt = delete(self.model.__table__).where(self._pk() == id_value).returning(*self._columns())
+        return self._first(await self.session.execute(stmt))
@@ -15,12 +15,12 @@ router = APIRouter()
 # router = APIRouter(prefix="/group_roles", tags=["User_Settings"])
 
 @router.get("/{id}", response_class=UnicodeJSONResponse, response_model=GroupRolesGetEnvelope, operation_id="get_group_roles_by_id")
-def get_group_roles_by_id(
+async def get_group_roles_by_id(
     request: Request,
     id: UUID,
     svc=Depends(get_group_roles_read_service),
 ):
-    item = svc.get(id=str(id))
+    item = await svc.get(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
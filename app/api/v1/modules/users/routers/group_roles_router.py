@@ -16,13 +16,13 @@ router = APIRouter()
 # router = APIRouter(prefix="/group_roles", tags=["User_Settings"])
 
 @router.post("/", response_class=UnicodeJSONResponse, response_model=GroupRolesCreateEnvelope, operation_id="create_group_roles")
-def create_group_roles(
+async def create_group_roles(
     request: Request,
     body: GroupRoleCreate,
     svc=Depends(get_group_roles_service),
 ):
-    data = jsonable_encoder(body)
-    item = svc.create(data=data)
+    data = body.model_dump()
+    item = await svc.create(data=data)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["FAILED"], details={"reason": "insert_failed"})
 
@@ -34,14 +34,14 @@ def create_group_roles(
     )
 
 @router.put("/{id}", response_class=UnicodeJSONResponse, response_model=GroupRolesUpdateEnvelope, operation_id="update_group_roles")
-def update_group_roles(
+async def update_group_roles(
     request: Request,
     id: UUID,
     body: GroupRoleUpdate,
     svc=Depends(get_group_roles_service),
 ):
-    updated = {k: v for k, v in jsonable_encoder(body).items() if v is not None}
-    item = svc.update(id=str(id), updated=updated)
+    updated = body.model_dump(exclude_none=True)
+    item = await svc.update(id=id, updated=updated)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -53,12 +53,12 @@ def update_group_roles(
     )
 
 @router.delete("/{id}", response_class=UnicodeJSONResponse, response_model=GroupRolesDeleteEnvelope, operation_id="delete_group_roles")
-def delete_group_roles(
+async def delete_group_roles(
     request: Request,
     id: UUID,
     svc=Depends(get_group_roles_service),
 ):
-    item = svc.delete(id=str(id))
+    item = await svc.delete(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
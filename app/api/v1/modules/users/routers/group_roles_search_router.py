@@ -15,14 +15,15 @@ router = APIRouter()
 
 
 @router.get("/search", response_class=UnicodeJSONResponse, response_model=GroupRolesSearchEnvelope, operation_id="search_group_roles")
-def search_group_roles(
+async def search_group_roles(
     request: Request,
-    
+    group_id: UUID | None = Query(None, description="Group id"),
+    role_id: UUID | None = Query(None, description="Role id"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     svc=Depends(get_group_roles_search_service),
 ):
-    rows, total = svc.search(limit=limit, offset=offset)
+    rows, total = await svc.search(limit=limit, offset=offset, group_id=group_id, role_id=role_id)
     items = [GroupRoleDTO.model_validate(r, from_attributes=True).model_dump(exclude_none=True) for r in rows]
 
     payload = build_list_payload(
@@ -30,7 +31,7 @@ def search_group_roles(
         total=total,
         limit=limit,
         offset=offset,
-        filters={},
+        filters={"group_id": group_id, "role_id": role_id},
     )
 
     return ResponseHandler.success_from_request(
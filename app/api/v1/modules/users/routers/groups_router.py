@@ -15,13 +15,13 @@ from app.api.v1.modules.users.models._envelopes import GroupsCreateEnvelope, Gro
 router = APIRouter()
 
 @router.post("/", response_class=UnicodeJSONResponse, response_model=GroupsCreateEnvelope, operation_id="create_groups")
-def create_groups(
+async def create_groups(
     request: Request,
     body: GroupCreate,
     svc=Depends(get_groups_service),
 ):
-    data = jsonable_encoder(body)
-    item = svc.create(data=data)
+    data = body.model_dump()
+    item = await svc.create(data=data)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["FAILED"], details={"reason": "insert_failed"})
 
@@ -33,14 +33,14 @@ def create_groups(
     )
 
 @router.put("/{id}", response_class=UnicodeJSONResponse, response_model=GroupsUpdateEnvelope, operation_id="update_groups")
-def update_groups(
+async def update_groups(
     request: Request,
     id: UUID,
     body: GroupUpdate,
     svc=Depends(get_groups_service),
 ):
-    updated = {k: v for k, v in jsonable_encoder(body).items() if v is not None}
-    item = svc.update(id=str(id), updated=updated)
+    updated = body.model_dump(exclude_none=True)
+    item = await svc.update(id=id, updated=updated)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -52,12 +52,12 @@ def update_groups(
     )
 
 @router.delete("/{id}", response_class=UnicodeJSONResponse, response_model=GroupsDeleteEnvelope, operation_id="delete_groups")
-def delete_groups(
+async def delete_groups(
     request: Request,
     id: UUID,
     svc=Depends(get_groups_service),
 ):
-    item = svc.delete(id=str(id))
+    item = await svc.delete(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
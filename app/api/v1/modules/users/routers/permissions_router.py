@@ -15,13 +15,13 @@ from app.api.v1.modules.users.models._envelopes import PermissionsCreateEnvelope
 router = APIRouter()
 
 @router.post("/", response_class=UnicodeJSONResponse, response_model=PermissionsCreateEnvelope, operation_id="create_permissions")
-def create_permissions(
+async def create_permissions(
     request: Request,
     body: PermissionCreate,
     svc=Depends(get_permissions_service),
 ):
-    data = jsonable_encoder(body)
-    item = svc.create(data=data)
+    data = body.model_dump()
+    item = await svc.create(data=data)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["FAILED"], details={"reason": "insert_failed"})
 
@@ -33,14 +33,14 @@ def create_permissions(
     )
 
 @router.put("/{id}", response_class=UnicodeJSONResponse, response_model=PermissionsUpdateEnvelope, operation_id="update_permissions")
-def update_permissions(
+async def update_permissions(
     request: Request,
     id: UUID,
     body: PermissionUpdate,
     svc=Depends(get_permissions_service),
 ):
-    updated = {k: v for k, v in jsonable_encoder(body).items() if v is not None}
-    item = svc.update(id=str(id), updated=updated)
+    updated = body.model_dump(exclude_none=True)
+    item = await svc.update(id=id, updated=updated)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -52,12 +52,12 @@ def update_permissions(
     )
 
 @router.delete("/{id}", response_class=UnicodeJSONResponse, response_model=PermissionsDeleteEnvelope, operation_id="delete_permissions")
-def delete_permissions(
+async def delete_permissions(
     request: Request,
     id: UUID,
     svc=Depends(get_permissions_service),
 ):
-    item = svc.delete(id=str(id))
+    item = await svc.delete(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
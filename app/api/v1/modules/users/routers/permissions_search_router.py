@@ -14,14 +14,15 @@ from app.api.v1.modules.users.models._envelopes import PermissionsSearchEnvelope
 router = APIRouter()
 
 @router.get("/search", response_class=UnicodeJSONResponse, response_model=PermissionsSearchEnvelope, operation_id="search_permissions")
-def search_permissions(
+async def search_permissions(
     request: Request,
     q: str = Query("", description="Permission code contains"),
+    company_code: str | None = Query(None, description="Company code"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     svc=Depends(get_permissions_search_service),
 ):
-    rows, total = svc.search(q=q, limit=limit, offset=offset)
+    rows, total = await svc.search(q=q, limit=limit, offset=offset, company_code=company_code)
     items = [PermissionDTO.model_validate(r, from_attributes=True).model_dump(exclude_none=True) for r in rows]
 
     payload = build_list_payload(
@@ -29,7 +30,7 @@ def search_permissions(
         total=total,
         limit=limit,
         offset=offset,
-        filters={"q": q},
+        filters={"q": q, "company_code": company_code},
     )
 
     return ResponseHandler.success_from_request(
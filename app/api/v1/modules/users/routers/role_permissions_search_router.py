@@ -14,14 +14,15 @@ from app.api.v1.modules.users.models._envelopes import RolePermissionsSearchEnve
 router = APIRouter()
 
 @router.get("/search", response_class=UnicodeJSONResponse, response_model=RolePermissionsSearchEnvelope, operation_id="search_role_permissions")
-def search_role_permissions(
+async def search_role_permissions(
     request: Request,
-    
+    role_id: UUID | None = Query(None, description="Role id"),
+    permission_id: UUID | None = Query(None, description="Permission id"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     svc=Depends(get_role_permissions_search_service),
 ):
-    rows, total = svc.search(limit=limit, offset=offset)
+    rows, total = await svc.search(limit=limit, offset=offset, role_id=role_id, permission_id=permission_id)
     items = [RolePermissionDTO.model_validate(r, from_attributes=True).model_dump(exclude_none=True) for r in rows]
 
     payload = build_list_payload(
@@ -29,7 +30,7 @@ def search_role_permissions(
         total=total,
         limit=limit,
         offset=offset,
-        filters={},
+        filters={"role_id": role_id, "permission_id": permission_id},
     )
 
     return ResponseHandler.success_from_request(
@@ -15,13 +15,13 @@ from app.api.v1.modules.users.models._envelopes import RolesCreateEnvelope, Role
 router = APIRouter()
 
 @router.post("/", response_class=UnicodeJSONResponse, response_model=RolesCreateEnvelope, operation_id="create_roles")
-def create_roles(
+async def create_roles(
     request: Request,
     body: RoleCreate,
     svc=Depends(get_roles_service),
 ):
-    data = jsonable_encoder(body)
-    item = svc.create(data=data)
+    data = body.model_dump()
+    item = await svc.create(data=data)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["FAILED"], details={"reason": "insert_failed"})
 
@@ -33,14 +33,14 @@ def create_roles(
     )
 
 @router.put("/{id}", response_class=UnicodeJSONResponse, response_model=RolesUpdateEnvelope, operation_id="update_roles")
-def update_roles(
+async def update_roles(
     request: Request,
     id: UUID,
     body: RoleUpdate,
     svc=Depends(get_roles_service),
 ):
-    updated = {k: v for k, v in jsonable_encoder(body).items() if v is not None}
-    item = svc.update(id=str(id), updated=updated)
+    updated = body.model_dump(exclude_none=True)
+    item = await svc.update(id=id, updated=updated)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -52,12 +52,12 @@ def update_roles(
     )
 
 @router.delete("/{id}", response_class=UnicodeJSONResponse, response_model=RolesDeleteEnvelope, operation_id="delete_roles")
-def delete_roles(
+async def delete_roles(
     request: Request,
     id: UUID,
     svc=Depends(get_roles_service),
 ):
-    item = svc.delete(id=str(id))
+    item = await svc.delete(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -14,14 +14,15 @@ from app.api.v1.modules.users.models._envelopes import RolesSearchEnvelope
 router = APIRouter()
 
 @router.get("/search", response_class=UnicodeJSONResponse, response_model=RolesSearchEnvelope, operation_id="search_roles")
-def search_roles(
+async def search_roles(
     request: Request,
     q: str = Query("", description="Role name contains"),
+    company_code: str | None = Query(None, description="Company code"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     svc=Depends(get_roles_search_service),
 ):
-    rows, total = svc.search(q=q, limit=limit, offset=offset)
+    rows, total = await svc.search(q=q, limit=limit, offset=offset, company_code=company_code)
     items = [RoleDTO.model_validate(r, from_attributes=True).model_dump(exclude_none=True) for r in rows]
 
     payload = build_list_payload(
@@ -29,7 +30,7 @@ def search_roles(
         total=total,
         limit=limit,
         offset=offset,
-        filters={"q": q},
+        filters={"q": q, "company_code": company_code},
     )
 
     return ResponseHandler.success_from_request(
@@ -15,13 +15,13 @@ from app.api.v1.modules.users.models._envelopes import UserGroupsCreateEnvelope,
 router = APIRouter()
 
 @router.post("/", response_class=UnicodeJSONResponse, response_model=UserGroupsCreateEnvelope, operation_id="create_user_groups")
-def create_user_groups(
+async def create_user_groups(
     request: Request,
     body: UserGroupCreate,
     svc=Depends(get_user_groups_service),
 ):
-    data = jsonable_encoder(body)
-    item = svc.create(data=data)
+    data = body.model_dump()
+    item = await svc.create(data=data)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["FAILED"], details={"reason": "insert_failed"})
 
@@ -33,14 +33,14 @@ def create_user_groups(
     )
 
 @router.put("/{id}", response_class=UnicodeJSONResponse, response_model=UserGroupsUpdateEnvelope, operation_id="update_user_groups")
-def update_user_groups(
+async def update_user_groups(
     request: Request,
     id: UUID,
     body: UserGroupUpdate,
     svc=Depends(get_user_groups_service),
 ):
-    updated = {k: v for k, v in jsonable_encoder(body).items() if v is not None}
-    item = svc.update(id=str(id), updated=updated)
+    updated = body.model_dump(exclude_none=True)
+    item = await svc.update(id=id, updated=updated)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -52,12 +52,12 @@ def update_user_groups(
     )
 
 @router.delete("/{id}", response_class=UnicodeJSONResponse, response_model=UserGroupsDeleteEnvelope, operation_id="delete_user_groups")
-def delete_user_groups(
+async def delete_user_groups(
     request: Request,
     id: UUID,
     svc=Depends(get_user_groups_service),
 ):
-    item = svc.delete(id=str(id))
+    item = await svc.delete(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -14,14 +14,15 @@ from app.api.v1.modules.users.models._envelopes import UserGroupsSearchEnvelope
 router = APIRouter()
 
 @router.get("/search", response_class=UnicodeJSONResponse, response_model=UserGroupsSearchEnvelope, operation_id="search_user_groups")
-def search_user_groups(
+async def search_user_groups(
     request: Request,
-    
+    profile_id: UUID | None = Query(None, description="User profile id"),
+    group_id: UUID | None = Query(None, description="Group id"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     svc=Depends(get_user_groups_search_service),
 ):
-    rows, total = svc.search(limit=limit, offset=offset)
+    rows, total = await svc.search(limit=limit, offset=offset, profile_id=profile_id, group_id=group_id)
     items = [UserGroupDTO.model_validate(r, from_attributes=True).model_dump(exclude_none=True) for r in rows]
 
     payload = build_list_payload(
@@ -29,7 +30,7 @@ def search_user_groups(
         total=total,
         limit=limit,
         offset=offset,
-        filters={},
+        filters={"profile_id": profile_id, "group_id": group_id},
     )
 
     return ResponseHandler.success_from_request(
@@ -14,12 +14,12 @@ from app.api.v1.modules.users.models._envelopes import UserProfilesGetEnvelope
 router = APIRouter()
 
 @router.get("/{id}", response_class=UnicodeJSONResponse, response_model=UserProfilesGetEnvelope, operation_id="get_user_profiles_by_id")
-def get_user_profiles_by_id(
+async def get_user_profiles_by_id(
     request: Request,
     id: UUID,
     svc=Depends(get_user_profiles_read_service),
 ):
-    item = svc.get(id=str(id))
+    item = await svc.get(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
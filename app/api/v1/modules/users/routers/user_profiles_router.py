@@ -15,13 +15,13 @@ from app.api.v1.modules.users.models._envelopes import UserProfilesCreateEnvelop
 router = APIRouter()
 
 @router.post("/", response_class=UnicodeJSONResponse, response_model=UserProfilesCreateEnvelope, operation_id="create_user_profiles")
-def create_user_profiles(
+async def create_user_profiles(
     request: Request,
     body: UserProfileCreate,
     svc=Depends(get_user_profiles_service),
 ):
-    data = jsonable_encoder(body)
-    item = svc.create(data=data)
+    data = body.model_dump()
+    item = await svc.create(data=data)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["FAILED"], details={"reason": "insert_failed"})
 
@@ -33,14 +33,14 @@ def create_user_profiles(
     )
 
 @router.put("/{id}", response_class=UnicodeJSONResponse, response_model=UserProfilesUpdateEnvelope, operation_id="update_user_profiles")
-def update_user_profiles(
+async def update_user_profiles(
     request: Request,
     id: UUID,
     body: UserProfileUpdate,
     svc=Depends(get_user_profiles_service),
 ):
-    updated = {k: v for k, v in jsonable_encoder(body).items() if v is not None}
-    item = svc.update(id=str(id), updated=updated)
+    updated = body.model_dump(exclude_none=True)
+    item = await svc.update(id=id, updated=updated)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -52,12 +52,12 @@ def update_user_profiles(
     )
 
 @router.delete("/{id}", response_class=UnicodeJSONResponse, response_model=UserProfilesDeleteEnvelope, operation_id="delete_user_profiles")
-def delete_user_profiles(
+async def delete_user_profiles(
     request: Request,
     id: UUID,
     svc=Depends(get_user_profiles_service),
 ):
-    item = svc.delete(id=str(id))
+    item = await svc.delete(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -14,14 +14,16 @@ from app.api.v1.modules.users.models._envelopes import UserProfilesSearchEnvelop
 router = APIRouter()
 
 @router.get("/search", response_class=UnicodeJSONResponse, response_model=UserProfilesSearchEnvelope, operation_id="search_user_profiles")
-def search_user_profiles(
+async def search_user_profiles(
     request: Request,
     q: str = Query("", description="Full name contains"),
+    company_code: str | None = Query(None, description="Company code"),
+    is_active: bool | None = Query(None, description="Active flag"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     svc=Depends(get_user_profiles_search_service),
 ):
-    rows, total = svc.search(q=q, limit=limit, offset=offset)
+    rows, total = await svc.search(q=q, limit=limit, offset=offset, company_code=company_code, is_active=is_active)
     items = [UserProfileDTO.model_validate(r, from_attributes=True).model_dump(exclude_none=True) for r in rows]
 
     payload = build_list_payload(
@@ -29,7 +31,7 @@ def search_user_profiles(
         total=total,
         limit=limit,
         offset=offset,
-        filters={"q": q},
+        filters={"q": q, "company_code": company_code, "is_active": is_active},
     )
 
     return ResponseHandler.success_from_request(
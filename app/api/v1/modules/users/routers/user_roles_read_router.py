@@ -14,12 +14,12 @@ from app.api.v1.modules.users.models._envelopes import UserRolesGetEnvelope
 router = APIRouter()
 
 @router.get("/{id}", response_class=UnicodeJSONResponse, response_model=UserRolesGetEnvelope, operation_id="get_user_roles_by_id")
-def get_user_roles_by_id(
+async def get_user_roles_by_id(
     request: Request,
     id: UUID,
     svc=Depends(get_user_roles_read_service),
 ):
-    item = svc.get(id=str(id))
+    item = await svc.get(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
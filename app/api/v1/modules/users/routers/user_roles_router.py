@@ -15,13 +15,13 @@ from app.api.v1.modules.users.models._envelopes import UserRolesCreateEnvelope,
 router = APIRouter()
 
 @router.post("/", response_class=UnicodeJSONResponse, response_model=UserRolesCreateEnvelope, operation_id="create_user_roles")
-def create_user_roles(
+async def create_user_roles(
     request: Request,
     body: UserRoleCreate,
     svc=Depends(get_user_roles_service),
 ):
-    data = jsonable_encoder(body)
-    item = svc.create(data=data)
+    data = body.model_dump()
+    item = await svc.create(data=data)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["FAILED"], details={"reason": "insert_failed"})
 
@@ -33,14 +33,14 @@ def create_user_roles(
     )
 
 @router.put("/{id}", response_class=UnicodeJSONResponse, response_model=UserRolesUpdateEnvelope, operation_id="update_user_roles")
-def update_user_roles(
+async def update_user_roles(
     request: Request,
     id: UUID,
     body: UserRoleUpdate,
     svc=Depends(get_user_roles_service),
 ):
-    updated = {k: v for k, v in jsonable_encoder(body).items() if v is not None}
-    item = svc.update(id=str(id), updated=updated)
+    updated = body.model_dump(exclude_none=True)
+    item = await svc.update(id=id, updated=updated)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -52,12 +52,12 @@ def update_user_roles(
     )
 
 @router.delete("/{id}", response_class=UnicodeJSONResponse, response_model=UserRolesDeleteEnvelope, operation_id="delete_user_roles")
-def delete_user_roles(
+async def delete_user_roles(
     request: Request,
     id: UUID,
     svc=Depends(get_user_roles_service),
 ):
-    item = svc.delete(id=str(id))
+    item = await svc.delete(id=id)
     if not item:
         return ResponseHandler.error(*ResponseCode.DATA["NOT_FOUND"], details={"id": str(id)})
 
@@ -14,14 +14,15 @@ from app.api.v1.modules.users.models._envelopes import UserRolesSearchEnvelope
 router = APIRouter()
 
 @router.get("/search", response_class=UnicodeJSONResponse, response_model=UserRolesSearchEnvelope, operation_id="search_user_roles")
-def search_user_roles(
+async def search_user_roles(
     request: Request,
-    
+    profile_id: UUID | None = Query(None, description="User profile id"),
+    role_id: UUID | None = Query(None, description="Role id"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     svc=Depends(get_user_roles_search_service),
 ):
-    rows, total = svc.search(limit=limit, offset=offset)
+    rows, total = await svc.search(limit=limit, offset=offset, profile_id=profile_id, role_id=role_id)
     items = [UserRoleDTO.model_validate(r, from_attributes=True).model_dump(exclude_none=True) for r in rows]
 
     payload = build_list_payload(
@@ -29,7 +30,7 @@ def search_user_roles(
         total=total,
         limit=limit,
         offset=offset,
-        filters={},
+        filters={"profile_id": profile_id, "role_id": role_id},
     )
 
     return ResponseHandler.success_from_request(
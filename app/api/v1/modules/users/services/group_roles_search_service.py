@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-from app.api.v1.modules.users.repositories import GroupRolesRepository
-from app.api.v1.modules.users.services._utils import unwrap_supabase
+from sqlalchemy.ext.asyncio import AsyncSession
 
-class GroupRolesSearchService:
-    def __init__(self, repo: GroupRolesRepository | None = None):
-        self.repo = repo or GroupRolesRepository()
+from app.api.v1.modules.users.repositories import GroupRolesRepository
+from app.api.v1.modules.users.services.users_base_service import UsersSearchService
 
-    def search(self, *, limit: int = 50, offset: int = 0):
-        res = self.repo.search(q="", q_field="", columns="*", order_by=None)
-        rows = unwrap_supabase(res)
-        total = len(rows)
-        return rows[offset: offset + limit], total
+class GroupRolesSearchService(UsersSearchService):
+    def __init__(self, session: AsyncSession, repo: GroupRolesRepository | None = None):
+        super().__init__(repo=repo or GroupRolesRepository(session))
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from app.api.v1.modules.users.repositories import GroupsRepository
-from app.api.v1.modules.users.services._utils import unwrap_single
+from sqlalchemy.ext.asyncio import AsyncSession
 
-class GroupsReadService:
-    def __init__(self, repo: GroupsRepository | None = None):
-        self.repo = repo or GroupsRepository()
+from app.api.v1.modules.users.repositories import GroupsRepository
+from app.api.v1.modules.users.services.users_base_service import UsersReadService
 
-    def get(self, *, id: str):
-        res = self.repo.get_by_id(id)
-        return unwrap_single(res)
+class GroupsReadService(UsersReadService):
+    def __init__(self, session: AsyncSession, repo: GroupsRepository | None = None):
+        super().__init__(repo=repo or GroupsRepository(session))
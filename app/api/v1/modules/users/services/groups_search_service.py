@@ -1,14 +1,12 @@
 from __future__ import annotations
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.api.v1.modules.users.repositories import GroupsRepository
-from app.api.v1.modules.users.services._utils import unwrap_supabase
+from app.api.v1.modules.users.services.users_base_service import UsersSearchService
 
-class GroupsSearchService:
-    def __init__(self, repo: GroupsRepository | None = None):
-        self.repo = repo or GroupsRepository()
+class GroupsSearchService(UsersSearchService):
+    sort_by = "group_name"
 
-    def search(self, *, q: str = "", limit: int = 50, offset: int = 0):
-        res = self.repo.search(q=q, q_field="group_name", columns="*", order_by="group_name")
-        rows = unwrap_supabase(res)
-        total = len(rows)
-        return rows[offset: offset + limit], total
+    def __init__(self, session: AsyncSession, repo: GroupsRepository | None = None):
+        super().__init__(repo=repo or GroupsRepository(session))
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from app.api.v1.modules.users.repositories import RolePermissionsRepository
-from app.api.v1.modules.users.services._utils import unwrap_single
+from sqlalchemy.ext.asyncio import AsyncSession
 
-class RolePermissionsReadService:
-    def __init__(self, repo: RolePermissionsRepository | None = None):
-        self.repo = repo or RolePermissionsRepository()
+from app.api.v1.modules.users.repositories import RolePermissionsRepository
+from app.api.v1.modules.users.services.users_base_service import UsersReadService
 
-    def get(self, *, id: str):
-        return unwrap_single(self.repo.get_by_id(id))
+class RolePermissionsReadService(UsersReadService):
+    def __init__(self, session: AsyncSession, repo: RolePermissionsRepository | None = None):
+        super().__init__(repo=repo or RolePermissionsRepository(session))
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.api.v1.modules.users.repositories import UserProfilesRepository
-from app.api.v1.modules.users.services._utils import unwrap_supabase
+from app.api.v1.modules.users.services.users_base_service import UsersSearchService
 
-class UserProfilesSearchService:
-    def __init__(self, repo: UserProfilesRepository | None = None):
-        self.repo = repo or UserProfilesRepository()
+class UserProfilesSearchService(UsersSearchService):
+    sort_by = "full_name"
 
-    def search(self, *, q: str = "", limit: int = 50, offset: int = 0):
-        res = self.repo.search_by_name(q=q)
-        rows = unwrap_supabase(res)
-        total = len(rows)
-        return rows[offset: offset + limit], total
+    def __init__(self, session: AsyncSession, repo: UserProfilesRepository | None = None):
+        super().__init__(repo=repo or UserProfilesRepository(session))
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
-from app.api.v1.modules.users.repositories import UserProfilesRepository
-from app.api.v1.modules.users.services._utils import unwrap_single
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
-class UserProfilesService:
-    def __init__(self, repo: UserProfilesRepository | None = None):
-        self.repo = repo or UserProfilesRepository()
+from app.api.v1.authen.principal_cache import principal_cache
+from app.api.v1.modules.users.repositories import UserProfilesRepository
+from app.api.v1.modules.users.services.users_base_service import UsersWriteService
 
-    def create(self, *, data: dict):
-        res = self.repo.insert(data)
-        return unwrap_single(res)
+class UserProfilesService(UsersWriteService):
+    def __init__(self, session: AsyncSession, repo: UserProfilesRepository | None = None):
+        super().__init__(session=session, repo=repo or UserProfilesRepository(session))
 
-    def update(self, *, id: str, updated: dict):
-        res = self.repo.update_by_id(id, updated)
-        return unwrap_single(res)
+    async def update(self, *, id: Any, updated: dict):
+        row = await super().update(id=id, updated=updated)
+        if row is not None and "user_id" in updated:
+            # re-pointing a profile to another auth user: the previous user_id is unknown here
+            principal_cache.invalidate(None)
+        return row
 
-    def delete(self, *, id: str):
-        res = self.repo.delete_by_id(id)
-        # supabase delete returns deleted rows in .data usually
-        return unwrap_single(res)
+    def _after_commit(self, row: dict | None) -> None:
+        # cached principals are keyed by auth user_id; without it drop all
+        principal_cache.invalidate((row or {}).get("user_id"))
+        # company_code / is_active feed the compiled RBAC masks
+        super()._after_commit(row)
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-from app.api.v1.modules.users.repositories import UserRolesRepository
-from app.api.v1.modules.users.services._utils import unwrap_supabase
+from sqlalchemy.ext.asyncio import AsyncSession
 
-class UserRolesSearchService:
-    def __init__(self, repo: UserRolesRepository | None = None):
-        self.repo = repo or UserRolesRepository()
+from app.api.v1.modules.users.repositories import UserRolesRepository
+from app.api.v1.modules.users.services.users_base_service import UsersSearchService
 
-    def search(self, *, limit: int = 50, offset: int = 0):
-        res = self.repo.search(q="", q_field="", columns="*", order_by=None)
-        rows = unwrap_supabase(res)
-        total = len(rows)
-        return rows[offset: offset + limit], total
+class UserRolesSearchService(UsersSearchService):
+    def __init__(self, session: AsyncSession, repo: UserRolesRepository | None = None):
+        super().__init__(repo=repo or UserRolesRepository(session))
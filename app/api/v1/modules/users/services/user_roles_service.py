@@ -1,17 +1,10 @@
 from __future__ import annotations
 
-from app.api.v1.modules.users.repositories import UserRolesRepository
-from app.api.v1.modules.users.services._utils import unwrap_single
-
-class UserRolesService:
-    def __init__(self, repo: UserRolesRepository | None = None):
-        self.repo = repo or UserRolesRepository()
+from sqlalchemy.ext.asyncio import AsyncSession
 
-    def create(self, *, data: dict):
-        return unwrap_single(self.repo.insert(data))
-
-    def update(self, *, id: str, updated: dict):
-        return unwrap_single(self.repo.update_by_id(id, updated))
+from app.api.v1.modules.users.repositories import UserRolesRepository
+from app.api.v1.modules.users.services.users_base_service import UsersWriteService
 
-    def delete(self, *, id: str):
-        return unwrap_single(self.repo.delete_by_id(id))
+class UserRolesService(UsersWriteService):
+    def __init__(self, session: AsyncSession, repo: UserRolesRepository | None = None):
+        super().__init__(session=session, repo=repo or UserRolesRepository(session))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.authen.access_engine import access_engine
+from app.api.v1.modules.users.repositories.users_base_repository import UsersTableRepository
+
+
+class UsersSearchService:
+    # default list order (None -> repository default: updated_at / created_at / id)
+    sort_by: str | None = None
+
+    def __init__(self, repo: UsersTableRepository):
+        self.repo = repo
+
+    async def search(self, *, q: str = "", limit: int = 50, offset: int = 0, **equals: Any):
+        """Server-side filter + page; `equals` are column == value filters (None -> ignored)."""
+        model = self.repo.model
+        base_filters = [getattr(model, f) == v for f, v in equals.items() if v is not None]
+        return await self.repo.search(
+            q=q or "",
+            limit=limit,
+            offset=offset,
+            base_filters=base_filters,
+            sort_by=self.sort_by,
+        )
+
+
+class UsersReadService:
+    def __init__(self, repo: UsersTableRepository):
+        self.repo = repo
+
+    async def get(self, *, id: Any):
+        return await self.repo.get_by_id(id)
+
+
+class UsersWriteService:
+    """Transaction boundary: commit/rollback lives here."""
+
+    def __init__(self, session: AsyncSession, repo: UsersTableRepository):
+        self.session = session
+        self.repo = repo
+
+    def _after_commit(self, row: dict | None) -> None:
+        # RBAC tables changed -> recompile access_engine snapshots on next check
+        access_engine.invalidate()
+
+    async def _write(self, op, *args) -> dict | None:
+        try:
+            row = await op(*args)
+            if row is None:
+                await self.session.rollback()
+                return None
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        self._after_commit(row)
+        return row
+
+    async def create(self, *, data: dict):
+        return await self._write(self.repo.insert, data)
+
+    async def update(self, *, id: Any, updated: dict):
+        return await self._write(self.repo.update_by_id, id, updated)
+
+    async def delete(self, *, id: Any):
+        return await self._write(self.repo.delete_by_id, id)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
 
 from app.api.v1.models._envelopes.base_envelopes import (
     ListPayload,
@@ -42,4 +45,54 @@ def build_list_payload(
             next_offset=next_offset,
         ),
         items=items,
-    )
\ No newline at end of file
+    )
+
+
+# ----------------------------------------------------------
+# Keyset (cursor) paging: no COUNT, stable under inserts
+# ----------------------------------------------------------
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Opaque cursor for the (created_at, id) position of the last returned row."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Inverse of encode_cursor; raises ValueError on anything it did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(at), UUID(row_id)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+
+def build_cursor_payload(
+    *,
+    items: list[Any],
+    limit: int,
+    cursor: Optional[str],
+    next_cursor: Optional[str],
+    filters: Optional[dict] = None,
+    fields: Optional[Sequence[str]] = None,
+    sort_by: Optional[str] = None,
+    sort_order: str = "desc",
+) -> dict[str, Any]:
+    """
+    ListPayload for cursor-paged endpoints, already dumped: paging carries cursor / next_cursor /
+    has_more instead of total / offset (there is no COUNT behind it).
+    """
+    payload = ListPayload(
+        filters=filters or {},
+        sort=Sort(by=sort_by, order=sort_order) if sort_by else None,
+        paging=Paging(
+            limit=limit,
+            returned=len(items),
+            has_more=next_cursor is not None,
+            cursor=cursor,
+            next_cursor=next_cursor,
+        ),
+        fields=list(fields) if fields else None,
+        items=items,
+    )
+    return payload.model_dump(exclude_none=True, exclude={"paging": {"total", "offset"}})
@@ -1,45 +1,89 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+from functools import lru_cache
+from typing import List, Optional, Sequence
 
 import httpx
 
+from app.core.config import get_settings
+
+EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+# retried with backoff: rate limited / transient upstream errors
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
 
 class OpenAIClient:
     """Minimal async client for OpenAI Embeddings API.
 
     - Uses direct HTTPS call (no extra SDK dependency)
+    - One pooled httpx.AsyncClient per process (keep-alive: no TLS handshake per call); aclose() on shutdown
     - Returns embedding as list[float]
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, *, max_connections: int = 10, timeout_seconds: float = 30, max_retries: int = 2):
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is not configured")
         self._api_key = api_key
+        self._max_connections = max_connections
+        self._timeout_seconds = timeout_seconds
+        self._max_retries = max_retries
+        self._http: Optional[httpx.AsyncClient] = None
 
-    async def embed(
-        self,
-        *,
-        text: str,
-        model: str,
-        dimensions: int,
-        timeout_seconds: int = 30,
-    ) -> List[float]:
-        url = "https://api.openai.com/v1/embeddings"
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self._timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                headers={"Authorization": f"Bearer {self._api_key}"},
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def embed_many(self, *, texts: Sequence[str], model: str, dimensions: int) -> List[List[float]]:
+        """One request for several inputs; results in input order."""
+        if not texts:
+            return []
         payload = {
-            "input": text,
+            "input": list(texts),
             "model": model,
             "dimensions": dimensions,
             "encoding_format": "float",
         }
+        for attempt in range(self._max_retries + 1):
+            try:
+                resp = await self._client().post(EMBEDDINGS_URL, json=payload)
+                if resp.status_code not in _RETRY_STATUS or attempt == self._max_retries:
+                    resp.raise_for_status()
+                    break
+                retry_after = resp.headers.get("retry-after")
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else 0.5 * 2**attempt
+            except httpx.TransportError:
+                if attempt == self._max_retries:
+                    raise
+                delay = 0.5 * 2**attempt
+            await asyncio.sleep(min(delay, 10.0))
+
+        data = resp.json()["data"]
+        return [d["embedding"] for d in sorted(data, key=lambda d: d["index"])]
+
+    async def embed(self, *, text: str, model: str, dimensions: int) -> List[float]:
+        return (await self.embed_many(texts=[text], model=model, dimensions=dimensions))[0]
 
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            resp = await client.post(url, headers=headers, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
 
-        return data["data"][0]["embedding"]
+@lru_cache()
+def get_openai_client() -> OpenAIClient:
+    """Shared client, built on first use (raises then if OPENAI_API_KEY is missing)."""
+    s = get_settings()
+    return OpenAIClient(
+        api_key=s.OPENAI_API_KEY or "",
+        max_connections=s.OPENAI_HTTP_MAX_CONNECTIONS,
+        timeout_seconds=s.OPENAI_TIMEOUT_SECONDS,
+    )
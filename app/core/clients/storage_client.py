@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional
+from urllib.parse import quote, unquote, urlparse
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+
+logger = get_service_logger("service.storage")
+
+
+class StorageError(RuntimeError):
+    """Upload / remove failed on the storage side."""
+
+
+class UploadTooLarge(StorageError):
+    pass
+
+
+class ChecksumMismatch(StorageError):
+    pass
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    bucket: str
+    path: str
+    size: int
+    sha256: str
+    content_type: str
+    url: str
+
+
+class _Digest:
+    """Running size + sha256 (+ md5 for ETag checks) of a streamed body."""
+
+    def __init__(self, max_bytes: Optional[int]):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+        self.md5 = hashlib.md5(usedforsecurity=False)
+
+    async def wrap(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            self.size += len(chunk)
+            if self.max_bytes and self.size > self.max_bytes:
+                raise UploadTooLarge(f"upload exceeds {self.max_bytes} bytes")
+            self.sha256.update(chunk)
+            self.md5.update(chunk)
+            yield chunk
+
+
+class ObjectStorage:
+    """
+    Streamed uploads with bounded concurrency and checksum verification.
+
+    - put_stream() consumes an async iterator of chunks; the body is never held in memory
+    - at most STORAGE_MAX_CONCURRENT_UPLOADS uploads run per worker, the rest wait for a slot
+    - sha256 is computed while streaming; a client-supplied checksum that does not match,
+      or a stored object that does not match what was sent, removes the object and raises
+    """
+
+    def __init__(self, *, max_concurrency: int):
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def put_stream(
+        self,
+        bucket: str,
+        path: str,
+        chunks: AsyncIterator[bytes],
+        *,
+        content_type: str,
+        expected_sha256: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> StoredObject:
+        async with self._slots:
+            digest = _Digest(max_bytes)
+            # a failed _put leaves nothing behind (backends write atomically); never remove here,
+            # the path may belong to an existing object
+            await self._put(bucket, path, digest.wrap(chunks), content_type)
+
+            sha256 = digest.sha256.hexdigest()
+            if expected_sha256 and expected_sha256.strip().lower() != sha256:
+                await self._discard(bucket, path)
+                raise ChecksumMismatch(f"sha256 mismatch: expected {expected_sha256}, received {sha256}")
+
+            if not await self._verify(bucket, path, digest):
+                await self._discard(bucket, path)
+                raise ChecksumMismatch(f"stored object {bucket}/{path} does not match the uploaded bytes")
+
+            logger.info("stored bucket=%s path=%s bytes=%s sha256=%s", bucket, path, digest.size, sha256[:12])
+            return StoredObject(bucket, path, digest.size, sha256, content_type, self.public_url(bucket, path))
+
+    async def _discard(self, bucket: str, path: str) -> None:
+        try:
+            await self.remove(bucket, [path])
+        except Exception:
+            logger.warning("could not remove partial object bucket=%s path=%s", bucket, path)
+
+    # ---- backend interface ----
+    async def _put(self, bucket: str, path: str, body: AsyncIterator[bytes], content_type: str) -> None:
+        raise NotImplementedError
+
+    async def _verify(self, bucket: str, path: str, digest: _Digest) -> bool:
+        raise NotImplementedError
+
+    async def remove(self, bucket: str, paths: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    async def download(self, bucket: str, path: str, dest: Path) -> None:
+        """Copy a stored object to a local file (streamed)."""
+        raise NotImplementedError
+
+    def public_url(self, bucket: str, path: str) -> str:
+        raise NotImplementedError
+
+    def path_from_url(self, bucket: str, url: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        return None
+
+
+# =========================================================
+# Supabase Storage (REST over a pooled httpx.AsyncClient)
+# =========================================================
+class SupabaseStorage(ObjectStorage):
+    def __init__(self, base_url: str, key: str, *, max_concurrency: int, timeout_seconds: float):
+        super().__init__(max_concurrency=max_concurrency)
+        self._base = base_url.rstrip("/") + "/storage/v1"
+        self._headers = {"Authorization": f"Bearer {key}", "apikey": key}
+        self._timeout = timeout_seconds
+        self._max_connections = max(2, max_concurrency * 2)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self._headers,
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=self._max_connections),
+            )
+        return self._client
+
+    def _object_url(self, bucket: str, path: str, kind: str = "") -> str:
+        prefix = f"{self._base}/object/{kind + '/' if kind else ''}"
+        return f"{prefix}{quote(bucket)}/{quote(path)}"
+
+    async def _put(self, bucket: str, path: str, body: AsyncIterator[bytes], content_type: str) -> None:
+        resp = await self.client.post(
+            self._object_url(bucket, path),
+            content=body,
+            headers={"content-type": content_type, "x-upsert": "false", "cache-control": "max-age=3600"},
+        )
+        if resp.status_code >= 400:
+            raise StorageError(f"Storage upload failed: {resp.status_code} {resp.text[:200]}")
+
+    async def _verify(self, bucket: str, path: str, digest: _Digest) -> bool:
+        resp = await self.client.head(self._object_url(bucket, path, "authenticated"))
+        if resp.status_code >= 400:
+            raise StorageError(f"Storage verify failed: {resp.status_code}")
+        length = resp.headers.get("content-length")
+        if length is not None and int(length) != digest.size:
+            return False
+        # single-part S3 ETag = md5 of the body; multipart ETags ("<md5>-<n>") cannot be checked this way
+        etag = resp.headers.get("etag", "").strip('W/"')
+        if len(etag) == 32 and "-" not in etag:
+            return etag.lower() == digest.md5.hexdigest()
+        return True
+
+    async def remove(self, bucket: str, paths: Iterable[str]) -> None:
+        resp = await self.client.request("DELETE", f"{self._base}/object/{quote(bucket)}", json={"prefixes": list(paths)})
+        if resp.status_code >= 400:
+            raise StorageError(f"Storage remove failed: {resp.status_code} {resp.text[:200]}")
+
+    async def download(self, bucket: str, path: str, dest: Path) -> None:
+        async with self.client.stream("GET", self._object_url(bucket, path, "authenticated")) as resp:
+            if resp.status_code >= 400:
+                raise StorageError(f"Storage download failed: {resp.status_code}")
+            fh = await asyncio.to_thread(open, dest, "wb")
+            try:
+                async for chunk in resp.aiter_bytes():
+                    await asyncio.to_thread(fh.write, chunk)
+            finally:
+                await asyncio.to_thread(fh.close)
+
+    def public_url(self, bucket: str, path: str) -> str:
+        return self._object_url(bucket, path, "public")
+
+    def path_from_url(self, bucket: str, url: str) -> Optional[str]:
+        marker = f"/storage/v1/object/public/{bucket}/"
+        parsed = urlparse(url or "")
+        if marker not in parsed.path:
+            return None
+        return unquote(parsed.path.split(marker, 1)[1])
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# =========================================================
+# Local filesystem (dev / tests / single-node installs)
+# =========================================================
+class LocalStorage(ObjectStorage):
+    """<root>/<bucket>/<path>, written to a .part file and renamed once complete."""
+
+    def __init__(self, root: str | Path, public_base_url: str, *, max_concurrency: int):
+        super().__init__(max_concurrency=max_concurrency)
+        self.root = Path(root).resolve()
+        self._public = public_base_url.rstrip("/")
+
+    def _file(self, bucket: str, path: str) -> Path:
+        target = (self.root / bucket / path).resolve()
+        if self.root / bucket not in target.parents:
+            raise StorageError(f"invalid object path: {path!r}")
+        return target
+
+    async def _put(self, bucket: str, path: str, body: AsyncIterator[bytes], content_type: str) -> None:
+        target = self._file(bucket, path)
+        if target.exists():
+            raise StorageError(f"object already exists: {bucket}/{path}")
+        part = target.with_name(target.name + ".part")
+        await asyncio.to_thread(part.parent.mkdir, parents=True, exist_ok=True)
+        fh = await asyncio.to_thread(open, part, "wb")
+        try:
+            async for chunk in body:
+                await asyncio.to_thread(fh.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(fh.close)
+            await asyncio.to_thread(part.unlink, True)
+            raise
+        await asyncio.to_thread(fh.close)
+        await asyncio.to_thread(os.replace, part, target)
+
+    async def _verify(self, bucket: str, path: str, digest: _Digest) -> bool:
+        def _sha256() -> str:
+            h = hashlib.sha256()
+            with open(self._file(bucket, path), "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+            return h.hexdigest()
+
+        return await asyncio.to_thread(_sha256) == digest.sha256.hexdigest()
+
+    async def remove(self, bucket: str, paths: Iterable[str]) -> None:
+        for path in paths:
+            await asyncio.to_thread(self._file(bucket, path).unlink, True)
+
+    async def download(self, bucket: str, path: str, dest: Path) -> None:
+        src = self._file(bucket, path)
+        if not src.exists():
+            raise StorageError(f"object not found: {bucket}/{path}")
+        await asyncio.to_thread(shutil.copyfile, src, dest)
+
+    def public_url(self, bucket: str, path: str) -> str:
+        return f"{self._public}/{quote(bucket)}/{quote(path)}"
+
+    def path_from_url(self, bucket: str, url: str) -> Optional[str]:
+        marker = f"{urlparse(self._public).path}/{bucket}/"
+        parsed = urlparse(url or "")
+        if not parsed.path.startswith(marker):
+            return None
+        return unquote(parsed.path[len(marker):])
+
+
+@lru_cache()
+def get_storage() -> ObjectStorage:
+    """Shared storage backend (STORAGE_BACKEND), built on first use."""
+    s = get_settings()
+    if s.STORAGE_BACKEND.lower() == "local":
+        return LocalStorage(s.STORAGE_LOCAL_ROOT, s.STORAGE_PUBLIC_BASE_URL, max_concurrency=s.STORAGE_MAX_CONCURRENT_UPLOADS)
+    return SupabaseStorage(
+        s.SUPABASE_URL,
+        s.SUPABASE_SERVICE_ROLE_KEY or s.SUPABASE_KEY,
+        max_concurrency=s.STORAGE_MAX_CONCURRENT_UPLOADS,
+        timeout_seconds=s.STORAGE_TIMEOUT_SECONDS,
+    )
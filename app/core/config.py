@@ -39,6 +39,72 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str | None = None
     OPENAI_EMBED_MODEL: str = "text-embedding-3-small"
     OPENAI_EMBED_DIM: int = 1536
+    OPENAI_HTTP_MAX_CONNECTIONS: int = 10  # pooled keep-alive connections to the API
+    OPENAI_TIMEOUT_SECONDS: float = 30
+
+    # --- Embedding service (app/services/embeddings.py) ---
+    EMBEDDING_BACKEND: str = "openai"  # registered backend name; "local" = offline hashed n-grams (tests / dev)
+    EMBEDDING_CACHE_SIZE: int = 5000  # in-process LRU, vectors (~6 KB each at 1536 dims)
+    EMBEDDING_CACHE_DB: bool = True  # also read / write public.embedding_cache when the table exists
+    EMBEDDING_BATCH_MAX: int = 64  # inputs per API request
+    EMBEDDING_BATCH_WINDOW_MS: int = 5  # wait this long for concurrent calls to join a request
+    EMBEDDING_MAX_CONCURRENCY: int = 4  # API requests in flight
+
+    # --- In-process caches ---
+    REFERENCE_CACHE_TTL_SECONDS: int = 300  # masters reference data (countries, provinces, ...)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # JWT sub -> user_profiles (0 = off)
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    VERIFIED_TOKEN_CACHE_MAX_ENTRIES: int = 10000  # token digest -> claims until exp (0 = off)
+    ACCESS_CACHE_TTL_SECONDS: int = 300  # compiled RBAC per company (check_access)
+    ACCESS_ENGINE_ENFORCE: bool = False  # false: check_access RPC decides, compiled RBAC is compared with it
+    ACCESS_RPC_SHADOW_RATE: float = 0.05  # enforced engine: share of checks still compared with the RPC
+    SUGGEST_INDEX_TTL_SECONDS: int = 600  # /suggest prefix indexes (patients, staff, services)
+    SUGGEST_INDEX_MAX_ROWS: int = 200000  # larger tables answer /suggest from the DB instead
+
+    # --- Object storage (patient photos / images) ---
+    STORAGE_BACKEND: str = "supabase"  # supabase | local
+    STORAGE_LOCAL_ROOT: str = "storage"  # local backend: files under <root>/<bucket>/<path>
+    STORAGE_PUBLIC_BASE_URL: str = "/storage"  # local backend: URL prefix the files are served under
+    STORAGE_MAX_CONCURRENT_UPLOADS: int = 4  # per worker; further uploads wait for a slot
+    STORAGE_UPLOAD_CHUNK_BYTES: int = 1048576
+    STORAGE_MAX_UPLOAD_BYTES: int = 26214400  # 25 MiB
+    STORAGE_TIMEOUT_SECONDS: int = 60
+    IMAGE_DERIVATIVE_WORKERS: int = 2  # process pool for thumbnail / preview rendering
+    IMAGE_THUMBNAIL_PX: int = 256  # longest edge
+    IMAGE_PREVIEW_PX: int = 1024  # longest edge
+    IMAGE_DERIVATIVE_QUALITY: int = 82  # JPEG quality
+
+    # --- Chat reply streaming (SSE) ---
+    CHAT_REPLY_GENERATOR: str = "local"  # registered generator name (app/services/reply_stream.py)
+    CHAT_STREAM_CHUNK_CHARS: int = 24  # local generator: max characters per delta
+    CHAT_STREAM_DELAY_MS: int = 0  # local generator: pause between deltas (demo / client testing)
+
+    # --- Retrieval logging (chat_retrievals / chat_retrieval_items) ---
+    CHAT_RETRIEVAL_LOG_QUEUE: int = 1000  # background writer: pending retrievals before new ones are dropped
+    CHAT_RETRIEVAL_LOG_BATCH: int = 50  # background writer: retrievals written per transaction
+
+    # --- KB vector search (in-process index over kb_chunks embeddings) ---
+    KB_VECTOR_INDEX_TTL_SECONDS: int = 900  # rebuild a company's partition in the background after this (0 = never)
+    KB_VECTOR_HYDRATE_ON_STARTUP: bool = True  # load every company's partition at startup (background)
+    KB_VECTOR_ANN_MIN_ROWS: int = 20000  # companies with at least this many chunks get an HNSW graph (hnswlib)
+    KB_VECTOR_ANN_M: int = 16
+    KB_VECTOR_ANN_EF_CONSTRUCTION: int = 200
+    KB_VECTOR_ANN_EF_SEARCH: int = 64
+    KB_SEARCH_MODE: str = "hybrid"  # hybrid | vector | lexical (request `mode` overrides)
+    KB_HYBRID_CANDIDATES: int = 50  # hybrid: depth of each ranked list before fusion
+    KB_RRF_K: int = 60  # reciprocal rank fusion constant: 1 / (k + rank)
+    KB_BM25_K1: float = 1.2
+    KB_BM25_B: float = 0.75
+    KB_SEARCH_CACHE_TTL_SECONDS: int = 600  # ranked hits per (query, filters, top_k, index version); 0 = off
+    KB_SEARCH_CACHE_MAX_ENTRIES: int = 5000
+    AI_TOPIC_CATALOG_TTL_SECONDS: int = 300  # compiled AI consult topic catalogs per (company, lang); 0 = off
+
+    # --- KB ingestion (kb_documents -> embedded kb_chunks) ---
+    KB_SOURCE_BUCKET: str = "kb-documents"  # storage bucket holding metadata.source_path
+    KB_CHUNK_CHARS: int = 1200  # max characters per chunk
+    KB_CHUNK_OVERLAP_CHARS: int = 150  # context repeated at the start of the next chunk
+    KB_INGEST_BATCH: int = 64  # chunks embedded + written (one transaction / checkpoint) per batch
+    KB_INGEST_CONCURRENCY: int = 4  # batches being embedded ahead of the writer
 
     # # --- Firebase ---kanchitk-2025-08-12
     # FIREBASE_CREDENTIALS_PATH: str | None = None
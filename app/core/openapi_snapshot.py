@@ -0,0 +1,204 @@
+# app/core/openapi_snapshot.py
+
+"""
+OpenAPI schema snapshot.
+
+The schema (hundreds of routes + rich `responses=` examples) is expensive to build,
+and FastAPI builds it on the first /openapi.json hit of every worker.
+
+- memory -> disk -> build once; the disk file is keyed by app version + route fingerprint +
+  source fingerprint (every loaded app.* module), so edited DTOs / examples / docstrings
+  never load a stale file even when APP_VERSION stays at its dev default
+- /openapi.json is served as pre-serialized bytes (no per-request json.dumps); a root_path
+  (proxy prefix) adds its servers entry to whichever snapshot is served, built or loaded
+- nothing is installed when docs are disabled (openapi_url=None) -> never built
+- build-time: `python -m app.core.openapi_snapshot` writes the file before deploy
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import fastapi
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from app.core.logging_config import get_service_logger
+
+logger = get_service_logger("main")
+
+DEFAULT_SNAPSHOT_DIR = ".cache/openapi"
+
+
+def _dumps(schema: Dict[str, Any]) -> bytes:
+    # same encoding as fastapi JSONResponse
+    return json.dumps(schema, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def route_fingerprint(app: FastAPI) -> str:
+    """Cheap key for "same routes" (no schema build): paths, methods, operation ids, servers."""
+    parts = [fastapi.__version__, json.dumps(app.servers or [], sort_keys=True)]
+    for r in app.routes:
+        methods = ",".join(sorted(getattr(r, "methods", None) or ()))
+        op = getattr(r, "operation_id", None) or getattr(r, "name", "")
+        parts.append(f"{getattr(r, 'path', '')}|{methods}|{op}|{getattr(r, 'include_in_schema', True)}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:12]
+
+
+def source_fingerprint(package: str = "app") -> str:
+    """
+    Hash of the source of every loaded module of `package` (routers, DTOs, examples, docstrings).
+    Content, not mtimes: identical across workers / containers built from the same tree.
+    """
+    h = hashlib.sha1()
+    for name in sorted(n for n in list(sys.modules) if n == package or n.startswith(package + ".")):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if not path or not path.endswith(".py"):
+            continue
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            continue
+        h.update(name.encode("utf-8"))
+        h.update(b"\0")
+        h.update(data)
+    return h.hexdigest()[:12]
+
+
+def snapshot_path(app: FastAPI, directory: Optional[str] = None) -> Path:
+    base = Path(directory or os.getenv("OPENAPI_SNAPSHOT_DIR") or DEFAULT_SNAPSHOT_DIR)
+    version = "".join(c if c.isalnum() or c in ".-_" else "_" for c in str(app.version))
+    return base / f"openapi-{version}-{route_fingerprint(app)}-{source_fingerprint()}.json"
+
+
+def with_root_path(body: bytes, root_path: str) -> bytes:
+    """The servers entry FastAPI adds when mounted under a root_path, applied to snapshot bytes."""
+    schema = json.loads(body)
+    servers = schema.get("servers") or []
+    if root_path in {s.get("url") for s in servers}:
+        return body
+    schema["servers"] = [{"url": root_path}, *servers]
+    return _dumps(schema)
+
+
+class OpenAPISnapshot:
+    """Process-wide schema bytes for one app (thread-safe, built at most once)."""
+
+    def __init__(self, app: FastAPI, build: Callable[[], Dict[str, Any]]):
+        self.app = app
+        self._build = build
+        self._lock = threading.Lock()
+        self.body: Optional[bytes] = None
+        self.path: Optional[Path] = None
+        self.source: Optional[str] = None
+        self.elapsed_ms: float = 0.0
+        self._rooted: Dict[str, bytes] = {}  # root_path -> body with its servers entry
+
+    def _write(self, path: Path, body: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)  # atomic: other workers never read a partial file
+        except OSError as e:
+            logger.warning("openapi snapshot not saved path=%s error=%s", path, e)
+
+    def get_bytes(self) -> bytes:
+        if self.body is not None:
+            return self.body
+
+        with self._lock:
+            if self.body is not None:
+                return self.body
+
+            t0 = time.perf_counter()
+            path = self.path = snapshot_path(self.app)
+            body: Optional[bytes] = None
+            source = "disk"
+            try:
+                body = path.read_bytes()
+            except OSError:
+                pass
+
+            if body is None:
+                source = "build"
+                body = _dumps(self._build())
+                self._write(path, body)
+
+            self.body = body
+            self.source = source
+            self.elapsed_ms = (time.perf_counter() - t0) * 1000
+            logger.info(
+                "openapi snapshot ready source=%s elapsed_ms=%.1f bytes=%s path=%s",
+                source, self.elapsed_ms, len(body), path,
+            )
+            return body
+
+    def get_bytes_for(self, root_path: str) -> bytes:
+        body = self.get_bytes()
+        if not root_path or not self.app.root_path_in_servers:
+            return body
+        rooted = self._rooted.get(root_path)
+        if rooted is None:
+            rooted = self._rooted[root_path] = with_root_path(body, root_path)
+        return rooted
+
+    def get_schema(self) -> Dict[str, Any]:
+        if self.app.openapi_schema is None:
+            self.app.openapi_schema = json.loads(self.get_bytes())
+        return self.app.openapi_schema
+
+
+def install_openapi_snapshot(app: FastAPI) -> Optional[OpenAPISnapshot]:
+    """Route /openapi.json (and app.openapi()) through the snapshot. No-op when docs are off."""
+    if not app.openapi_url:
+        return None
+
+    snapshot = OpenAPISnapshot(app, build=app.openapi)  # FastAPI's own builder
+    app.openapi = snapshot.get_schema  # type: ignore[method-assign]
+    app.state.openapi_snapshot = snapshot
+
+    # replace FastAPI's handler (json.dumps of the dict on every request)
+    app.router.routes[:] = [r for r in app.router.routes if getattr(r, "path", None) != app.openapi_url]
+
+    async def openapi_json(request: Request) -> Response:
+        # the snapshot itself never depends on root_path (app.servers stays untouched): the
+        # servers entry FastAPI would add is applied to the bytes, built and loaded alike
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        if snapshot.body is None:
+            body = await run_in_threadpool(snapshot.get_bytes_for, root_path)
+        else:
+            body = snapshot.get_bytes_for(root_path)
+        return Response(content=body, media_type="application/json")
+
+    app.add_route(app.openapi_url, openapi_json, include_in_schema=False)
+    return snapshot
+
+
+def main() -> None:
+    """Build-time: write the snapshot for the current code + APP_VERSION (the path the workers will load)."""
+    t0 = time.perf_counter()
+    from app.main import app
+
+    t1 = time.perf_counter()
+    snapshot: Optional[OpenAPISnapshot] = getattr(app.state, "openapi_snapshot", None)
+    if snapshot is None:
+        raise SystemExit("docs are disabled (ENABLE_DOCS / ENV) -> no OpenAPI snapshot to build")
+
+    snapshot.get_bytes()
+    print(
+        f"openapi snapshot: {snapshot.path} source={snapshot.source} "
+        f"import_ms={(t1 - t0) * 1000:.0f} schema_ms={snapshot.elapsed_ms:.0f} bytes={len(snapshot.body or b'')}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# app/core/startup_profile.py
+
+"""
+Startup (cold start) profile: import-time breakdown of `import app.main`.
+
+Runs a fresh interpreter with `-X importtime` and reports
+- wall time of the import (module import + create_app())
+- self time summed per group (app modules per feature package, third-party per top-level package)
+- slowest single modules by cumulative time
+
+Usage:
+    python -m app.core.startup_profile [--top 25] [--target app.main]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str) -> List[ImportRecord]:
+    out: List[ImportRecord] = []
+    for line in text.splitlines():
+        m = _LINE.match(line)
+        if m:
+            out.append(ImportRecord(m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+    return out
+
+
+def group_of(module: str) -> str:
+    parts = module.split(".")
+    if parts[0] != "app":
+        return parts[0]
+    # app.api.v1.modules.<feature> / app.api.v1.<area> / app.<area>
+    if parts[:4] == ["app", "api", "v1", "modules"] and len(parts) > 4:
+        return ".".join(parts[:5])
+    if parts[:3] == ["app", "api", "v1"] and len(parts) > 3:
+        return ".".join(parts[:4])
+    return ".".join(parts[:2])
+
+
+def run_profile(target: str = "app.main") -> tuple[float, List[ImportRecord]]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr[-2000:])
+    return wall, parse_importtime(proc.stderr)
+
+
+def format_report(wall: float, records: List[ImportRecord], *, target: str, top: int = 25) -> str:
+    by_group: Dict[str, int] = defaultdict(int)
+    for r in records:
+        by_group[group_of(r.module)] += r.self_us
+    total_self = sum(by_group.values()) or 1
+    root = next((r for r in records if r.module == target), None)
+
+    lines = [
+        f"startup profile: import {target}",
+        f"  process wall time : {wall * 1000:8.0f} ms (interpreter start included)",
+        f"  import {target:<10} : {(root.cumulative_us if root else total_self) / 1000:8.0f} ms",
+        f"  modules imported  : {len(records)}",
+        "",
+        f"self time per group (top {top}):",
+    ]
+    for name, us in sorted(by_group.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        lines.append(f"  {us / 1000:8.1f} ms  {us * 100 / total_self:5.1f}%  {name}")
+
+    lines += ["", f"slowest modules by cumulative time (top {top}):"]
+    for r in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {r.cumulative_us / 1000:8.1f} ms  self {r.self_us / 1000:7.1f} ms  {r.module}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--target", default="app.main")
+    args = parser.parse_args()
+
+    wall, records = run_profile(args.target)
+    print(format_report(wall, records, target=args.target, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,16 @@ ssl_ctx = ssl.create_default_context()
 ssl_ctx.check_hostname = False
 ssl_ctx.verify_mode = ssl.CERT_NONE
 
+
+def _ssl_arg():
+    """SSL_MODE: require (permissive ctx, default) | verify (full check) | disable (local Postgres / benchmarks)."""
+    mode = (settings.SSL_MODE or "require").strip().lower()
+    if mode == "disable":
+        return False
+    if mode == "verify":
+        return ssl.create_default_context()
+    return ssl_ctx
+
 # # ✅ Direct DB (db.<ref>.supabase.co:5432) -> use pooled connections + recycle
 # print("settings.DATABASE_URL =", settings.DATABASE_URL)
 # print("final DATABASE_URL =", DATABASE_URL)
@@ -53,7 +63,7 @@ engine = create_async_engine(
     poolclass=NullPool,          # ✅ ใช้ NullPool เมื่อผ่าน PgBouncer/Supabase pooler
     pool_pre_ping=True,
     connect_args={
-        "ssl": ssl_ctx,
+        "ssl": _ssl_arg(),
         "statement_cache_size": 0,          # ✅ ปิด statement cache ของ asyncpg
         "prepared_statement_cache_size": 0, # ✅ (ถ้า dialect รองรับ) ปิดเพิ่มอีกชั้น
     },
@@ -2,6 +2,10 @@
 
 from app.db.base import Base
 
+# Relationship loading policy: nothing is eager by default.
+# lazy="raise_on_sql" -> reading an unloaded relationship raises instead of quietly
+# issuing one query per row; queries that need related rows add selectinload()/joinedload().
+
 # ----- Core Settings ----- #
 from .core_settings import (
     Company, Department, Location, Building,
@@ -28,6 +32,12 @@ from .booking_settings import (
     Booking, BookingViewConfig, BookingStatusHistory, BookingStaff
 )
 
+# ----- User Settings (profiles + RBAC) ----- #
+from .user_settings import (
+    UserProfile, Group, Role, Permission,
+    UserGroup, UserRole, RolePermission, GroupRole,
+)
+
 
 __all__ = [
     "Base",
@@ -50,4 +60,8 @@ __all__ = [
     
     # Booking settings
     "Booking", "BookingViewConfig", "BookingStatusHistory", "BookingStaff",
+
+    # User settings
+    "UserProfile", "Group", "Role", "Permission",
+    "UserGroup", "UserRole", "RolePermission", "GroupRole",
 ]
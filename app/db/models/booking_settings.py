@@ -126,32 +126,32 @@ class Booking(Base):
     # ==========================================================
     # Relationships (back_populates ready; string-based to avoid circular import)
     # ==========================================================
-    company: Mapped["Company"] = relationship("Company", lazy="selectin", back_populates="bookings")
-    location: Mapped["Location"] = relationship("Location", lazy="selectin", back_populates="bookings")
-    building: Mapped["Building"] = relationship("Building", lazy="selectin", back_populates="bookings")
-    room: Mapped["Room"] = relationship("Room", lazy="selectin", back_populates="bookings")
+    company: Mapped["Company"] = relationship("Company", lazy="raise_on_sql", back_populates="bookings")
+    location: Mapped["Location"] = relationship("Location", lazy="raise_on_sql", back_populates="bookings")
+    building: Mapped["Building"] = relationship("Building", lazy="raise_on_sql", back_populates="bookings")
+    room: Mapped["Room"] = relationship("Room", lazy="raise_on_sql", back_populates="bookings")
 
-    patient: Mapped["Patient"] = relationship("Patient", lazy="selectin", back_populates="bookings")
+    patient: Mapped["Patient"] = relationship("Patient", lazy="raise_on_sql", back_populates="bookings")
 
     primary_person: Mapped["Staff"] = relationship(
         "Staff",
-        lazy="selectin",
+        lazy="raise_on_sql",
         foreign_keys="Booking.primary_person_id",
         back_populates="primary_bookings",
     )
 
-    service: Mapped["Service"] = relationship("Service", lazy="selectin", back_populates="bookings")
+    service: Mapped["Service"] = relationship("Service", lazy="raise_on_sql", back_populates="bookings")
 
     status_histories: Mapped[List["BookingStatusHistory"]] = relationship(
         "BookingStatusHistory",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
         back_populates="booking",
     )
 
     booking_staffs: Mapped[List["BookingStaff"]] = relationship(
         "BookingStaff",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
         back_populates="booking",
     )
@@ -195,9 +195,9 @@ class BookingViewConfig(Base):
     )
 
     # ---- Relationships ----
-    company: Mapped["Company"] = relationship("Company", lazy="selectin")
-    location: Mapped["Location"] = relationship("Location", lazy="selectin")
-    building: Mapped["Building"] = relationship("Building", lazy="selectin")
+    company: Mapped["Company"] = relationship("Company", lazy="raise_on_sql")
+    location: Mapped["Location"] = relationship("Location", lazy="raise_on_sql")
+    building: Mapped["Building"] = relationship("Building", lazy="raise_on_sql")
 
 
 # ==========================================================
@@ -228,7 +228,7 @@ class BookingStatusHistory(Base):
     # ---- Relationships ----
     booking: Mapped["Booking"] = relationship(
         "Booking",
-        lazy="selectin",
+        lazy="raise_on_sql",
         back_populates="status_histories",
     )
 
@@ -273,12 +273,12 @@ class BookingStaff(Base):
     # relationships
     booking: Mapped["Booking"] = relationship(
         "Booking",
-        lazy="selectin",
+        lazy="raise_on_sql",
         back_populates="booking_staffs",
     )
     staff: Mapped["Staff"] = relationship(
         "Staff",
-        lazy="selectin",
+        lazy="raise_on_sql",
         foreign_keys="BookingStaff.staff_id",
         back_populates="booking_staffs",
     )
@@ -75,7 +75,7 @@ class Company(Base):
     bookings: Mapped[List["Booking"]] = relationship(
         "Booking",
         back_populates="company",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -136,7 +136,7 @@ class Location(Base):
     bookings: Mapped[List["Booking"]] = relationship(
         "Booking",
         back_populates="location",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -181,7 +181,7 @@ class Building(Base):
     bookings: Mapped[List["Booking"]] = relationship(
         "Booking",
         back_populates="building",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -303,7 +303,7 @@ class Room(Base):
     bookings: Mapped[List["Booking"]] = relationship(
         "Booking",
         back_populates="room",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -402,7 +402,7 @@ class Service(Base):
     bookings: Mapped[List["Booking"]] = relationship(
         "Booking",
         back_populates="service",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     # ✅ CHANGED: computed display field for API response
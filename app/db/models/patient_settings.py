@@ -8,7 +8,8 @@ from datetime import date, datetime
 from typing import Optional, List
 
 from sqlalchemy import (Boolean, CheckConstraint, Date, DateTime, 
-    ForeignKey, String, Text, text, UniqueConstraint,func,
+    ForeignKey, Index, String, Text, text, UniqueConstraint,func,
+    literal_column,
     )
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
@@ -158,17 +159,17 @@ class Patient(Base):
     allergy: Mapped[Optional["Allergy"]] = relationship(
         "Allergy",
         foreign_keys=[allergy_id],
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     drug_allergy: Mapped[Optional["Allergy"]] = relationship(
         "Allergy",
         foreign_keys=[drug_allergy_id],
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     alert: Mapped[Optional["Alert"]] = relationship(
         "Alert",
         foreign_keys=[alert_id],
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     market_source_id: Mapped[Optional[uuid.UUID]] = mapped_column(PG_UUID(as_uuid=True))  # ✅ NEW
     referral_source_note: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  # ✅ NEW
@@ -180,10 +181,51 @@ class Patient(Base):
     bookings: Mapped[List["Booking"]] = relationship(
         "Booking",
         back_populates="patient",
-        lazy="selectin",
-    )
-
-
+        lazy="raise_on_sql",
+    )
+
+
+
+###===== Patient search (pg_trgm) =====###
+# Query expressions must be identical to the indexed ones (no bind params),
+# so literals are inlined with literal_column().
+_SP = literal_column("' '")
+_EMPTY = literal_column("''")
+
+# code + Thai + English names, lower-cased -> ILIKE '%tok%' / similarity()
+PATIENT_SEARCH_TEXT = func.lower(
+    Patient.patient_code + _SP
+    + Patient.first_name_lo + _SP + Patient.last_name_lo + _SP
+    + func.coalesce(Patient.first_name_en, _EMPTY) + _SP
+    + func.coalesce(Patient.last_name_en, _EMPTY)
+)
+
+# id card + phone, digits only ("081-234-5678" -> "0812345678")
+PATIENT_SEARCH_DIGITS = func.regexp_replace(
+    Patient.id_card_no + _SP + func.coalesce(Patient.telephone, _EMPTY),
+    literal_column("'[^0-9 ]'"),
+    _EMPTY,
+    literal_column("'g'"),
+)
+
+# append_constraint(): expression indexes are not auto-attached from literal-bearing expressions
+for _ix in (
+    Index(
+        "ix_patients_search_text_trgm",
+        PATIENT_SEARCH_TEXT.label("search_text"),
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    ),
+    Index(
+        "ix_patients_search_digits_trgm",
+        PATIENT_SEARCH_DIGITS.label("search_digits"),
+        postgresql_using="gin",
+        postgresql_ops={"search_digits": "gin_trgm_ops"},
+    ),
+    Index("idx_patients_created_at", Patient.created_at.desc()),
+):
+    if _ix.table is None:
+        Patient.__table__.append_constraint(_ix)
 
 ########################
 # from sqlalchemy import Index
@@ -252,6 +294,9 @@ class PatientImage(Base):
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     image_type: Mapped[Optional[str]] = mapped_column(String(25), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # derivatives rendered at upload (NULL until produced; see app/services/image_derivatives.py)
+    thumbnail_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    preview_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
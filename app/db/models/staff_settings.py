@@ -94,18 +94,18 @@ class Staff(Base):
     )
 
     # Relationships (optional, ช่วย join/serialize)
-    main_location: Mapped[Optional["Location"]] = relationship("Location", foreign_keys=[main_location_id], lazy="selectin")
-    main_building: Mapped[Optional["Building"]] = relationship("Building", foreign_keys=[main_building_id], lazy="selectin")
-    main_room: Mapped[Optional["Room"]] = relationship("Room", foreign_keys=[main_room_id], lazy="selectin")
+    main_location: Mapped[Optional["Location"]] = relationship("Location", foreign_keys=[main_location_id], lazy="raise_on_sql")
+    main_building: Mapped[Optional["Building"]] = relationship("Building", foreign_keys=[main_building_id], lazy="raise_on_sql")
+    main_room: Mapped[Optional["Room"]] = relationship("Room", foreign_keys=[main_room_id], lazy="raise_on_sql")
 
     departments: Mapped[List["StaffDepartment"]] = relationship(
-        "StaffDepartment", back_populates="staff", cascade="all, delete-orphan", lazy="selectin"
+        "StaffDepartment", back_populates="staff", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
     locations: Mapped[List["StaffLocation"]] = relationship(
-        "StaffLocation", back_populates="staff", cascade="all, delete-orphan", lazy="selectin"
+        "StaffLocation", back_populates="staff", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
     services: Mapped[List["StaffService"]] = relationship(
-        "StaffService", back_populates="staff", cascade="all, delete-orphan", lazy="selectin"
+        "StaffService", back_populates="staff", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
     
     
@@ -116,7 +116,7 @@ class Staff(Base):
         "Booking",
         back_populates="primary_person",          # ✅ ต้องตรงกับ Booking.primary_person
         foreign_keys="Booking.primary_person_id",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     # ==========================================================
@@ -125,7 +125,7 @@ class Staff(Base):
     booking_staffs: Mapped[List["BookingStaff"]] = relationship(
         "BookingStaff",
         back_populates="staff",                   # ✅ ต้องตรงกับ BookingStaff.staff
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -169,8 +169,8 @@ class StaffDepartment(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    staff: Mapped["Staff"] = relationship("Staff", back_populates="departments", lazy="selectin")
-    department: Mapped["Department"] = relationship("Department", lazy="selectin")
+    staff: Mapped["Staff"] = relationship("Staff", back_populates="departments", lazy="raise_on_sql")
+    department: Mapped["Department"] = relationship("Department", lazy="raise_on_sql")
 
 
 # =========================================================
@@ -212,8 +212,8 @@ class StaffLocation(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    staff: Mapped["Staff"] = relationship("Staff", back_populates="locations", lazy="selectin")
-    location: Mapped["Location"] = relationship("Location", lazy="selectin")
+    staff: Mapped["Staff"] = relationship("Staff", back_populates="locations", lazy="raise_on_sql")
+    location: Mapped["Location"] = relationship("Location", lazy="raise_on_sql")
 
 
 # =========================================================
@@ -249,8 +249,8 @@ class StaffService(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    staff: Mapped["Staff"] = relationship("Staff", back_populates="services", lazy="selectin")
-    service: Mapped["Service"] = relationship("Service", lazy="selectin")
+    staff: Mapped["Staff"] = relationship("Staff", back_populates="services", lazy="raise_on_sql")
+    service: Mapped["Service"] = relationship("Service", lazy="raise_on_sql")
 
 
 # =========================================================
@@ -310,10 +310,10 @@ class StaffWorkPattern(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
-    staff: Mapped["Staff"] = relationship("Staff", lazy="selectin")
-    location: Mapped["Location"] = relationship("Location", lazy="selectin")
-    department: Mapped["Department"] = relationship("Department", lazy="selectin")
-    shift_template: Mapped["StaffTemplate"] = relationship("StaffTemplate", lazy="selectin")
+    staff: Mapped["Staff"] = relationship("Staff", lazy="raise_on_sql")
+    location: Mapped["Location"] = relationship("Location", lazy="raise_on_sql")
+    department: Mapped["Department"] = relationship("Department", lazy="raise_on_sql")
+    shift_template: Mapped["StaffTemplate"] = relationship("StaffTemplate", lazy="raise_on_sql")
 
 
 # =========================================================
@@ -364,9 +364,9 @@ class StaffLeave(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
-    company: Mapped[Optional["Company"]] = relationship("Company", lazy="selectin")
-    location: Mapped[Optional["Location"]] = relationship("Location", lazy="selectin")
-    staff: Mapped[Optional["Staff"]] = relationship("Staff", lazy="selectin")
+    company: Mapped[Optional["Company"]] = relationship("Company", lazy="raise_on_sql")
+    location: Mapped[Optional["Location"]] = relationship("Location", lazy="raise_on_sql")
+    staff: Mapped[Optional["Staff"]] = relationship("Staff", lazy="raise_on_sql")
 
 
 
@@ -0,0 +1,114 @@
+# app/db/models/user_settings.py
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Boolean, DateTime, String, text, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from app.db.base import Base
+
+
+###=====user_profiles=====###
+class UserProfile(Base):
+    __tablename__ = "user_profiles"
+    __table_args__ = (
+        Index("idx_user_profiles_user_id", "user_id"),
+        Index("idx_user_profiles_company_name", "company_code", "full_name"),
+    )
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    user_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True))  # auth.users.id (JWT sub)
+    company_code: Mapped[str] = mapped_column(String(50), nullable=False)
+    location_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True))
+    department_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True))
+
+    preferred_language: Mapped[Optional[str]] = mapped_column(String(10))
+    preferred_currency: Mapped[Optional[str]] = mapped_column(String(10))
+    full_name: Mapped[Optional[str]] = mapped_column(String(255))
+    avatar_url: Mapped[Optional[str]] = mapped_column(String(500))
+    email: Mapped[Optional[str]] = mapped_column(String(255))
+    password_hash: Mapped[Optional[str]] = mapped_column(String(255))
+
+    # actor binding used by auth (JWT mode)
+    patient_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True))
+    staff_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True))
+    actor_type: Mapped[Optional[str]] = mapped_column(String(25))
+
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("true"))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+###=====groups=====###
+class Group(Base):
+    __tablename__ = "groups"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    group_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String(500))
+    company_code: Mapped[Optional[str]] = mapped_column(String(50))
+
+
+###=====roles=====###
+class Role(Base):
+    __tablename__ = "roles"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    role_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String(500))
+    company_code: Mapped[Optional[str]] = mapped_column(String(50))
+
+
+###=====permissions=====###
+class Permission(Base):
+    __tablename__ = "permissions"
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    permission_code: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String(500))
+    company_code: Mapped[Optional[str]] = mapped_column(String(50))
+
+
+###=====user_groups=====###
+class UserGroup(Base):
+    __tablename__ = "user_groups"
+    __table_args__ = (Index("idx_user_groups_profile_id", "profile_id"),)
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    profile_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("user_profiles.id", ondelete="CASCADE"), nullable=False)
+    group_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
+
+
+###=====user_roles=====###
+class UserRole(Base):
+    __tablename__ = "user_roles"
+    __table_args__ = (Index("idx_user_roles_profile_id", "profile_id"),)
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    profile_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("user_profiles.id", ondelete="CASCADE"), nullable=False)
+    role_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
+
+
+###=====role_permissions=====###
+class RolePermission(Base):
+    __tablename__ = "role_permissions"
+    __table_args__ = (Index("idx_role_permissions_role_id", "role_id"),)
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    role_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
+    permission_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("permissions.id", ondelete="CASCADE"), nullable=False)
+
+
+###=====group_roles=====###
+class GroupRole(Base):
+    __tablename__ = "group_roles"
+    __table_args__ = (Index("idx_group_roles_group_id", "group_id"),)
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    group_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
+    role_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
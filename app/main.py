@@ -2,23 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
 from typing import List
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-
+from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+
+from app.api.v1.authen.access_engine import access_engine, require_admin
+from app.api.v1.authen.principal_cache import principal_cache
+from app.api.v1.authen.token_cache import verified_token_cache
+from app.api.v1.modules.ai.consult.services.ai_topic_catalog import ai_topic_catalog
+from app.api.v1.modules.chat.services.chat_retrieval_log_writer import retrieval_log_writer
+from app.services import reply_stream
+from app.services.schema_capabilities import schema_capabilities
+from app.services.suggest_index import suggest_index
 from app.api.v1.routers import get_api_router
+from app.core.clients.openai_client import get_openai_client
+from app.core.clients.storage_client import get_storage
+from app.core.config import get_settings
 from app.core.exception_handlers import register_exception_handlers
 from app.core.logging_config import get_service_logger
-from app.database.database import engine
+from app.core.openapi_snapshot import install_openapi_snapshot
+from app.database.database import AsyncSessionLocal, engine
 # from app.middlewares.request_logger import RequestLoggingMiddleware
 from app.middlewares.request_context import RequestContextMiddleware
 
 
 logger = get_service_logger("main")
 
+_T0 = time.perf_counter()  # after the imports above: startup_ms excludes them
+
 
 def _is_true(v: str | None, default: bool = False) -> bool:
     if v is None:
@@ -26,6 +44,12 @@ def _is_true(v: str | None, default: bool = False) -> bool:
     return v.strip().lower() in ("1", "true", "yes", "y", "on")
 
 
+def _docs_enabled() -> bool:
+    # docs (and the OpenAPI schema build) are off in production unless ENABLE_DOCS says otherwise
+    is_prod = os.getenv("ENV", "dev").strip().lower() in ("prod", "production")
+    return _is_true(os.getenv("ENABLE_DOCS"), default=not is_prod)
+
+
 def _parse_cors_origins() -> List[str]:
     """
     PRODUCTION:
@@ -57,23 +81,74 @@ async def lifespan(app: FastAPI):
     logger.info("ENV=%s", os.getenv("ENV", "dev"))
     logger.info("API_PREFIX=%s", os.getenv("API_PREFIX", "/api/v1"))
 
+    snapshot = getattr(app.state, "openapi_snapshot", None)
+    if snapshot is not None and _is_true(os.getenv("OPENAPI_WARMUP")):
+        # load (or build) the schema before serving, instead of on the first /docs hit
+        await run_in_threadpool(snapshot.get_bytes)
+
+    # optional views / functions / columns: probed once here instead of per request
+    async def _probe_schema() -> None:
+        async with AsyncSessionLocal() as db:
+            await schema_capabilities.refresh(db)
+
+    try:
+        await asyncio.wait_for(_probe_schema(), timeout=10)
+    except Exception as e:
+        logger.warning("schema capability probe failed at startup (retried on first use): %s", e)
+
+    # KB vector partitions: loaded in the background, a search before that loads its company itself
+    hydrate = None
+    if get_settings().KB_VECTOR_HYDRATE_ON_STARTUP:
+        from app.api.v1.modules.kb.services.kb_search_service import hydrate_kb_vector_index
+
+        async def _hydrate() -> None:
+            try:
+                await hydrate_kb_vector_index()
+            except Exception as e:
+                logger.warning("kb vector index hydration failed (loaded on first search): %s", e)
+
+        hydrate = asyncio.create_task(_hydrate())
+
+    logger.info("startup_ms=%.0f (create_app + lifespan, module imports excluded)", (time.perf_counter() - _T0) * 1000)
+
     try:
         yield
     finally:
         # ---------- Shutdown ----------
+        # KB / embeddings / image modules (numpy, PIL) are imported here and in /health/caches,
+        # not at module level: workers that never touch them don't pay for them at startup
+        from app.api.v1.modules.kb.services.kb_ingestion_service import cancel_ingestions
+        from app.services import image_derivatives
+        from app.services.embeddings import get_embedding_service
+        from app.services.vector_index import kb_vector_index
+
+        await reply_stream.drain()  # streamed replies still being persisted
+        await retrieval_log_writer.aclose()  # queued retrieval logs
+        if hydrate is not None:
+            hydrate.cancel()
+        await cancel_ingestions()  # resumed from their checkpoint by the next run
+        await kb_vector_index.aclose()
+        if get_embedding_service.cache_info().currsize:
+            await get_embedding_service().aclose()  # queued embeddings / cache writes
         if engine is not None:
             await engine.dispose()
             logger.info("🧹 SQLAlchemy engine disposed")
+        if get_storage.cache_info().currsize:
+            await get_storage().aclose()
+        if get_openai_client.cache_info().currsize:
+            await get_openai_client().aclose()
+        image_derivatives.shutdown()
 
 
 def create_app() -> FastAPI:
+    docs = _docs_enabled()
     app = FastAPI(
         title=os.getenv("APP_NAME", "WellPlus API"),
         version=os.getenv("APP_VERSION", "1.0.0"),
         lifespan=lifespan,
-        docs_url="/docs" if _is_true(os.getenv("ENABLE_DOCS"), default=True) else None,
-        redoc_url="/redoc" if _is_true(os.getenv("ENABLE_DOCS"), default=True) else None,
-        openapi_url="/openapi.json" if _is_true(os.getenv("ENABLE_DOCS"), default=True) else None,
+        docs_url="/docs" if docs else None,
+        redoc_url="/redoc" if docs else None,
+        openapi_url="/openapi.json" if docs else None,
     )
 
     # ---------- CORS ----------
@@ -96,6 +171,12 @@ def create_app() -> FastAPI:
     api_prefix = os.getenv("API_PREFIX", "/api/v1").rstrip("/")
     app.include_router(get_api_router(), prefix=api_prefix)
 
+    # ---------- Local object storage (STORAGE_BACKEND=local) ----------
+    settings = get_settings()
+    if settings.STORAGE_BACKEND.lower() == "local":
+        os.makedirs(settings.STORAGE_LOCAL_ROOT, exist_ok=True)
+        app.mount(settings.STORAGE_PUBLIC_BASE_URL.rstrip("/"), StaticFiles(directory=settings.STORAGE_LOCAL_ROOT), name="storage")
+
     # ---------- Health / Ready ----------
     @app.get("/", tags=["Health"])
     async def health():
@@ -106,6 +187,37 @@ def create_app() -> FastAPI:
         # ถ้าต้องการ: เพิ่ม DB ping ในอนาคต (อย่าให้ช้า)
         return {"status": "ready"}
 
+    @app.get("/health/caches", tags=["Health"])
+    async def caches():
+        # in-process caches (per worker): size + hit ratio / rows per suggest index
+        from app.api.v1.modules.kb.services.kb_search_cache import kb_search_cache
+        from app.services.embeddings import get_embedding_service
+        from app.services.vector_index import kb_vector_index
+
+        return {
+            "access": access_engine.stats(),
+            "verified_tokens": verified_token_cache.stats(),
+            "principals": principal_cache.stats(),
+            "suggest": suggest_index.stats(),
+            "kb_vectors": kb_vector_index.stats(),
+            "kb_search": kb_search_cache.stats(),
+            "ai_topics": ai_topic_catalog.stats(),
+            "embeddings": get_embedding_service().stats() if get_embedding_service.cache_info().currsize else None,
+        }
+
+    @app.get("/health/schema", tags=["Health"])
+    async def schema():
+        return schema_capabilities.stats()
+
+    @app.post("/health/schema/refresh", tags=["Health"], dependencies=[Depends(require_admin())])
+    async def schema_refresh():
+        # re-probe after a migration (this worker only)
+        async with AsyncSessionLocal() as db:
+            return await schema_capabilities.refresh(db)
+
+    # ---------- OpenAPI (snapshot; skipped when docs are disabled) ----------
+    install_openapi_snapshot(app)
+
     return app
 
 
@@ -0,0 +1,350 @@
+# app/services/embeddings.py
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, Sequence, Set, Tuple
+
+from sqlalchemy import Integer, Text, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, REAL
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.clients.openai_client import get_openai_client
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+from app.database.database import AsyncSessionLocal
+from app.services.schema_capabilities import schema_capabilities
+from app.utils.lazy_import import LazyModule
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyModule("numpy")
+
+logger = get_service_logger("service.embeddings")
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_for_hash(value: str) -> str:
+    """NFC + collapsed whitespace: "ปวดหัว " and "ปวดหัว" share one embedding."""
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", value or "")).strip()
+
+
+def content_hash(value: str) -> str:
+    """sha256 of the normalized text (also what chat_retrievals.query_hash should hold)."""
+    return hashlib.sha256(normalize_for_hash(value).encode("utf-8")).hexdigest()
+
+
+class EmbeddingBackend(Protocol):
+    """Turns texts into vectors; `model` + `dim` identify its vector space (part of every cache key)."""
+
+    model: str
+    dim: int
+
+    async def embed_many(self, texts: Sequence[str]) -> List[Sequence[float]]: ...
+
+
+class OpenAIEmbeddingBackend:
+    def __init__(self, model: str, dim: int):
+        self.model = model
+        self.dim = dim
+
+    async def embed_many(self, texts: Sequence[str]) -> List[Sequence[float]]:
+        return await get_openai_client().embed_many(texts=texts, model=self.model, dimensions=self.dim)
+
+
+class LocalHashEmbeddingBackend:
+    """
+    Offline, deterministic backend (tests / dev without an API key): hashed character trigrams
+    (Thai has no spaces) + words into `dim` buckets. Similar texts get similar vectors, but the
+    space is not comparable with a real model's.
+    """
+
+    def __init__(self, dim: int):
+        self.model = "local-hash"
+        self.dim = dim
+
+    def _one(self, value: str) -> np.ndarray:
+        v = np.zeros(self.dim, dtype=np.float32)
+        s = normalize_for_hash(value).lower()
+        grams = [s[i : i + 3] for i in range(max(1, len(s) - 2))] + s.split(" ")
+        for g in grams:
+            h = int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little")
+            v[h % self.dim] += 1.0 if (h >> 63) else -1.0
+        n = float(np.linalg.norm(v))
+        return v / n if n else v
+
+    async def embed_many(self, texts: Sequence[str]) -> List[Sequence[float]]:
+        return [self._one(t) for t in texts]
+
+
+def _openai_backend() -> EmbeddingBackend:
+    s = get_settings()
+    return OpenAIEmbeddingBackend(s.OPENAI_EMBED_MODEL, int(s.OPENAI_EMBED_DIM))
+
+
+def _local_backend() -> EmbeddingBackend:
+    return LocalHashEmbeddingBackend(int(get_settings().OPENAI_EMBED_DIM))
+
+
+_FACTORIES: Dict[str, Callable[[], EmbeddingBackend]] = {"openai": _openai_backend, "local": _local_backend}
+
+
+def register_embedding_backend(name: str, factory: Callable[[], EmbeddingBackend]) -> None:
+    """Plug in another backend (e.g. a local sentence-transformer); select it with EMBEDDING_BACKEND=<name>."""
+    _FACTORIES[name] = factory
+    get_embedding_service.cache_clear()
+
+
+# ---- DB-persisted cache (optional table, see kb/MIGRATION_NOTES.md) ----
+_CACHE_TABLE = "public.embedding_cache"
+
+_CACHE_GET = text(
+    """
+    SELECT content_hash, embedding
+    FROM public.embedding_cache
+    WHERE model = :model AND dim = :dim AND content_hash = ANY(:hashes)
+    """
+).bindparams(bindparam("hashes", type_=ARRAY(Text)), bindparam("dim", type_=Integer))
+
+# vectors travel as one flat real[] (binary float4, no text round-trip), sliced per row by ordinality:
+# unnest would flatten a 2-D array
+_CACHE_PUT = text(
+    """
+    INSERT INTO public.embedding_cache (model, dim, content_hash, embedding)
+    SELECT :model, :dim, u.h, (:vectors)[(u.i - 1) * :dim + 1 : u.i * :dim]
+    FROM unnest(:hashes) WITH ORDINALITY AS u(h, i)
+    ON CONFLICT (model, dim, content_hash) DO NOTHING
+    """
+).bindparams(
+    bindparam("hashes", type_=ARRAY(Text)),
+    bindparam("vectors", type_=ARRAY(REAL)),
+    bindparam("dim", type_=Integer),
+)
+
+
+class EmbeddingService:
+    """
+    embed() / embed_many() with three layers in front of the backend:
+
+    1. in-process LRU keyed by (model, dim, content_hash)       — EMBEDDING_CACHE_SIZE vectors
+    2. public.embedding_cache (same key; if the table exists)   — one SELECT per call, writes off the request path
+    3. coalescing: concurrent misses within EMBEDDING_BATCH_WINDOW_MS (or EMBEDDING_BATCH_MAX inputs) go out
+       as one multi-input request; identical texts in flight share one result. At most
+       EMBEDDING_MAX_CONCURRENCY backend requests run at once.
+
+    Vectors are float32 NumPy arrays (6 KB at 1536 dims vs ~50 KB as a list of floats).
+    """
+
+    def __init__(
+        self,
+        backend: EmbeddingBackend,
+        *,
+        cache_size: int,
+        batch_max: int,
+        batch_window_ms: float,
+        max_concurrency: int,
+        use_db: bool = True,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.backend = backend
+        self.cache_size = cache_size
+        self.batch_max = max(1, batch_max)
+        self.batch_window = max(0.0, batch_window_ms) / 1000
+        self.use_db = use_db
+        self._session_factory = session_factory
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._queued: Dict[str, Tuple[str, asyncio.Future, bool]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {"lru_hits": 0, "db_hits": 0, "computed": 0, "requests": 0}
+
+    # ---- public API ----
+    async def embed(self, value: str) -> np.ndarray:
+        return (await self.embed_many([value]))[0]
+
+    async def embed_many(self, values: Sequence[str], *, remember: bool = True) -> List[np.ndarray]:
+        """remember=False: bulk work (ingestion) - computed vectors go to the DB cache but not the LRU."""
+        hashes = [content_hash(v) for v in values]
+        found: Dict[str, np.ndarray] = {}
+        missing: Dict[str, str] = {}
+        for h, v in zip(hashes, values):
+            vec = self._lru_get(h)
+            if vec is not None:
+                found[h] = vec
+                self._stats["lru_hits"] += 1
+            elif h not in found:
+                missing[h] = v
+
+        if missing and await self._db_enabled():
+            for h, vec in (await self._db_get(list(missing))).items():
+                found[h] = vec
+                if remember:
+                    self._lru_put(h, vec)
+                missing.pop(h, None)
+                self._stats["db_hits"] += 1
+
+        if missing:
+            futures = {h: self._submit(h, v, remember) for h, v in missing.items()}
+            # shield: one caller giving up must not cancel a result other callers wait for
+            results = await asyncio.gather(*(asyncio.shield(f) for f in futures.values()))
+            found.update(zip(futures, results))
+
+        return [found[h] for h in hashes]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend.model, "dim": self.backend.dim, "lru_size": len(self._lru), **self._stats}
+
+    async def aclose(self, timeout: float = 10.0) -> None:
+        """Shutdown: flush what is queued and let pending cache writes finish."""
+        self._flush()
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=timeout)
+
+    # ---- LRU ----
+    def _key(self, h: str) -> str:
+        return f"{self.backend.model}:{self.backend.dim}:{h}"
+
+    def _lru_get(self, h: str) -> Optional[np.ndarray]:
+        key = self._key(h)
+        vec = self._lru.get(key)
+        if vec is not None:
+            self._lru.move_to_end(key)
+        return vec
+
+    def _lru_put(self, h: str, vec: np.ndarray) -> None:
+        if self.cache_size <= 0:
+            return
+        key = self._key(h)
+        self._lru[key] = vec
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.cache_size:
+            self._lru.popitem(last=False)
+
+    # ---- DB cache ----
+    async def _db_enabled(self) -> bool:
+        if not self.use_db:
+            return False
+        if not schema_capabilities.loaded:
+            try:
+                async with self._session_factory() as db:
+                    await schema_capabilities.ensure(db)
+            except Exception as e:
+                logger.warning("embedding cache: schema probe failed: %s", e)
+                return False
+        return schema_capabilities.has_table(_CACHE_TABLE)
+
+    async def _db_get(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        try:
+            async with self._session_factory() as db:
+                rows = (
+                    await db.execute(
+                        _CACHE_GET, {"model": self.backend.model, "dim": self.backend.dim, "hashes": hashes}
+                    )
+                ).all()
+        except Exception as e:
+            logger.warning("embedding cache read failed: %s", e)
+            return {}
+        return {r.content_hash: np.asarray(r.embedding, dtype=np.float32) for r in rows}
+
+    async def _db_put(self, items: Dict[str, np.ndarray]) -> None:
+        try:
+            async with self._session_factory() as db:
+                await db.execute(
+                    _CACHE_PUT,
+                    {
+                        "model": self.backend.model,
+                        "dim": self.backend.dim,
+                        "hashes": list(items),
+                        "vectors": np.concatenate(list(items.values())).tolist(),
+                    },
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning("embedding cache write failed (%d vectors): %s", len(items), e)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # ---- coalescing ----
+    def _submit(self, h: str, value: str, remember: bool = True) -> asyncio.Future:
+        if h in self._inflight:
+            return self._inflight[h]
+        if h in self._queued:
+            _, fut, queued_remember = self._queued[h]
+            self._queued[h] = (value, fut, queued_remember or remember)
+            return fut
+        fut = asyncio.get_running_loop().create_future()
+        self._queued[h] = (value, fut, remember)
+        if len(self._queued) >= self.batch_max:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return fut
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queued:
+            return
+        batch, self._queued = self._queued, {}
+        for h, (_, fut, _) in batch.items():
+            self._inflight[h] = fut
+        self._spawn(self._run(batch))
+
+    async def _run(self, batch: Dict[str, Tuple[str, asyncio.Future, bool]]) -> None:
+        hashes = list(batch)
+        try:
+            async with self._slots:
+                t0 = time.perf_counter()
+                vectors = await self.backend.embed_many([batch[h][0] for h in hashes])
+                self._stats["requests"] += 1
+                logger.debug("embedded %d texts in %.1fms", len(hashes), (time.perf_counter() - t0) * 1000)
+            computed = {h: np.asarray(v, dtype=np.float32) for h, v in zip(hashes, vectors)}
+        except Exception as e:
+            for h in hashes:
+                fut = batch[h][1]
+                if not fut.done():
+                    fut.set_exception(e)
+                self._inflight.pop(h, None)
+            return
+
+        self._stats["computed"] += len(computed)
+        for h, vec in computed.items():
+            if batch[h][2]:
+                self._lru_put(h, vec)
+            fut = batch[h][1]
+            if not fut.done():
+                fut.set_result(vec)
+            self._inflight.pop(h, None)
+        if self.use_db and schema_capabilities.has_table(_CACHE_TABLE):
+            self._spawn(self._db_put(computed))
+
+
+@lru_cache()
+def get_embedding_service() -> EmbeddingService:
+    s = get_settings()
+    factory = _FACTORIES.get(s.EMBEDDING_BACKEND)
+    if factory is None:
+        logger.warning("unknown EMBEDDING_BACKEND=%r, using openai", s.EMBEDDING_BACKEND)
+        factory = _openai_backend
+    return EmbeddingService(
+        factory(),
+        cache_size=int(s.EMBEDDING_CACHE_SIZE),
+        batch_max=int(s.EMBEDDING_BATCH_MAX),
+        batch_window_ms=float(s.EMBEDDING_BATCH_WINDOW_MS),
+        max_concurrency=int(s.EMBEDDING_MAX_CONCURRENCY),
+        use_db=bool(s.EMBEDDING_CACHE_DB),
+    )
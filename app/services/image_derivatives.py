@@ -0,0 +1,138 @@
+# app/services/image_derivatives.py
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import AsyncIterator, Dict, Optional, Sequence, Tuple
+
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+
+logger = get_service_logger("service.image_derivatives")
+
+# derivative name -> DTO / column it is exposed as
+DERIVATIVE_FIELDS = {"thumb": "thumbnail_url", "preview": "preview_url"}
+DERIVATIVE_CONTENT_TYPE = "image/jpeg"
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def derivative_path(path: str, name: str) -> str:
+    """Object path of a derivative, next to the original: a/b/<stem>.<name>.jpg"""
+    p = PurePosixPath(path)
+    return str(p.with_name(f"{p.stem}.{name}.jpg"))
+
+
+def derivative_paths(path: str) -> Tuple[str, ...]:
+    return tuple(derivative_path(path, name) for name in DERIVATIVE_FIELDS)
+
+
+@lru_cache()
+def available() -> bool:
+    """Pillow is optional: without it uploads still succeed and derivatives are left to the backfill."""
+    ok = importlib.util.find_spec("PIL") is not None
+    if not ok:
+        logger.warning("Pillow is not installed; image derivatives are disabled")
+    return ok
+
+
+def _sizes() -> Tuple[Tuple[str, int], ...]:
+    s = get_settings()
+    return (("thumb", int(s.IMAGE_THUMBNAIL_PX)), ("preview", int(s.IMAGE_PREVIEW_PX)))
+
+
+def _render(src: str, sizes: Sequence[Tuple[str, int]], quality: int) -> Dict[str, bytes]:
+    """Worker process: decode once, EXIF-rotate, downscale largest -> smallest, encode JPEG."""
+    from PIL import Image, ImageOps
+
+    out: Dict[str, bytes] = {}
+    with Image.open(src) as im:
+        largest = max(edge for _, edge in sizes)
+        im.draft("RGB", (largest, largest))  # JPEG: let the decoder skip full resolution
+        img = ImageOps.exif_transpose(im)
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            flat = Image.new("RGB", img.size, "white")
+            flat.paste(img, mask=img.getchannel("A"))
+            img = flat
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+
+        # each size is scaled from the previous (larger) one; thumbnail() never upscales
+        for name, edge in sorted(sizes, key=lambda s: -s[1]):
+            img.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            buf = io.BytesIO()
+            img.save(buf, "JPEG", quality=quality, optimize=True, progressive=True)
+            out[name] = buf.getvalue()
+    return out
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=max(1, int(get_settings().IMAGE_DERIVATIVE_WORKERS)),
+            # spawn: never fork the running event loop / connection pools into the workers
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def render(src: Path) -> Dict[str, bytes]:
+    """{"thumb": jpeg, "preview": jpeg} for the image file at src (CPU work runs in the process pool)."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            _executor(), _render, str(src), _sizes(), int(get_settings().IMAGE_DERIVATIVE_QUALITY)
+        )
+    except BrokenProcessPool:
+        # a worker died (OOM on a huge image, killed, ...): start a fresh pool for the next upload
+        shutdown()
+        raise
+
+
+async def _once(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+async def store_derivatives(storage, bucket: str, original_path: str, src: Path) -> Dict[str, str]:
+    """
+    Render + upload the derivatives of one stored original; {"thumbnail_url": ..., "preview_url": ...}.
+
+    Best-effort: an undecodable file, missing Pillow or a storage error returns {} (and removes any
+    derivative already written) — the original upload is never failed because of a derivative.
+    """
+    if not available():
+        return {}
+    written = []
+    try:
+        rendered = await render(src)
+        urls: Dict[str, str] = {}
+        for name, data in rendered.items():
+            path = derivative_path(original_path, name)
+            stored = await storage.put_stream(bucket, path, _once(data), content_type=DERIVATIVE_CONTENT_TYPE)
+            written.append(path)
+            urls[DERIVATIVE_FIELDS[name]] = stored.url
+        return urls
+    except Exception as e:
+        logger.warning("derivatives failed bucket=%s path=%s: %s", bucket, original_path, e)
+        if written:
+            try:
+                await storage.remove(bucket, written)
+            except Exception:
+                logger.warning("could not remove derivatives bucket=%s paths=%s", bucket, written)
+        return {}
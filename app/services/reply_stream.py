@@ -0,0 +1,168 @@
+# app/services/reply_stream.py
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Protocol, Set
+
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+
+logger = get_service_logger("service.reply_stream")
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # nginx: do not buffer the event stream
+}
+
+
+class ReplyGenerator(Protocol):
+    """
+    Produces assistant text incrementally.
+
+    draft: the reply composed by the rule-based path (topic cards, triage stub); generators backed by
+    an LLM may use it as guidance or ignore it, the local generator simply re-emits it.
+    """
+
+    def stream(self, *, prompt: str, draft: str, lang: Optional[str] = None) -> AsyncIterator[str]: ...
+
+
+class LocalReplyGenerator:
+    """Deterministic generator: the draft in word-sized pieces (Thai runs split every chunk_chars)."""
+
+    _WORDS = re.compile(r"\S+\s*|\s+")
+
+    def __init__(self, chunk_chars: int = 24, delay_seconds: float = 0.0):
+        self.chunk_chars = max(1, chunk_chars)
+        self.delay_seconds = delay_seconds
+
+    def chunks(self, draft: str) -> list[str]:
+        out: list[str] = []
+        buf = ""
+        for word in self._WORDS.findall(draft or ""):
+            while len(word) > self.chunk_chars:
+                if buf:
+                    out.append(buf)
+                    buf = ""
+                cut = self._cut(word, self.chunk_chars)
+                out.append(word[:cut])
+                word = word[cut:]
+            if len(buf) + len(word) > self.chunk_chars and buf:
+                out.append(buf)
+                buf = ""
+            buf += word
+        if buf:
+            out.append(buf)
+        return out
+
+    @staticmethod
+    def _cut(word: str, at: int) -> int:
+        # never separate Thai vowel / tone marks (combining, category Mn) from their base character
+        while at < len(word) and unicodedata.category(word[at]) == "Mn":
+            at += 1
+        return at
+
+    async def stream(self, *, prompt: str, draft: str, lang: Optional[str] = None) -> AsyncIterator[str]:
+        for piece in self.chunks(draft):
+            if self.delay_seconds:
+                await asyncio.sleep(self.delay_seconds)
+            yield piece
+
+
+def _local_generator() -> ReplyGenerator:
+    s = get_settings()
+    return LocalReplyGenerator(s.CHAT_STREAM_CHUNK_CHARS, s.CHAT_STREAM_DELAY_MS / 1000)
+
+
+_FACTORIES: Dict[str, Callable[[], ReplyGenerator]] = {"local": _local_generator}
+
+
+def register_reply_generator(name: str, factory: Callable[[], ReplyGenerator]) -> None:
+    """Plug in another backend (e.g. an LLM client); select it with CHAT_REPLY_GENERATOR=<name>."""
+    _FACTORIES[name] = factory
+    get_reply_generator.cache_clear()
+
+
+@lru_cache()
+def get_reply_generator() -> ReplyGenerator:
+    name = get_settings().CHAT_REPLY_GENERATOR
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        logger.warning("unknown CHAT_REPLY_GENERATOR=%r, using local", name)
+        factory = _local_generator
+    return factory()
+
+
+def sse(event: str, data: Any) -> bytes:
+    payload = json.dumps(data, ensure_ascii=False, default=str, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+# ---- background persistence ----
+_pending: Set[asyncio.Task] = set()
+
+
+def run_in_background(coro: Awaitable[Any], *, what: str) -> None:
+    """Fire-and-forget with a strong reference (tasks are otherwise GC-able) and error logging."""
+
+    async def _run() -> None:
+        try:
+            await coro
+        except Exception:
+            logger.exception("background %s failed", what)
+
+    task = asyncio.create_task(_run())
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+async def drain(timeout: float = 10.0) -> None:
+    """Shutdown: let in-flight persists finish."""
+    if _pending:
+        await asyncio.wait(set(_pending), timeout=timeout)
+
+
+async def stream_reply(
+    *,
+    prompt: str,
+    draft: str,
+    lang: Optional[str] = None,
+    start: Dict[str, Any],
+    final: Dict[str, Any],
+    persist: Callable[[str, str], Awaitable[Any]],
+    generator: Optional[ReplyGenerator] = None,
+) -> AsyncIterator[bytes]:
+    """
+    SSE body: `start` (ids) -> `delta` {"text"} * n -> `done` (final payload + full assistant_text).
+
+    The assistant message is persisted when the stream ends, however it ends, in a background task
+    (own DB session), so the client never waits on the write: persist(text, status) with status
+    "done", "failed" (generation error, `error` event sent; text so far) or "aborted" (client
+    disconnected; the text it was sent).
+    """
+    gen = generator or get_reply_generator()
+    parts: list[str] = []
+    status = "aborted"  # until the generator finishes: a disconnect closes this stream at a yield
+    try:
+        yield sse("start", start)
+        try:
+            async for piece in gen.stream(prompt=prompt, draft=draft, lang=lang):
+                parts.append(piece)
+                yield sse("delta", {"text": piece})
+        except Exception:
+            status = "failed"
+            logger.exception("reply generation failed")
+            yield sse("error", {"message": "reply generation failed"})
+            return
+
+        status = "done"
+        yield sse("done", {**final, "assistant_text": "".join(parts)})
+    finally:
+        if status != "done":
+            logger.info("streamed reply %s after %d pieces", status, len(parts))
+        run_in_background(persist("".join(parts), status), what="assistant message persist")
@@ -0,0 +1,121 @@
+# app/services/schema_capabilities.py
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional
+
+from sqlalchemy import Text, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging_config import get_service_logger
+
+logger = get_service_logger("service.schema_capabilities")
+
+# optional database objects the code adapts to (schema-qualified)
+TABLES = (
+    "public.embedding_cache",
+)
+VIEWS = (
+    "public.vw_chat_sessions_summary",
+    "public.vw_chat_message_citations",
+)
+FUNCTIONS = (
+    "public.rpc_request_escalation",
+)
+
+_PROBE = text(
+    """
+    SELECT
+      ARRAY(SELECT t FROM unnest(:tables) AS t WHERE to_regclass(t) IS NOT NULL) AS tables,
+      ARRAY(SELECT v FROM unnest(:views) AS v WHERE to_regclass(v) IS NOT NULL) AS views,
+      ARRAY(
+        SELECT f FROM unnest(:functions) AS f
+        WHERE EXISTS (
+          SELECT 1 FROM pg_proc p JOIN pg_namespace n ON n.oid = p.pronamespace
+          WHERE n.nspname || '.' || p.proname = f
+        )
+      ) AS functions
+    """
+).bindparams(
+    bindparam("tables", type_=ARRAY(Text)),
+    bindparam("views", type_=ARRAY(Text)),
+    bindparam("functions", type_=ARRAY(Text)),
+)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    tables: FrozenSet[str] = field(default_factory=frozenset)
+    views: FrozenSet[str] = field(default_factory=frozenset)
+    functions: FrozenSet[str] = field(default_factory=frozenset)
+    probed_at: float = 0.0
+
+
+class SchemaCapabilities:
+    """
+    Which optional tables / views / functions exist, probed once (one round-trip) instead of per request.
+
+    - probed at startup (lifespan); if the database was unreachable then, the first caller probes
+    - migrations applied while running: POST /health/schema/refresh (per worker)
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    async def refresh(self, db: AsyncSession) -> Dict[str, Any]:
+        t0 = time.perf_counter()
+        row = (
+            await db.execute(
+                _PROBE,
+                {"tables": list(TABLES), "views": list(VIEWS), "functions": list(FUNCTIONS)},
+            )
+        ).one()
+        self._snapshot = _Snapshot(
+            tables=frozenset(row.tables or ()),
+            views=frozenset(row.views or ()),
+            functions=frozenset(row.functions or ()),
+            probed_at=time.time(),
+        )
+        logger.info("schema capabilities probed in %.1fms: %s", (time.perf_counter() - t0) * 1000, self.stats())
+        return self.stats()
+
+    async def ensure(self, db: AsyncSession) -> None:
+        """No-op once probed; otherwise probe on this session (first request after a failed startup probe)."""
+        if self._snapshot is not None:
+            return
+        async with self._lock:
+            if self._snapshot is None:
+                await self.refresh(db)
+
+    def has_table(self, name: str) -> bool:
+        return self._snapshot is not None and name in self._snapshot.tables
+
+    def has_view(self, name: str) -> bool:
+        return self._snapshot is not None and name in self._snapshot.views
+
+    def has_function(self, name: str) -> bool:
+        return self._snapshot is not None and name in self._snapshot.functions
+
+    def stats(self) -> Dict[str, Any]:
+        snap = self._snapshot
+        if snap is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "probed_at": snap.probed_at,
+            "tables": {t: t in snap.tables for t in TABLES},
+            "views": {v: v in snap.views for v in VIEWS},
+            "functions": {f: f in snap.functions for f in FUNCTIONS},
+        }
+
+
+schema_capabilities = SchemaCapabilities()
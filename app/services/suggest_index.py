@@ -0,0 +1,249 @@
+# app/services/suggest_index.py
+
+from __future__ import annotations
+
+import asyncio
+import time
+from bisect import bisect_left, insort
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+from app.utils.search_text import (
+    digits_only,
+    looks_like_phone_or_id,
+    normalize_text,
+    normalize_th_phone,
+    search_tokens,
+    strip_name_title,
+)
+
+logger = get_service_logger("service.suggest_index")
+
+# tables without company_code (patients, services, ...) share one scope
+GLOBAL_SCOPE = "*"
+
+# forward scan budget per lookup: bounds latency on very common prefixes ("สม", "08")
+SCAN_LIMIT = 2000
+CANDIDATES_PER_RESULT = 5
+
+# (id, label, extra keys) — extra keys are matched but never shown (codes, phone digits, ...)
+SuggestRow = Tuple[Any, str, Sequence[str]]
+Loader = Callable[[int], Awaitable[List[SuggestRow]]]
+# (max_rows) -> True when the table holds more rows than that; answered without loading them
+Probe = Callable[[int], Awaitable[bool]]
+
+
+def suggest_keys(label: str, extra: Iterable[str] = ()) -> Tuple[str, ...]:
+    """Normalized prefix keys for one row: each word of the label (titles dropped) + extras (codes, phones)."""
+    keys = {t.strip("()[],") for t in search_tokens(strip_name_title(normalize_text(label)))}
+    for value in extra:
+        v = normalize_text(value)
+        if v:
+            keys.add(v)
+            d = digits_only(v)
+            if len(d) >= 3 and d != v:
+                keys.add(d)
+    keys.discard("")
+    return tuple(keys)
+
+
+class PrefixIndex:
+    """
+    Sorted (key, id) pairs; a lookup is bisect to the query prefix + a bounded forward scan.
+
+    - multi-word queries: the longest word drives the scan, the others must prefix some key of the row
+    - ranking: label contains the query words in order, then shorter labels, then alphabetical
+    - partial=True: table exceeded SUGGEST_INDEX_MAX_ROWS, callers answer from the DB instead
+    """
+
+    __slots__ = ("version", "loaded_at", "partial", "_entries", "_labels", "_keys")
+
+    def __init__(self, rows: Iterable[SuggestRow] = (), *, version: int = 0, partial: bool = False):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.partial = partial
+        self._labels: Dict[str, str] = {}
+        self._keys: Dict[str, Tuple[str, ...]] = {}
+        entries: List[Tuple[str, str]] = []
+        for row_id, label, extra in rows:
+            rid = str(row_id)
+            keys = suggest_keys(label, extra)
+            self._labels[rid] = label
+            self._keys[rid] = keys
+            entries.extend((k, rid) for k in keys)
+        entries.sort()
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def upsert(self, row_id: Any, label: str, extra: Sequence[str] = ()) -> None:
+        rid = str(row_id)
+        self.remove(rid)
+        keys = suggest_keys(label, extra)
+        self._labels[rid] = label
+        self._keys[rid] = keys
+        for k in keys:
+            insort(self._entries, (k, rid))
+
+    def remove(self, row_id: Any) -> None:
+        rid = str(row_id)
+        self._labels.pop(rid, None)
+        for k in self._keys.pop(rid, ()):
+            i = bisect_left(self._entries, (k, rid))
+            if i < len(self._entries) and self._entries[i] == (k, rid):
+                del self._entries[i]
+
+    def lookup(self, q: str, limit: int = 10) -> List[Dict[str, str]]:
+        norm = normalize_text(q)
+        if looks_like_phone_or_id(norm):
+            d = normalize_th_phone(norm) if norm.startswith("+") else digits_only(norm)
+            norm = d
+            tokens = [d] if d else []
+        else:
+            tokens = search_tokens(strip_name_title(norm))
+        if not tokens:
+            return []
+        head, rest = tokens[0], tokens[1:]
+
+        found: Dict[str, None] = {}
+        wanted = limit * CANDIDATES_PER_RESULT
+        entries, keys_of = self._entries, self._keys
+        i = bisect_left(entries, (head,))
+        end = min(len(entries), i + SCAN_LIMIT)
+        while i < end and len(found) < wanted:
+            key, rid = entries[i]
+            if not key.startswith(head):
+                break
+            if rid not in found and (not rest or all(any(k.startswith(t) for k in keys_of[rid]) for t in rest)):
+                found[rid] = None
+            i += 1
+
+        phrase = " ".join(tokens) if rest else head
+        labels = self._labels
+
+        def rank(rid: str) -> Tuple[int, int, str]:
+            label = labels[rid]
+            return (0 if phrase in label.lower() else 1, len(label), label)
+
+        return [{"id": rid, "label": labels[rid]} for rid in sorted(found, key=rank)[:limit]]
+
+
+class SuggestIndex:
+    """
+    Per (entity, scope) prefix indexes for /suggest endpoints.
+
+    - built lazily on first lookup from the entity's loader (projection query, one round-trip)
+    - an optional size probe runs first: a table over SUGGEST_INDEX_MAX_ROWS is marked partial
+      without fetching its rows, and that verdict is kept until the TTL like any index
+    - write paths keep it fresh: upsert()/remove() for row-level changes (large tables),
+      invalidate() to rebuild on next lookup (small tables / writes that move rows between scopes)
+    - TTL bounds staleness for writes made by other workers or directly in the database
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_rows: Optional[int] = None):
+        self._ttl_seconds = ttl_seconds
+        self._max_rows = max_rows
+        self._indexes: Dict[Tuple[str, str], PrefixIndex] = {}
+        self._versions: Dict[str, int] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = float(get_settings().SUGGEST_INDEX_TTL_SECONDS)
+        return self._ttl_seconds
+
+    @property
+    def max_rows(self) -> int:
+        if self._max_rows is None:
+            self._max_rows = int(get_settings().SUGGEST_INDEX_MAX_ROWS)
+        return self._max_rows
+
+    def version(self, entity: str) -> int:
+        return self._versions.get(entity, 0)
+
+    def _bump(self, entity: str) -> None:
+        self._versions[entity] = self.version(entity) + 1
+
+    def _is_fresh(self, entity: str, index: Optional[PrefixIndex]) -> bool:
+        if index is None or index.version != self.version(entity):
+            return False
+        ttl = self.ttl_seconds
+        return ttl <= 0 or (time.monotonic() - index.loaded_at) < ttl
+
+    async def get(
+        self, entity: str, loader: Loader, *, scope: Optional[str] = None, probe: Optional[Probe] = None
+    ) -> PrefixIndex:
+        key = (entity, scope or GLOBAL_SCOPE)
+        index = self._indexes.get(key)
+        if self._is_fresh(entity, index):
+            return index
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            index = self._indexes.get(key)
+            if self._is_fresh(entity, index):
+                return index
+
+            version = self.version(entity)
+            t0 = time.perf_counter()
+            if probe is not None and await probe(self.max_rows):
+                # too large to hold: the verdict is cached (until TTL / write) without fetching the rows
+                rows: List[SuggestRow] = []
+                index = PrefixIndex(version=version, partial=True)
+            else:
+                rows = await loader(self.max_rows + 1)
+                if len(rows) > self.max_rows:  # no probe, or the table grew since it ran
+                    index = PrefixIndex(version=version, partial=True)
+                else:
+                    # CPU-bound (normalize + sort): keep the event loop responsive for large tables
+                    index = await asyncio.to_thread(PrefixIndex, rows, version=version)
+
+            # a write landed while loading -> serve this result once, do not keep it
+            if version == self.version(entity):
+                self._indexes[key] = index
+            logger.info(
+                "suggest index built entity=%s scope=%s rows=%s partial=%s elapsed_ms=%.1f",
+                entity, key[1], len(rows), index.partial, (time.perf_counter() - t0) * 1000,
+            )
+            return index
+
+    def upsert(self, entity: str, row_id: Any, label: str, extra: Sequence[str] = (), *, scope: Optional[str] = None) -> None:
+        """Apply a committed insert/update to the loaded index (bumps the version so in-flight builds are dropped)."""
+        self._bump(entity)
+        index = self._indexes.get((entity, scope or GLOBAL_SCOPE))
+        if index is not None and not index.partial:
+            index.upsert(row_id, label, extra)
+        self._restamp(entity)
+
+    def remove(self, entity: str, row_id: Any) -> None:
+        """Drop a row from every scope of the entity."""
+        self._bump(entity)
+        for (e, _), index in self._indexes.items():
+            if e == entity:
+                index.remove(row_id)
+        self._restamp(entity)
+
+    def _restamp(self, entity: str) -> None:
+        # loaded indexes already reflect the write; only a concurrent build must be discarded
+        v = self.version(entity)
+        for (e, _), index in self._indexes.items():
+            if e == entity:
+                index.version = v
+
+    def invalidate(self, entity: str) -> None:
+        """Rebuild every scope of the entity on the next lookup."""
+        self._bump(entity)
+        for key in [k for k in self._indexes if k[0] == entity]:
+            self._indexes.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            f"{entity}:{scope}": {"rows": len(index), "partial": index.partial, "version": index.version}
+            for (entity, scope), index in self._indexes.items()
+        }
+
+
+suggest_index = SuggestIndex()
@@ -5,15 +5,49 @@
 # supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
 
 # app/services/supabase_client.py
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
 from app.core.config import get_settings
-from supabase import create_client, Client
 
-_settings = get_settings()
+if TYPE_CHECKING:
+    from supabase import Client
+
+_client: Optional["Client"] = None
+_lock = threading.Lock()
+
+
+def get_supabase() -> "Client":
+    """Shared Supabase client, created on first use (not at import -> faster worker start)."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                # SDK + its HTTP/realtime/storage stack are imported here, not during app startup
+                from supabase import create_client
+
+                settings = get_settings()
+                if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
+                    raise RuntimeError("Missing SUPABASE_URL or SUPABASE_KEY in environment variables.")
+                _client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+    return _client
+
+
+class _LazySupabase:
+    """Stands in for the client in `from app.services.supabase_client import supabase`."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_supabase(), name)
+
+    def __repr__(self) -> str:
+        return f"<lazy supabase client loaded={_client is not None}>"
 
-if not _settings.SUPABASE_URL or not _settings.SUPABASE_KEY:
-    raise RuntimeError("Missing SUPABASE_URL or SUPABASE_KEY in environment variables.")
 
-supabase: Client = create_client(_settings.SUPABASE_URL, _settings.SUPABASE_KEY)
+supabase: "Client" = _LazySupabase()  # type: ignore[assignment]
 
 
 ##### Old Version-2025-07-01
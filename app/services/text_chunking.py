@@ -0,0 +1,142 @@
+# app/services/text_chunking.py
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Sequence
+
+from app.core.logging_config import get_service_logger
+
+logger = get_service_logger("service.text_chunking")
+
+PAGE_BREAK = "\f"
+# pages are joined with a paragraph break, so a page boundary is also the preferred cut
+_PAGE_JOIN = "\n\n"
+# a cut is searched for in the last part of the window only: chunks stay close to max_chars
+_CUT_WINDOW = 0.3
+_SENTENCE_END = re.compile(r"[.!?。](?=\s)|\n")
+_SPACE = re.compile(r"\s")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    index: int
+    content: str
+    page_start: int  # 1-based, inclusive
+    page_end: int
+    char_start: int  # offsets in the joined text (stable for the same source + settings)
+    char_end: int
+
+
+@lru_cache()
+def pdf_available() -> bool:
+    """pypdf is optional: without it only text sources can be ingested."""
+    ok = importlib.util.find_spec("pypdf") is not None
+    if not ok:
+        logger.warning("pypdf is not installed; PDF sources cannot be ingested")
+    return ok
+
+
+def read_pages(path: Path) -> List[str]:
+    """
+    Text of a local source file, one string per page: PDF pages (pypdf), otherwise UTF-8 text
+    split on form feeds. Blocking - run it in a thread.
+    """
+    if path.suffix.lower() == ".pdf":
+        if not pdf_available():
+            raise RuntimeError("pypdf is not installed (pip install pypdf)")
+        from pypdf import PdfReader
+
+        return [page.extract_text() or "" for page in PdfReader(str(path)).pages]
+    return path.read_text(encoding="utf-8-sig", errors="replace").split(PAGE_BREAK)
+
+
+def _clean(page: str) -> str:
+    page = unicodedata.normalize("NFC", page).replace("\r\n", "\n").replace("\r", "\n")
+    page = re.sub(r"[ \t ]+", " ", page)
+    return re.sub(r"\n{3,}", "\n\n", page).strip()
+
+
+def _safe_cut(text: str, pos: int) -> int:
+    # never split a base character from its combining marks (Thai vowels / tone marks)
+    while 0 < pos < len(text) and unicodedata.combining(text[pos]):
+        pos -= 1
+    return pos
+
+
+def _find_cut(text: str, start: int, end: int) -> int:
+    lo = start + int((end - start) * (1 - _CUT_WINDOW))
+    window = text[lo:end]
+    para = window.rfind("\n\n")
+    if para >= 0:
+        return lo + para
+    sentences = [m.end() for m in _SENTENCE_END.finditer(window)]
+    if sentences:
+        return lo + sentences[-1]
+    # Thai has no word spaces: a space usually separates phrases / sentences
+    spaces = [m.start() for m in _SPACE.finditer(window)]
+    if spaces:
+        return lo + spaces[-1]
+    return _safe_cut(text, end)
+
+
+def chunk_pages(pages: Sequence[str], *, max_chars: int, overlap_chars: int) -> List[Chunk]:
+    """
+    Split pages into chunks of at most max_chars, cut at a paragraph / page break, else a sentence
+    end, else a space (hard cut only inside very long runs). Consecutive chunks share about
+    overlap_chars of context, started on a word boundary. Deterministic: the same pages and
+    settings always give the same chunks, which is what lets ingestion resume by chunk_index.
+    """
+    max_chars = max(100, int(max_chars))
+    overlap_chars = max(0, min(int(overlap_chars), max_chars // 2))
+
+    text = ""
+    page_starts: List[int] = []
+    for page in pages:
+        if text:
+            text += _PAGE_JOIN
+        page_starts.append(len(text))
+        text += _clean(page)
+
+    def page_of(offset: int) -> int:
+        n = 0
+        for i, s in enumerate(page_starts):
+            if s <= offset:
+                n = i
+        return n + 1
+
+    chunks: List[Chunk] = []
+    start = 0
+    while start < len(text):
+        end = min(start + max_chars, len(text))
+        cut = end if end == len(text) else max(_find_cut(text, start, end), start + 1)
+        raw = text[start:cut]
+        content = raw.strip()
+        if content:
+            lead = len(raw) - len(raw.lstrip())
+            c_start, c_end = start + lead, start + lead + len(content)
+            chunks.append(
+                Chunk(
+                    index=len(chunks),
+                    content=content,
+                    page_start=page_of(c_start),
+                    page_end=page_of(c_end - 1),
+                    char_start=c_start,
+                    char_end=c_end,
+                )
+            )
+        if cut >= len(text):
+            break
+        nxt = cut
+        if overlap_chars:
+            back = text[cut - overlap_chars : cut] if cut - overlap_chars > start else ""
+            space = _SPACE.search(back)
+            if space:
+                nxt = cut - len(back) + space.end()
+        start = max(nxt, start + 1)
+    return chunks
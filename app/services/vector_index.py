@@ -0,0 +1,636 @@
+# app/services/vector_index.py
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import math
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.logging_config import get_service_logger
+from app.utils.search_text import lexical_tokens
+from app.utils.lazy_import import LazyModule
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyModule("numpy")  # numpy is imported on first use, not at app startup
+
+logger = get_service_logger("service.vector_index")
+
+# partitions this small are searched inline; larger ones in a worker thread (NumPy / hnswlib release the GIL)
+INLINE_SEARCH_ROWS = 4096
+# share of tombstoned rows after which a partition is rebuilt (compacted) in the background
+COMPACT_DEAD_RATIO = 0.25
+
+
+@dataclass(frozen=True)
+class VectorDoc:
+    """Document-level attributes searched by filters (doc_type / lang / tags / document_id)."""
+
+    id: UUID
+    doc_type: Optional[str] = None
+    language_code: Optional[str] = None
+    tags: FrozenSet[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class VectorRow:
+    chunk_id: UUID
+    document_id: UUID
+    embedding: Sequence[float]  # float32 ndarray from the loaders; any float sequence is accepted
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    text: str = ""  # chunk content for the BM25 index (only its terms are kept)
+
+
+@dataclass(frozen=True)
+class VectorHit:
+    chunk_id: UUID
+    document_id: UUID
+    score: float  # cosine similarity (search) / BM25 (search_lexical)
+
+
+@dataclass(frozen=True)
+class FusedHit:
+    chunk_id: UUID
+    document_id: UUID
+    score: float  # reciprocal rank fusion score
+    ranks: Mapping[str, int]  # 1-based rank per list the chunk appeared in
+    scores: Mapping[str, float]
+
+
+# company's rows + the documents they belong to (one projection query per table)
+Loader = Callable[[], Awaitable[Tuple[List[VectorRow], List[VectorDoc]]]]
+
+
+@lru_cache()
+def _hnswlib():
+    """hnswlib is optional: without it large partitions are searched by brute force too."""
+    try:
+        return importlib.import_module("hnswlib")
+    except ImportError:
+        logger.warning("hnswlib is not installed; vector search uses brute force only")
+        return None
+
+
+def _as_set(value: Any) -> Set[str]:
+    if value is None:
+        return set()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return {str(v) for v in value}
+    return {str(value)}
+
+
+def _normalize(vecs: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    norms = np.linalg.norm(vecs, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.divide(vecs, norms, out=out)
+
+
+def reciprocal_rank_fusion(rankings: Mapping[str, Sequence[VectorHit]], *, k: int = 60, top_k: int) -> List[FusedHit]:
+    """
+    Merge ranked lists by sum(1 / (k + rank)): only ranks count, so cosine and BM25 scores need
+    no calibration against each other. Ties: best single rank first, then the first list's order.
+    """
+    fused: Dict[UUID, Dict[str, Any]] = {}
+    for name, hits in rankings.items():
+        for rank, h in enumerate(hits, start=1):
+            f = fused.setdefault(h.chunk_id, {"document_id": h.document_id, "score": 0.0, "ranks": {}, "scores": {}})
+            f["score"] += 1.0 / (k + rank)
+            f["ranks"][name] = rank
+            f["scores"][name] = h.score
+    order = sorted(fused.items(), key=lambda kv: (-kv[1]["score"], min(kv[1]["ranks"].values())))
+    return [
+        FusedHit(chunk_id=cid, document_id=f["document_id"], score=f["score"], ranks=f["ranks"], scores=f["scores"])
+        for cid, f in order[:top_k]
+    ]
+
+
+class VectorPartition:
+    """
+    One company's chunk vectors: L2-normalized float32 rows (cosine = dot product).
+
+    - rows are append-only with tombstones; an updated chunk overwrites its row in place
+    - brute force is one matrix-vector product over the rows allowed by the filters
+    - above `ann_min_rows` an HNSW graph (hnswlib, inner product) answers unfiltered / broad queries;
+      selective filters still go to brute force over the few allowed rows (exact and cheaper)
+    - the same rows carry a BM25 inverted index over their text (search_lexical); filters, tombstones
+      and write paths are shared, so both searches always see the same chunks
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[VectorRow],
+        docs: Iterable[VectorDoc],
+        *,
+        dim: int,
+        version: int = 0,
+        ann_min_rows: int = 0,
+    ):
+        self.dim = dim
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.ann_min_rows = ann_min_rows
+
+        self._docs: List[VectorDoc] = []
+        self._doc_codes: Dict[UUID, int] = {}
+        for d in docs:
+            self.set_document(d)
+
+        rows = [r for r in rows if len(r.embedding) == dim]
+        cap = max(16, len(rows))
+        self._vecs = np.zeros((cap, dim), dtype=np.float32)
+        self._alive = np.zeros(cap, dtype=bool)
+        self._doc_of = np.full(cap, -1, dtype=np.int32)
+        self._ids: List[UUID] = []
+        self._rows: Dict[UUID, int] = {}
+        self._meta: List[Mapping[str, Any]] = []
+        self._n = 0
+        self._dead = 0
+
+        # BM25: term -> {row: term frequency}; per-row unique terms (to unindex) and length
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._row_terms: List[Tuple[str, ...]] = []
+        self._dl = np.zeros(cap, dtype=np.float32)
+        self._dl_total = 0.0
+
+        if rows:
+            # filled row by row and normalized in place: no stacked copy of every embedding next to _vecs
+            for i, r in enumerate(rows):
+                self._vecs[i] = r.embedding
+                self._ids.append(r.chunk_id)
+                self._rows[r.chunk_id] = i
+                self._meta.append(r.metadata or {})
+                self._row_terms.append(())
+                self._index_text(i, r.text)
+                self._doc_of[i] = self._doc_code(r.document_id)
+            self._alive[: len(rows)] = True
+            self._n = len(rows)
+            _normalize(self._vecs[: self._n], out=self._vecs[: self._n])
+
+        self._ann = None
+        self._ann_lock = threading.Lock()
+        if self.ann_min_rows and self._n >= self.ann_min_rows:
+            self._build_ann()
+
+    # ---- size / health ----
+    def __len__(self) -> int:
+        return self._n - self._dead
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._n > 1000 and self._dead > self._n * COMPACT_DEAD_RATIO
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rows": len(self),
+            "dead": self._dead,
+            "terms": len(self._postings),
+            "documents": len(self._doc_codes),
+            "ann": self._ann is not None,
+            "version": self.version,
+        }
+
+    # ---- ANN ----
+    def _build_ann(self) -> None:
+        hnswlib = _hnswlib()
+        if hnswlib is None:
+            return
+        s = get_settings()
+        ann = hnswlib.Index(space="ip", dim=self.dim)
+        ann.init_index(max_elements=len(self._vecs), ef_construction=int(s.KB_VECTOR_ANN_EF_CONSTRUCTION), M=int(s.KB_VECTOR_ANN_M))
+        ann.set_ef(int(s.KB_VECTOR_ANN_EF_SEARCH))
+        live = np.flatnonzero(self._alive[: self._n])
+        if len(live):
+            ann.add_items(self._vecs[live], live)
+        self._ann = ann
+
+    # ---- documents ----
+    def _doc_code(self, document_id: UUID) -> int:
+        code = self._doc_codes.get(document_id)
+        if code is None:
+            code = len(self._docs)
+            self._docs.append(VectorDoc(id=document_id))
+            self._doc_codes[document_id] = code
+        return code
+
+    def set_document(self, doc: VectorDoc) -> None:
+        code = self._doc_codes.get(doc.id)
+        if code is None:
+            self._doc_codes[doc.id] = len(self._docs)
+            self._docs.append(doc)
+        else:
+            self._docs[code] = doc
+
+    def has_document(self, document_id: UUID) -> bool:
+        code = self._doc_codes.get(document_id)
+        return code is not None and bool(((self._doc_of[: self._n] == code) & self._alive[: self._n]).any())
+
+    # ---- incremental writes ----
+    def _grow(self, need: int) -> None:
+        cap = len(self._vecs)
+        if need <= cap:
+            return
+        new_cap = max(need, cap * 2)
+        vecs = np.zeros((new_cap, self.dim), dtype=np.float32)
+        vecs[: self._n] = self._vecs[: self._n]
+        alive = np.zeros(new_cap, dtype=bool)
+        alive[: self._n] = self._alive[: self._n]
+        doc_of = np.full(new_cap, -1, dtype=np.int32)
+        doc_of[: self._n] = self._doc_of[: self._n]
+        dl = np.zeros(new_cap, dtype=np.float32)
+        dl[: self._n] = self._dl[: self._n]
+        # swap whole arrays: a search running in a thread keeps the references it started with
+        self._vecs, self._alive, self._doc_of, self._dl = vecs, alive, doc_of, dl
+        if self._ann is not None:
+            with self._ann_lock:
+                self._ann.resize_index(new_cap)
+
+    def upsert(self, rows: Sequence[VectorRow]) -> int:
+        rows = [r for r in rows if len(r.embedding) == self.dim]
+        if not rows:
+            return 0
+        vecs = _normalize(np.asarray([r.embedding for r in rows], dtype=np.float32))
+        self._grow(self._n + len(rows))
+        touched = []
+        for r, v in zip(rows, vecs):
+            i = self._rows.get(r.chunk_id)
+            if i is None:
+                i = self._n
+                self._n += 1
+                self._ids.append(r.chunk_id)
+                self._meta.append(r.metadata or {})
+                self._row_terms.append(())
+                self._rows[r.chunk_id] = i
+            else:
+                self._meta[i] = r.metadata or {}
+                if not self._alive[i]:
+                    self._dead -= 1
+                self._unindex_text(i)
+            self._index_text(i, r.text)
+            self._vecs[i] = v
+            self._doc_of[i] = self._doc_code(r.document_id)
+            self._alive[i] = True
+            touched.append(i)
+        if self._ann is not None:
+            with self._ann_lock:
+                for i in touched:
+                    try:
+                        self._ann.unmark_deleted(i)
+                    except RuntimeError:
+                        pass  # never added / not deleted
+                self._ann.add_items(self._vecs[touched], touched)
+        return len(touched)
+
+    def remove(self, chunk_ids: Iterable[UUID]) -> int:
+        removed = []
+        for cid in chunk_ids:
+            i = self._rows.get(cid)
+            if i is not None and self._alive[i]:
+                self._alive[i] = False
+                self._unindex_text(i)
+                removed.append(i)
+        self._dead += len(removed)
+        if self._ann is not None and removed:
+            with self._ann_lock:
+                for i in removed:
+                    self._ann.mark_deleted(i)
+        return len(removed)
+
+    def remove_document(self, document_id: UUID) -> int:
+        code = self._doc_codes.get(document_id)
+        if code is None:
+            return 0
+        rows = np.flatnonzero((self._doc_of[: self._n] == code) & self._alive[: self._n])
+        return self.remove(self._ids[i] for i in rows)
+
+    # ---- BM25 ----
+    def _index_text(self, i: int, text: str) -> None:
+        tf = Counter(lexical_tokens(text))
+        for term, n in tf.items():
+            self._postings.setdefault(term, {})[i] = n
+        self._row_terms[i] = tuple(tf)
+        self._dl[i] = sum(tf.values())
+        self._dl_total += float(self._dl[i])
+
+    def _unindex_text(self, i: int) -> None:
+        for term in self._row_terms[i]:
+            rows = self._postings.get(term)
+            if rows is not None:
+                rows.pop(i, None)
+                if not rows:
+                    del self._postings[term]
+        self._row_terms[i] = ()
+        self._dl_total -= float(self._dl[i])
+        self._dl[i] = 0.0
+
+    def search_lexical(self, query: str, top_k: int, filters: Optional[Mapping[str, Any]] = None) -> List[VectorHit]:
+        """BM25 (Okapi, KB_BM25_K1 / KB_BM25_B) over the chunk text; chunks matching no query term are not returned."""
+        terms = set(lexical_tokens(query))
+        live = len(self)
+        if not terms or not live:
+            return []
+        s = get_settings()
+        k1, b = float(s.KB_BM25_K1), float(s.KB_BM25_B)
+        n = self._n
+        dl, ids, doc_of = self._dl, self._ids, self._doc_of
+        avgdl = max(self._dl_total / live, 1.0)
+
+        scores = np.zeros(n, dtype=np.float32)
+        for term in terms:
+            # list(): one C-level copy, safe against a write on the event loop while this runs in a thread
+            postings = list((self._postings.get(term) or {}).items())
+            if not postings:
+                continue
+            rows = np.fromiter((r for r, _ in postings), dtype=np.int64, count=len(postings))
+            tf = np.fromiter((f for _, f in postings), dtype=np.float32, count=len(postings))
+            keep = rows < n
+            rows, tf = rows[keep], tf[keep]
+            idf = math.log(1.0 + (live - len(postings) + 0.5) / (len(postings) + 0.5))
+            scores[rows] += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl[rows] / avgdl))
+
+        mask = self._allowed(filters or {})
+        if mask is not None:
+            scores[~mask] = 0.0
+        rows = np.flatnonzero(scores > 0)
+        if not len(rows):
+            return []
+        k = min(top_k, len(rows))
+        top = np.argpartition(-scores[rows], k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+        top = top[np.argsort(-scores[rows][top], kind="stable")]
+        return [
+            VectorHit(chunk_id=ids[i], document_id=self._docs[doc_of[i]].id, score=float(scores[i]))
+            for i in rows[top]
+        ]
+
+    # ---- search ----
+    def _allowed(self, filters: Mapping[str, Any]) -> Optional[np.ndarray]:
+        """Row mask for the filters; None = every live row."""
+        if not filters:
+            return None
+        doc_keys = {"doc_type", "lang", "language_code", "tags", "document_id", "document_ids"}
+        doc_filters = {k: v for k, v in filters.items() if k in doc_keys and v not in (None, "", [])}
+        meta_filters = {k: v for k, v in filters.items() if k not in doc_keys and v is not None}
+
+        mask = self._alive[: self._n].copy()
+        if doc_filters:
+            doc_types = _as_set(doc_filters.get("doc_type"))
+            langs = _as_set(doc_filters.get("lang")) | _as_set(doc_filters.get("language_code"))
+            tags = _as_set(doc_filters.get("tags"))
+            doc_ids = _as_set(doc_filters.get("document_id")) | _as_set(doc_filters.get("document_ids"))
+            # documents are few: decide per document, then expand to rows with one isin()
+            codes = [
+                code
+                for code, d in enumerate(self._docs)
+                if (not doc_types or d.doc_type in doc_types)
+                and (not langs or d.language_code in langs)
+                and (not tags or not tags.isdisjoint(d.tags))
+                and (not doc_ids or str(d.id) in doc_ids)
+            ]
+            mask &= np.isin(self._doc_of[: self._n], np.asarray(codes, dtype=np.int32))
+        if meta_filters:
+            wanted = {k: _as_set(v) for k, v in meta_filters.items()}
+            for i in np.flatnonzero(mask):
+                meta = self._meta[i]
+                if not all(str(meta.get(k)) in vals for k, vals in wanted.items()):
+                    mask[i] = False
+        return mask
+
+    def _ann_search(self, q: np.ndarray, k: int, mask: Optional[np.ndarray]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        try:
+            with self._ann_lock:
+                self._ann.set_ef(max(int(get_settings().KB_VECTOR_ANN_EF_SEARCH), k))
+                labels, dists = self._ann.knn_query(
+                    q, k=k, filter=(lambda label: bool(mask[label])) if mask is not None else None
+                )
+        except RuntimeError:
+            # fewer than k reachable under the filter: answer exactly instead
+            return None
+        return labels[0].astype(np.int64), 1.0 - dists[0]
+
+    def search(self, query: Sequence[float], top_k: int, filters: Optional[Mapping[str, Any]] = None) -> List[VectorHit]:
+        q = np.asarray(query, dtype=np.float32)
+        if q.shape != (self.dim,):
+            raise ValueError(f"query has {q.shape[-1] if q.ndim else 0} dimensions, index has {self.dim}")
+        q = _normalize(q)
+        n = self._n
+        vecs, alive, ids, doc_of = self._vecs, self._alive, self._ids, self._doc_of
+
+        mask = self._allowed(filters or {})
+        allowed = int(mask.sum()) if mask is not None else n - self._dead
+        if allowed == 0:
+            return []
+        k = min(top_k, allowed)
+
+        hits = None
+        if self._ann is not None and allowed >= self.ann_min_rows:
+            hits = self._ann_search(q, k, mask)
+        if hits is not None:
+            rows, scores = hits
+        else:
+            rows = np.flatnonzero(mask) if mask is not None else np.flatnonzero(alive[:n])
+            sims = vecs[rows] @ q
+            top = np.argpartition(-sims, k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+            top = top[np.argsort(-sims[top])]
+            rows, scores = rows[top], sims[top]
+
+        return [
+            VectorHit(chunk_id=ids[i], document_id=self._docs[doc_of[i]].id, score=float(s))
+            for i, s in zip(rows, scores)
+        ]
+
+
+class VectorIndex:
+    """
+    Per company_code vector partitions (same lifecycle as SuggestIndex).
+
+    - hydrated at startup (warm()) and lazily on the first search of a company
+    - write paths keep it fresh: upsert() / remove() / remove_document() / set_document();
+      invalidate() rebuilds on next use
+    - after KB_VECTOR_INDEX_TTL_SECONDS (writes by other workers / directly in the DB) the partition
+      is rebuilt in the background while the current one keeps serving
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, ann_min_rows: Optional[int] = None):
+        self._ttl_seconds = ttl_seconds
+        self._ann_min_rows = ann_min_rows
+        self._partitions: Dict[str, VectorPartition] = {}
+        self._versions: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = float(get_settings().KB_VECTOR_INDEX_TTL_SECONDS)
+        return self._ttl_seconds
+
+    @property
+    def ann_min_rows(self) -> int:
+        if self._ann_min_rows is None:
+            self._ann_min_rows = int(get_settings().KB_VECTOR_ANN_MIN_ROWS)
+        return self._ann_min_rows
+
+    def version(self, company_code: str) -> int:
+        """Bumped by every write path and every stored (re)build of the company's partition."""
+        return self._versions.get(company_code, 0)
+
+    def _bump(self, company_code: str) -> None:
+        self._versions[company_code] = self.version(company_code) + 1
+        part = self._partitions.get(company_code)
+        if part is not None:
+            # the loaded partition reflects the write; only a concurrent build must be discarded
+            part.version = self._versions[company_code]
+
+    def _is_expired(self, part: VectorPartition) -> bool:
+        ttl = self.ttl_seconds
+        return part.needs_compaction or (ttl > 0 and (time.monotonic() - part.loaded_at) >= ttl)
+
+    async def _build(self, company_code: str, loader: Loader) -> VectorPartition:
+        version = self.version(company_code)
+        t0 = time.perf_counter()
+        rows, docs = await loader()
+        part = await asyncio.to_thread(
+            VectorPartition,
+            rows,
+            docs,
+            dim=int(get_settings().OPENAI_EMBED_DIM),
+            version=version,
+            ann_min_rows=self.ann_min_rows,
+        )
+        # a write landed while loading -> serve this result once, do not keep it
+        if version == self.version(company_code):
+            # a (re)build is a new index state too: versioned caches (kb_search_cache) must not carry over
+            self._bump(company_code)
+            part.version = self.version(company_code)
+            self._partitions[company_code] = part
+        logger.info(
+            "vector index built company=%s rows=%s ann=%s elapsed_ms=%.1f",
+            company_code, len(part), part.stats()["ann"], (time.perf_counter() - t0) * 1000,
+        )
+        return part
+
+    async def get(self, company_code: str, loader: Loader, refresh_loader: Optional[Loader] = None) -> VectorPartition:
+        """
+        The company's partition, built on first use. refresh_loader: loader with its own DB session for
+        the background rebuild of an expired partition (the request session is closed by then).
+        """
+        part = self._partitions.get(company_code)
+        if part is not None and part.version == self.version(company_code):
+            if self._is_expired(part) and refresh_loader is not None:
+                self._refresh_in_background(company_code, refresh_loader)
+            return part
+
+        lock = self._locks.setdefault(company_code, asyncio.Lock())
+        async with lock:
+            part = self._partitions.get(company_code)
+            if part is not None and part.version == self.version(company_code):
+                return part
+            return await self._build(company_code, loader)
+
+    def _refresh_in_background(self, company_code: str, loader: Loader) -> None:
+        task = self._refreshing.get(company_code)
+        if task is not None and not task.done():
+            return
+
+        async def _run() -> None:
+            try:
+                async with self._locks.setdefault(company_code, asyncio.Lock()):
+                    await self._build(company_code, loader)
+            except Exception as e:
+                logger.warning("vector index refresh failed company=%s: %s", company_code, e)
+
+        self._refreshing[company_code] = asyncio.create_task(_run())
+
+    async def search(
+        self,
+        company_code: str,
+        loader: Loader,
+        query: Sequence[float],
+        top_k: int,
+        filters: Optional[Mapping[str, Any]] = None,
+        *,
+        refresh_loader: Optional[Loader] = None,
+    ) -> List[VectorHit]:
+        part = await self.get(company_code, loader, refresh_loader)
+        if len(part) <= INLINE_SEARCH_ROWS:
+            return part.search(query, top_k, filters)
+        return await asyncio.to_thread(part.search, query, top_k, filters)
+
+    async def lexical_search(
+        self,
+        company_code: str,
+        loader: Loader,
+        query: str,
+        top_k: int,
+        filters: Optional[Mapping[str, Any]] = None,
+        *,
+        refresh_loader: Optional[Loader] = None,
+    ) -> List[VectorHit]:
+        part = await self.get(company_code, loader, refresh_loader)
+        if len(part) <= INLINE_SEARCH_ROWS:
+            return part.search_lexical(query, top_k, filters)
+        return await asyncio.to_thread(part.search_lexical, query, top_k, filters)
+
+    async def warm(self, company_codes: Iterable[str], loader_for: Callable[[str], Loader]) -> None:
+        """Startup hydration, one company at a time (failures are logged, the company loads lazily)."""
+        for cc in company_codes:
+            try:
+                await self.get(cc, loader_for(cc))
+            except Exception as e:
+                logger.warning("vector index hydration failed company=%s: %s", cc, e)
+
+    # ---- write paths (call after commit) ----
+    def upsert(self, company_code: str, rows: Sequence[VectorRow], docs: Sequence[VectorDoc] = ()) -> None:
+        self._bump(company_code)
+        part = self._partitions.get(company_code)
+        if part is not None:
+            for d in docs:
+                part.set_document(d)
+            part.upsert(rows)
+
+    def remove(self, company_code: str, chunk_ids: Iterable[UUID]) -> None:
+        self._bump(company_code)
+        part = self._partitions.get(company_code)
+        if part is not None:
+            part.remove(chunk_ids)
+
+    def remove_document(self, company_code: str, document_id: UUID) -> None:
+        self._bump(company_code)
+        part = self._partitions.get(company_code)
+        if part is not None:
+            part.remove_document(document_id)
+
+    def set_document(self, company_code: str, doc: VectorDoc) -> None:
+        """Document attributes changed (doc_type / language / tags): filters see it immediately."""
+        self._bump(company_code)
+        part = self._partitions.get(company_code)
+        if part is not None:
+            part.set_document(doc)
+
+    def has_document(self, company_code: str, document_id: UUID) -> bool:
+        """True if the loaded partition holds live rows of the document (False when not loaded)."""
+        part = self._partitions.get(company_code)
+        return part is not None and part.has_document(document_id)
+
+    def invalidate(self, company_code: str) -> None:
+        self._bump(company_code)
+        self._partitions.pop(company_code, None)
+
+    async def aclose(self) -> None:
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {cc: part.stats() for cc, part in self._partitions.items()}
+
+
+kb_vector_index = VectorIndex()
@@ -47,4 +47,48 @@ def filter_items_in_memory(
 def page_items(items: List[Any], limit: int, offset: int) -> List[Any]:
     if limit <= 0:
         return []
-    return (items or [])[offset : offset + limit]
\ No newline at end of file
+    return (items or [])[offset : offset + limit]
+
+def sort_items_in_memory(
+    items: List[Any],
+    *,
+    sort_by: Optional[str],
+    sort_dir: str = "asc",
+    default_candidates: tuple = ("updated_at", "created_at", "id"),
+    tie_breaker: Optional[str] = "id",
+) -> List[Any]:
+    """
+    Same ordering rules as the SQL search repositories:
+    - sort_by=None -> first of default_candidates present on the items
+    - NULLs last on asc, first on desc (Postgres default)
+    - deterministic tie-breaker (id asc)
+    """
+    out = list(items or [])
+    if not out:
+        return out
+
+    def has_field(field: str) -> bool:
+        x = out[0]
+        return field in x if isinstance(x, dict) else hasattr(x, field)
+
+    if sort_by is None:
+        for cand in default_candidates:
+            if has_field(cand):
+                sort_by = cand
+                break
+
+    if not sort_by or not has_field(sort_by):
+        return out
+
+    def key_of(field: str):
+        def _key(x: Any):
+            v = x.get(field) if isinstance(x, dict) else getattr(x, field, None)
+            return (v is None, v) if v is not None else (True, 0)
+        return _key
+
+    # list.sort is stable -> sort by tie-breaker first, then by the main column
+    if tie_breaker and tie_breaker != sort_by and has_field(tie_breaker):
+        out.sort(key=key_of(tie_breaker))
+
+    out.sort(key=key_of(sort_by), reverse=(sort_dir or "").lower() == "desc")
+    return out
@@ -85,6 +85,29 @@ def respond_list_paged(
     )
 
 
+def _weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Any, etag: Optional[str]) -> bool:
+    """
+    If-None-Match check (weak comparison, RFC 9110):
+    - True => caller should answer 304 Not Modified
+    """
+    if not etag:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",") if t.strip()]
+    return "*" in tags or _weak(etag) in {_weak(t) for t in tags}
+
+
+def not_modified(etag: str) -> StarletteResponse:
+    return StarletteResponse(status_code=304, headers={"ETag": etag})
+
+
 async def run_or_500(
     fn: Callable[[], Any],
     logger: Optional[Any] = None,   # backward compatible
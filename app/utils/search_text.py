@@ -0,0 +1,112 @@
+# app/utils/search_text.py
+
+"""Normalization helpers for keyword search (Thai + English names, phone numbers)."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import List
+
+# zero-width / joiner characters that Thai keyboards and copy-paste leave behind
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"), None)
+_NON_DIGITS = re.compile(r"\D")
+_PHONE_CHARS = re.compile(r"^[0-9+\-\s().]+$")
+
+# honorifics typed in front of names; removed only as a leading token
+_NAME_TITLES = (
+    "นางสาว", "นาย", "นาง", "ด.ช.", "ด.ญ.", "เด็กชาย", "เด็กหญิง", "น.ส.", "คุณ",
+    "mr.", "mrs.", "ms.", "miss", "mr", "mrs", "ms", "dr.", "dr",
+)
+
+
+def normalize_text(value: str | None) -> str:
+    """NFC, drop zero-width chars, lower-case, collapse whitespace."""
+    if not value:
+        return ""
+    if not value.isascii():
+        value = unicodedata.normalize("NFC", value).translate(_INVISIBLE)
+    return " ".join(value.split()).lower()
+
+
+# a Thai word starts with a consonant (ก-ฮ) or a leading vowel (เ แ โ ใ ไ), never with a following
+# vowel (ะ า ำ) or a combining mark (ิ ี ุ ู ั ็ ่ ้ ...): "คุณากร" / "นายิกา" are names, not titles
+_THAI_WORD_START = re.compile(r"[\u0e01-\u0e2e\u0e40-\u0e44]")
+# without a separator, what follows a Thai title must still look like a name ("นางฟ้า" is a word)
+_MIN_THAI_NAME_CHARS = 3
+
+
+def _spacing_chars(word: str) -> int:
+    return sum(1 for c in word if unicodedata.category(c) != "Mn")
+
+
+def strip_name_title(value: str) -> str:
+    """'นายสมชาย ใจดี' -> 'สมชาย ใจดี', 'mr. john' -> 'john' (expects normalize_text() output)."""
+    for title in _NAME_TITLES:
+        if not value.startswith(title) or len(value) == len(title):
+            continue
+        nxt = value[len(title)]
+        rest = value[len(title):].lstrip(" .")
+        if not rest:
+            continue
+        if nxt in " .":
+            return rest
+        # glued to the name: Latin titles never ("mrs" vs "mrsomething"); Thai only at a word start
+        if title.isascii() or not _THAI_WORD_START.match(nxt):
+            continue
+        if _spacing_chars(rest.split(" ", 1)[0]) >= _MIN_THAI_NAME_CHARS:
+            return rest
+    return value
+
+
+def digits_only(value: str | None) -> str:
+    return _NON_DIGITS.sub("", value or "")
+
+
+def looks_like_phone_or_id(value: str) -> bool:
+    """Only digits and phone punctuation (+66 81-234 5678, 1-2345-67890-12-3)."""
+    return bool(value) and bool(_PHONE_CHARS.match(value)) and any(c.isdigit() for c in value)
+
+
+def normalize_th_phone(value: str | None) -> str:
+    """Digits with the Thai country code folded to a leading 0: '+66 81 234 5678' -> '0812345678'."""
+    d = digits_only(value)
+    if (value or "").lstrip().startswith("+66") or (d.startswith("66") and len(d) in (10, 11)):
+        d = "0" + d[2:]
+    return d
+
+
+def search_tokens(value: str) -> List[str]:
+    """Whitespace tokens of an already normalized query, longest first (most selective)."""
+    return sorted({t for t in value.split(" ") if t}, key=len, reverse=True)
+
+
+# Thai script run / Latin-digit run (drug names, doses: "paracetamol", "500mg", "covid-19")
+_LEXICAL_RUNS = re.compile(r"[\u0e01-\u0e4e]+|[a-z0-9]+(?:[.\-][a-z0-9]+)*")
+# tone marks are the most common Thai typo / variant: ignored for matching
+_THAI_TONES = dict.fromkeys(map(ord, "\u0e48\u0e49\u0e4a\u0e4b"), None)
+
+
+def lexical_tokens(value: str | None) -> List[str]:
+    """
+    Terms for the BM25 index, in order, duplicates kept (term frequency).
+
+    Thai has no spaces between words and dictionary segmentation splits drug names and
+    transliterations inconsistently, so Thai runs become overlapping character bigrams
+    ('ปวดหัว' -> 'ปว', 'วด', 'ดห', 'หั', 'ัว'); Latin / digit runs stay whole words.
+    """
+    tokens: List[str] = []
+    for run in _LEXICAL_RUNS.findall(normalize_text(value)):
+        if run[0].isascii():
+            tokens.append(run)
+            continue
+        run = run.translate(_THAI_TONES)
+        if len(run) < 3:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def escape_like(value: str, escape: str = "\\") -> str:
+    return value.replace(escape, escape * 2).replace("%", escape + "%").replace("_", escape + "_")
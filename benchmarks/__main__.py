@@ -0,0 +1,121 @@
+# benchmarks/__main__.py
+
+"""
+python -m benchmarks seed --scale small
+python -m benchmarks run  --scale small --requests 50 [--only bookings.grid] [--json out.json]
+python -m benchmarks all  --scale tiny
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import List, Optional
+
+from benchmarks.config import SCALES, BenchConfig, load_config
+
+
+def _configure_app_env(cfg: BenchConfig, supabase_url: str) -> None:
+    # must happen before app.* is imported (get_settings() is lru_cached)
+    os.environ["DATABASE_URL"] = cfg.database_url
+    os.environ["SSL_MODE"] = "disable"
+    os.environ["AUTH_MODE"] = "DEV"
+    os.environ["SUPABASE_URL"] = supabase_url
+    os.environ["SUPABASE_KEY"] = "bench.bench.bench"
+    os.environ["SUPABASE_JWT_SECRET"] = "bench-secret"
+    os.environ["ENABLE_DOCS"] = "0"
+
+
+def _scale_name(cfg: BenchConfig) -> str:
+    return next((k for k, v in SCALES.items() if v == cfg.scale), "custom")
+
+
+async def _seed(cfg: BenchConfig) -> None:
+    from benchmarks.seed import seed
+
+    report = await seed(cfg)
+    total = sum(report.rows.values())
+    print(f"seeded {total} rows in {report.seconds:.1f}s (scale={_scale_name(cfg)})")
+    for table, n in sorted(report.rows.items(), key=lambda kv: -kv[1]):
+        print(f"  {table:<32} {n:>10}")
+
+
+async def _run(cfg: BenchConfig, supabase_url: str, stub_stats, *, requests: int, warmup: int,
+               only: Optional[List[str]], json_out: Optional[str]) -> int:
+    _configure_app_env(cfg, supabase_url)
+
+    from app.database.database import engine
+    from app.main import app
+
+    from benchmarks.harness import QueryCounter, Runner, format_table
+    from benchmarks.scenarios import default_scenarios, load_context
+
+    ctx = await load_context(cfg.asyncpg_dsn)
+    scenarios = default_scenarios(ctx)
+    if only:
+        scenarios = [s for s in scenarios if any(s.name.startswith(o) for o in only)]
+
+    counter = QueryCounter(engine)
+    runner = Runner(app, app_queries=counter, stub_stats=stub_stats)
+    results = []
+    try:
+        for sc in scenarios:
+            results.append(await runner.run(sc, requests=requests, warmup=warmup))
+            print(f"  done {sc.name}", file=sys.stderr)
+    finally:
+        counter.close()
+        await engine.dispose()
+
+    print(f"scale={_scale_name(cfg)} company={ctx.company_code} date={ctx.booking_date}")
+    print(format_table(results))
+
+    if json_out:
+        with open(json_out, "w", encoding="utf-8") as f:
+            json.dump(
+                {"scale": _scale_name(cfg), "context": ctx.__dict__, "results": [r.as_dict() for r in results]},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+    return 1 if any(r.errors for r in results) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("command", choices=["seed", "run", "all"])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", action="append", help="scenario name prefix (repeatable)")
+    parser.add_argument("--json", dest="json_out", help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    cfg = load_config(args.scale)
+
+    if args.command in ("seed", "all"):
+        asyncio.run(_seed(cfg))
+    if args.command == "seed":
+        return 0
+
+    from benchmarks.postgrest_stub import StubServer
+
+    with StubServer(cfg.asyncpg_dsn) as server:
+        stub = server.stub
+        return asyncio.run(
+            _run(
+                cfg,
+                server.url,
+                lambda: (stub.http_requests, stub.sql_statements),
+                requests=args.requests,
+                warmup=args.warmup,
+                only=args.only,
+                json_out=args.json_out,
+            )
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+# benchmarks/harness.py
+
+"""
+In-process endpoint runner: ASGI client -> app, per request latency, SQL count, allocations.
+
+- latency: wall time of the ASGI call (httpx.ASGITransport, no sockets)
+- queries: statements on the app engine (SQLAlchemy cursor events)
+           + HTTP calls / SQL statements served by the PostgREST stand-in
+- allocations: separate tracemalloc pass (peak + retained per request), so tracing
+  overhead does not leak into the latency numbers
+"""
+
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """Counts statements executed through an AsyncEngine (or its sync_engine)."""
+
+    def __init__(self, engine: Any):
+        self.count = 0
+        self._target = getattr(engine, "sync_engine", engine)
+        event.listen(self._target, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args: Any, **kwargs: Any) -> None:
+        self.count += 1
+
+    def close(self) -> None:
+        event.remove(self._target, "before_cursor_execute", self._on_execute)
+
+
+@dataclass
+class Scenario:
+    name: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    method: str = "GET"
+    json: Optional[Any] = None
+    expect: int = 200
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    errors: int
+    status: Dict[int, int]
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    mean_ms: float
+    sql_per_req: float
+    rest_per_req: float
+    rest_sql_per_req: float
+    alloc_peak_kib: Optional[float] = None
+    alloc_retained_kib: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    k = (len(s) - 1) * pct / 100.0
+    lo, hi = int(k), min(int(k) + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+
+class Runner:
+    def __init__(
+        self,
+        app: Any,
+        *,
+        app_queries: QueryCounter,
+        stub_stats: Optional[Callable[[], tuple[int, int]]] = None,
+        base_url: str = "http://bench.local",
+    ):
+        self.app = app
+        self.app_queries = app_queries
+        self.stub_stats = stub_stats or (lambda: (0, 0))
+        self.base_url = base_url
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url=self.base_url, timeout=120)
+
+    async def _call(self, client: httpx.AsyncClient, sc: Scenario) -> httpx.Response:
+        return await client.request(sc.method, sc.path, params=sc.params, json=sc.json)
+
+    async def run(self, sc: Scenario, *, requests: int = 50, warmup: int = 3, alloc_requests: int = 5) -> ScenarioResult:
+        latencies: List[float] = []
+        status: Dict[int, int] = {}
+        errors = 0
+
+        async with self._client() as client:
+            for _ in range(warmup):
+                await self._call(client, sc)
+
+            q0 = self.app_queries.count
+            r0, s0 = self.stub_stats()
+            gc.collect()
+            for _ in range(requests):
+                t0 = time.perf_counter()
+                resp = await self._call(client, sc)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                status[resp.status_code] = status.get(resp.status_code, 0) + 1
+                if resp.status_code != sc.expect:
+                    errors += 1
+            q1 = self.app_queries.count
+            r1, s1 = self.stub_stats()
+
+            peak = retained = None
+            if alloc_requests:
+                peaks, kept = [], []
+                tracemalloc.start()
+                try:
+                    for _ in range(alloc_requests):
+                        gc.collect()
+                        before, _ = tracemalloc.get_traced_memory()
+                        tracemalloc.reset_peak()
+                        await self._call(client, sc)
+                        after, top = tracemalloc.get_traced_memory()
+                        peaks.append((top - before) / 1024)
+                        kept.append((after - before) / 1024)
+                finally:
+                    tracemalloc.stop()
+                peak, retained = statistics.median(peaks), statistics.median(kept)
+
+        n = max(requests, 1)
+        return ScenarioResult(
+            name=sc.name,
+            requests=requests,
+            errors=errors,
+            status=status,
+            p50_ms=percentile(latencies, 50),
+            p90_ms=percentile(latencies, 90),
+            p99_ms=percentile(latencies, 99),
+            max_ms=max(latencies) if latencies else 0.0,
+            mean_ms=statistics.fmean(latencies) if latencies else 0.0,
+            sql_per_req=(q1 - q0) / n,
+            rest_per_req=(r1 - r0) / n,
+            rest_sql_per_req=(s1 - s0) / n,
+            alloc_peak_kib=peak,
+            alloc_retained_kib=retained,
+        )
+
+
+def format_table(results: List[ScenarioResult]) -> str:
+    header = (
+        f"{'scenario':<28} {'n':>4} {'err':>4} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} "
+        f"{'sql/req':>8} {'rest/req':>9} {'peakKiB':>9} {'keptKiB':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.name:<28} {r.requests:>4} {r.errors:>4} {r.p50_ms:>8.1f} {r.p90_ms:>8.1f} {r.p99_ms:>8.1f} {r.max_ms:>8.1f} "
+            f"{r.sql_per_req:>8.1f} {r.rest_per_req:>9.1f} "
+            f"{(r.alloc_peak_kib or 0):>9.0f} {(r.alloc_retained_kib or 0):>8.0f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,216 @@
+# benchmarks/kb_retrieval.py
+
+"""
+KB retrieval quality + latency: vector vs BM25 (lexical) vs hybrid (reciprocal rank fusion).
+
+python -m benchmarks.kb_retrieval [--chunks 3000] [--k 1,5,10] [--repeat 5]
+python -m benchmarks.kb_retrieval --corpus chunks.jsonl --queries queries.jsonl
+
+Offline: builds the same in-process partition KB search serves from (app/services/vector_index.py)
+and embeds through EMBEDDING_BACKEND. With EMBEDDING_BACKEND=local (no API key) "vector" is a
+hashed character n-gram space, much closer to lexical matching than a real embedding model; run
+with the production backend for numbers that mean something.
+
+Without --corpus a synthetic Thai / English clinical corpus is generated: drug fact / side effect /
+symptom chunks among clinic boilerplate, queried by exact drug names (Thai and English) and by
+symptoms.
+
+  corpus lines:  {"id": "...", "text": "...", "document_id": "..."?}
+  queries lines: {"query": "...", "relevant": ["<corpus id>", ...]}
+
+Reports recall@k and MRR per mode, and latency: the query embedding (cold, once per query) and the
+index search per mode (p50 / p95 over --repeat passes). In the service hybrid runs BM25 while the
+query is embedded, so its end-to-end latency is about embed + vector + fusion.
+"""
+
+from __future__ import annotations
+
+import os
+
+# settings are read on first use; the harness needs no database, API keys only for a remote backend
+for _k, _v in {
+    "SUPABASE_URL": "http://bench.invalid",
+    "SUPABASE_KEY": "bench.bench.bench",
+    "SUPABASE_JWT_SECRET": "bench-secret",
+    "EMBEDDING_CACHE_DB": "false",
+}.items():
+    os.environ.setdefault(_k, _v)
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from app.core.clients.openai_client import get_openai_client
+from app.core.config import get_settings
+from app.services.embeddings import get_embedding_service
+from app.services.vector_index import VectorDoc, VectorPartition, VectorRow, reciprocal_rank_fusion
+
+from benchmarks.harness import percentile
+
+# (english, thai, symptom th, symptom en, side effect th)
+_DRUGS = [
+    ("paracetamol", "พาราเซตามอล", "ปวดหัว", "headache", "คลื่นไส้"),
+    ("ibuprofen", "ไอบูโพรเฟน", "ปวดกล้ามเนื้อ", "muscle pain", "ระคายเคืองกระเพาะ"),
+    ("amoxicillin", "อะม็อกซีซิลลิน", "เจ็บคอ", "sore throat", "ท้องเสีย"),
+    ("omeprazole", "โอเมพราโซล", "กรดไหลย้อน", "acid reflux", "ปวดศีรษะ"),
+    ("cetirizine", "เซทิริซีน", "ผื่นคัน", "itchy rash", "ง่วงนอน"),
+    ("loratadine", "ลอราทาดีน", "น้ำมูกไหล", "runny nose", "ปากแห้ง"),
+    ("metformin", "เมทฟอร์มิน", "เบาหวาน", "diabetes", "ท้องอืด"),
+    ("amlodipine", "แอมโลดิปีน", "ความดันสูง", "high blood pressure", "ข้อเท้าบวม"),
+    ("simvastatin", "ซิมวาสแตติน", "ไขมันสูง", "high cholesterol", "ปวดกล้ามเนื้อ"),
+    ("salbutamol", "ซาลบูทามอล", "หอบหืด", "asthma", "ใจสั่น"),
+    ("melatonin", "เมลาโทนิน", "นอนไม่หลับ", "insomnia", "ง่วงซึมตอนเช้า"),
+    ("loperamide", "โลเพอราไมด์", "ท้องเสีย", "diarrhea", "ท้องผูก"),
+    ("domperidone", "ดอมเพอริโดน", "คลื่นไส้", "nausea", "ปากแห้ง"),
+    ("dimenhydrinate", "ไดเมนไฮดริเนต", "เวียนหัว", "dizziness", "ง่วงนอน"),
+]
+_FILLER = [
+    "คลินิกเปิดให้บริการทุกวัน{day} เวลา {h}:00 ถึง {h2}:00 น. กรุณานัดหมายล่วงหน้าผ่านแอปพลิเคชัน",
+    "ผู้ป่วยใหม่กรุณานำบัตรประชาชนมาแสดงที่เคาน์เตอร์ชั้น {floor} เพื่อลงทะเบียนประวัติ",
+    "Our wellness packages include a consultation, body composition analysis and a follow-up call within {n} days.",
+    "สามารถชำระค่าบริการด้วยบัตรเครดิต โอนเงิน หรือเงินสด ใบเสร็จจะส่งทางอีเมลภายใน {n} วันทำการ",
+    "ที่จอดรถสำหรับผู้มารับบริการอยู่ที่อาคาร {floor} จอดฟรี {n} ชั่วโมงเมื่อประทับตราที่เคาน์เตอร์",
+    "Please arrive {n} minutes before your appointment; late arrivals may be rescheduled.",
+]
+_DAYS = ["จันทร์", "อังคาร", "พุธ", "พฤหัสบดี", "ศุกร์", "เสาร์"]
+
+Corpus = List[Tuple[str, str]]  # (id, text)
+Queries = List[Tuple[str, List[str]]]  # (query, relevant ids)
+
+
+def synthetic(chunks: int, seed: int) -> Tuple[Corpus, Queries]:
+    rnd = random.Random(seed)
+    corpus: Corpus = []
+    queries: Queries = []
+    for en, th, sym_th, sym_en, side in _DRUGS:
+        dose, times = rnd.choice([250, 500, 10, 20, 100]), rnd.randint(1, 4)
+        fact, side_id, sym_id = f"fact:{en}", f"side:{en}", f"sym:{en}"
+        corpus += [
+            (fact, f"{th} ({en}) ใช้บรรเทาอาการ{sym_th} ({sym_en}) ขนาดที่แนะนำ {dose} มิลลิกรัม วันละ {times} ครั้ง หลังอาหาร"),
+            (side_id, f"ผลข้างเคียงที่อาจพบจากการใช้{th} ได้แก่ {side} หากอาการรุนแรงควรหยุดยาและพบแพทย์"),
+            (sym_id, f"อาการ{sym_th} ควรพักผ่อนให้เพียงพอ ดื่มน้ำมาก ๆ หากไม่ดีขึ้นภายใน 3 วันควรพบแพทย์"),
+        ]
+        queries += [
+            (f"{en} dose", [fact]),
+            (f"{th} กินครั้งละเท่าไหร่", [fact]),
+            (f"{th} มีผลข้างเคียงไหม", [side_id]),
+            (f"{sym_th} กินยาอะไรดี", [fact, sym_id]),
+            (f"what helps with {sym_en}", [fact]),
+        ]
+    while len(corpus) < chunks:
+        text = rnd.choice(_FILLER).format(
+            day=rnd.choice(_DAYS), h=rnd.randint(7, 10), h2=rnd.randint(17, 21), floor=rnd.randint(1, 9), n=rnd.randint(2, 30)
+        )
+        corpus.append((f"filler:{len(corpus)}", text))
+    return corpus, queries
+
+
+def load_jsonl(corpus_path: str, queries_path: str) -> Tuple[Corpus, Queries]:
+    with open(corpus_path, encoding="utf-8") as f:
+        corpus = [(str(d["id"]), d["text"]) for d in map(json.loads, f) if d]
+    with open(queries_path, encoding="utf-8") as f:
+        queries = [(d["query"], [str(r) for r in d["relevant"]]) for d in map(json.loads, f) if d]
+    return corpus, queries
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    try:
+        await _evaluate(args)
+    finally:
+        await get_embedding_service().aclose()
+        if get_openai_client.cache_info().currsize:
+            await get_openai_client().aclose()
+
+
+async def _evaluate(args: argparse.Namespace) -> None:
+    if args.corpus:
+        corpus, queries = load_jsonl(args.corpus, args.queries)
+    else:
+        corpus, queries = synthetic(args.chunks, args.seed)
+    ks = sorted({int(k) for k in args.k.split(",")})
+    depth = max(max(ks), int(get_settings().KB_HYBRID_CANDIDATES))
+    rrf_k = int(get_settings().KB_RRF_K)
+    svc = get_embedding_service()
+
+    t0 = time.perf_counter()
+    vectors = await svc.embed_many([text for _, text in corpus], remember=False)
+    embed_corpus = time.perf_counter() - t0
+    doc = uuid.uuid4()
+    ids = {name: uuid.uuid5(uuid.NAMESPACE_URL, name) for name, _ in corpus}
+    names = {v: k for k, v in ids.items()}
+    t0 = time.perf_counter()
+    part = VectorPartition(
+        (VectorRow(chunk_id=ids[name], document_id=doc, embedding=v, text=text) for (name, text), v in zip(corpus, vectors)),
+        [VectorDoc(id=doc)],
+        dim=svc.backend.dim,
+        ann_min_rows=int(get_settings().KB_VECTOR_ANN_MIN_ROWS),
+    )
+    build = time.perf_counter() - t0
+    print(
+        f"backend={svc.backend.model} dim={svc.backend.dim} chunks={len(corpus)} queries={len(queries)} "
+        f"terms={part.stats()['terms']} ann={part.stats()['ann']} "
+        f"(corpus embedded in {embed_corpus:.1f}s, index built in {build * 1000:.0f}ms)"
+    )
+
+    embed_ms: List[float] = []
+    query_vecs = []
+    for q, _ in queries:
+        t0 = time.perf_counter()
+        query_vecs.append(await svc.embed(q))
+        embed_ms.append((time.perf_counter() - t0) * 1000)
+
+    modes: Dict[str, Callable[[str, Sequence[float]], List]] = {
+        "vector": lambda q, v: part.search(v, depth),
+        "lexical": lambda q, v: part.search_lexical(q, depth),
+        "hybrid": lambda q, v: reciprocal_rank_fusion(
+            {"vector": part.search(v, depth), "lexical": part.search_lexical(q, depth)}, k=rrf_k, top_k=depth
+        ),
+    }
+    header = f"{'mode':<8} " + " ".join(f"{f'R@{k}':>7}" for k in ks) + f" {'MRR':>7} {'p50':>9} {'p95':>9}"
+    print(header)
+    print("-" * len(header))
+    for mode, run in modes.items():
+        recall = {k: 0.0 for k in ks}
+        mrr = 0.0
+        latency: List[float] = []
+        for rep in range(args.repeat):
+            for (q, relevant), v in zip(queries, query_vecs):
+                t0 = time.perf_counter()
+                hits = run(q, v)
+                latency.append((time.perf_counter() - t0) * 1000)
+                if rep:
+                    continue
+                ranked = [names[h.chunk_id] for h in hits]
+                for k in ks:
+                    recall[k] += len(set(ranked[:k]) & set(relevant)) / len(relevant)
+                first = next((i for i, name in enumerate(ranked, start=1) if name in relevant), None)
+                mrr += 1.0 / first if first else 0.0
+        n = len(queries)
+        print(
+            f"{mode:<8} "
+            + " ".join(f"{recall[k] / n:>7.3f}" for k in ks)
+            + f" {mrr / n:>7.3f} {percentile(latency, 50):>7.2f}ms {percentile(latency, 95):>7.2f}ms"
+        )
+    print(f"{'embed':<8} " + " " * (8 * len(ks) + 8) + f"{percentile(embed_ms, 50):>7.2f}ms {percentile(embed_ms, 95):>7.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.kb_retrieval")
+    parser.add_argument("--corpus", default=None, help="chunks as JSON lines: {id, text}")
+    parser.add_argument("--queries", default=None, help="queries as JSON lines: {query, relevant: [id, ...]}")
+    parser.add_argument("--chunks", type=int, default=3000, help="synthetic corpus size")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--k", default="1,5,10", help="recall cut-offs")
+    parser.add_argument("--repeat", type=int, default=5, help="search passes per query (latency)")
+    args = parser.parse_args()
+    if bool(args.corpus) != bool(args.queries):
+        parser.error("--corpus and --queries go together")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
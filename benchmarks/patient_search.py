@@ -0,0 +1,176 @@
+# benchmarks/patient_search.py
+
+"""
+Patient keyword search: legacy ILIKE-OR vs trigram-indexed PatientsSearchRepository.
+
+python -m benchmarks.patient_search --patients 1000000 [--requests 30] [--explain]
+
+Tops up the patients table (BENCH_DATABASE_URL, seeded via `python -m benchmarks seed`)
+to --patients rows with COPY, then times a Thai / English / phone / code / id-card query mix.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+import asyncpg
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db.models.patient_settings import Patient
+from app.api.v1.modules.patients.repositories.patients_search_repository import PatientsSearchRepository
+
+from benchmarks.config import load_config
+from benchmarks.harness import percentile
+from benchmarks.seed import _FIRST_EN, _FIRST_TH, _LAST_EN, _LAST_TH
+
+_COMPANY = "PSRCH"
+_BATCH = 50_000
+_COLUMNS = ("id", "patient_code", "first_name_lo", "last_name_lo", "full_name_lo", "first_name_en", "last_name_en",
+            "full_name_en", "id_card_no", "email", "telephone", "sex", "birth_date", "status", "is_active")
+
+
+async def _top_up(dsn: str, target: int, seed: int) -> int:
+    conn = await asyncpg.connect(dsn, ssl=False)
+    try:
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        have = await conn.fetchval("select count(*) from patients")
+        start = await conn.fetchval("select count(*) from patients where patient_code like $1", f"{_COMPANY}-%")
+        rng = random.Random(seed)
+        n = start
+        while have < target:
+            rows = []
+            for _ in range(min(_BATCH, target - have)):
+                n += 1
+                i_first, i_last = rng.randrange(len(_FIRST_TH)), rng.randrange(len(_LAST_TH))
+                first_lo, last_lo = f"{_FIRST_TH[i_first]}{n % 97:02d}", _LAST_TH[i_last]
+                first_en, last_en = f"{_FIRST_EN[i_first]}{n % 97:02d}", _LAST_EN[i_last]
+                rows.append((
+                    uuid.UUID(int=rng.getrandbits(128), version=4), f"{_COMPANY}-P{n:08d}", first_lo, last_lo,
+                    f"{first_lo} {last_lo}", first_en, last_en, f"{first_en} {last_en}", f"9{n:012d}",
+                    f"p{n:08d}@psrch.local", f"08{rng.randrange(10**8):08d}", rng.choice(["M", "F"]),
+                    date(1950, 1, 1) + timedelta(days=rng.randrange(25_000)), "active", True,
+                ))
+            await conn.copy_records_to_table("patients", records=rows, columns=list(_COLUMNS))
+            have += len(rows)
+            print(f"  patients: {have}/{target}", flush=True)
+        await conn.execute("analyze patients")
+        return have
+    finally:
+        await conn.close()
+
+
+async def _query_mix(dsn: str) -> List[Tuple[str, str]]:
+    conn = await asyncpg.connect(dsn, ssl=False)
+    try:
+        r = await conn.fetchrow(
+            "select patient_code, first_name_lo, last_name_lo, first_name_en, id_card_no, telephone "
+            "from patients order by patient_code desc limit 1"
+        )
+    finally:
+        await conn.close()
+    return [
+        ("thai.name", f"{r['first_name_lo']} {r['last_name_lo']}"),
+        ("thai.title", f"นาย{r['first_name_lo']}"),
+        ("english.name", (r["first_name_en"] or "").lower()),
+        ("phone.fragment", (r["telephone"] or "")[-6:]),
+        ("phone.intl", "+66 " + (r["telephone"] or "0")[1:]),
+        ("patient_code", r["patient_code"]),
+        ("id_card", r["id_card_no"]),
+    ]
+
+
+def _legacy_stmt(q: str, limit: int = 50):
+    # pre-index implementation: seven ILIKE '%q%' ORed + a separate count
+    like = f"%{q}%"
+    cond = or_(
+        Patient.first_name_lo.ilike(like), Patient.last_name_lo.ilike(like), Patient.first_name_en.ilike(like),
+        Patient.last_name_en.ilike(like), Patient.patient_code.ilike(like), Patient.telephone.ilike(like),
+        Patient.id_card_no.ilike(like),
+    )
+    page = select(Patient.id, Patient.patient_code, Patient.full_name_lo).where(Patient.is_active.is_(True), cond) \
+        .order_by(Patient.created_at.desc()).limit(limit)
+    total = select(func.count()).select_from(Patient).where(Patient.is_active.is_(True), cond)
+    return page, total
+
+
+async def _time(fn, requests: int) -> Dict[str, float]:
+    await fn()  # warm-up
+    samples = []
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return {"p50": percentile(samples, 50), "p95": percentile(samples, 95)}
+
+
+def _literal_sql(stmt: Any, dialect: Any) -> str:
+    return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+async def _explain(session: AsyncSession, sql: str, params: Any = ()) -> str:
+    conn = await session.connection()
+    rows = (await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)).all()
+    return "\n".join(r[0] for r in rows)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    cfg = load_config()
+    total = await _top_up(cfg.asyncpg_dsn, args.patients, cfg.seed)
+    mix = await _query_mix(cfg.asyncpg_dsn)
+
+    engine = create_async_engine(cfg.database_url, poolclass=NullPool, connect_args={"ssl": False})
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    captured: List[Tuple[str, Any]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        captured.append((statement, parameters))
+
+    print(f"\npatients={total} requests={args.requests}")
+    print(f"{'query':<16} {'legacy p50':>11} {'legacy p95':>11} {'new p50':>9} {'new p95':>9} {'hits':>6}")
+    try:
+        async with sessions() as session:
+            repo = PatientsSearchRepository(session)
+            for name, q in mix:
+                page, count = _legacy_stmt(q)
+
+                async def legacy() -> None:
+                    await session.execute(page)
+                    await session.execute(count)
+
+                async def indexed() -> int:
+                    _, n = await repo.search_projection(q_text=q, sort_by="relevance")
+                    return n
+
+                old = await _time(legacy, args.requests)
+                new = await _time(indexed, args.requests)
+                hits = await indexed()
+                print(f"{name:<16} {old['p50']:>9.1f}ms {old['p95']:>9.1f}ms {new['p50']:>7.1f}ms {new['p95']:>7.1f}ms {hits:>6}")
+
+                if args.explain:
+                    sql, params = captured[-1]  # the repository's page query from indexed()
+                    print(f"--- {name} legacy\n{await _explain(session, _literal_sql(page, engine.dialect))}")
+                    print(f"--- {name} indexed\n{await _explain(session, sql, params)}")
+                captured.clear()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.patient_search")
+    parser.add_argument("--patients", type=int, default=1_000_000, help="top the patients table up to this many rows")
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--explain", action="store_true", help="print EXPLAIN ANALYZE of both queries")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+# benchmarks/postgrest_stub.py
+
+"""
+Local PostgREST stand-in.
+
+Serves the subset of the PostgREST HTTP API that supabase-py sends from the
+Supabase-backed repositories (table select/insert/update/delete with filters,
+or=(...), order, limit/offset or Range, count=exact, single object, rpc), and
+runs it as SQL on the benchmark database. Point SUPABASE_URL at it and the
+repositories run unchanged, minus the network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as _dt
+import decimal
+import json
+import re
+import socket
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncpg
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+_OPS = {"eq": "=", "neq": "<>", "gt": ">", "gte": ">=", "lt": "<", "lte": "<=", "like": "LIKE", "ilike": "ILIKE"}
+_RESERVED = {"select", "order", "limit", "offset", "or", "and", "on_conflict", "columns"}
+_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class PostgrestError(Exception):
+    def __init__(self, status: int, message: str, code: str = "PGRST100"):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.code = code
+
+
+def _json_default(v: Any) -> Any:
+    if isinstance(v, (uuid.UUID,)):
+        return str(v)
+    if isinstance(v, (_dt.datetime, _dt.date, _dt.time)):
+        return v.isoformat()
+    if isinstance(v, decimal.Decimal):
+        return float(v)
+    if isinstance(v, _dt.timedelta):
+        return str(v)
+    raise TypeError(f"not JSON serializable: {type(v).__name__}")
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _q(ident: str) -> str:
+    if not _IDENT.match(ident):
+        raise PostgrestError(400, f"invalid identifier: {ident!r}")
+    return f'"{ident}"'
+
+
+def split_top_level(s: str, sep: str = ",") -> List[str]:
+    """Split on sep outside parentheses / double quotes."""
+    out, buf, depth, quoted = [], [], 0, False
+    for ch in s:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        if ch == sep and depth == 0 and not quoted:
+            out.append("".join(buf))
+            buf = []
+        else:
+            buf.append(ch)
+    if buf:
+        out.append("".join(buf))
+    return out
+
+
+def _unquote(v: str) -> str:
+    v = v.strip()
+    return v[1:-1] if len(v) >= 2 and v[0] == v[-1] == '"' else v
+
+
+@dataclass
+class TableInfo:
+    name: str
+    columns: Dict[str, str]  # column -> udt name (uuid, int4, varchar, ...)
+    is_view: bool = False
+
+
+class SqlBuilder:
+    """Translate one PostgREST request into (sql, args)."""
+
+    def __init__(self, table: TableInfo):
+        self.table = table
+        self.args: List[Any] = []
+
+    def _param(self, value: Any, cast: Optional[str] = None) -> str:
+        self.args.append(value)
+        ref = f"${len(self.args)}"
+        return f"{ref}::{cast}" if cast else ref
+
+    def _col(self, name: str) -> Tuple[str, str]:
+        if name not in self.table.columns:
+            raise PostgrestError(400, f"column {self.table.name}.{name} does not exist", "42703")
+        return f"{_q(self.table.name)}.{_q(name)}", self.table.columns[name]
+
+    def condition(self, column: str, expr: str) -> str:
+        col, udt = self._col(column)
+        negate = expr.startswith("not.")
+        if negate:
+            expr = expr[4:]
+        op, _, raw = expr.partition(".")
+
+        if op == "is":
+            v = raw.lower()
+            sql = f"{col} IS {'NULL' if v == 'null' else 'TRUE' if v == 'true' else 'FALSE'}"
+        elif op == "in":
+            items = [_unquote(x) for x in split_top_level(raw.strip()[1:-1])] if raw.strip() not in ("()", "") else []
+            sql = f"{col} = ANY({self._param(items, 'text[]')}::{udt}[])"
+        elif op in ("like", "ilike"):
+            sql = f"{col}::text {_OPS[op]} {self._param(raw.replace('*', '%'), 'text')}"
+        elif op in _OPS:
+            sql = f"{col} {_OPS[op]} {self._param(_unquote(raw), 'text')}::{udt}"
+        else:
+            raise PostgrestError(400, f"unsupported operator: {op}")
+        return f"NOT ({sql})" if negate else sql
+
+    def logic(self, op: str, body: str) -> str:
+        # or=(a.eq.1,b.ilike.*x*,and(c.eq.2,d.is.null))
+        parts = []
+        for item in split_top_level(body.strip()[1:-1]):
+            item = item.strip()
+            m = re.match(r"^(not\.)?(or|and)\((.*)\)$", item)
+            if m:
+                inner = self.logic(m.group(2), f"({m.group(3)})")
+                parts.append(f"NOT {inner}" if m.group(1) else inner)
+                continue
+            column, _, expr = item.partition(".")
+            parts.append(self.condition(column, expr))
+        joiner = " OR " if op == "or" else " AND "
+        return "(" + joiner.join(parts or ["TRUE"]) + ")"
+
+    def where(self, params: List[Tuple[str, str]]) -> str:
+        conds = []
+        for key, value in params:
+            if key in ("or", "and"):
+                conds.append(self.logic(key, value))
+            elif key.startswith("not.") and key[4:] in ("or", "and"):
+                conds.append("NOT " + self.logic(key[4:], value))
+            elif key not in _RESERVED:
+                conds.append(self.condition(key, value))
+        return (" WHERE " + " AND ".join(conds)) if conds else ""
+
+    def projection(self, select: Optional[str]) -> str:
+        if not select or select.strip() == "*":
+            return "*"
+        cols = []
+        for item in split_top_level(select):
+            item = item.strip()
+            if "(" in item:
+                raise PostgrestError(400, f"resource embedding is not supported by the stand-in: {item}")
+            alias, _, name = item.rpartition(":")
+            name = name.split("::")[0]
+            col, _ = self._col(name)
+            cols.append(f"{col} AS {_q(alias or name)}")
+        return ", ".join(cols)
+
+    def order_by(self, order: Optional[str]) -> str:
+        if not order:
+            return ""
+        terms = []
+        for item in order.split(","):
+            bits = item.strip().split(".")
+            col, _ = self._col(bits[0])
+            direction = "DESC" if "desc" in bits[1:] else "ASC"
+            nulls = " NULLS FIRST" if "nullsfirst" in bits[1:] else " NULLS LAST" if "nullslast" in bits[1:] else ""
+            terms.append(f"{col} {direction}{nulls}")
+        return " ORDER BY " + ", ".join(terms)
+
+
+class PostgrestStub:
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self.pool: Optional[asyncpg.Pool] = None
+        self.tables: Dict[str, TableInfo] = {}
+        self.http_requests = 0
+        self.sql_statements = 0
+
+    # ---------- lifecycle ----------
+    async def start(self) -> None:
+        async def init(conn: asyncpg.Connection) -> None:
+            for t in ("json", "jsonb"):
+                await conn.set_type_codec(t, encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+
+        self.pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=8, ssl=False, init=init)
+        await self.refresh_schema()
+
+    async def stop(self) -> None:
+        if self.pool is not None:
+            await self.pool.close()
+
+    async def refresh_schema(self) -> None:
+        rows = await self.pool.fetch(
+            """
+            select c.table_name, c.column_name, c.udt_name, t.table_type
+            from information_schema.columns c
+            join information_schema.tables t
+              on t.table_schema = c.table_schema and t.table_name = c.table_name
+            where c.table_schema = 'public'
+            """
+        )
+        tables: Dict[str, TableInfo] = {}
+        for r in rows:
+            info = tables.setdefault(r["table_name"], TableInfo(r["table_name"], {}, r["table_type"] == "VIEW"))
+            info.columns[r["column_name"]] = r["udt_name"]
+        self.tables = tables
+
+    def _table(self, name: str) -> TableInfo:
+        info = self.tables.get(name)
+        if info is None:
+            raise PostgrestError(404, f'relation "public.{name}" does not exist', "42P01")
+        return info
+
+    async def _fetch(self, sql: str, args: List[Any]) -> List[dict]:
+        self.sql_statements += 1
+        async with self.pool.acquire() as conn:
+            return [dict(r) for r in await conn.fetch(sql, *args)]
+
+    # ---------- handlers ----------
+    @staticmethod
+    def _range(request: Request, params: Dict[str, str]) -> Tuple[Optional[int], int]:
+        limit = int(params["limit"]) if "limit" in params else None
+        offset = int(params.get("offset") or 0)
+        rng = request.headers.get("range")
+        if rng and "-" in rng:
+            a, _, b = rng.partition("-")
+            offset = int(a)
+            if b:
+                limit = int(b) - int(a) + 1
+        return limit, offset
+
+    async def select(self, request: Request, table: TableInfo) -> Response:
+        items = list(request.query_params.multi_items())
+        params = dict(items)
+        b = SqlBuilder(table)
+        where = b.where(items)
+        sql = f"SELECT {b.projection(params.get('select'))} FROM {_q(table.name)}{where}{b.order_by(params.get('order'))}"
+        limit, offset = self._range(request, params)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        if offset:
+            sql += f" OFFSET {int(offset)}"
+        rows = await self._fetch(sql, b.args)
+
+        headers = {}
+        prefer = request.headers.get("prefer", "")
+        end = offset + len(rows) - 1
+        content_range = f"{offset}-{end}" if rows else "*"
+        if "count=exact" in prefer or "count=planned" in prefer or "count=estimated" in prefer:
+            cb = SqlBuilder(table)
+            total = (await self._fetch(f"SELECT count(*) AS n FROM {_q(table.name)}{cb.where(items)}", cb.args))[0]["n"]
+            headers["Content-Range"] = f"{content_range}/{total}"
+        else:
+            headers["Content-Range"] = f"{content_range}/*"
+
+        if request.method == "HEAD":
+            return Response(status_code=200, headers=headers)
+        return self._respond(request, rows, 200, headers)
+
+    def _respond(self, request: Request, rows: List[dict], status: int, headers: Optional[dict] = None) -> Response:
+        accept = request.headers.get("accept", "")
+        if "vnd.pgrst.object" in accept:
+            if len(rows) != 1:
+                raise PostgrestError(406, f"JSON object requested, multiple (or no) rows returned ({len(rows)})", "PGRST116")
+            return Response(_dumps(rows[0]), status, headers=headers, media_type="application/json")
+        return Response(_dumps(rows), status, headers=headers, media_type="application/json")
+
+    async def insert(self, request: Request, table: TableInfo) -> Response:
+        body = json.loads(await request.body() or b"[]")
+        rows = body if isinstance(body, list) else [body]
+        if not rows:
+            return self._respond(request, [], 201)
+        keys = sorted({k for r in rows for k in r})
+        for k in keys:
+            SqlBuilder(table)._col(k)
+        cols = ", ".join(_q(k) for k in keys)
+        sql = (
+            f"INSERT INTO {_q(table.name)} ({cols}) "
+            f"SELECT {cols} FROM json_populate_recordset(NULL::{_q(table.name)}, $1::json) RETURNING *"
+        )
+        out = await self._fetch(sql, [json.dumps(rows, default=_json_default)])
+        return self._respond(request, out if "return=minimal" not in request.headers.get("prefer", "") else [], 201)
+
+    async def update(self, request: Request, table: TableInfo) -> Response:
+        data = json.loads(await request.body() or b"{}")
+        b = SqlBuilder(table)
+        for k in data:
+            b._col(k)
+        payload = b._param(json.dumps(data, default=_json_default), "json")
+        sets = ", ".join(f"{_q(k)} = _r.{_q(k)}" for k in data)
+        sql = (
+            f"UPDATE {_q(table.name)} SET {sets} FROM json_populate_record(NULL::{_q(table.name)}, {payload}) AS _r"
+            f"{b.where(list(request.query_params.multi_items()))} RETURNING {_q(table.name)}.*"
+        )
+        return self._respond(request, await self._fetch(sql, b.args), 200)
+
+    async def delete(self, request: Request, table: TableInfo) -> Response:
+        b = SqlBuilder(table)
+        sql = f"DELETE FROM {_q(table.name)}{b.where(list(request.query_params.multi_items()))} RETURNING *"
+        return self._respond(request, await self._fetch(sql, b.args), 200)
+
+    async def rpc(self, request: Request, fn: str) -> Response:
+        args = json.loads(await request.body() or b"{}") if request.method == "POST" else dict(request.query_params)
+        named = ", ".join(f"{_q(k)} => ${i}" for i, k in enumerate(args, 1))
+        rows = await self._fetch(f"SELECT * FROM {_q(fn)}({named})", list(args.values()))
+        # scalar functions come back as one column named after the function
+        if len(rows) == 1 and list(rows[0].keys()) == [fn]:
+            return Response(_dumps(rows[0][fn]), 200, media_type="application/json")
+        return self._respond(request, rows, 200)
+
+    async def handle(self, request: Request) -> Response:
+        self.http_requests += 1
+        path = request.path_params["path"].strip("/")
+        try:
+            if path.startswith("rpc/"):
+                return await self.rpc(request, path[4:])
+            table = self._table(path)
+            if request.method in ("GET", "HEAD"):
+                return await self.select(request, table)
+            if request.method == "POST":
+                return await self.insert(request, table)
+            if request.method == "PATCH":
+                return await self.update(request, table)
+            if request.method == "DELETE":
+                return await self.delete(request, table)
+            raise PostgrestError(405, f"method {request.method} not supported")
+        except PostgrestError as e:
+            return Response(_dumps({"code": e.code, "message": e.message, "details": None, "hint": None}), e.status, media_type="application/json")
+        except asyncpg.PostgresError as e:
+            return Response(_dumps({"code": e.sqlstate, "message": str(e), "details": None, "hint": None}), 400, media_type="application/json")
+
+    def asgi_app(self) -> Starlette:
+        methods = ["GET", "HEAD", "POST", "PATCH", "DELETE"]
+        return Starlette(
+            routes=[Route("/rest/v1/{path:path}", self.handle, methods=methods)],
+            on_startup=[self.start],
+            on_shutdown=[self.stop],
+        )
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class StubServer:
+    """Runs the stand-in with uvicorn on a background thread (supabase-py is a sync HTTP client)."""
+
+    def __init__(self, dsn: str, port: Optional[int] = None):
+        import uvicorn
+
+        self.stub = PostgrestStub(dsn)
+        self.port = port or _free_port()
+        self._server = uvicorn.Server(uvicorn.Config(self.stub.asgi_app(), host="127.0.0.1", port=self.port, log_level="warning"))
+        self._thread = threading.Thread(target=self._server.run, name="postgrest-stub", daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        for _ in range(200):
+            if self._server.started:
+                return self
+            if not self._thread.is_alive():
+                break
+            threading.Event().wait(0.05)
+        raise RuntimeError("PostgREST stand-in did not start")
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+async def _serve_forever(dsn: str, port: int) -> None:
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(PostgrestStub(dsn).asgi_app(), host="127.0.0.1", port=port))
+    await server.serve()
+
+
+if __name__ == "__main__":  # python -m benchmarks.postgrest_stub <dsn> [port]
+    import sys
+
+    asyncio.run(_serve_forever(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 54321))
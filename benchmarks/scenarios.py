@@ -0,0 +1,90 @@
+# benchmarks/scenarios.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+import asyncpg
+
+from benchmarks.harness import Scenario
+
+API = "/api/v1"
+
+
+@dataclass(frozen=True)
+class BenchContext:
+    company_code: str
+    location_id: str
+    building_id: str
+    room_id: str
+    booking_date: str
+    booking_id: str
+    patient_q: str
+    staff_q: str
+
+
+async def load_context(dsn: str) -> BenchContext:
+    """Pick realistic ids from the seeded data (busiest building/day, common names)."""
+    conn = await asyncpg.connect(dsn, ssl=False)
+    try:
+        row = await conn.fetchrow(
+            """
+            select company_code, location_id, building_id, booking_date, count(*) as n
+            from bookings
+            group by 1, 2, 3, 4
+            order by n desc, booking_date desc
+            limit 1
+            """
+        )
+        if row is None:
+            raise SystemExit("no bookings found: run `python -m benchmarks seed` first")
+        room = await conn.fetchrow(
+            "select room_id, id from bookings where building_id = $1 and booking_date = $2 limit 1",
+            row["building_id"], row["booking_date"],
+        )
+        patient = await conn.fetchval("select left(first_name_lo, 3) from patients limit 1")
+        staff = await conn.fetchval("select split_part(staff_name, ' ', 2) from staff where role = 'doctor' limit 1")
+    finally:
+        await conn.close()
+
+    return BenchContext(
+        company_code=row["company_code"],
+        location_id=str(row["location_id"]),
+        building_id=str(row["building_id"]),
+        room_id=str(room["room_id"]),
+        booking_date=row["booking_date"].isoformat(),
+        booking_id=str(room["id"]),
+        patient_q=patient or "สม",
+        staff_q=staff or "ใจดี",
+    )
+
+
+def default_scenarios(ctx: BenchContext) -> List[Scenario]:
+    grid = {
+        "date": ctx.booking_date,
+        "company_code": ctx.company_code,
+        "location_id": ctx.location_id,
+        "building_id": ctx.building_id,
+    }
+    return [
+        # --- Supabase-backed (PostgREST stand-in) ---
+        Scenario("bookings.grid", f"{API}/bookings/grid", grid),
+        Scenario("bookings.grid.columns", f"{API}/bookings/grid", {**grid, "format": "columns"}),
+        Scenario("bookings.search", f"{API}/bookings/search",
+                 {"company_code": ctx.company_code, "booking_date": ctx.booking_date, "limit": 50}),
+        # --- SQLAlchemy ---
+        Scenario("dashboard.inbox", f"{API}/doctor-dashboard/inbox",
+                 {"company_code": ctx.company_code, "booking_date": ctx.booking_date, "limit": 50}),
+        Scenario("dashboard.inbox.summary", f"{API}/doctor-dashboard/inbox/summary",
+                 {"company_code": ctx.company_code, "booking_date": ctx.booking_date}),
+        Scenario("dashboard.inbox.detail", f"{API}/doctor-dashboard/inbox/{ctx.booking_id}",
+                 {"company_code": ctx.company_code}),
+        Scenario("patients.search", f"{API}/patients/search", {"q": ctx.patient_q, "limit": 20}),
+        Scenario("patients.search.empty_q", f"{API}/patients/search", {"limit": 20}),
+        Scenario("staff.search", f"{API}/staff/search", {"q": ctx.staff_q, "limit": 20}),
+        Scenario("doctors.eligible", f"{API}/doctors/eligible",
+                 {"room_id": ctx.room_id, "location_id": ctx.location_id, "check_location": "true"}),
+        Scenario("masters.provinces.search", f"{API}/masters/provinces/search", {"q": "1", "limit": 50}),
+        Scenario("masters.geo_tree", f"{API}/masters/geo_tree"),
+    ]
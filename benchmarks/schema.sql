@@ -0,0 +1,65 @@
+-- benchmarks/schema.sql
+-- Objects the app reads that are not declared in app/db/models (views, config tables,
+-- columns added in the live database). Applied after Base.metadata.create_all().
+
+ALTER TABLE bookings ADD COLUMN IF NOT EXISTS consultation_type varchar(25);
+ALTER TABLE bookings ADD COLUMN IF NOT EXISTS note_status varchar(25);
+
+ALTER TABLE services ADD COLUMN IF NOT EXISTS service_code varchar(50);
+ALTER TABLE services ADD COLUMN IF NOT EXISTS service_name_th varchar(255);
+ALTER TABLE services ADD COLUMN IF NOT EXISTS service_name_en varchar(255);
+
+CREATE TABLE IF NOT EXISTS booking_timeslot_config (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    company_code varchar(50) NOT NULL,
+    location_id uuid NOT NULL,
+    building_id uuid NOT NULL,
+    time_from time NOT NULL,
+    time_to time NOT NULL,
+    slot_min integer NOT NULL,
+    is_active boolean NOT NULL DEFAULT true,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS booking_timeslot_exception (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    company_code varchar(50) NOT NULL,
+    location_id uuid NOT NULL,
+    building_id uuid NOT NULL,
+    date date NOT NULL,
+    time_from time,
+    time_to time,
+    slot_min integer,
+    is_closed boolean NOT NULL DEFAULT false,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_bench_bookings_grid
+    ON bookings (company_code, location_id, building_id, booking_date);
+
+CREATE OR REPLACE VIEW booking_grid_view AS
+SELECT
+    b.id                AS booking_id,
+    b.company_code,
+    b.location_id,
+    b.building_id,
+    b.room_id,
+    r.room_name,
+    b.patient_id,
+    p.full_name_lo      AS patient_name,
+    p.telephone         AS patient_telephone,
+    b.primary_person_id AS doctor_id,
+    st.staff_name       AS doctor_name,
+    b.service_id,
+    s.service_name,
+    b.booking_date,
+    b.start_time,
+    b.end_time,
+    b.status,
+    b.source_of_ad,
+    b.note
+FROM bookings b
+JOIN rooms r     ON r.id = b.room_id
+JOIN patients p  ON p.id = b.patient_id
+JOIN staff st    ON st.id = b.primary_person_id
+JOIN services s  ON s.id = b.service_id;
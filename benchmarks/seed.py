@@ -0,0 +1,299 @@
+# benchmarks/seed.py
+
+"""
+Synthetic clinic seed for a local, disposable Postgres.
+
+Schema = app/db/models (create_all) + benchmarks/schema.sql (views/tables the ORM does not declare).
+Data is deterministic for a given (scale, seed); rows are written with COPY.
+"""
+
+from __future__ import annotations
+
+import random
+import time as _time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import asyncpg
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db.base import Base
+import app.db.models  # noqa: F401  (register tables on Base.metadata)
+
+from benchmarks.config import BenchConfig
+
+SCHEMA_SQL = Path(__file__).with_name("schema.sql")
+
+_FIRST_TH = ["สมชาย", "สมหญิง", "วิชัย", "มาลี", "ประเสริฐ", "สุดา", "อนันต์", "กมล", "ธนพร", "ศิริพร", "ณัฐพล", "พิมพ์ชนก"]
+_LAST_TH = ["ใจดี", "รักษ์ไทย", "ศรีสุข", "ทองดี", "บุญมา", "แก้วประเสริฐ", "วงศ์สวัสดิ์", "จันทร์เพ็ญ", "สายทอง", "มั่นคง"]
+_FIRST_EN = ["Somchai", "Somying", "Wichai", "Malee", "Prasert", "Suda", "Anan", "Kamol", "Thanaporn", "Siriporn", "Nattapon", "Pimchanok"]
+_LAST_EN = ["Jaidee", "Rakthai", "Srisuk", "Thongdee", "Boonma", "Kaewprasert", "Wongsawat", "Chanpen", "Saithong", "Mankong"]
+_ROLES = ["doctor", "doctor", "nurse", "therapist"]
+
+
+@dataclass
+class SeedReport:
+    rows: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def add(self, table: str, n: int) -> None:
+        self.rows[table] = self.rows.get(table, 0) + n
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _slots(cfg: BenchConfig) -> List[time]:
+    h0, m0 = map(int, cfg.time_from.split(":"))
+    h1, m1 = map(int, cfg.time_to.split(":"))
+    t, end, out = h0 * 60 + m0, h1 * 60 + m1, []
+    while t < end:
+        out.append(time(t // 60, t % 60))
+        t += cfg.slot_min
+    return out
+
+
+def _add_minutes(t: time, minutes: int) -> time:
+    total = t.hour * 60 + t.minute + minutes
+    return time(min(total // 60, 23), total % 60)
+
+
+def _booking_status(rng: random.Random, day: date, today: date) -> str:
+    if day < today:
+        return rng.choices(["completed", "cancelled", "no_show"], weights=[85, 10, 5])[0]
+    if day == today:
+        return rng.choice(["checked_in", "in_service", "confirmed", "booked"])
+    return rng.choices(["booked", "confirmed", "cancelled"], weights=[60, 35, 5])[0]
+
+
+async def _reset_schema(cfg: BenchConfig) -> None:
+    engine = create_async_engine(cfg.database_url, poolclass=NullPool, connect_args={"ssl": False})
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("DROP SCHEMA IF EXISTS public CASCADE")
+            await conn.exec_driver_sql("CREATE SCHEMA public")
+            await conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+            await conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+
+
+async def _copy(conn: asyncpg.Connection, report: SeedReport, table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+    if rows:
+        await conn.copy_records_to_table(table, records=rows, columns=list(columns))
+    report.add(table, len(rows))
+
+
+def _check_disposable(dbname: str) -> None:
+    import os
+
+    if "bench" not in dbname.lower() and os.getenv("BENCH_ALLOW_RESET") != "1":
+        raise SystemExit(
+            f"refusing to reset database {dbname!r}: name must contain 'bench' (or set BENCH_ALLOW_RESET=1)"
+        )
+
+
+async def seed(cfg: BenchConfig) -> SeedReport:
+    """DROP + recreate the public schema, then load the synthetic clinic."""
+    t0 = _time.perf_counter()
+    rng = random.Random(cfg.seed)
+    sc = cfg.scale
+    report = SeedReport()
+    now = datetime.now(timezone.utc)
+    today = date.today()
+
+    conn = await asyncpg.connect(cfg.asyncpg_dsn, ssl=False)
+    try:
+        _check_disposable(await conn.fetchval("select current_database()"))
+    finally:
+        await conn.close()
+
+    await _reset_schema(cfg)
+
+    conn = await asyncpg.connect(cfg.asyncpg_dsn, ssl=False)
+    try:
+        await conn.execute(SCHEMA_SQL.read_text(encoding="utf-8"))
+
+        # ---------- geo reference (global) ----------
+        await _copy(conn, report, "countries", ("country_code", "name_lo", "name_en", "is_active"), [("TH", "ไทย", "Thailand", True)])
+        provinces, cities, districts = [], [], []
+        city_id = district_id = 0
+        for p in range(1, sc.provinces + 1):
+            provinces.append((p, f"จังหวัด{p:02d}", f"Province {p:02d}", "TH", (p % 6) + 1, True))
+            for _ in range(sc.cities_per_province):
+                city_id += 1
+                cities.append((city_id, f"อำเภอ{city_id:04d}", f"District {city_id:04d}", p, True))
+                for _ in range(sc.districts_per_city):
+                    district_id += 1
+                    districts.append((district_id, f"ตำบล{district_id:05d}", f"Subdistrict {district_id:05d}", city_id, 10000 + p * 100 + district_id % 100, True))
+        await _copy(conn, report, "provinces", ("id", "name_lo", "name_en", "country_code", "geography_id", "is_active"), provinces)
+        await _copy(conn, report, "cities", ("id", "name_lo", "name_en", "province_id", "is_active"), cities)
+        await _copy(conn, report, "districts", ("id", "name_lo", "name_en", "city_id", "zip_code", "is_active"), districts)
+
+        # ---------- global catalogs ----------
+        room_types = [(_uuid(rng), f"RT{i}", name, True) for i, name in enumerate(["Consult", "Treatment", "Procedure"], 1)]
+        await _copy(conn, report, "room_types", ("id", "type_code", "type_name", "is_active"), room_types)
+
+        service_types = [(_uuid(rng), f"ประเภทบริการ {i}", True) for i in range(1, 6)]
+        await _copy(conn, report, "service_types", ("id", "service_type_name", "is_active"), service_types)
+
+        services = []
+        for i in range(1, sc.services + 1):
+            services.append((
+                _uuid(rng), f"บริการ {i:03d}", rng.choice(service_types)[0], float(rng.choice([500, 1200, 2500, 4900])),
+                rng.choice([30, 60]), f"SV{i:03d}", f"บริการ {i:03d}", f"Service {i:03d}", True,
+            ))
+        await _copy(
+            conn, report, "services",
+            ("id", "service_name", "service_type_id", "service_price", "duration", "service_code", "service_name_th", "service_name_en", "is_active"),
+            services,
+        )
+
+        templates = [
+            (_uuid(rng), "AM", "Morning", time(9, 0), time(13, 0), False, True),
+            (_uuid(rng), "PM", "Afternoon", time(13, 0), time(17, 0), False, True),
+        ]
+        await _copy(conn, report, "staff_template", ("id", "shift_code", "shift_name", "start_time", "end_time", "is_overnight", "is_active"), templates)
+
+        slots = _slots(cfg)
+        days = [cfg.start_date + timedelta(days=d) for d in range(sc.days)]
+
+        for c in range(1, sc.companies + 1):
+            code = f"{cfg.company_prefix}{c:02d}"
+            await _copy(
+                conn, report, "companies", ("company_code", "company_name", "company_name_en", "is_active", "head_office"),
+                [(code, f"คลินิกทดสอบ {c}", f"Bench Clinic {c}", True, True)],
+            )
+
+            departments = [(_uuid(rng), code, name, f"D{i}", True) for i, name in enumerate(["OPD", "Dermatology", "Wellness", "Rehab"], 1)]
+            await _copy(conn, report, "departments", ("id", "company_code", "department_name", "department_code", "is_active"), departments)
+
+            # ---------- facilities ----------
+            locations, buildings, rooms, view_cfg, ts_cfg = [], [], [], [], []
+            rooms_by_building: Dict[uuid.UUID, List[uuid.UUID]] = {}
+            for l in range(1, sc.locations + 1):
+                loc_id = _uuid(rng)
+                locations.append((loc_id, code, f"สาขา {l}", "clinic", f"L{c:02d}{l:02d}", True))
+                for b in range(1, sc.buildings + 1):
+                    bld_id = _uuid(rng)
+                    buildings.append((bld_id, code, loc_id, f"B{l:02d}{b:02d}", f"อาคาร{chr(64 + b)}", 3, True))
+                    view_cfg.append((_uuid(rng), code, loc_id, bld_id, "default", min(sc.rooms, 6), True, True))
+                    ts_cfg.append((_uuid(rng), code, loc_id, bld_id, slots[0], _add_minutes(slots[-1], cfg.slot_min), cfg.slot_min, True))
+                    rooms_by_building[bld_id] = []
+                    for r in range(1, sc.rooms + 1):
+                        room_id = _uuid(rng)
+                        rooms.append((room_id, loc_id, bld_id, f"R{l:02d}{b:02d}{r:02d}", f"อาคาร{chr(64 + b)} - ห้อง {100 * b + r}", 2, True, True, rng.choice(room_types)[0], b))
+                        rooms_by_building[bld_id].append(room_id)
+            await _copy(conn, report, "locations", ("id", "company_code", "location_name", "location_type", "location_code", "is_active"), locations)
+            await _copy(conn, report, "buildings", ("id", "company_code", "location_id", "building_code", "building_name", "floors", "is_active"), buildings)
+            await _copy(
+                conn, report, "rooms",
+                ("id", "location_id", "building_id", "room_code", "room_name", "capacity", "is_available", "is_active", "room_type_id", "floor_number"),
+                rooms,
+            )
+            await _copy(
+                conn, report, "booking_view_config",
+                ("id", "company_code", "location_id", "building_id", "name", "max_columns", "is_default", "is_active"), view_cfg,
+            )
+            await _copy(
+                conn, report, "booking_timeslot_config",
+                ("id", "company_code", "location_id", "building_id", "time_from", "time_to", "slot_min", "is_active"), ts_cfg,
+            )
+            room_services = [(_uuid(rng), r[0], s[0], i == 0, True) for r in rooms for i, s in enumerate(rng.sample(services, min(4, len(services))))]
+            await _copy(conn, report, "room_services", ("id", "room_id", "service_id", "is_default", "is_active"), room_services)
+
+            # ---------- staff ----------
+            staff, staff_locs, staff_svcs, staff_depts, patterns, leaves = [], [], [], [], [], []
+            doctors: List[uuid.UUID] = []
+            for s in range(1, sc.staff + 1):
+                sid = _uuid(rng)
+                role = _ROLES[s % len(_ROLES)]
+                loc = rng.choice(locations)
+                name = f"{'นพ.' if role == 'doctor' else ''}{rng.choice(_FIRST_TH)} {rng.choice(_LAST_TH)}"
+                staff.append((sid, name, role, f"{code.lower()}.staff{s:04d}@bench.local", f"08{rng.randrange(10**8):08d}", loc[0], True))
+                staff_locs.append((_uuid(rng), sid, loc[0], "Mon-Fri", time(9, 0), time(17, 0), True, True))
+                staff_depts.append((_uuid(rng), sid, rng.choice(departments)[0], role, True, True))
+                if role == "doctor":
+                    doctors.append(sid)
+                    for svc in rng.sample(services, min(5, len(services))):
+                        staff_svcs.append((_uuid(rng), sid, svc[0], svc[4], True))
+                    for weekday in range(5):
+                        patterns.append((_uuid(rng), sid, loc[0], staff_depts[-1][2], weekday, rng.choice(templates)[0], True))
+                    if rng.random() < 0.3:
+                        d0 = rng.choice(days)
+                        leaves.append((_uuid(rng), code, loc[0], sid, "annual", d0, d0 + timedelta(days=rng.randint(0, 4)), "approved", True))
+            await _copy(conn, report, "staff", ("id", "staff_name", "role", "email", "phone", "main_location_id", "is_active"), staff)
+            await _copy(
+                conn, report, "staff_locations",
+                ("id", "staff_id", "location_id", "work_days", "work_time_from", "work_time_to", "is_primary", "is_active"), staff_locs,
+            )
+            await _copy(conn, report, "staff_departments", ("id", "staff_id", "department_id", "role_in_dept", "is_primary", "is_active"), staff_depts)
+            await _copy(conn, report, "staff_services", ("id", "staff_id", "service_id", "duration_minutes", "is_active"), staff_svcs)
+            await _copy(
+                conn, report, "staff_work_pattern",
+                ("id", "staff_id", "location_id", "department_id", "weekday", "shift_template_id", "is_active"), patterns,
+            )
+            await _copy(
+                conn, report, "staff_leave",
+                ("id", "company_code", "location_id", "staff_id", "leave_type", "date_from", "date_to", "status", "is_active"), leaves,
+            )
+
+            # ---------- patients ----------
+            patients: List[tuple] = []
+            for n in range(1, sc.patients + 1):
+                i_first, i_last = rng.randrange(len(_FIRST_TH)), rng.randrange(len(_LAST_TH))
+                first_lo, last_lo = _FIRST_TH[i_first], _LAST_TH[i_last]
+                first_en, last_en = _FIRST_EN[i_first], _LAST_EN[i_last]
+                patients.append((
+                    _uuid(rng), f"{code}-P{n:07d}", first_lo, last_lo, f"{first_lo} {last_lo}",
+                    first_en, last_en, f"{first_en} {last_en}",
+                    f"{c}{n:012d}", f"{code.lower()}.p{n:07d}@bench.local", f"08{rng.randrange(10**8):08d}",
+                    rng.choice(["M", "F"]), date(1950, 1, 1) + timedelta(days=rng.randrange(25_000)), "active", True,
+                ))
+            await _copy(
+                conn, report, "patients",
+                ("id", "patient_code", "first_name_lo", "last_name_lo", "full_name_lo", "first_name_en", "last_name_en", "full_name_en",
+                 "id_card_no", "email", "telephone", "sex", "birth_date", "status", "is_active"),
+                patients,
+            )
+
+            # ---------- a year of bookings, booking.json day shape ----------
+            room_meta = {r[0]: (r[1], r[2]) for r in rooms}
+            batch: List[tuple] = []
+            cols = ("id", "resource_track_id", "company_code", "location_id", "building_id", "room_id", "patient_id",
+                    "primary_person_id", "service_id", "booking_date", "start_time", "end_time", "status", "source_of_ad",
+                    "consultation_type", "created_at", "updated_at")
+            for day in days:
+                if day.weekday() == 6 or not doctors:
+                    continue
+                for room_id, (loc_id, bld_id) in room_meta.items():
+                    i = 0
+                    while i < len(slots):
+                        if rng.random() >= sc.fill_rate:
+                            i += 1
+                            continue
+                        svc = rng.choice(services)
+                        n_slots = max(1, svc[4] // cfg.slot_min)
+                        batch.append((
+                            _uuid(rng), _uuid(rng), code, loc_id, bld_id, room_id, rng.choice(patients)[0], rng.choice(doctors),
+                            svc[0], day, slots[i], _add_minutes(slots[i], n_slots * cfg.slot_min), _booking_status(rng, day, today),
+                            rng.choice(["online", "walk_in", "call_center", "line"]), rng.choice(["onsite", "online"]), now, now,
+                        ))
+                        i += n_slots
+                if len(batch) >= 50_000:
+                    await _copy(conn, report, "bookings", cols, batch)
+                    batch = []
+            await _copy(conn, report, "bookings", cols, batch)
+
+        await conn.execute("ANALYZE")
+    finally:
+        await conn.close()
+
+    report.seconds = _time.perf_counter() - t0
+    return report
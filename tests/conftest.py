@@ -0,0 +1,38 @@
+# tests/conftest.py
+
+import os
+
+# settings are read on first use; tests need no Supabase / OpenAI / database
+for _k, _v in {
+    "SUPABASE_URL": "http://test.invalid",
+    "SUPABASE_KEY": "test.test.test",
+    "SUPABASE_JWT_SECRET": "test-secret",
+    "EMBEDDING_BACKEND": "local",
+    "EMBEDDING_CACHE_DB": "false",
+}.items():
+    os.environ.setdefault(_k, _v)
+
+import pytest
+from sqlalchemy import Column, MetaData, Table
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def sqlite_metadata(*models) -> MetaData:
+    """
+    Column-only copies of the models' tables that SQLite can create: server defaults
+    (gen_random_uuid(), now()), NOT NULL, CHECK constraints (= any(array[...])) and foreign keys are
+    left out, so fixtures only insert the columns a test reads. Rows must set their id themselves.
+    """
+    md = MetaData()
+    for model in models:
+        src = model.__table__
+        Table(
+            src.name,
+            md,
+            *[Column(c.name, c.type, primary_key=c.primary_key) for c in src.columns],
+        )
+    return md
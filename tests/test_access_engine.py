@@ -0,0 +1,119 @@
+# tests/test_access_engine.py
+
+import pytest
+
+from app.api.v1.authen import access_engine as engine_module
+from app.api.v1.authen.access_engine import AccessEngine, check_route, compile_access
+from app.core.config import get_settings
+
+pytestmark = pytest.mark.anyio
+
+ADMIN, NURSE, NOBODY = "p-admin", "p-nurse", "p-nobody"
+
+
+def _compiled():
+    return compile_access(
+        "WS",
+        0,
+        permissions=[("perm-read", "patients.read"), ("perm-write", "patients.write"), ("perm-admin", "admin")],
+        routes=[
+            ("/api/v1/patients", "GET", "perm-read"),
+            ("/api/v1/patients", "GET", "perm-admin"),
+            ("/api/v1/patients/{patient_id}", "PUT", "perm-write"),
+            ("/api/v1/admin/*", "*", "perm-admin"),
+            ("/api/v1/other-company", "GET", "perm-foreign"),
+        ],
+        role_permissions=[("role-nurse", "perm-read"), ("role-admin", "perm-admin"), ("role-admin", "perm-write")],
+        group_roles=[("group-admins", "role-admin")],
+        profile_roles=[(NURSE, "role-nurse")],
+        profile_groups=[(ADMIN, "group-admins")],
+    )
+
+
+# (profile, route, method) -> what the check_access RPC answers (module docstring semantics)
+CASES = [
+    (NURSE, "/api/v1/patients", "GET", True),  # one of the route's permissions is enough
+    (ADMIN, "/api/v1/patients?limit=10", "get", True),  # query string and method case ignored
+    (NURSE, "/api/v1/patients/42", "PUT", False),
+    (ADMIN, "/api/v1/patients/42", "PUT", True),  # {param} segment
+    (ADMIN, "/api/v1/admin/users/1", "DELETE", True),  # trailing * and method *
+    (NURSE, "/api/v1/admin/users/1", "GET", False),
+    (ADMIN, "/api/v1/not-protected", "GET", False),  # no protected_routes row -> deny
+    (ADMIN, "/api/v1/other-company", "GET", False),  # permission of another company
+    (NOBODY, "/api/v1/patients", "GET", False),
+]
+
+
+@pytest.mark.parametrize("profile_id,route,method,expected", CASES)
+def test_compiled_access_answers_like_the_rpc(profile_id, route, method, expected):
+    assert _compiled().can_access(profile_id, route, method) is expected
+
+
+class RPCSession:
+    """Stands in for the database: answers `select public.check_access(...)`."""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.params = []
+
+    async def execute(self, stmt, params):
+        self.params.append(params)
+        answer = self.answer
+
+        class Result:
+            def scalar(self):
+                if isinstance(answer, Exception):
+                    raise answer
+                return answer
+
+        return Result()
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    compiled = _compiled()
+    eng = AccessEngine(ttl_seconds=60)
+
+    async def get(db, company_code):
+        return compiled
+
+    monkeypatch.setattr(eng, "get", get)
+    monkeypatch.setattr(engine_module, "access_engine", eng)
+    return eng
+
+
+async def test_rpc_decides_until_the_engine_is_enforced(engine):
+    # the engine says yes, the RPC says no: the RPC wins and the mismatch is counted
+    rpc = RPCSession(False)
+    assert await check_route(rpc, NURSE, "/api/v1/patients", "GET", "WS", enforce=False) is False
+    assert rpc.params == [
+        {"p_profile_id": NURSE, "p_route": "/api/v1/patients", "p_method": "GET", "p_company_code": "WS"}
+    ]
+    assert (engine.compared, engine.mismatches) == (1, 1)
+
+    assert await check_route(RPCSession(True), NURSE, "/api/v1/patients", "GET", "WS", enforce=False) is True
+    assert (engine.compared, engine.mismatches) == (2, 1)
+
+
+async def test_rpc_failure_is_not_hidden_while_it_decides(engine):
+    with pytest.raises(RuntimeError):
+        await check_route(RPCSession(RuntimeError("rpc down")), NURSE, "/api/v1/patients", "GET", "WS", enforce=False)
+
+
+async def test_enforced_engine_samples_the_rpc(engine):
+    rpc = RPCSession(False)
+    assert await check_route(rpc, NURSE, "/api/v1/patients", "GET", "WS", enforce=True, shadow_rate=1) is True
+    assert (engine.compared, engine.mismatches) == (1, 1)
+
+    silent = RPCSession(False)
+    assert await check_route(silent, NURSE, "/api/v1/patients", "GET", "WS", enforce=True, shadow_rate=0) is True
+    assert silent.params == []
+
+    down = RPCSession(RuntimeError("rpc down"))
+    assert await check_route(down, NURSE, "/api/v1/patients", "GET", "WS", enforce=True, shadow_rate=1) is True
+
+
+def test_rpc_is_the_default_source_of_truth():
+    s = get_settings()
+    assert s.ACCESS_ENGINE_ENFORCE is False
+    assert s.ACCESS_RPC_SHADOW_RATE > 0
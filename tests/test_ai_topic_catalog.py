@@ -0,0 +1,211 @@
+# tests/test_ai_topic_catalog.py
+
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.modules.ai.consult.repositories.ai_topic_categories_repository import AITopicCategoriesRepository
+from app.api.v1.modules.ai.consult.repositories.ai_topics_repository import AITopicsRepository
+from app.api.v1.modules.ai.consult.services import ai_topic_categories_service as categories_module
+from app.api.v1.modules.ai.consult.services.ai_consult_service import AITopicsService
+from app.api.v1.modules.ai.consult.services.ai_topic_catalog import SORT_FIELDS, AITopicCatalog
+from app.api.v1.modules.ai.consult.services.ai_topic_categories_service import AITopicCategoriesService
+
+pytestmark = pytest.mark.anyio
+
+# only the columns the repositories' SQL reads; TIMESTAMP columns come back as datetime (PARSE_DECLTYPES)
+DDL = [
+    """
+    CREATE TABLE public.ai_topic_categories (
+        id TEXT PRIMARY KEY, company_code TEXT, category_code TEXT, category_name_th TEXT, category_name_en TEXT,
+        description_th TEXT, description_en TEXT, parent_category_id TEXT, icon_name TEXT, color_code TEXT,
+        sort_order INTEGER, is_active BOOLEAN, is_system BOOLEAN, is_deleted BOOLEAN, metadata TEXT,
+        created_at TIMESTAMP, updated_at TIMESTAMP, created_by TEXT, updated_by TEXT
+    )
+    """,
+    """
+    CREATE TABLE public.ai_topics (
+        id TEXT PRIMARY KEY, company_code TEXT, topic_code TEXT, label_th TEXT, label_en TEXT,
+        topic_name_th TEXT, topic_name_en TEXT, description_th TEXT, description_en TEXT, default_cards TEXT,
+        is_active BOOLEAN, is_deleted BOOLEAN, sort_order INTEGER, created_at TIMESTAMP, updated_at TIMESTAMP,
+        ai_topic_category_id TEXT, intent_code TEXT, topic_type TEXT, topic_level TEXT, output_format TEXT,
+        action_type TEXT, requires_auth BOOLEAN, requires_patient_context BOOLEAN, requires_booking_context BOOLEAN,
+        requires_payment_context BOOLEAN, requires_service_context BOOLEAN, is_system BOOLEAN, is_default BOOLEAN,
+        version_no INTEGER, metadata TEXT
+    )
+    """,
+]
+
+T0 = datetime(2026, 1, 1, 8, 0, 0)
+SYM, MED, HEAD, FOREIGN_CAT, GONE_CAT = (str(uuid.uuid4()) for _ in range(5))
+
+CATEGORIES = [
+    # id, company, code, th, en, description_th, parent, sort, active, deleted
+    (SYM, "WS", "SYM", "อาการ", "Symptoms", "อาการทั่วไป 100%", None, 1, True, False),
+    (MED, None, "MED", "ยา", "Medicine", None, None, 2, True, False),
+    (HEAD, "WS", "SYM_HEAD", "ปวดหัว", "Headache", None, SYM, 1, True, False),
+    (str(uuid.uuid4()), None, "OLD", "เลิกใช้", "Retired", None, None, 2, False, False),
+    (str(uuid.uuid4()), "WS", "BILL", "การเงิน", "Billing", None, None, 1, True, False),
+    (FOREIGN_CAT, "XX", "SYM", "อื่น", "Other company", None, None, 0, True, False),
+    (GONE_CAT, "WS", "GONE", "ลบแล้ว", "Deleted", None, None, 0, True, True),
+]
+
+TOPICS = [
+    # code, company, label_th, label_en, description_th, category, sort, active
+    ("fever", "WS", "ไข้", "Fever", "มีไข้ตัวร้อน", SYM, 2, True),
+    ("headache", "WS", "ปวดหัว", "Headache", "ปวดศีรษะ", HEAD, 1, True),
+    ("migraine", None, "ไมเกรน", "Migraine", "ปวดหัวข้างเดียว", HEAD, 1, True),
+    ("cough", None, "ไอ", "Cough", "ไอแห้ง 100% ไม่มีเสมหะ", SYM, 3, True),
+    ("paracetamol", None, "พาราเซตามอล", "Paracetamol", "ยาลดไข้ a_b", MED, 1, True),
+    ("dosage", "WS", "ขนาดยา", "Dosage", None, MED, 2, False),
+    ("refund", "WS", "คืนเงิน", "Refunds", None, None, 1, True),
+    ("hello", None, "สวัสดี", "Hello", None, None, 0, True),
+    ("rash", "WS", "ผื่น", "Rash", "ผื่นคัน", SYM, 2, True),
+    ("insomnia", "WS", "นอนไม่หลับ", "Insomnia", None, SYM, 2, False),
+    ("other-co", "XX", "ของบริษัทอื่น", "Other company", None, FOREIGN_CAT, 0, True),
+    ("deleted", "WS", "ลบแล้ว", "Deleted", None, SYM, 0, True),
+]
+
+
+@pytest.fixture
+async def sessions():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=StaticPool, connect_args={"detect_types": sqlite3.PARSE_DECLTYPES}
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _attach(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        cur.execute("ATTACH DATABASE ':memory:' AS public")
+        cur.close()
+
+    async with engine.begin() as conn:
+        for ddl in DDL:
+            await conn.execute(text(ddl))
+        for n, (cid, company, code, th, en, desc, parent, sort, active, deleted) in enumerate(CATEGORIES):
+            await conn.execute(
+                text(
+                    "INSERT INTO public.ai_topic_categories (id, company_code, category_code, category_name_th,"
+                    " category_name_en, description_th, parent_category_id, sort_order, is_active, is_system,"
+                    " is_deleted, created_at, updated_at) VALUES (:id, :company, :code, :th, :en, :desc, :parent,"
+                    " :sort, :active, true, :deleted, :ts, :ts)"
+                ),
+                {"id": cid, "company": company, "code": code, "th": th, "en": en, "desc": desc, "parent": parent,
+                 "sort": sort, "active": active, "deleted": deleted, "ts": str(T0 + timedelta(hours=n))},
+            )
+        for n, (code, company, th, en, desc, category, sort, active) in enumerate(TOPICS):
+            await conn.execute(
+                text(
+                    "INSERT INTO public.ai_topics (id, company_code, topic_code, label_th, label_en, description_th,"
+                    " ai_topic_category_id, sort_order, is_active, is_deleted, created_at, updated_at, version_no)"
+                    " VALUES (:id, :company, :code, :th, :en, :desc, :category, :sort, :active, :deleted,"
+                    " :created, :updated, 1)"
+                ),
+                {"id": str(uuid.uuid4()), "company": company, "code": code, "th": th, "en": en, "desc": desc,
+                 "category": category, "sort": sort, "active": active, "deleted": code == "deleted",
+                 "created": str(T0 + timedelta(days=n)), "updated": str(T0 + timedelta(days=(5 * n) % 7))},
+            )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+class PgSQLSession:
+    """The repositories' PostgreSQL text SQL on SQLite: ILIKE -> LIKE (test data is Thai or ASCII)."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, stmt, params=None):
+        return await self.session.execute(text(str(stmt).replace(" ILIKE ", " LIKE ")), params or {})
+
+
+def _dump(items):
+    return [i.model_dump() for i in items]
+
+
+TOPIC_FILTERS = [
+    {},
+    {"include_uncategorized": True},
+    {"is_active": True},
+    {"is_active": False, "include_uncategorized": True},
+    {"category_id": uuid.UUID(SYM)},
+    {"category_code": "MED", "is_active": True},
+    {"q": "ปวดหัว"},
+    {"q": "head", "include_uncategorized": True},
+    {"q": "sym"},  # category_code, case-insensitive
+    {"q": "100%"},  # % is a literal, not a wildcard
+    {"q": "a_b"},
+    {"q": "  fever  ", "include_uncategorized": True},
+    {"q": "nothing matches"},
+]
+# category_code sorts only over categorized topics: SQLite puts NULLs first, PostgreSQL (and the catalog) last
+TOPIC_SORTS = [(f, d) for f in SORT_FIELDS for d in ("asc", "desc")] + [("bogus", "asc")]
+PAGES = [(3, 0), (3, 3), (3, 6), (50, 0), (2, 20)]
+
+
+@pytest.mark.parametrize("company_code", ["WS", None])
+@pytest.mark.parametrize("lang", ["TH", "EN"])
+async def test_topic_catalog_search_matches_list_topics(sessions, company_code, lang):
+    async with sessions() as db:
+        repo = AITopicsRepository(PgSQLSession(db))
+        service = AITopicsService(repo)
+        catalog = await AITopicCatalog(ttl_seconds=60).get(
+            company_code,
+            lang,
+            lambda: repo.list_catalog_rows(company_code=company_code),
+            map_item=service._map_item,
+            parse_cards=service._parse_default_cards,
+        )
+
+        cases = [(f, ("sort_order", "asc"), page) for f in TOPIC_FILTERS for page in PAGES]
+        cases += [({}, sort, page) for sort in TOPIC_SORTS for page in PAGES]
+        for filters, (sort_by, sort_dir), (limit, offset) in cases:
+            args = dict(
+                category_id=None, category_code=None, q=None, is_active=None, include_uncategorized=False,
+                limit=limit, offset=offset, sort_by=sort_by, sort_dir=sort_dir,
+            )
+            args.update(filters)
+            rows, total = await repo.list_topics(company_code=company_code, **args)
+            items, found = catalog.search(**args)
+
+            assert (found, _dump(items)) == (total, _dump(service._map_item(r, lang) for r in rows)), args
+
+
+CATEGORY_FILTERS = [
+    {},
+    {"is_active": True},
+    {"is_active": False},
+    {"parent_category_id": uuid.UUID(SYM)},
+    {"q": "sym"},
+    {"q": "ปวด"},
+    {"q": "100%"},
+    {"q": "s_m"},  # _ is a literal: matches nothing
+    {"q": " headache "},
+]
+
+
+@pytest.mark.parametrize("company_code", ["WS", None])
+async def test_category_list_from_the_catalog_matches_the_sql(sessions, monkeypatch, company_code):
+    async def listed(catalog, **kw):
+        monkeypatch.setattr(categories_module, "ai_topic_catalog", catalog)
+        async with sessions() as db:
+            service = AITopicCategoriesService(AITopicCategoriesRepository(PgSQLSession(db)))
+            payload, total = await service.list_categories(company_code=company_code, **kw)
+        return _dump(payload.items), total
+
+    cached = AITopicCatalog(ttl_seconds=60)
+    for filters in CATEGORY_FILTERS:
+        for limit, offset in PAGES:
+            args = dict(is_active=None, q=None, parent_category_id=None, limit=limit, offset=offset)
+            args.update(filters)
+            assert await listed(cached, **args) == await listed(AITopicCatalog(ttl_seconds=0), **args), args
+
+    assert cached.misses == 1  # one load served every case
+    assert [c["category_code"] for c in (await listed(cached, **{**args, "q": None, "limit": 50, "offset": 0}))[0]] == (
+        ["BILL", "SYM_HEAD", "SYM", "MED", "OLD"] if company_code else ["MED", "OLD"]
+    )
@@ -0,0 +1,205 @@
+# tests/test_chat_retrievals.py
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from app.api.v1.modules.chat.models.schemas import ChatRetrievalCreateRequest, ChatRetrievalItemCreateRequest
+from app.api.v1.modules.chat.services.chat_retrieval_log_writer import ChatRetrievalLogWriter
+from app.api.v1.modules.chat.services.chat_retrievals_service import ChatRetrievalsService
+
+pytestmark = pytest.mark.anyio
+
+OWN, FOREIGN = uuid.uuid4(), uuid.uuid4()
+NOW = datetime(2026, 1, 5, 8, 0, tzinfo=timezone.utc)
+
+
+def _items(n: int):
+    return [
+        ChatRetrievalItemCreateRequest(
+            chunk_id=uuid.uuid4(), document_id=uuid.uuid4(), rank=n - i, score=1.0 / (i + 1), metadata={"lang": "ไทย"}
+        )
+        for i in range(n)
+    ]
+
+
+class Result:
+    def __init__(self, rows=(), scalar=None):
+        self._rows, self._scalar = list(rows), scalar
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._scalar
+
+    def scalar_one(self):
+        return self._scalar
+
+
+class RetrievalsDB:
+    """chat_retrievals of company WS: {OWN}. Records statements, parameters, commits and rollbacks."""
+
+    def __init__(self):
+        self.calls = []
+        self.commits = self.rollbacks = 0
+
+    async def execute(self, stmt, params):
+        self.calls.append((stmt, params))
+        owned = params["retrieval_id"] == OWN and params["company_code"] == "WS"
+        if "SELECT 1" in str(stmt):
+            return Result(scalar=1 if owned else None)
+        if not owned:
+            return Result()
+        rows = [
+            {"id": uuid.uuid4(), "retrieval_id": OWN, "chunk_id": c, "document_id": d, "rank": r, "score": s,
+             "metadata": json.loads(m), "created_at": NOW}
+            for c, d, r, s, m in zip(*(params[k] for k in ("chunk_ids", "document_ids", "ranks", "scores", "metadatas")))
+        ]
+        return Result(rows)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+# ---- POST /chat/retrievals/{id}/items ----
+
+async def test_items_go_in_as_one_array_per_column():
+    db = RetrievalsDB()
+    items = _items(3)
+    out = await ChatRetrievalsService(db).add_retrieval_items("WS", OWN, items)
+
+    ((stmt, params),) = db.calls
+    assert params["chunk_ids"] == [i.chunk_id for i in items]
+    assert params["ranks"] == [3, 2, 1] and params["scores"] == [i.score for i in items]
+    assert [json.loads(m) for m in params["metadatas"]] == [{"lang": "ไทย"}] * 3
+    assert [o.rank for o in out] == [1, 2, 3] and db.commits == 1
+
+    # fixed statement text for any batch size; arrays are bound with their element types
+    await ChatRetrievalsService(db).add_retrieval_items("WS", OWN, _items(7))
+    assert db.calls[1][0] is stmt
+    sql = str(stmt.compile(dialect=asyncpg_dialect()))
+    assert "unnest" in sql and "::UUID[]" in sql and "::INTEGER[]" in sql and "::FLOAT[]" in sql
+
+
+@pytest.mark.parametrize("n", [0, 2])
+async def test_foreign_or_unknown_retrieval_is_not_found(n):
+    db = RetrievalsDB()
+    assert await ChatRetrievalsService(db).add_retrieval_items("WS", FOREIGN, _items(n)) is None
+    assert await ChatRetrievalsService(db).add_retrieval_items("XX", OWN, _items(n)) is None
+    assert db.commits == 0
+
+
+async def test_empty_items_for_an_own_retrieval_is_an_empty_list():
+    db = RetrievalsDB()
+    assert await ChatRetrievalsService(db).add_retrieval_items("WS", OWN, []) == []
+
+
+# ---- ChatRetrievalLogWriter ----
+
+class LogDB:
+    """Session factory for the writer: one record per (session, savepoint, statement); query_text 'boom' fails."""
+
+    def __init__(self):
+        self.sessions = []
+
+    def __call__(self):
+        db = self
+
+        class Savepoint:
+            def __init__(self, session):
+                self.session = session
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, *exc):
+                self.session["savepoints"].append("rollback" if exc_type else "release")
+                return False
+
+        class Session:
+            def __init__(self):
+                self.state = {"written": [], "savepoints": [], "commits": 0}
+                db.sessions.append(self.state)
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def begin_nested(self):
+                return Savepoint(self.state)
+
+            async def execute(self, stmt, params):
+                if params["query_text"] == "boom":
+                    raise RuntimeError("bad record")
+                self.state["written"].append(params["query_text"])
+                return Result(scalar=uuid.uuid4())
+
+            async def commit(self):
+                self.state["commits"] += 1
+
+        return Session()
+
+
+def _record(query: str):
+    return ChatRetrievalCreateRequest(session_id=uuid.uuid4(), query_text=query), _items(2)
+
+
+async def test_writer_batches_records_under_savepoints():
+    db = LogDB()
+    writer = ChatRetrievalLogWriter(max_queue=10, batch_size=2, session_factory=db)
+    for q in ("a", "boom", "c", "d", "e"):
+        assert writer.submit("WS", *_record(q)) is True
+    await writer.aclose()
+
+    assert [s["written"] for s in db.sessions] == [["a"], ["c", "d"], ["e"]]
+    assert db.sessions[0]["savepoints"] == ["release", "rollback"]  # the bad record did not lose "a"
+    assert all(s["commits"] == 1 for s in db.sessions)  # one transaction per batch
+    assert writer.stats() == {"queued": 0, "written": 4, "failed": 1, "dropped": 0}
+
+
+async def test_full_queue_drops_and_counts():
+    db = LogDB()
+    writer = ChatRetrievalLogWriter(max_queue=2, batch_size=10, session_factory=db)
+    accepted = [writer.submit("WS", *_record(f"q{i}")) for i in range(5)]  # the worker has not run yet
+    assert accepted == [True, True, False, False, False]
+    assert writer.stats()["dropped"] == 3
+
+    await writer.aclose()
+    assert [s["written"] for s in db.sessions] == [["q0", "q1"]]
+
+
+async def test_submit_never_waits_on_the_database():
+    gate = asyncio.Event()
+    db = LogDB()
+
+    def slow_factory():
+        session = db()
+        execute = session.execute
+
+        async def blocked(stmt, params):
+            await gate.wait()
+            return await execute(stmt, params)
+
+        session.execute = blocked
+        return session
+
+    writer = ChatRetrievalLogWriter(max_queue=10, batch_size=1, session_factory=slow_factory)
+    writer.submit("WS", *_record("a"))
+    await asyncio.sleep(0)
+    assert writer.submit("WS", *_record("b")) is True  # worker is stuck on "a"
+    gate.set()
+    await writer.aclose()
+    assert writer.stats()["written"] == 2
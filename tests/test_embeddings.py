@@ -0,0 +1,135 @@
+# tests/test_embeddings.py
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.services import schema_capabilities as capabilities_module
+from app.services.embeddings import EmbeddingService, LocalHashEmbeddingBackend, content_hash
+from app.services.schema_capabilities import _Snapshot
+
+pytestmark = pytest.mark.anyio
+
+DIM = 8
+
+
+class CountingBackend(LocalHashEmbeddingBackend):
+    def __init__(self):
+        super().__init__(DIM)
+        self.calls = []
+
+    async def embed_many(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(0)
+        return await super().embed_many(texts)
+
+
+def _service(backend, **kw):
+    opts = dict(cache_size=100, batch_max=16, batch_window_ms=5, max_concurrency=2, use_db=False)
+    opts.update(kw)
+    return EmbeddingService(backend, **opts)
+
+
+async def test_concurrent_misses_go_out_as_one_request():
+    backend = CountingBackend()
+    svc = _service(backend)
+    vecs = await asyncio.gather(*(svc.embed(f"text {i}") for i in range(5)))
+    assert len(backend.calls) == 1 and sorted(backend.calls[0]) == [f"text {i}" for i in range(5)]
+    assert all(v.dtype == np.float32 and v.shape == (DIM,) for v in vecs)
+
+
+async def test_batch_max_splits_requests():
+    backend = CountingBackend()
+    svc = _service(backend, batch_max=4, batch_window_ms=1000)
+    await svc.embed_many([f"text {i}" for i in range(10)])
+    await svc.aclose()
+    assert [len(c) for c in backend.calls] == [4, 4, 2]
+
+
+async def test_identical_texts_in_flight_share_one_result():
+    backend = CountingBackend()
+    svc = _service(backend)
+    a, b, c = await asyncio.gather(svc.embed("ปวดหัว"), svc.embed("ปวดหัว "), svc.embed(" ปวดหัว"))
+    assert len(backend.calls) == 1 and len(backend.calls[0]) == 1
+    assert a is b is c
+
+
+async def test_content_addressed_lru_hit_skips_the_backend():
+    backend = CountingBackend()
+    svc = _service(backend)
+    first = await svc.embed("sore   throat")
+    again = await svc.embed("sore throat")
+    assert again is first
+    assert len(backend.calls) == 1
+    assert svc.stats()["lru_hits"] == 1
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class Row:
+    def __init__(self, content_hash, embedding):
+        self.content_hash = content_hash
+        self.embedding = embedding
+
+
+class FakeCacheDB:
+    """public.embedding_cache as a dict; records every statement's parameters."""
+
+    def __init__(self):
+        self.table = {}
+        self.writes = []
+
+    def session(self):
+        db = self
+
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, stmt, params):
+                if "INSERT" in str(stmt):
+                    db.writes.append(params)
+                    flat, dim = params["vectors"], params["dim"]
+                    for i, h in enumerate(params["hashes"]):
+                        db.table[h] = flat[i * dim : (i + 1) * dim]
+                    return FakeResult([])
+                return FakeResult([Row(h, db.table[h]) for h in params["hashes"] if h in db.table])
+
+            async def commit(self):
+                return None
+
+        return Session()
+
+
+async def test_db_cache_binds_vectors_as_floats_and_serves_hits(monkeypatch):
+    monkeypatch.setattr(
+        capabilities_module.schema_capabilities, "_snapshot", _Snapshot(tables=frozenset({"public.embedding_cache"}))
+    )
+    db = FakeCacheDB()
+
+    writer = _service(CountingBackend(), use_db=True, session_factory=db.session)
+    computed = await writer.embed_many(["fever", "cough"])
+    await writer.aclose()
+
+    (params,) = db.writes
+    assert params["dim"] == DIM and params["hashes"] == [content_hash("fever"), content_hash("cough")]
+    assert all(isinstance(x, float) for x in params["vectors"]) and len(params["vectors"]) == 2 * DIM
+
+    # another worker: empty LRU, the DB cache answers, the backend is never called
+    backend = CountingBackend()
+    reader = _service(backend, use_db=True, session_factory=db.session)
+    loaded = await reader.embed_many(["cough", "fever"])
+    assert backend.calls == []
+    assert reader.stats()["db_hits"] == 2
+    np.testing.assert_array_equal(loaded[0], computed[1])
+    np.testing.assert_array_equal(loaded[1], computed[0])
@@ -0,0 +1,178 @@
+# tests/test_geo_tree.py
+
+import gzip
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.v1.modules.masters.repositories.cities_search_repository import CitySearchRepository
+from app.api.v1.modules.masters.repositories.countries_search_repository import CountrySearchRepository
+from app.api.v1.modules.masters.repositories.districts_search_repository import DistrictSearchRepository
+from app.api.v1.modules.masters.repositories.provinces_search_repository import ProvinceSearchRepository
+from app.api.v1.modules.masters.routers.geo_tree_router import get_geo_tree_service, router
+from app.api.v1.modules.masters.services import base_settings_service, geo_tree_service as geo_module
+from app.api.v1.modules.masters.services.cities_search_service import CitySearchService
+from app.api.v1.modules.masters.services.countries_search_service import CountrySearchService
+from app.api.v1.modules.masters.services.districts_search_service import DistrictSearchService
+from app.api.v1.modules.masters.services.geo_tree_service import GeoTreeService
+from app.api.v1.modules.masters.services.provinces_search_service import ProvinceSearchService
+from app.api.v1.modules.masters.services.reference_data_cache import ReferenceDataCache
+
+pytestmark = pytest.mark.anyio
+
+
+def _tables():
+    # search projection rows, as load_all() returns them (name_lo labelled "name" below countries)
+    return {
+        "countries": [
+            {"country_code": "LA", "name_lo": "ລາວ", "name_en": "Laos", "is_active": True},
+            {"country_code": "TH", "name_lo": "ໄທ", "name_en": "Thailand", "is_active": True},
+        ],
+        "provinces": [
+            {"id": 1, "name": "ນະຄອນຫຼວງວຽງຈັນ", "name_en": "Vientiane Capital", "country_code": "LA", "is_active": True},
+            {"id": 2, "name": "ຫຼວງພະບາງ", "name_en": "Luang Prabang", "country_code": "LA", "is_active": True},
+            {"id": 3, "name": "ອຸດອນທານີ", "name_en": "Udon Thani", "country_code": "TH", "is_active": False},
+        ],
+        "cities": [
+            {"id": 10, "name": "ຈັນທະບູລີ", "name_en": "Chanthabouly", "province_id": 1, "is_active": True},
+            {"id": 11, "name": "ສີສັດຕະນາກ", "name_en": "Sisattanak", "province_id": 1, "is_active": True},
+        ],
+        "districts": [
+            {"id": 100, "name": "ບ້ານອານຸ", "name_en": "Ban Anou", "zip_code": 1000, "city_id": 10, "is_active": True},
+            {"id": 101, "name": "ບ້ານຊຽງຍືນ", "name_en": "Ban Xiengyuen", "zip_code": 1000, "city_id": 10,
+             "is_active": True},
+        ],
+    }
+
+
+@pytest.fixture
+def geo(monkeypatch):
+    """GeoTreeService over in-memory tables; write(table, fn) edits a table and bumps its cache version."""
+    cache = ReferenceDataCache(ttl_seconds=60)
+    monkeypatch.setattr(base_settings_service, "reference_data_cache", cache)
+    monkeypatch.setattr(geo_module, "_state", geo_module._GeoTreeState())
+    tables = _tables()
+
+    def repo(cls, table):
+        r = cls(session=None)
+
+        async def load_all():
+            return [dict(x) for x in tables[table]]
+
+        r.load_all = load_all
+        return r
+
+    def service():
+        return GeoTreeService(
+            countries=CountrySearchService(repo(CountrySearchRepository, "countries")),
+            provinces=ProvinceSearchService(repo(ProvinceSearchRepository, "provinces")),
+            cities=CitySearchService(repo(CitySearchRepository, "cities")),
+            districts=DistrictSearchService(repo(DistrictSearchRepository, "districts")),
+        )
+
+    def write(table, fn):
+        fn(tables[table])
+        cache.invalidate(table)
+
+    return service, write
+
+
+@pytest.fixture
+def client(geo):
+    service, _ = geo
+    app = FastAPI()
+    app.include_router(router, prefix="/geo_tree")
+    app.dependency_overrides[get_geo_tree_service] = service
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_snapshot_is_rebuilt_only_when_a_source_changes(geo):
+    service, write = geo
+    first = await service().snapshot()
+    assert await service().snapshot() is first
+
+    tree = json.loads(first.body_json)["data"]["countries"]
+    assert [c["country_code"] for c in tree] == ["LA", "TH"]
+    assert tree[1]["provinces"] == []  # inactive province left out
+    vientiane = tree[0]["provinces"][0]  # ordered by name_lo: ນ < ຫ
+    assert vientiane["name_lo"] == "ນະຄອນຫຼວງວຽງຈັນ"
+    assert [d["id"] for d in vientiane["cities"][0]["districts"]] == [101, 100]  # ຊ < ອ
+
+    write("districts", lambda rows: rows[0].update(name_en="Ban Anou Nuea"))
+    second = await service().snapshot()
+    assert second is not first and second.version != first.version
+
+
+async def test_full_tree_etag_and_304(client, geo):
+    async with client:
+        r = await client.get("/geo_tree", headers={"Accept-Encoding": "identity"})
+        assert r.status_code == 200 and "content-encoding" not in r.headers
+        snap = await geo[0]().snapshot()
+        assert r.headers["etag"] == f'"{snap.version}"' and r.content == snap.body_json
+        assert r.json()["data"]["version"] == snap.version
+
+        for tag in (r.headers["etag"], f'W/{r.headers["etag"]}', f'"stale", {r.headers["etag"]}'):
+            not_modified = await client.get("/geo_tree", headers={"If-None-Match": tag})
+            assert not_modified.status_code == 304 and not_modified.content == b""
+            assert not_modified.headers["etag"] == r.headers["etag"]
+
+        assert (await client.get("/geo_tree", headers={"If-None-Match": '"stale"'})).status_code == 200
+
+
+async def test_gzip_body_is_the_precompressed_snapshot(client, geo):
+    async with client:
+        r = await client.get("/geo_tree", headers={"Accept-Encoding": "gzip"})
+    snap = await geo[0]().snapshot()
+
+    assert r.headers["content-encoding"] == "gzip" and r.headers["vary"] == "Accept-Encoding"
+    assert r.headers["content-length"] == str(len(snap.body_gzip))
+    assert gzip.decompress(snap.body_gzip) == snap.body_json
+    assert r.content == snap.body_json  # httpx decoded it
+    assert len(snap.body_gzip) < len(snap.body_json)
+
+
+async def test_since_returns_the_delta_from_a_remembered_version(client, geo):
+    service, write = geo
+    async with client:
+        v1 = (await client.get("/geo_tree")).json()["data"]["version"]
+
+        write("districts", lambda rows: rows[0].update(name_en="Ban Anou Nuea"))
+        write("districts", lambda rows: rows.append(
+            {"id": 102, "name": "ບ້ານໂພນໄຊ", "name_en": "Ban Phonxay", "zip_code": 1001, "city_id": 11, "is_active": True}
+        ))
+        write("provinces", lambda rows: rows[1].update(is_active=False))
+
+        data = (await client.get("/geo_tree", params={"since": v1})).json()["data"]
+        v2 = (await service().snapshot()).version
+        assert data["version"] == v2 and data["base_version"] == v1
+        assert data["delta"] == {
+            "provinces": {"upsert": [], "remove": [2]},
+            "districts": {
+                "upsert": [
+                    {"id": 100, "city_id": 10, "name_lo": "ບ້ານອານຸ", "name_en": "Ban Anou Nuea", "zip_code": 1000},
+                    {"id": 102, "city_id": 11, "name_lo": "ບ້ານໂພນໄຊ", "name_en": "Ban Phonxay", "zip_code": 1001},
+                ],
+                "remove": [],
+            },
+        }
+
+        assert (await client.get("/geo_tree", params={"since": v2})).json()["data"]["delta"] == {}
+
+        # unknown base: the full tree
+        r = await client.get("/geo_tree", params={"since": "0000000000000000"})
+        assert r.headers["etag"] == f'"{v2}"' and "countries" in r.json()["data"]
+
+
+async def test_history_keeps_the_last_max_history_versions(geo, monkeypatch):
+    service, write = geo
+    monkeypatch.setattr(geo_module, "MAX_HISTORY", 2)
+    versions = [(await service().snapshot()).version]
+    for n in range(2):
+        write("countries", lambda rows: rows[0].update(name_en=f"Laos {n}"))
+        versions.append((await service().snapshot()).version)
+
+    assert (await service().delta_since(versions[0]))[1] is None  # fell out of the history
+    _, delta = await service().delta_since(versions[1])
+    assert delta == {"countries": {"upsert": [{"id": "LA", "name_lo": "ລາວ", "name_en": "Laos 1"}], "remove": []}}
@@ -0,0 +1,135 @@
+# tests/test_hybrid_retrieval.py
+
+import math
+import uuid
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.vector_index import VectorDoc, VectorHit, VectorPartition, VectorRow, reciprocal_rank_fusion
+from app.utils.search_text import lexical_tokens
+
+DIM = 4
+
+
+# ---- lexical_tokens ----
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("ปวดหัว", ["ปว", "วด", "ดห", "หั", "ัว"]),  # Thai runs -> overlapping bigrams
+        ("ไข้หวัด", ["ไข", "ขห", "หว", "วั", "ัด"]),  # tone marks dropped: ไข้ / ไข match
+        ("ยา", ["ยา"]),  # runs shorter than 3 stay whole
+        ("ปวด ปวด", ["ปว", "วด", "ปว", "วด"]),  # duplicates kept (term frequency)
+        ("Paracetamol 500mg, COVID-19", ["paracetamol", "500mg", "covid-19"]),
+        ("ยาแก้ปวด Tylenol", ["ยา", "าแ", "แก", "กป", "ปว", "วด", "tylenol"]),
+        (None, []),
+    ],
+)
+def test_lexical_tokens(value, expected):
+    assert lexical_tokens(value) == expected
+
+
+# ---- BM25 (VectorPartition.search_lexical) ----
+
+CORPUS = [
+    "aspirin aspirin headache",
+    "aspirin fever",
+    "fever cough cold sore throat",
+    "headache after long screen time and poor sleep",
+    "unrelated billing question",
+]
+
+
+def _partition(texts):
+    docs = [VectorDoc(id=uuid.uuid4()) for _ in texts]
+    rows = [
+        VectorRow(chunk_id=uuid.uuid4(), document_id=d.id, embedding=[1.0] * DIM, text=t)
+        for d, t in zip(docs, texts)
+    ]
+    return VectorPartition(rows, docs, dim=DIM), rows
+
+
+def _bm25(query, texts):
+    """Okapi BM25 written out independently of the inverted index."""
+    s = get_settings()
+    k1, b = s.KB_BM25_K1, s.KB_BM25_B
+    docs = [lexical_tokens(t) for t in texts]
+    avgdl = sum(len(d) for d in docs) / len(docs)
+    scores = []
+    for d in docs:
+        score = 0.0
+        for term in set(lexical_tokens(query)):
+            n = sum(term in other for other in docs)
+            tf = d.count(term)
+            if tf:
+                idf = math.log(1 + (len(docs) - n + 0.5) / (n + 0.5))
+                score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(d) / avgdl))
+        scores.append(score)
+    return scores
+
+
+def test_bm25_ranks_a_tiny_corpus():
+    part, rows = _partition(CORPUS)
+    hits = part.search_lexical("aspirin headache", top_k=10)
+
+    expected = _bm25("aspirin headache", CORPUS)
+    ranked = sorted((i for i, s in enumerate(expected) if s > 0), key=lambda i: -expected[i])
+    assert [h.chunk_id for h in hits] == [rows[i].chunk_id for i in ranked]
+    assert [h.score for h in hits] == pytest.approx([expected[i] for i in ranked], rel=1e-5)
+    assert hits[0].chunk_id == rows[0].chunk_id  # both terms, aspirin twice
+    assert rows[4].chunk_id not in {h.chunk_id for h in hits}  # no query term: not returned
+
+
+def test_bm25_top_k_and_filters():
+    part, rows = _partition(CORPUS)
+    assert [h.chunk_id for h in part.search_lexical("aspirin headache", top_k=1)] == [rows[0].chunk_id]
+
+    only = part.search_lexical("aspirin headache", top_k=10, filters={"document_id": str(rows[1].document_id)})
+    assert [h.chunk_id for h in only] == [rows[1].chunk_id]
+    assert part.search_lexical("nothing matches", top_k=10) == []
+
+
+def test_bm25_thai_query_matches_without_tone_marks():
+    part, rows = _partition(["ปวดหัวตัวร้อน", "ไข้หวัดใหญ่", "นัดหมายแพทย์"])
+    hits = part.search_lexical("ไขหวัด", top_k=3)
+    assert hits[0].chunk_id == rows[1].chunk_id
+
+
+# ---- reciprocal_rank_fusion (ranks / scores are what chat_retrieval_items records) ----
+
+def _hits(*ids, base=1.0):
+    return [VectorHit(chunk_id=i, document_id=i, score=base - n / 10) for n, i in enumerate(ids)]
+
+
+def test_fused_scores_and_ranks():
+    a, b, c, d = (uuid.uuid4() for _ in range(4))
+    fused = reciprocal_rank_fusion({"vector": _hits(a, b, c), "lexical": _hits(c, a, d, base=9.0)}, k=60, top_k=10)
+
+    assert [f.chunk_id for f in fused] == [a, c, b, d]
+    by_id = {f.chunk_id: f for f in fused}
+    assert by_id[a].score == pytest.approx(1 / 61 + 1 / 62)
+    assert by_id[c].score == pytest.approx(1 / 63 + 1 / 61)
+    assert by_id[b].score == pytest.approx(1 / 62)
+    assert dict(by_id[a].ranks) == {"vector": 1, "lexical": 2}
+    assert dict(by_id[a].scores) == {"vector": pytest.approx(1.0), "lexical": pytest.approx(8.9)}
+    assert dict(by_id[d].ranks) == {"lexical": 3}  # only the lists a chunk appeared in
+
+    assert [f.chunk_id for f in reciprocal_rank_fusion({"vector": _hits(a, b, c)}, top_k=2)] == [a, b]
+
+
+def test_ties_go_to_the_best_single_rank_then_the_first_list():
+    x, y = uuid.uuid4(), uuid.uuid4()
+    swapped = reciprocal_rank_fusion({"vector": _hits(x, y), "lexical": _hits(y, x)}, top_k=2)
+    assert swapped[0].score == swapped[1].score
+    assert [f.chunk_id for f in swapped] == [x, y]  # same best rank: the first list's order
+
+    # k=0: p = 1/2 + 1/6, q = 1/3 + 1/3; q is seen first, p has the better single rank
+    p, q, *fill = (uuid.uuid4() for _ in range(6))
+    fused = reciprocal_rank_fusion(
+        {"lexical": _hits(fill[0], fill[1], q, fill[2], fill[3], p), "vector": _hits(fill[0], p, q)}, k=0, top_k=10
+    )
+    scores = {f.chunk_id: f.score for f in fused}
+    assert scores[p] == scores[q]
+    ids = [f.chunk_id for f in fused]
+    assert ids.index(p) == ids.index(q) - 1
@@ -0,0 +1,80 @@
+# tests/test_image_derivatives.py
+
+import io
+
+import pytest
+
+from app.core.clients.storage_client import LocalStorage, StorageError
+from app.core.config import get_settings
+from app.services import image_derivatives
+from app.services.image_derivatives import derivative_path, store_derivatives
+
+Image = pytest.importorskip("PIL.Image")
+
+pytestmark = pytest.mark.anyio
+
+BUCKET = "images"
+ORIGINAL = "patients/p1/scan.jpg"
+
+
+@pytest.fixture(autouse=True)
+def _pool():
+    yield
+    image_derivatives.shutdown()
+
+
+def _storage(tmp_path) -> LocalStorage:
+    return LocalStorage(tmp_path, "http://files.local/storage", max_concurrency=4)
+
+
+def _jpeg(tmp_path, size=(2000, 1000)):
+    src = tmp_path / "upload.jpg"
+    Image.new("RGB", size, (200, 40, 40)).save(src, "JPEG")
+    return src
+
+
+def _objects(tmp_path):
+    return sorted(str(p.relative_to(tmp_path / BUCKET)) for p in (tmp_path / BUCKET).rglob("*") if p.is_file())
+
+
+async def test_jpeg_is_stored_in_both_sizes(tmp_path):
+    storage = _storage(tmp_path)
+    urls = await store_derivatives(storage, BUCKET, ORIGINAL, _jpeg(tmp_path))
+
+    s = get_settings()
+    assert set(urls) == {"thumbnail_url", "preview_url"}
+    for name, field, edge in (("thumb", "thumbnail_url", s.IMAGE_THUMBNAIL_PX), ("preview", "preview_url", s.IMAGE_PREVIEW_PX)):
+        path = derivative_path(ORIGINAL, name)
+        assert urls[field] == storage.public_url(BUCKET, path)
+        with Image.open(tmp_path / BUCKET / path) as im:
+            assert im.format == "JPEG" and im.mode == "RGB"
+            assert max(im.size) == edge and im.size[0] == 2 * im.size[1]  # longest edge, aspect kept
+
+
+async def test_small_image_is_not_upscaled(tmp_path):
+    urls = await store_derivatives(_storage(tmp_path), BUCKET, ORIGINAL, _jpeg(tmp_path, size=(120, 80)))
+    assert len(urls) == 2
+    for name in ("thumb", "preview"):
+        with Image.open(tmp_path / BUCKET / derivative_path(ORIGINAL, name)) as im:
+            assert im.size == (120, 80)
+
+
+async def test_undecodable_file_returns_nothing_and_stores_nothing(tmp_path):
+    src = tmp_path / "upload.jpg"
+    src.write_bytes(b"not an image" * 100)
+    (tmp_path / BUCKET).mkdir()
+
+    assert await store_derivatives(_storage(tmp_path), BUCKET, ORIGINAL, src) == {}
+    assert _objects(tmp_path) == []
+
+
+async def test_storage_error_removes_the_derivatives_already_written(tmp_path):
+    class FailingThumb(LocalStorage):
+        async def _put(self, bucket, path, body, content_type):
+            if ".thumb." in path:
+                raise StorageError("bucket unavailable")
+            await super()._put(bucket, path, body, content_type)
+
+    storage = FailingThumb(tmp_path, "http://files.local/storage", max_concurrency=4)
+    assert await store_derivatives(storage, BUCKET, ORIGINAL, _jpeg(tmp_path)) == {}
+    assert _objects(tmp_path) == []  # the preview (rendered and stored first) was removed again
@@ -0,0 +1,211 @@
+# tests/test_kb_ingestion.py
+
+import uuid
+
+import numpy as np
+import pytest
+
+from app.api.v1.modules.kb.repositories.kb_ingestion_repository import KBIngestionRepository
+from app.api.v1.modules.kb.services import kb_ingestion_service as service_module
+from app.api.v1.modules.kb.services.kb_ingestion_service import KBIngestionService
+from app.core.config import get_settings
+from app.services.text_chunking import Chunk, chunk_pages
+from app.services.vector_index import VectorIndex
+
+pytestmark = pytest.mark.anyio
+
+WORDS = " ".join(f"word{i:03d}" for i in range(120))  # 959 chars, spaces only
+
+
+# ---- chunk_pages ----
+
+def test_chunks_overlap_on_a_word_boundary():
+    chunks = chunk_pages([WORDS], max_chars=200, overlap_chars=40)
+
+    assert [c.index for c in chunks] == list(range(len(chunks))) and len(chunks) > 4
+    assert all(len(c.content) <= 200 for c in chunks)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert prev.char_start < nxt.char_start < prev.char_end  # shared context
+        assert nxt.content.startswith("word")  # never starts mid-word
+        assert prev.content.endswith(nxt.content[: prev.char_end - nxt.char_start])
+    assert chunks[-1].content.endswith("word119")
+
+
+def test_chunks_without_overlap_tile_the_text():
+    chunks = chunk_pages([WORDS], max_chars=200, overlap_chars=0)
+    assert " ".join(c.content for c in chunks) == WORDS
+    assert all(a.char_end <= b.char_start for a, b in zip(chunks, chunks[1:]))
+
+
+def test_chunks_carry_their_page_range():
+    pages = ["alpha " * 30, "beta " * 30, "gamma " * 30]
+    chunks = chunk_pages(pages, max_chars=250, overlap_chars=30)
+
+    assert chunks[0].page_start == 1 and chunks[-1].page_end == 3
+    for c in chunks:
+        assert c.page_start <= c.page_end
+        for page, word in ((1, "alpha"), (2, "beta"), (3, "gamma")):
+            assert (word in c.content) == (c.page_start <= page <= c.page_end)
+    assert any(c.page_start < c.page_end for c in chunks)  # overlap / cut across a page break
+    assert chunk_pages(pages, max_chars=250, overlap_chars=30) == chunks  # deterministic: resume relies on it
+
+
+# ---- insert_chunks: one flat real[] sliced per row ----
+
+class CaptureSession:
+    def __init__(self):
+        self.params = []
+
+    async def execute(self, stmt, params):
+        self.params.append(params)
+        rows = [type("Row", (), {"chunk_index": i, "id": uuid.uuid4()})() for i in params["chunk_indexes"]]
+        return type("Result", (), {"all": lambda self: rows})()
+
+
+def _chunk(i: int) -> Chunk:
+    return Chunk(index=i, content=f"c{i}", page_start=1, page_end=1, char_start=i, char_end=i + 1)
+
+
+async def test_embeddings_are_bound_as_one_float_array():
+    db = CaptureSession()
+    vectors = [np.arange(4, dtype=np.float32) + 10 * i for i in range(3)]
+    ids = await KBIngestionRepository(db).insert_chunks(
+        company_code="C1", document_id=uuid.uuid4(), column_type="vector(4)",
+        chunks=[_chunk(i) for i in range(3)], metadatas=[{}] * 3, embeddings=vectors,
+    )
+
+    (params,) = db.params
+    flat, dim = params["embeddings"], params["dim"]
+    assert dim == 4 and len(flat) == 12 and all(type(x) is float for x in flat)
+    # what (:embeddings)[(i - 1) * :dim + 1 : i * :dim] selects for ordinality i = 1..3
+    assert [flat[(i - 1) * dim : i * dim] for i in (1, 2, 3)] == [v.tolist() for v in vectors]
+    assert sorted(ids) == [0, 1, 2]
+
+
+async def test_ragged_embeddings_are_rejected():
+    with pytest.raises(ValueError):
+        await KBIngestionRepository(CaptureSession()).insert_chunks(
+            company_code="C1", document_id=uuid.uuid4(), column_type="real[]",
+            chunks=[_chunk(0), _chunk(1)], metadatas=[{}, {}], embeddings=[[1.0, 2.0], [1.0]],
+        )
+
+
+# ---- resume from count_done_chunks ----
+
+class Store:
+    """kb_documents row + committed kb_chunks of one document."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.chunks = {}  # chunk_index -> content
+        self.inserts = []  # chunk indexes per insert_chunks call
+        self.fail_on_insert = None
+
+
+class FakeSession:
+    def __init__(self, store):
+        self.store = store
+        self.pending_chunks = {}
+        self.pending_doc = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        self.store.chunks.update(self.pending_chunks)
+        if self.pending_doc is not None:
+            self.store.doc = self.pending_doc
+        self.pending_chunks, self.pending_doc = {}, None
+
+    async def rollback(self):
+        self.pending_chunks, self.pending_doc = {}, None
+
+
+class FakeRepo:
+    def __init__(self, db):
+        self.db = db
+        self.store = db.store
+
+    async def get_document(self, *, document_id):
+        return dict(self.store.doc)
+
+    async def embedding_column_type(self):
+        return "vector(8)"
+
+    async def count_done_chunks(self, *, document_id):
+        return max(self.store.chunks, default=-1) + 1
+
+    async def delete_chunks(self, *, document_id):
+        self.store.chunks.clear()
+
+    async def set_state(self, *, document_id, status, ingest):
+        doc = dict(self.db.pending_doc or self.store.doc)
+        doc["status"] = status
+        doc["metadata"] = {**(doc.get("metadata") or {}), "ingest": dict(ingest)}
+        self.db.pending_doc = doc
+
+    async def insert_chunks(self, *, company_code, document_id, column_type, chunks, metadatas, embeddings):
+        indexes = [c.index for c in chunks]
+        if self.store.fail_on_insert in indexes:
+            raise RuntimeError("connection lost")
+        self.store.inserts.append(indexes)
+        self.db.pending_chunks.update({c.index: c.content for c in chunks})
+        return {i: uuid.uuid4() for i in indexes}
+
+
+@pytest.fixture
+def ingest(monkeypatch):
+    doc_id = uuid.uuid4()
+    store = Store({"id": doc_id, "company_code": "C1", "metadata": {"source_path": "c1/a.txt"}, "status": "draft"})
+    source = {"sha256": "s1", "pages": [WORDS]}
+
+    async def load_source(self, source_path):
+        return source["sha256"], source["pages"]
+
+    settings = get_settings().model_copy(
+        update={"KB_CHUNK_CHARS": 200, "KB_CHUNK_OVERLAP_CHARS": 0, "KB_INGEST_BATCH": 2, "KB_INGEST_CONCURRENCY": 2}
+    )
+    monkeypatch.setattr(service_module, "KBIngestionRepository", FakeRepo)
+    monkeypatch.setattr(service_module, "kb_vector_index", VectorIndex(ttl_seconds=60))
+    monkeypatch.setattr(KBIngestionService, "_load_source", load_source)
+    service = KBIngestionService(settings=settings, session_factory=lambda: FakeSession(store))
+
+    async def run(**kw):
+        return await service.ingest(doc_id, **kw)
+
+    return run, store, source
+
+
+async def test_interrupted_ingest_resumes_after_the_committed_chunks(ingest):
+    run, store, _ = ingest
+    total = len(chunk_pages([WORDS], max_chars=200, overlap_chars=0))
+
+    store.fail_on_insert = 2  # the second batch (chunks 2, 3) never commits
+    first = await run()
+    assert first.status == "failed" and first.written == 2
+    assert sorted(store.chunks) == [0, 1]
+    assert store.doc["status"] == "failed" and store.doc["metadata"]["ingest"]["chunks_done"] == 2
+
+    store.fail_on_insert = None
+    store.inserts.clear()
+    second = await run()
+    assert second.status == "ready" and second.resumed_from == 2
+    assert store.inserts[0][0] == 2  # chunks 0, 1 are not embedded or written again
+    assert sorted(store.chunks) == list(range(total))
+    assert store.doc["metadata"]["ingest"]["chunks_done"] == total
+
+
+async def test_changed_source_starts_over(ingest):
+    run, store, source = ingest
+    store.fail_on_insert = 2
+    await run()
+
+    store.fail_on_insert = None
+    store.inserts.clear()
+    source["sha256"] = "s2"  # another file under the same path: the fingerprint no longer matches
+    report = await run()
+    assert report.status == "ready" and report.resumed_from == 0
+    assert store.inserts[0][0] == 0
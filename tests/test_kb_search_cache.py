@@ -0,0 +1,128 @@
+# tests/test_kb_search_cache.py
+
+import uuid
+
+import pytest
+
+from app.api.v1.modules.kb.models.schemas import KBSearchRequest
+from app.api.v1.modules.kb.services import kb_search_service as service_module
+from app.api.v1.modules.kb.services.kb_search_cache import KBSearchCache
+from app.api.v1.modules.kb.services.kb_search_service import KBSearchService
+from app.core.config import get_settings
+from app.services.vector_index import VectorDoc, VectorIndex, VectorRow
+
+pytestmark = pytest.mark.anyio
+
+COMPANY = "C1"
+DOC = VectorDoc(id=uuid.uuid4())
+
+
+def _row(content: str) -> VectorRow:
+    dim = int(get_settings().OPENAI_EMBED_DIM)
+    return VectorRow(chunk_id=uuid.uuid4(), document_id=DOC.id, embedding=[1.0] * dim, text=content)
+
+
+class FakeRepo:
+    """kb_chunks behind KBSearchService: the loader's rows + content by chunk id."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.loads = 0
+
+    async def load_vectors(self, *, company_code):
+        self.loads += 1
+        return list(self.rows), [DOC]
+
+    async def fetch_chunks(self, *, company_code, chunk_ids):
+        by_id = {r.chunk_id: r for r in self.rows}
+        return [{"chunk_id": i, "content": by_id[i].text} for i in chunk_ids if i in by_id]
+
+
+@pytest.fixture
+def search(monkeypatch):
+    index, cache = VectorIndex(ttl_seconds=0), KBSearchCache(ttl_seconds=60, max_entries=100)
+    monkeypatch.setattr(service_module, "kb_vector_index", index)
+    monkeypatch.setattr(service_module, "kb_search_cache", cache)
+    repo = FakeRepo([_row("aspirin for headache"), _row("fever and cough")])
+    service = KBSearchService(repo=repo, company_code=COMPANY, settings=get_settings())
+
+    ranked = []
+    rank = service.rank
+
+    async def counting_rank(**kw):
+        ranked.append(kw["req"].query)
+        return await rank(**kw)
+
+    service.rank = counting_rank
+
+    async def run(query="aspirin"):
+        return await service.search(req=KBSearchRequest(query=query, mode="lexical"))
+
+    return run, service, index, cache, repo, ranked
+
+
+async def test_repeat_query_is_served_from_the_cache(search):
+    run, _, _, cache, _, ranked = search
+    await run()  # cold: the partition build bumps the version, this ranking is not kept
+    await run()
+    hits = await run()
+
+    assert ranked == ["aspirin", "aspirin"]
+    assert [h["content"] for h in hits] == ["aspirin for headache"]
+    assert cache.stats()["hits"] == 1
+
+
+async def test_index_write_or_rebuild_makes_entries_miss(search):
+    run, _, index, cache, repo, ranked = search
+    await run()
+    await run()
+    assert len(ranked) == 2 and cache.stats()["size"] == 1
+
+    # a write (upsert -> _bump): the cached ranking would miss the new chunk
+    new = _row("aspirin dosage for children")
+    repo.rows.append(new)
+    index.upsert(COMPANY, [new], [DOC])
+    hits = await run()
+    assert len(ranked) == 3
+    assert new.chunk_id in {h["chunk_id"] for h in hits}
+    await run()
+    assert len(ranked) == 3  # re-cached under the new version
+
+    # a rebuild (invalidate -> reload): a new index state, again a miss
+    loads = repo.loads
+    index.invalidate(COMPANY)
+    await run()
+    assert repo.loads == loads + 1 and len(ranked) == 4
+
+    # _bump alone is enough
+    index._bump(COMPANY)
+    await run()
+    assert len(ranked) == 5
+
+
+async def test_ranking_computed_across_a_version_change_is_not_stored(search):
+    run, service, index, cache, repo, ranked = search
+    await run()  # partition built
+    rank = service.rank
+
+    async def racing_rank(**kw):
+        hits = await rank(**kw)
+        index.remove(COMPANY, [repo.rows[0].chunk_id])  # a write lands while the request ranks
+        return hits
+
+    service.rank = racing_rank
+    await run()
+    assert cache.stats()["size"] == 0
+
+    service.rank = rank
+    await run()
+    assert len(ranked) == 3 and cache.stats()["size"] == 1
+
+
+def test_entry_of_another_version_is_a_miss():
+    cache = KBSearchCache(ttl_seconds=60, max_entries=10)
+    key = cache.key(COMPANY, "ปวดหัว  ", "hybrid", {"doc_type": "faq"}, 8)
+    cache.put(key, 3, [])
+    assert cache.get(cache.key(COMPANY, "ปวดหัว", "hybrid", {"doc_type": "faq"}, 8), 3) == []  # same text, whitespace
+    assert cache.get(key, 4) is None
+    assert (cache.hits, cache.misses) == (1, 1)
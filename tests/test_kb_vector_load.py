@@ -0,0 +1,69 @@
+# tests/test_kb_vector_load.py
+
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.api.v1.modules.kb.repositories import kb_search_repository
+from app.api.v1.modules.kb.repositories.kb_search_repository import KBSearchRepository
+from app.services.vector_index import VectorPartition
+
+pytestmark = pytest.mark.anyio
+
+DIM = 8
+
+
+class FakeSession:
+    """Serves kb_documents, then kb_chunks keyset pages (ORDER BY id, id > :after, LIMIT :limit)."""
+
+    def __init__(self, chunks):
+        self.chunks = sorted(chunks, key=lambda c: c.id)
+        self.pages = 0
+
+    async def execute(self, stmt, params):
+        if "kb_documents" in str(stmt) and "kb_chunks" not in str(stmt):
+            rows = [SimpleNamespace(id=self.chunks[0].document_id, doc_type=None, language_code="th", tags=None)]
+        else:
+            self.pages += 1
+            after = params.get("after")
+            rows = [c for c in self.chunks if after is None or c.id > after][: params["limit"]]
+        return SimpleNamespace(all=lambda: rows)
+
+
+def _chunks(n: int):
+    rnd = np.random.default_rng(3)
+    doc = uuid.uuid4()
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(), document_id=doc, embedding=[float(x) for x in rnd.normal(size=DIM)],
+            metadata=None, content=f"chunk {i}",
+        )
+        for i in range(n)
+    ]
+
+
+async def test_pages_are_read_as_float32_rows(monkeypatch):
+    monkeypatch.setattr(kb_search_repository, "VECTOR_LOAD_BATCH", 4)
+    chunks = _chunks(10)
+    db = FakeSession(chunks)
+    rows, docs = await KBSearchRepository(db).load_vectors(company_code="C1")
+
+    assert db.pages == 3 and len(rows) == 10 and len(docs) == 1
+    assert all(isinstance(r.embedding, np.ndarray) and r.embedding.dtype == np.float32 for r in rows)
+
+
+async def test_partition_from_loaded_rows_ranks_by_cosine(monkeypatch):
+    chunks = _chunks(50)
+    rows, docs = await KBSearchRepository(FakeSession(chunks)).load_vectors(company_code="C1")
+    part = VectorPartition(rows, docs, dim=DIM)
+
+    query = np.asarray(chunks[17].embedding, dtype=np.float32)
+    hits = part.search(query, 5)
+    assert hits[0].chunk_id == chunks[17].id
+    assert hits[0].score == pytest.approx(1.0, abs=1e-5)
+
+    matrix = np.asarray([c.embedding for c in sorted(chunks, key=lambda c: c.id)], dtype=np.float32)
+    expected = matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+    assert [h.score for h in hits] == pytest.approx(sorted(expected, reverse=True)[:5], abs=1e-5)
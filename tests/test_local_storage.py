@@ -0,0 +1,71 @@
+# tests/test_local_storage.py
+
+import asyncio
+import hashlib
+
+import pytest
+
+from app.core.clients.storage_client import ChecksumMismatch, LocalStorage, UploadTooLarge
+
+pytestmark = pytest.mark.anyio
+
+CHUNK = b"x" * 64 * 1024
+
+
+async def _chunks(n: int, chunk: bytes = CHUNK):
+    for _ in range(n):
+        yield chunk
+        await asyncio.sleep(0)
+
+
+def _storage(tmp_path, max_concurrency: int = 4) -> LocalStorage:
+    return LocalStorage(tmp_path, "http://files.local/storage", max_concurrency=max_concurrency)
+
+
+async def test_streamed_upload_is_stored_with_its_sha256(tmp_path):
+    storage = _storage(tmp_path)
+    stored = await storage.put_stream("docs", "a/report.pdf", _chunks(8), content_type="application/pdf")
+
+    body = CHUNK * 8
+    assert stored.size == len(body)
+    assert stored.sha256 == hashlib.sha256(body).hexdigest()
+    assert (tmp_path / "docs" / "a" / "report.pdf").read_bytes() == body
+    assert stored.url == "http://files.local/storage/docs/a/report.pdf"
+    assert storage.path_from_url("docs", stored.url) == "a/report.pdf"
+
+
+async def test_checksum_mismatch_removes_the_object(tmp_path):
+    storage = _storage(tmp_path)
+    with pytest.raises(ChecksumMismatch):
+        await storage.put_stream("docs", "bad.bin", _chunks(2), content_type="application/octet-stream",
+                                 expected_sha256="0" * 64)
+    assert not (tmp_path / "docs" / "bad.bin").exists()
+
+
+async def test_upload_over_the_size_limit_leaves_nothing_behind(tmp_path):
+    storage = _storage(tmp_path)
+    with pytest.raises(UploadTooLarge):
+        await storage.put_stream("docs", "big.bin", _chunks(4), content_type="application/octet-stream",
+                                 max_bytes=len(CHUNK) * 3)
+    assert list((tmp_path / "docs").iterdir()) == []
+
+
+async def test_concurrent_uploads_are_bounded_by_the_semaphore(tmp_path):
+    storage = _storage(tmp_path, max_concurrency=2)
+    active = peak = 0
+
+    async def tracked(n: int):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            async for chunk in _chunks(n):
+                yield chunk
+        finally:
+            active -= 1
+
+    stored = await asyncio.gather(
+        *(storage.put_stream("docs", f"f{i}.bin", tracked(4), content_type="application/octet-stream") for i in range(6))
+    )
+    assert peak == 2
+    assert sorted(s.path for s in stored) == [f"f{i}.bin" for i in range(6)]
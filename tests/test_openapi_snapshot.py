@@ -0,0 +1,56 @@
+# tests/test_openapi_snapshot.py
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from app.core import openapi_snapshot
+from app.core.openapi_snapshot import install_openapi_snapshot, snapshot_path
+
+pytestmark = pytest.mark.anyio
+
+
+class Item(BaseModel):
+    name: str
+
+
+def _app() -> FastAPI:
+    app = FastAPI(version="1.0.0")
+
+    @app.get("/items", response_model=Item, operation_id="get_item")
+    async def get_item():
+        return Item(name="a")
+
+    install_openapi_snapshot(app)
+    return app
+
+
+async def _fetch(app: FastAPI, root_path: str = "") -> dict:
+    transport = httpx.ASGITransport(app=app, root_path=root_path)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        res = await c.get("/openapi.json")
+    assert res.status_code == 200
+    return res.json()
+
+
+async def test_loaded_snapshot_gets_the_root_path_server(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAPI_SNAPSHOT_DIR", str(tmp_path))
+    built = _app()
+    assert "servers" not in await _fetch(built)
+    assert built.state.openapi_snapshot.source == "build"
+
+    loaded = _app()
+    schema = await _fetch(loaded, root_path="/wellplus")
+    assert loaded.state.openapi_snapshot.source == "disk"
+    assert schema["servers"] == [{"url": "/wellplus"}]
+    assert loaded.servers == []  # the snapshot (and its key) never depends on root_path
+
+
+def test_snapshot_key_follows_the_source(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAPI_SNAPSHOT_DIR", str(tmp_path))
+    app = _app()
+    before = snapshot_path(app)
+    monkeypatch.setattr(openapi_snapshot, "source_fingerprint", lambda package="app": "edited-dto")
+    assert snapshot_path(app) != before
+    assert snapshot_path(app).name.startswith("openapi-1.0.0-")
@@ -0,0 +1,45 @@
+# tests/test_patients_search.py
+
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.v1.modules.patients.repositories.patients_search_repository import PatientsSearchRepository
+from app.db.models.patient_settings import Patient
+
+from tests.conftest import sqlite_metadata
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def repo():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    md = sqlite_metadata(Patient)
+    async with engine.begin() as conn:
+        await conn.run_sync(md.create_all)
+        await conn.execute(
+            md.tables["patients"].insert(),
+            [
+                {"id": uuid.uuid4(), "patient_code": "HN001", "id_card_no": "1100000000001",
+                 "full_name_lo": "สมชาย ใจดี", "status": "active", "is_active": True},
+                {"id": uuid.uuid4(), "patient_code": "HN002", "id_card_no": "1100000000002",
+                 "full_name_lo": "สมศรี ใจดี", "status": "active", "is_active": True},
+            ],
+        )
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        yield PatientsSearchRepository(session)
+    await engine.dispose()
+
+
+async def test_exact_match_pages_agree_with_its_total(repo):
+    first, total = await repo.search_projection(q_text="hn001", limit=1, offset=0)
+    assert [r["patient_code"] for r in first] == ["HN001"] and total == 1
+
+    # past the exact hit: empty page, same total (no fall-through to the fuzzy query)
+    rest, total = await repo.search_projection(q_text="hn001", limit=1, offset=1)
+    assert rest == [] and total == 1
+
+    by_id_card, total = await repo.search_projection(q_text="1-1000-00000-00-2", limit=10, offset=0)
+    assert [r["patient_code"] for r in by_id_card] == ["HN002"] and total == 1
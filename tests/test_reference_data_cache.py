@@ -0,0 +1,64 @@
+# tests/test_reference_data_cache.py
+
+import pytest
+
+from app.db.models import Country
+from app.api.v1.modules.masters.repositories.countries_search_repository import CountrySearchRepository
+from app.api.v1.modules.masters.services.countries_search_service import CountrySearchService
+from app.api.v1.modules.masters.services.reference_data_cache import ReferenceDataCache, reference_data_cache
+
+pytestmark = pytest.mark.anyio
+
+ROWS = [
+    {"country_code": "LA", "name_lo": "ລາວ", "name_en": "Laos", "is_active": True, "created_at": None,
+     "updated_at": None, "internal_note": "snapshot-only"},
+    {"country_code": "TH", "name_lo": "ໄທ", "name_en": "Thailand", "is_active": True, "created_at": None,
+     "updated_at": None, "internal_note": "snapshot-only"},
+]
+
+
+async def _load():
+    return [dict(r) for r in ROWS]
+
+
+async def test_etag_depends_on_content_not_process_version():
+    fresh = ReferenceDataCache(ttl_seconds=60)
+    bumped = ReferenceDataCache(ttl_seconds=60)
+    for _ in range(3):
+        bumped.invalidate("countries")
+
+    a = await fresh.get("countries", _load, pk_field="country_code")
+    b = await bumped.get("countries", _load, pk_field="country_code")
+    assert a.version != b.version
+    assert a.etag == b.etag
+
+    async def changed():
+        return [dict(ROWS[0], name_en="Lao PDR"), dict(ROWS[1])]
+
+    bumped.invalidate("countries")
+    c = await bumped.get("countries", changed, pk_field="country_code")
+    assert c.etag != a.etag
+
+
+class Repo(CountrySearchRepository):
+    def __init__(self):
+        super().__init__(session=None)
+
+    async def load_all(self):
+        return await _load()
+
+
+async def test_cached_search_returns_the_sql_projection():
+    reference_data_cache.clear()
+    svc = CountrySearchService(Repo())
+    rows, total = await svc.search(q="thai", is_active=True, sort_by="country_code")
+    assert total == 1
+    assert rows == [{k: ROWS[1][k] for k in Country.__table__.c.keys()}]
+
+    Repo.list_columns = ("country_code", "name_en")
+    try:
+        rows, _ = await svc.search(q="", is_active=None, sort_by="country_code", sort_dir="asc")
+        assert rows == [{"country_code": "LA", "name_en": "Laos"}, {"country_code": "TH", "name_en": "Thailand"}]
+    finally:
+        Repo.list_columns = None
+        reference_data_cache.clear()
@@ -0,0 +1,113 @@
+# tests/test_reply_stream.py
+
+import asyncio
+import json
+import unicodedata
+
+import pytest
+
+from app.services import reply_stream
+from app.services.reply_stream import LocalReplyGenerator, stream_reply
+
+pytestmark = pytest.mark.anyio
+
+THAI = "ผู้ป่วยมีอาการปวดศีรษะเรื้อรังและคลื่นไส้ ควรพบแพทย์ที่แผนกอายุรกรรมภายในสัปดาห์นี้"
+
+
+# ---- LocalReplyGenerator.chunks ----
+
+@pytest.mark.parametrize("chunk_chars", [1, 3, 5, 24])
+def test_thai_chunks_keep_marks_with_their_base(chunk_chars):
+    pieces = LocalReplyGenerator(chunk_chars).chunks(THAI)
+    assert "".join(pieces) == THAI
+    assert all(pieces) and not any(unicodedata.category(p[0]) == "Mn" for p in pieces)
+
+
+def test_words_are_packed_up_to_chunk_chars():
+    pieces = LocalReplyGenerator(12).chunks("take two tablets after meals")
+    assert pieces == ["take two ", "tablets ", "after meals"]
+    assert LocalReplyGenerator(12).chunks("") == []
+
+
+# ---- stream_reply ----
+
+def _events(body: list) -> list:
+    out = []
+    for raw in body:
+        event, data = raw.decode("utf-8").strip().split("\n")
+        out.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return out
+
+
+class FailingGenerator:
+    async def stream(self, *, prompt, draft, lang=None):
+        yield "ปวด"
+        raise RuntimeError("model went away")
+
+
+@pytest.fixture
+def persisted():
+    saved = []
+
+    async def persist(text, status):
+        saved.append((text, status))
+
+    return saved, persist
+
+
+def _stream(persist, generator=None, draft=THAI):
+    return stream_reply(
+        prompt="q", draft=draft, start={"session_id": "s1"}, final={"assistant_message_id": "m1"},
+        persist=persist, generator=generator or LocalReplyGenerator(8),
+    )
+
+
+async def test_events_are_start_deltas_done_and_the_reply_is_saved(persisted):
+    saved, persist = persisted
+    events = _events([b async for b in _stream(persist)])
+    await reply_stream.drain()
+
+    names = [e for e, _ in events]
+    assert names[0] == "start" and names[-1] == "done" and set(names[1:-1]) == {"delta"}
+    assert events[0][1] == {"session_id": "s1"}
+    assert "".join(d["text"] for e, d in events if e == "delta") == THAI
+    assert events[-1][1] == {"assistant_message_id": "m1", "assistant_text": THAI}
+    assert saved == [(THAI, "done")]
+
+
+async def test_disconnect_still_saves_what_was_sent(persisted):
+    saved, persist = persisted
+    body = _stream(persist)
+    sent = [await body.__anext__() for _ in range(3)]  # start + two deltas, then the client goes away
+    await body.aclose()
+    await reply_stream.drain()
+
+    text = "".join(d["text"] for e, d in _events(sent) if e == "delta")
+    assert saved == [(text, "aborted")] and THAI.startswith(text) and text
+
+
+async def test_cancelled_response_task_still_saves(persisted):
+    saved, persist = persisted
+    gate = asyncio.Event()
+
+    async def consume():
+        async for raw in _stream(persist, LocalReplyGenerator(8, delay_seconds=0.01)):
+            gate.set()
+
+    task = asyncio.create_task(consume())
+    await gate.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await reply_stream.drain()
+
+    assert [status for _, status in saved] == ["aborted"]
+
+
+async def test_generation_error_sends_error_and_records_the_turn(persisted):
+    saved, persist = persisted
+    events = _events([b async for b in _stream(persist, FailingGenerator())])
+    await reply_stream.drain()
+
+    assert [e for e, _ in events] == ["start", "delta", "error"]
+    assert saved == [("ปวด", "failed")]
@@ -0,0 +1,88 @@
+# tests/test_schema_refresh_admin.py
+
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.api.v1.authen import access_engine as engine_module
+from app.api.v1.authen.access_engine import compile_access
+from app.api.v1.authen.auth import current_principal
+from app.api.v1.authen.principal_cache import ResolvedPrincipal
+from app.database.session import get_db
+from app.main import app
+from app.services import schema_capabilities as capabilities_module
+
+pytestmark = pytest.mark.anyio
+
+PROFILE = "p-ops"
+
+
+def _principal():
+    return ResolvedPrincipal(
+        user_id=uuid4(), profile_id=PROFILE, company_code="WS", patient_id=None, staff_id=None,
+        actor_type="staff", email=None, is_active=True,
+    )
+
+
+def _compiled(granted: bool):
+    return compile_access(
+        "WS",
+        0,
+        permissions=[("perm-admin", "system.admin")],
+        routes=[("/health/schema/refresh", "POST", "perm-admin")],
+        role_permissions=[("role-ops", "perm-admin")] if granted else [],
+        group_roles=[],
+        profile_roles=[(PROFILE, "role-ops")],
+        profile_groups=[],
+    )
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def client(monkeypatch):
+    refreshed = []
+
+    async def refresh(db):
+        refreshed.append(db)
+        return {"loaded": True}
+
+    async def no_db():
+        yield None
+
+    monkeypatch.setattr(capabilities_module.schema_capabilities, "refresh", refresh)
+    monkeypatch.setattr("app.main.AsyncSessionLocal", lambda: _NullSession())
+    app.dependency_overrides[current_principal] = _principal
+    app.dependency_overrides[get_db] = no_db
+    try:
+        yield httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test"), refreshed
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("granted,status", [(False, 403), (True, 200)])
+async def test_schema_refresh_requires_the_route_grant(client, monkeypatch, granted, status):
+    http, refreshed = client
+    asked = []
+
+    async def rpc(db, profile_id, route, method, company_code):
+        asked.append((route, method))
+        return granted
+
+    async def get(db, company_code):
+        return _compiled(granted)
+
+    monkeypatch.setattr(engine_module, "check_rpc", rpc)
+    monkeypatch.setattr(engine_module.access_engine, "get", get)
+    async with http:
+        resp = await http.post("/health/schema/refresh")
+    assert resp.status_code == status
+    assert asked == [("/health/schema/refresh", "POST")]  # the RPC decides by default
+    assert len(refreshed) == (1 if granted else 0)
@@ -0,0 +1,37 @@
+# tests/test_search_text.py
+
+import pytest
+
+from app.utils.search_text import normalize_text, strip_name_title
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("นายสมชาย ใจดี", "สมชาย ใจดี"),
+        ("นาย สมชาย", "สมชาย"),
+        ("นางสาวสมศรี", "สมศรี"),
+        ("นางสาวิตรี", "สาวิตรี"),  # "นางสาว" + combining mark -> title "นาง", name "สาวิตรี"
+        ("ด.ช.สมชาย", "สมชาย"),
+        ("น.ส.แก้ว", "แก้ว"),  # leading vowel starts a word
+        ("คุณ.สมชาย", "สมชาย"),
+        ("Mr. John", "john"),
+        ("dr smith", "smith"),
+    ],
+)
+def test_titles_are_stripped(value, expected):
+    assert strip_name_title(normalize_text(value)) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "คุณากร ใจดี",  # following vowel: "คุณากร" is the name
+        "นางฟ้า",  # too short to be a name after "นาง"
+        "นายิกา",  # combining mark right after "นาย"
+        "นาย",
+        "mrsomething",
+    ],
+)
+def test_names_that_start_like_a_title_are_kept(value):
+    assert strip_name_title(normalize_text(value)) == normalize_text(value)
@@ -0,0 +1,112 @@
+# tests/test_staff_query_counts.py
+
+"""
+Query-count regression for the staff work pattern / leave endpoints: relationships are
+lazy="raise_on_sql", so a response that touched one would fail instead of quietly adding
+SELECTs (the old lazy="selectin" default cascaded into departments, services, bookings, ...).
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.db.models as db_models
+from app.database.session import get_db
+from app.api.v1.modules.staff.routers.staff_leave_read_router import router as staff_leave_read_router
+from app.api.v1.modules.staff.routers.staff_leave_search_router import router as staff_leave_search_router
+from app.api.v1.modules.staff.routers.staff_work_pattern_router import router as staff_work_pattern_router
+
+from tests.conftest import sqlite_metadata
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2026, 1, 5, 8, 0, tzinfo=timezone.utc)
+STAFF_ID = uuid.uuid4()
+LOCATION_ID = uuid.uuid4()
+PATTERN_ID = uuid.uuid4()
+LEAVE_ID = uuid.uuid4()
+
+
+@pytest.fixture
+async def client():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    md = sqlite_metadata(db_models.Staff, db_models.Location, db_models.StaffWorkPattern, db_models.StaffLeave)
+    async with engine.begin() as conn:
+        await conn.run_sync(md.create_all)
+        await conn.execute(md.tables["staff"].insert(), {"id": STAFF_ID, "staff_name": "Dr. A", "created_at": NOW})
+        await conn.execute(
+            md.tables["locations"].insert(), {"id": LOCATION_ID, "location_name": "Siam", "created_at": NOW}
+        )
+        await conn.execute(
+            md.tables["staff_work_pattern"].insert(),
+            {
+                "id": PATTERN_ID, "staff_id": STAFF_ID, "location_id": LOCATION_ID, "department_id": uuid.uuid4(),
+                "weekday": 1, "shift_template_id": uuid.uuid4(), "is_active": True, "created_at": NOW,
+            },
+        )
+        await conn.execute(
+            md.tables["staff_leave"].insert(),
+            {
+                "id": LEAVE_ID, "company_code": "C1", "location_id": LOCATION_ID, "staff_id": STAFF_ID,
+                "leave_type": "sick", "date_from": date(2026, 1, 6), "date_to": date(2026, 1, 7),
+                "status": "approved", "is_active": True, "created_at": NOW,
+            },
+        )
+
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def _db():
+        async with sessions() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(staff_work_pattern_router, prefix="/staff_work_pattern")
+    app.include_router(staff_leave_search_router, prefix="/staff/leave")
+    app.include_router(staff_leave_read_router, prefix="/staff/leave")
+    app.dependency_overrides[get_db] = _db
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        c.statements = statements
+        yield c
+    await engine.dispose()
+
+
+async def _get(client, url: str, expected_statements: int) -> dict:
+    client.statements.clear()
+    res = await client.get(url)
+    # a raise_on_sql relationship access surfaces as a 500 with the InvalidRequestError text
+    assert res.status_code == 200, res.text
+    assert "raise_on_sql" not in res.text
+    assert len(client.statements) == expected_statements, client.statements
+    return res.json()
+
+
+async def test_work_pattern_search_is_count_plus_page(client):
+    body = await _get(client, "/staff_work_pattern/search", 2)
+    assert body["data"]["paging"]["total"] == 1
+
+
+async def test_work_pattern_by_id_is_one_select(client):
+    body = await _get(client, f"/staff_work_pattern/{PATTERN_ID}", 1)
+    assert body["data"]["item"]["id"] == str(PATTERN_ID)
+
+
+async def test_leave_search_is_count_plus_joined_page(client):
+    body = await _get(client, "/staff/leave/search", 2)
+    assert body["data"]["items"][0]["staff_name"] == "Dr. A"
+
+
+async def test_leave_by_id_is_one_select(client):
+    body = await _get(client, f"/staff/leave/{LEAVE_ID}", 1)
+    assert body["data"]["item"]["id"] == str(LEAVE_ID)
@@ -0,0 +1,64 @@
+# tests/test_staff_suggest_scope.py
+
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.db.models as db_models
+from app.api.v1.modules.staff.repositories.staff_search_repository import StaffSearchRepository
+from app.api.v1.modules.staff.services import staff_search_service as service_module
+from app.api.v1.modules.staff.services.staff_search_service import StaffSearchService
+from app.services.suggest_index import SuggestIndex
+
+from tests.conftest import sqlite_metadata
+
+pytestmark = pytest.mark.anyio
+
+LOC_A, LOC_B = uuid.uuid4(), uuid.uuid4()
+
+
+@pytest.fixture
+async def sessions():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    md = sqlite_metadata(db_models.Staff, db_models.Location, db_models.StaffLocation)
+    staff = md.tables["staff"]
+    async with engine.begin() as conn:
+        await conn.run_sync(md.create_all)
+        await conn.execute(
+            md.tables["locations"].insert(),
+            [{"id": LOC_A, "company_code": "A", "location_name": "A1"}, {"id": LOC_B, "company_code": "B", "location_name": "B1"}],
+        )
+        shared = uuid.uuid4()
+        await conn.execute(
+            staff.insert(),
+            [
+                {"id": uuid.uuid4(), "staff_name": "Somchai A", "main_location_id": LOC_A, "is_active": True},
+                {"id": uuid.uuid4(), "staff_name": "Somsak A", "main_location_id": LOC_A, "is_active": True},
+                {"id": uuid.uuid4(), "staff_name": "Somying B", "main_location_id": LOC_B, "is_active": True},
+                {"id": shared, "staff_name": "Somporn B (also A)", "main_location_id": LOC_B, "is_active": True},
+                {"id": uuid.uuid4(), "staff_name": "Somjit A (inactive)", "main_location_id": LOC_A, "is_active": False},
+            ],
+        )
+        await conn.execute(
+            md.tables["staff_locations"].insert(),
+            {"id": uuid.uuid4(), "staff_id": shared, "location_id": LOC_A, "is_active": True},
+        )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.parametrize("max_rows", [100, 1])  # full index / partial index -> DB fallback
+async def test_suggest_stays_in_the_company(sessions, monkeypatch, max_rows):
+    monkeypatch.setattr(service_module, "suggest_index", SuggestIndex(ttl_seconds=60, max_rows=max_rows))
+    async with sessions() as db:
+        svc = StaffSearchService(StaffSearchRepository(db))
+        a = {x["label"] for x in await svc.suggest(q="som", limit=10, company_code="A")}
+        b = {x["label"] for x in await svc.suggest(q="som", limit=10, company_code="B")}
+        index = await service_module.suggest_index.get(
+            service_module.SUGGEST_ENTITY, None, scope="A", probe=None
+        )
+
+    assert index.partial is (max_rows == 1)
+    assert a == {"Somchai A", "Somsak A", "Somporn B (also A)"}
+    assert b == {"Somying B", "Somporn B (also A)"}
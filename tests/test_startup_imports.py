@@ -0,0 +1,21 @@
+# tests/test_startup_imports.py
+
+import os
+import subprocess
+import sys
+
+from app.utils.lazy_import import LazyModule
+
+
+def test_app_import_does_not_load_numpy_or_pil():
+    # fresh interpreter: this test session has long since imported numpy itself
+    probe = "import sys, app.main; print(sorted(m for m in ('numpy', 'PIL') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, env=os.environ.copy(), check=True)
+    assert out.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_lazy_module_imports_on_first_attribute():
+    json = LazyModule("json")
+    assert "loaded=False" in repr(json)
+    assert json.loads("[1]") == [1]
+    assert "loaded=True" in repr(json)
@@ -0,0 +1,46 @@
+# tests/test_suggest_index.py
+
+import pytest
+
+from app.services.suggest_index import SuggestIndex
+
+pytestmark = pytest.mark.anyio
+
+
+class Table:
+    def __init__(self, n: int):
+        self.rows = [(i, f"patient {i}", ()) for i in range(n)]
+        self.loaded = 0
+        self.probed = 0
+
+    async def load(self, limit: int):
+        self.loaded += 1
+        return self.rows[:limit]
+
+    async def exceeds(self, max_rows: int) -> bool:
+        self.probed += 1
+        return len(self.rows) > max_rows
+
+
+async def test_oversized_table_is_marked_partial_without_loading_rows():
+    table = Table(11)
+    index = SuggestIndex(ttl_seconds=0, max_rows=10)
+    first = await index.get("patients", table.load, probe=table.exceeds)
+    again = await index.get("patients", table.load, probe=table.exceeds)
+    assert first.partial and again is first
+    assert (table.probed, table.loaded) == (1, 0)
+
+
+async def test_table_within_limit_is_loaded_once():
+    table = Table(10)
+    index = SuggestIndex(ttl_seconds=0, max_rows=10)
+    built = await index.get("patients", table.load, probe=table.exceeds)
+    assert not built.partial and len(built) == 10
+    assert built.lookup("patient 7", 1) == [{"id": "7", "label": "patient 7"}]
+    assert (table.probed, table.loaded) == (1, 1)
+
+
+async def test_without_probe_the_row_cap_still_applies():
+    table = Table(11)
+    built = await SuggestIndex(ttl_seconds=0, max_rows=10).get("patients", table.load)
+    assert built.partial and table.loaded == 1